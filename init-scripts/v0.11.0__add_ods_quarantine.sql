@@ -0,0 +1,30 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Quarantine table for ODS records rejected by the page loader
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- Records that do not fit the ODS column types are stored here with the
+-- error instead of aborting the page they arrived in (dws/ods_loader.py
+-- also creates the table on first use for existing databases)
+CREATE TABLE IF NOT EXISTS warehouse.ods_quarantine (
+    quarantine_id SERIAL PRIMARY KEY,
+    source_table VARCHAR(50) NOT NULL,
+    record_id INTEGER,
+    project_id INTEGER,
+    payload JSONB,
+    error TEXT,
+    quarantined_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_ods_quarantine_source
+    ON warehouse.ods_quarantine(source_table, record_id);
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA warehouse TO redmine_warehouse;
+GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA warehouse TO redmine_warehouse;
+
+COMMENT ON TABLE warehouse.ods_quarantine IS 'ODS records rejected during sync';
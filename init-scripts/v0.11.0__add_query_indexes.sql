@@ -0,0 +1,84 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Indexes backing the warehouse read and report queries
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- Every query in dws/repository.py, dws/statements.py,
+-- scheduler/ads_scheduler.py and dws/services/quality_service.py that
+-- filters a large table is served by an index below or by an existing
+-- primary key / unique constraint. tests/integration/test_query_plans.py
+-- seeds a synthetic dataset and fails on sequential scans of these tables.
+--
+-- On an existing, populated warehouse run each statement by hand with
+-- CREATE INDEX CONCURRENTLY to avoid blocking the daily sync.
+
+-- -----------------------------------------------------
+-- DWD Layer
+-- -----------------------------------------------------
+
+-- Issue snapshots of one project on one day (get_issues_snapshot,
+-- get_top_assignees, refresh_daily_summary). The included
+-- columns let the aggregates run as index-only scans.
+CREATE INDEX IF NOT EXISTS idx_dwd_snapshot_project_date
+    ON warehouse.dwd_issue_daily_snapshot(project_id, snapshot_date)
+    INCLUDE (status_name, priority_name, assigned_to_name, is_new, is_closed);
+
+-- High-priority issues of one project on one day (get_high_priority_issues);
+-- partial, so it only holds the few high-priority rows
+CREATE INDEX IF NOT EXISTS idx_dwd_snapshot_high_priority
+    ON warehouse.dwd_issue_daily_snapshot(project_id, snapshot_date, priority_name)
+    WHERE priority_name IN ('立刻', '紧急', '高');
+
+-- Latest snapshot date (data quality freshness check)
+CREATE INDEX IF NOT EXISTS idx_dwd_snapshot_date
+    ON warehouse.dwd_issue_daily_snapshot(snapshot_date);
+
+-- -----------------------------------------------------
+-- DWS Layer
+-- -----------------------------------------------------
+
+-- Snapshot continuity and freshness checks
+CREATE INDEX IF NOT EXISTS idx_dws_project_summary_date
+    ON warehouse.dws_project_daily_summary(snapshot_date);
+
+-- Contributions of one user in one project (refresh_user_workload)
+CREATE INDEX IF NOT EXISTS idx_dws_contributors_user_project
+    ON warehouse.dws_issue_contributors(user_id, project_id);
+
+-- Monthly contributor report of one project, as an index-only scan
+CREATE INDEX IF NOT EXISTS idx_dws_contributors_project
+    ON warehouse.dws_issue_contributors(project_id)
+    INCLUDE (user_id, user_name, role_category, issue_id,
+             journal_count, status_change_count);
+
+-- Monthly workload report of all users
+CREATE INDEX IF NOT EXISTS idx_dws_user_workload_month
+    ON warehouse.dws_user_monthly_workload(year_month);
+
+-- -----------------------------------------------------
+-- ODS Layer
+-- -----------------------------------------------------
+
+-- Freshness of the ODS tables (quality checks, get_ods_sync_status)
+CREATE INDEX IF NOT EXISTS idx_ods_issues_updated_on
+    ON warehouse.ods_issues(updated_on);
+
+CREATE INDEX IF NOT EXISTS idx_ods_journals_created_on
+    ON warehouse.ods_journals(created_on);
+
+-- Field changes of a journal by name (status / assignee history)
+CREATE INDEX IF NOT EXISTS idx_ods_journal_details_journal_name
+    ON warehouse.ods_journal_details(journal_id, name);
+
+ANALYZE warehouse.dwd_issue_daily_snapshot;
+ANALYZE warehouse.dws_project_daily_summary;
+ANALYZE warehouse.dws_issue_contributors;
+ANALYZE warehouse.dws_user_monthly_workload;
+ANALYZE warehouse.ods_issues;
+ANALYZE warehouse.ods_journals;
+ANALYZE warehouse.ods_journal_details;
@@ -0,0 +1,291 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Change-only issue history with as-of snapshot functions
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- dwd_issue_daily_snapshot stores one row per issue per day, whether or
+-- not anything changed. dwd_issue_history stores one row per validity
+-- interval [valid_from, valid_to) instead: a new interval is only opened
+-- when the project, status, priority or assignee of an issue changes, so
+-- storage and write volume follow the change rate. Other columns
+-- (subject, updated_at) are updated in place on the open interval. The
+-- open interval of an issue that disappears from its project is ended.
+--
+-- Readers go through warehouse.issue_snapshot_on(project, date), which
+-- returns the dwd_issue_daily_snapshot rows of that project and day when
+-- there are any, and otherwise reconstructs them from the history up to
+-- the last day the history was written for that project. Which table the
+-- sync writes to is chosen with SNAPSHOT_STORAGE (dws/history.py).
+
+-- -----------------------------------------------------
+-- 1. History table
+-- -----------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS warehouse.dwd_issue_history (
+    id BIGSERIAL,
+    issue_id INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    valid_from DATE NOT NULL,
+    valid_to DATE NOT NULL DEFAULT 'infinity',
+    subject TEXT,
+    status_id INTEGER,
+    status_name TEXT,
+    priority_id INTEGER,
+    priority_name TEXT,
+    assigned_to_id INTEGER,
+    assigned_to_name TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT dwd_issue_history_pkey PRIMARY KEY (issue_id, valid_from),
+    CONSTRAINT ck_dwd_issue_history_interval CHECK (valid_from < valid_to)
+);
+
+-- Intervals of one project covering a day. Recent days only match the
+-- open intervals (valid_to = 'infinity'), at the end of the index.
+CREATE INDEX IF NOT EXISTS idx_dwd_issue_history_project_valid
+    ON warehouse.dwd_issue_history(project_id, valid_to, valid_from);
+
+-- Open interval of each issue (writers close and update it)
+CREATE UNIQUE INDEX IF NOT EXISTS uk_dwd_issue_history_open
+    ON warehouse.dwd_issue_history(issue_id)
+    WHERE valid_to = 'infinity';
+
+-- Last day the history writers recorded for each project. The history
+-- only answers for days up to it: with SNAPSHOT_STORAGE=daily the history
+-- stays frozen at the seed below, and a day the sync has not written yet
+-- must read as empty, not as the seeded state.
+CREATE TABLE IF NOT EXISTS warehouse.dwd_issue_history_watermark (
+    project_id INTEGER PRIMARY KEY,
+    recorded_through DATE NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- -----------------------------------------------------
+-- 2. Seed from the existing daily snapshots
+-- -----------------------------------------------------
+
+-- Consecutive days with the same status, priority and assignee collapse
+-- into one interval carrying the values of its last day. The last
+-- interval of every issue stays open. Skipped once the history has rows.
+-- No watermark is set: the seeded days are served from their daily rows.
+INSERT INTO warehouse.dwd_issue_history (
+    issue_id, project_id, valid_from, valid_to,
+    subject, status_id, status_name, priority_id, priority_name,
+    assigned_to_id, assigned_to_name, created_at, updated_at
+)
+SELECT
+    issue_id, project_id, valid_from,
+    COALESCE(
+        LEAD(valid_from) OVER (PARTITION BY issue_id ORDER BY valid_from),
+        'infinity'
+    ),
+    subject, status_id, status_name, priority_id, priority_name,
+    assigned_to_id, assigned_to_name, created_at, updated_at
+FROM (
+    SELECT DISTINCT ON (issue_id, run)
+        issue_id, project_id, run, snapshot_date,
+        MIN(snapshot_date) OVER (PARTITION BY issue_id, run) AS valid_from,
+        subject, status_id, status_name, priority_id, priority_name,
+        assigned_to_id, assigned_to_name, created_at, updated_at
+    FROM (
+        SELECT
+            s.*,
+            SUM(CASE WHEN changed THEN 1 ELSE 0 END)
+                OVER (PARTITION BY issue_id ORDER BY snapshot_date) AS run
+        FROM (
+            SELECT
+                s.*,
+                s.status_id IS DISTINCT FROM LAG(s.status_id) OVER w
+                    OR s.priority_id IS DISTINCT FROM LAG(s.priority_id) OVER w
+                    OR s.assigned_to_id IS DISTINCT FROM LAG(s.assigned_to_id) OVER w
+                    OR LAG(s.issue_id) OVER w IS NULL AS changed
+            FROM warehouse.dwd_issue_daily_snapshot s
+            WINDOW w AS (PARTITION BY s.issue_id ORDER BY s.snapshot_date)
+        ) s
+    ) runs
+    ORDER BY issue_id, run, snapshot_date DESC
+) intervals
+WHERE NOT EXISTS (SELECT 1 FROM warehouse.dwd_issue_history);
+
+ANALYZE warehouse.dwd_issue_history;
+
+-- -----------------------------------------------------
+-- 3. As-of snapshot functions
+-- -----------------------------------------------------
+
+-- Both functions are single-statement SQL functions, so the planner
+-- inlines them into the calling query and uses the indexes above.
+
+-- Issues of a project on p_date, in the dwd_issue_daily_snapshot shape,
+-- reconstructed from the history. is_new / is_closed are derived from the
+-- previous interval, as the daily sync derives them from the previous day
+-- of the same project; subject and updated_at are the latest values of the
+-- interval.
+CREATE OR REPLACE FUNCTION warehouse.issue_history_on(
+    p_project_id INTEGER,
+    p_date DATE
+)
+RETURNS TABLE (
+    id BIGINT,
+    issue_id INTEGER,
+    project_id INTEGER,
+    snapshot_date DATE,
+    subject TEXT,
+    status_id INTEGER,
+    status_name TEXT,
+    priority_id INTEGER,
+    priority_name TEXT,
+    assigned_to_id INTEGER,
+    assigned_to_name TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    is_new BOOLEAN,
+    is_closed BOOLEAN,
+    is_updated BOOLEAN,
+    created_at_snapshot TIMESTAMP
+) AS $$
+    SELECT
+        h.id, h.issue_id, h.project_id, p_date,
+        h.subject, h.status_id, h.status_name,
+        h.priority_id, h.priority_name,
+        h.assigned_to_id, h.assigned_to_name,
+        h.created_at, h.updated_at,
+        h.valid_from = p_date AND prev.project_id IS DISTINCT FROM h.project_id,
+        h.valid_from = p_date
+            AND h.status_name = '已shutdown'
+            AND (prev.project_id IS DISTINCT FROM h.project_id
+                 OR prev.status_name IS DISTINCT FROM '已shutdown'),
+        COALESCE(h.updated_at::DATE = p_date, FALSE),
+        h.recorded_at
+    FROM warehouse.dwd_issue_history h
+    LEFT JOIN warehouse.dwd_issue_history prev
+        ON prev.issue_id = h.issue_id AND prev.valid_to = h.valid_from
+    WHERE h.project_id = p_project_id
+      AND h.valid_to > p_date
+      AND h.valid_from <= p_date
+$$ LANGUAGE sql STABLE;
+
+-- Issues of a project on p_date: the stored daily snapshot rows when that
+-- day has any, otherwise the reconstructed history if it was recorded
+-- through p_date, otherwise nothing
+CREATE OR REPLACE FUNCTION warehouse.issue_snapshot_on(
+    p_project_id INTEGER,
+    p_date DATE
+)
+RETURNS TABLE (
+    id BIGINT,
+    issue_id INTEGER,
+    project_id INTEGER,
+    snapshot_date DATE,
+    subject TEXT,
+    status_id INTEGER,
+    status_name TEXT,
+    priority_id INTEGER,
+    priority_name TEXT,
+    assigned_to_id INTEGER,
+    assigned_to_name TEXT,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    is_new BOOLEAN,
+    is_closed BOOLEAN,
+    is_updated BOOLEAN,
+    created_at_snapshot TIMESTAMP
+) AS $$
+    SELECT
+        s.id, s.issue_id, s.project_id, s.snapshot_date,
+        s.subject, s.status_id, s.status_name,
+        s.priority_id, s.priority_name,
+        s.assigned_to_id, s.assigned_to_name,
+        s.created_at, s.updated_at,
+        s.is_new, s.is_closed, s.is_updated,
+        s.created_at_snapshot
+    FROM warehouse.dwd_issue_daily_snapshot s
+    WHERE s.project_id = p_project_id AND s.snapshot_date = p_date
+    UNION ALL
+    SELECT h.*
+    FROM warehouse.issue_history_on(p_project_id, p_date) h
+    WHERE EXISTS (
+        SELECT 1 FROM warehouse.dwd_issue_history_watermark w
+        WHERE w.project_id = p_project_id AND w.recorded_through >= p_date
+    )
+      AND NOT EXISTS (
+        SELECT 1 FROM warehouse.dwd_issue_daily_snapshot s
+        WHERE s.project_id = p_project_id AND s.snapshot_date = p_date
+    )
+$$ LANGUAGE sql STABLE;
+
+-- -----------------------------------------------------
+-- 4. Daily summary over either storage
+-- -----------------------------------------------------
+
+CREATE OR REPLACE FUNCTION warehouse.refresh_daily_summary(
+    p_project_id INTEGER,
+    p_snapshot_date DATE
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO warehouse.dws_project_daily_summary (
+        project_id, snapshot_date,
+        total_issues, new_issues, closed_issues,
+        status_new, status_in_progress, status_resolved, status_closed,
+        priority_immediate, priority_urgent, priority_high, priority_normal, priority_low
+    )
+    SELECT
+        project_id,
+        snapshot_date,
+        COUNT(*) as total_issues,
+        SUM(CASE WHEN is_new THEN 1 ELSE 0 END) as new_issues,
+        SUM(CASE WHEN is_closed THEN 1 ELSE 0 END) as closed_issues,
+        SUM(CASE WHEN status_name = 'New' THEN 1 ELSE 0 END) as status_new,
+        SUM(CASE WHEN status_name = 'In Progress' THEN 1 ELSE 0 END) as status_in_progress,
+        SUM(CASE WHEN status_name = 'Resolved' THEN 1 ELSE 0 END) as status_resolved,
+        SUM(CASE WHEN status_name = 'Closed' THEN 1 ELSE 0 END) as status_closed,
+        SUM(CASE WHEN priority_name = 'Immediate' THEN 1 ELSE 0 END) as priority_immediate,
+        SUM(CASE WHEN priority_name = 'Urgent' THEN 1 ELSE 0 END) as priority_urgent,
+        SUM(CASE WHEN priority_name = 'High' THEN 1 ELSE 0 END) as priority_high,
+        SUM(CASE WHEN priority_name = 'Normal' THEN 1 ELSE 0 END) as priority_normal,
+        SUM(CASE WHEN priority_name = 'Low' THEN 1 ELSE 0 END) as priority_low
+    FROM warehouse.issue_snapshot_on(p_project_id, p_snapshot_date)
+    GROUP BY project_id, snapshot_date
+    ON CONFLICT (project_id, snapshot_date) DO UPDATE SET
+        total_issues = EXCLUDED.total_issues,
+        new_issues = EXCLUDED.new_issues,
+        closed_issues = EXCLUDED.closed_issues,
+        status_new = EXCLUDED.status_new,
+        status_in_progress = EXCLUDED.status_in_progress,
+        status_resolved = EXCLUDED.status_resolved,
+        status_closed = EXCLUDED.status_closed,
+        priority_immediate = EXCLUDED.priority_immediate,
+        priority_urgent = EXCLUDED.priority_urgent,
+        priority_high = EXCLUDED.priority_high,
+        priority_normal = EXCLUDED.priority_normal,
+        priority_low = EXCLUDED.priority_low;
+END;
+$$ LANGUAGE plpgsql;
+
+-- -----------------------------------------------------
+-- 5. Authorization
+-- -----------------------------------------------------
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA warehouse TO redmine_warehouse;
+GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA warehouse TO redmine_warehouse;
+GRANT ALL PRIVILEGES ON ALL FUNCTIONS IN SCHEMA warehouse TO redmine_warehouse;
+
+-- -----------------------------------------------------
+-- 6. Comments
+-- -----------------------------------------------------
+
+COMMENT ON TABLE warehouse.dwd_issue_history IS
+    'DWD issue history, one row per status/priority/assignee validity interval';
+COMMENT ON TABLE warehouse.dwd_issue_history_watermark IS
+    'Last day dwd_issue_history was recorded for each project';
+COMMENT ON FUNCTION warehouse.issue_history_on(INTEGER, DATE) IS
+    'Issues of a project on a date, reconstructed from dwd_issue_history';
+COMMENT ON FUNCTION warehouse.issue_snapshot_on(INTEGER, DATE) IS
+    'Issues of a project on a date from the daily snapshots or the history';
@@ -0,0 +1,41 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Natural key (journal_id, detail_ordinal) for ODS journal details
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- Position of the detail within its journal, as returned by the Redmine API
+ALTER TABLE warehouse.ods_journal_details
+    ADD COLUMN IF NOT EXISTS detail_ordinal INTEGER;
+
+-- Unique index uq_ods_journal_details_key (journal_id, detail_ordinal).
+-- Existing tables contain duplicate rows written by the append-only sync
+-- and no ordinals yet: dws/ods_loader.py compact_journal_details() removes
+-- the duplicates in small batches, numbers the remaining rows and then
+-- builds the index with CREATE UNIQUE INDEX CONCURRENTLY. The ODS sync
+-- runs it once automatically; ODSSyncService().compact_journal_details()
+-- runs it ahead of a sync.
+-- A table without unnumbered or duplicate rows (always the case on a fresh
+-- install) gets the index here, so ON CONFLICT (journal_id, detail_ordinal)
+-- works before any compaction has run.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM warehouse.ods_journal_details
+        WHERE detail_ordinal IS NULL
+    ) AND NOT EXISTS (
+        SELECT 1 FROM warehouse.ods_journal_details
+        GROUP BY journal_id, detail_ordinal
+        HAVING COUNT(*) > 1
+    ) THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_ods_journal_details_key
+            ON warehouse.ods_journal_details(journal_id, detail_ordinal);
+    END IF;
+END $$;
+
+COMMENT ON COLUMN warehouse.ods_journal_details.detail_ordinal IS
+    'Position of the detail within its journal (0-based)';
@@ -0,0 +1,152 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Monthly range partitioning of dwd_issue_daily_snapshot
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- dwd_issue_daily_snapshot holds one row per issue per day. It is
+-- partitioned by snapshot_date into one partition per month, named
+-- dwd_issue_daily_snapshot_pYYYYMM, so day-scoped reads and writes only
+-- touch one partition. dws/partitions.py creates future partitions ahead
+-- of time and applies the retention policy (detach or drop old months).
+
+-- 1. Partition management functions
+
+-- Create the partition holding p_date if it does not exist yet.
+-- Returns the partition name, or NULL when the table is not partitioned.
+CREATE OR REPLACE FUNCTION warehouse.ensure_issue_snapshot_partition(p_date DATE)
+RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_date)::DATE;
+    v_name TEXT := 'dwd_issue_daily_snapshot_p' || to_char(p_date, 'YYYYMM');
+BEGIN
+    IF (SELECT relkind FROM pg_class
+        WHERE oid = 'warehouse.dwd_issue_daily_snapshot'::regclass) <> 'p' THEN
+        RETURN NULL;
+    END IF;
+    IF to_regclass('warehouse.' || v_name) IS NULL THEN
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE warehouse.%I PARTITION OF warehouse.dwd_issue_daily_snapshot '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_start, (v_start + INTERVAL '1 month')::DATE
+            );
+        EXCEPTION WHEN duplicate_table THEN
+            -- Created concurrently by another session
+            NULL;
+        END;
+    END IF;
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create every missing monthly partition between p_from and p_to
+-- (inclusive). Returns the number of months covered.
+CREATE OR REPLACE FUNCTION warehouse.ensure_issue_snapshot_partitions(
+    p_from DATE,
+    p_to DATE
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month DATE := date_trunc('month', p_from)::DATE;
+    v_count INTEGER := 0;
+BEGIN
+    WHILE v_month <= p_to LOOP
+        PERFORM warehouse.ensure_issue_snapshot_partition(v_month);
+        v_month := (v_month + INTERVAL '1 month')::DATE;
+        v_count := v_count + 1;
+    END LOOP;
+    RETURN v_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. Convert the existing table (skipped when already partitioned)
+
+DO $$
+DECLARE
+    v_first DATE;
+    v_last DATE;
+BEGIN
+    IF (SELECT relkind FROM pg_class
+        WHERE oid = 'warehouse.dwd_issue_daily_snapshot'::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE warehouse.dwd_issue_daily_snapshot
+        RENAME TO dwd_issue_daily_snapshot_unpartitioned;
+    ALTER INDEX warehouse.dwd_issue_daily_snapshot_pkey
+        RENAME TO dwd_issue_daily_snapshot_unpartitioned_pkey;
+    ALTER INDEX warehouse.uk_dwd_issue_snapshot
+        RENAME TO uk_dwd_issue_snapshot_unpartitioned;
+    DROP INDEX IF EXISTS warehouse.idx_dwd_snapshot_project_date;
+    DROP INDEX IF EXISTS warehouse.idx_dwd_snapshot_high_priority;
+    DROP INDEX IF EXISTS warehouse.idx_dwd_snapshot_date;
+
+    -- The primary key of a partitioned table must include the partition key
+    CREATE TABLE warehouse.dwd_issue_daily_snapshot (
+        id BIGINT NOT NULL DEFAULT nextval('warehouse.dwd_issue_daily_snapshot_id_seq'),
+        issue_id INTEGER NOT NULL,
+        project_id INTEGER NOT NULL,
+        snapshot_date DATE NOT NULL,
+        subject TEXT,
+        status_id INTEGER,
+        status_name TEXT,
+        priority_id INTEGER,
+        priority_name TEXT,
+        assigned_to_id INTEGER,
+        assigned_to_name TEXT,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP,
+        is_new BOOLEAN DEFAULT FALSE,
+        is_closed BOOLEAN DEFAULT FALSE,
+        is_updated BOOLEAN DEFAULT FALSE,
+        created_at_snapshot TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CONSTRAINT dwd_issue_daily_snapshot_pkey PRIMARY KEY (id, snapshot_date),
+        CONSTRAINT uk_dwd_issue_snapshot UNIQUE (issue_id, snapshot_date)
+    ) PARTITION BY RANGE (snapshot_date);
+
+    ALTER SEQUENCE warehouse.dwd_issue_daily_snapshot_id_seq
+        OWNED BY warehouse.dwd_issue_daily_snapshot.id;
+
+    -- Same indexes as v0.11.0__add_query_indexes.sql, now per partition
+    CREATE INDEX idx_dwd_snapshot_project_date
+        ON warehouse.dwd_issue_daily_snapshot(project_id, snapshot_date)
+        INCLUDE (status_name, priority_name, assigned_to_name, is_new, is_closed);
+    CREATE INDEX idx_dwd_snapshot_high_priority
+        ON warehouse.dwd_issue_daily_snapshot(project_id, snapshot_date, priority_name)
+        WHERE priority_name IN ('立刻', '紧急', '高');
+    CREATE INDEX idx_dwd_snapshot_date
+        ON warehouse.dwd_issue_daily_snapshot(snapshot_date);
+
+    SELECT MIN(snapshot_date), MAX(snapshot_date) INTO v_first, v_last
+    FROM warehouse.dwd_issue_daily_snapshot_unpartitioned;
+    PERFORM warehouse.ensure_issue_snapshot_partitions(
+        LEAST(v_first, CURRENT_DATE),
+        GREATEST(v_last, (CURRENT_DATE + INTERVAL '3 months')::DATE)
+    );
+
+    INSERT INTO warehouse.dwd_issue_daily_snapshot
+    SELECT * FROM warehouse.dwd_issue_daily_snapshot_unpartitioned;
+
+    DROP TABLE warehouse.dwd_issue_daily_snapshot_unpartitioned;
+END;
+$$;
+
+ANALYZE warehouse.dwd_issue_daily_snapshot;
+
+-- 3. Authorization
+
+GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA warehouse TO redmine_warehouse;
+GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA warehouse TO redmine_warehouse;
+GRANT ALL PRIVILEGES ON ALL FUNCTIONS IN SCHEMA warehouse TO redmine_warehouse;
+
+-- 4. Comments
+
+COMMENT ON TABLE warehouse.dwd_issue_daily_snapshot IS
+    'DWD issue daily snapshot, partitioned by month of snapshot_date';
+COMMENT ON FUNCTION warehouse.ensure_issue_snapshot_partition(DATE) IS
+    'Create the monthly dwd_issue_daily_snapshot partition holding a date';
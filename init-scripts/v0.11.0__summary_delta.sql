@@ -0,0 +1,115 @@
+-- =====================================================
+-- Redmine MCP Server - Database Schema
+-- Version: v0.11.0
+-- Type: SCHEMA
+-- Date: 2026-10-18
+-- Description: Bucket counts shared by the full and incremental project summary refresh
+-- =====================================================
+
+SET search_path TO warehouse, public;
+
+-- dws_project_daily_summary used to be rebuilt with a GROUP BY over every
+-- snapshot row of a project and day after each sync. The sync now keeps it
+-- up to date incrementally (dws/summary.py): it counts the buckets of only
+-- the issues it writes, before and after writing them, and adds the
+-- difference to the summary row in the same transaction.
+-- summarize_issue_snapshots holds the bucket definitions for both paths;
+-- refresh_dws_project_daily_summary remains the full recompute used for
+-- new summary rows and for repair.
+
+-- Bucket counts of a project's issues on a day, optionally limited to
+-- some issues. Inlined by the planner: with p_issue_ids the snapshot rows
+-- are looked up by issue, so the cost follows the number of issues.
+CREATE OR REPLACE FUNCTION warehouse.summarize_issue_snapshots(
+    p_project_id INTEGER,
+    p_date DATE,
+    p_issue_ids INTEGER[] DEFAULT NULL
+)
+RETURNS TABLE (
+    total_issues INTEGER,
+    new_issues INTEGER,
+    closed_issues INTEGER,
+    status_new INTEGER,
+    status_in_progress INTEGER,
+    status_resolved INTEGER,
+    status_closed INTEGER,
+    priority_immediate INTEGER,
+    priority_urgent INTEGER,
+    priority_high INTEGER,
+    priority_normal INTEGER,
+    priority_low INTEGER
+) AS $$
+    SELECT
+        COUNT(*)::INTEGER,
+        COUNT(*) FILTER (WHERE s.is_new)::INTEGER,
+        COUNT(*) FILTER (WHERE s.is_closed)::INTEGER,
+        COUNT(*) FILTER (WHERE s.status_name = 'New')::INTEGER,
+        COUNT(*) FILTER (WHERE s.status_name = 'In Progress')::INTEGER,
+        COUNT(*) FILTER (WHERE s.status_name = 'Resolved')::INTEGER,
+        COUNT(*) FILTER (WHERE s.status_name = 'Closed')::INTEGER,
+        COUNT(*) FILTER (WHERE s.priority_name = 'Immediate')::INTEGER,
+        COUNT(*) FILTER (WHERE s.priority_name = 'Urgent')::INTEGER,
+        COUNT(*) FILTER (WHERE s.priority_name = 'High')::INTEGER,
+        COUNT(*) FILTER (WHERE s.priority_name = 'Normal')::INTEGER,
+        COUNT(*) FILTER (WHERE s.priority_name = 'Low')::INTEGER
+    FROM warehouse.issue_snapshot_on(p_project_id, p_date) s
+    WHERE p_issue_ids IS NULL OR s.issue_id = ANY(p_issue_ids)
+$$ LANGUAGE sql STABLE;
+
+-- Full recompute of one summary row
+CREATE OR REPLACE FUNCTION warehouse.refresh_daily_summary(
+    p_project_id INTEGER,
+    p_snapshot_date DATE
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO warehouse.dws_project_daily_summary (
+        project_id, snapshot_date,
+        total_issues, new_issues, closed_issues,
+        status_new, status_in_progress, status_resolved, status_closed,
+        priority_immediate, priority_urgent, priority_high, priority_normal, priority_low
+    )
+    SELECT
+        p_project_id, p_snapshot_date,
+        total_issues, new_issues, closed_issues,
+        status_new, status_in_progress, status_resolved, status_closed,
+        priority_immediate, priority_urgent, priority_high, priority_normal, priority_low
+    FROM warehouse.summarize_issue_snapshots(p_project_id, p_snapshot_date)
+    WHERE total_issues > 0
+    ON CONFLICT (project_id, snapshot_date) DO UPDATE SET
+        total_issues = EXCLUDED.total_issues,
+        new_issues = EXCLUDED.new_issues,
+        closed_issues = EXCLUDED.closed_issues,
+        status_new = EXCLUDED.status_new,
+        status_in_progress = EXCLUDED.status_in_progress,
+        status_resolved = EXCLUDED.status_resolved,
+        status_closed = EXCLUDED.status_closed,
+        priority_immediate = EXCLUDED.priority_immediate,
+        priority_urgent = EXCLUDED.priority_urgent,
+        priority_high = EXCLUDED.priority_high,
+        priority_normal = EXCLUDED.priority_normal,
+        priority_low = EXCLUDED.priority_low;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Name used by the application (docs/technical/WAREHOUSE_NAMING_CONVENTION.md)
+CREATE OR REPLACE FUNCTION warehouse.refresh_dws_project_daily_summary(
+    p_project_id INTEGER,
+    p_snapshot_date DATE
+)
+RETURNS VOID AS $$
+BEGIN
+    PERFORM warehouse.refresh_daily_summary(p_project_id, p_snapshot_date);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Authorization
+
+GRANT ALL PRIVILEGES ON ALL FUNCTIONS IN SCHEMA warehouse TO redmine_warehouse;
+
+-- Comments
+
+COMMENT ON FUNCTION warehouse.summarize_issue_snapshots(INTEGER, DATE, INTEGER[]) IS
+    'dws_project_daily_summary bucket counts of a project day, optionally for some issues';
+COMMENT ON FUNCTION warehouse.refresh_dws_project_daily_summary(INTEGER, DATE) IS
+    'Recompute one dws_project_daily_summary row from the issue snapshots';
@@ -0,0 +1,263 @@
+"""Read-through cache for Redmine entities.
+
+:class:`ReadCache` keeps the converted results of read tools
+(``get_redmine_issue``, ``list_redmine_projects``, ``get_redmine_wiki_page``)
+in memory for a per-resource TTL.  It is bounded by entry count and by
+approximate size (the length of the JSON encoding), evicting least recently
+used entries first.
+
+Every entry is tagged with the entities it was built from (e.g.
+``("issue", "42")``).  Write tools call :func:`invalidate` with the same
+tags; this drops the entries and bumps a per-tag generation counter.  A read
+that started before the write carries the old generation, so its result is
+neither stored nor shared with reads that start after the write.
+
+Cached results are shared between callers and must be treated as read-only.
+
+Configuration (environment):
+    REDMINE_CACHE_MAX_ENTRIES       entries kept (default 1000, 0 disables)
+    REDMINE_CACHE_MAX_BYTES         approximate size limit (default 32 MiB)
+    REDMINE_CACHE_TTL_ISSUE         seconds an issue is served from memory
+                                    (default 30)
+    REDMINE_CACHE_TTL_PROJECTS      seconds for the project list (default 300)
+    REDMINE_CACHE_TTL_WIKI_PAGE     seconds for a wiki page (default 120)
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from .singleflight import coalesce
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTLS = {"issue": 30.0, "projects": 300.0, "wiki_page": 120.0}
+
+_MISSING = object()
+
+
+def entity_tag(resource: str, *ident: Any) -> Tuple[str, ...]:
+    """Tag identifying one Redmine entity (ids compared as strings)."""
+    return (resource, *(str(part) for part in ident))
+
+
+def _estimate_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class ReadCache:
+    """Bounded TTL + LRU cache with tag-based invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 30.0,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        # key -> (value, expires_at, size, tags)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int, Tuple]]" = (
+            OrderedDict()
+        )
+        self._by_tag: Dict[Hashable, set] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._stale_writes = 0
+
+    def _ttl(self, key: Hashable) -> float:
+        resource = key[0] if isinstance(key, tuple) and key else key
+        return self.ttls.get(resource, self.default_ttl)
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size, tags = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or the ``_MISSING`` sentinel."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return _MISSING
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def generation(self, tags: Iterable[Hashable]) -> Tuple[int, ...]:
+        """Current generation of each tag, to pass back to :meth:`set`."""
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[Hashable] = (),
+        generation: Optional[Tuple[int, ...]] = None,
+    ) -> bool:
+        """Store ``value`` unless a tag was invalidated since ``generation``."""
+        tags = tuple(tags)
+        ttl = self._ttl(key)
+        if ttl <= 0:
+            return False
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            current = tuple(self._generations.get(tag, 0) for tag in tags)
+            if generation is not None and generation != current:
+                self._stale_writes += 1
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size, tags)
+            self._bytes += size
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+            return True
+
+    def invalidate(self, *tags: Hashable) -> int:
+        """Drop every entry carrying one of ``tags``; returns the count."""
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                for key in list(self._by_tag.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            self._invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+            self._generations.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "stale_writes_skipped": self._stale_writes,
+            }
+
+    @classmethod
+    def from_env(cls) -> Optional["ReadCache"]:
+        """Build a cache from the environment, or None if disabled."""
+        try:
+            max_entries = int(os.getenv("REDMINE_CACHE_MAX_ENTRIES", "1000"))
+            max_bytes = int(os.getenv("REDMINE_CACHE_MAX_BYTES", str(32 * 1024**2)))
+            ttls = {
+                resource: float(
+                    os.getenv(f"REDMINE_CACHE_TTL_{resource.upper()}", default)
+                )
+                for resource, default in DEFAULT_TTLS.items()
+            }
+        except ValueError as e:
+            logger.warning(f"Invalid Redmine cache settings ({e}), using defaults")
+            return cls()
+        if max_entries <= 0:
+            return None
+        return cls(max_entries=max_entries, max_bytes=max_bytes, ttls=ttls)
+
+
+_cache: Optional[ReadCache] = None
+_cache_configured = False
+_cache_lock = threading.Lock()
+
+
+def get_read_cache() -> Optional[ReadCache]:
+    """Return the process-wide cache, or None if caching is disabled."""
+    global _cache, _cache_configured
+    if not _cache_configured:
+        with _cache_lock:
+            if not _cache_configured:
+                _cache = ReadCache.from_env()
+                _cache_configured = True
+    return _cache
+
+
+async def cached_read(
+    key: Hashable,
+    tags: Iterable[Hashable],
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Serve ``key`` from the cache, or fetch it (coalesced) and store it."""
+    cache = get_read_cache()
+    if cache is None:
+        return await coalesce(key, fetch)
+
+    value = cache.get(key)
+    if value is not _MISSING:
+        return value
+    tags = tuple(tags)
+    generation = cache.generation(tags)
+    # Reads that start after a write must not join a fetch started before it
+    value = await coalesce((key, generation), fetch)
+    cache.set(key, value, tags, generation)
+    return value
+
+
+def invalidate(*tags: Hashable) -> None:
+    """Drop cached reads of the given entities after a write."""
+    cache = get_read_cache()
+    if cache is not None:
+        removed = cache.invalidate(*tags)
+        if removed:
+            logger.debug(f"Invalidated {removed} cached reads for {tags}")
+
+
+def clear_read_cache() -> None:
+    """Empty the cache (used by tests and after configuration changes)."""
+    cache = get_read_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def get_cache_stats() -> Optional[Dict[str, Any]]:
+    cache = get_read_cache()
+    return cache.get_stats() if cache is not None else None
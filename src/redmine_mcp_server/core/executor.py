@@ -0,0 +1,235 @@
+"""Bounded thread pools for blocking I/O issued from async MCP tools.
+
+FastMCP runs tool coroutines on the event loop, so every synchronous
+python-redmine or psycopg2 call made directly inside a tool stalls all
+other requests.  Tools hand such calls to one of the named executors
+defined here instead.  Each executor has a fixed worker count, a per-call
+timeout and counters describing queue depth and outcomes, which are
+exposed through the health endpoints.
+
+Configuration (environment):
+    REDMINE_EXECUTOR_WORKERS    worker threads for Redmine calls (default 16)
+    WAREHOUSE_EXECUTOR_WORKERS  worker threads for warehouse calls (default 8)
+    REDMINE_CALL_TIMEOUT        seconds before a Redmine call is abandoned
+                                (default 60, 0 disables)
+    WAREHOUSE_CALL_TIMEOUT      seconds before a warehouse call is abandoned
+                                (default 120, 0 disables)
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingCallTimeout(TimeoutError):
+    """Raised when a call handed to an executor does not finish in time."""
+
+    def __init__(self, executor_name: str, timeout: float):
+        self.executor_name = executor_name
+        self.timeout = timeout
+        super().__init__(
+            f"Blocking {executor_name} call did not complete within {timeout:g}s"
+        )
+
+
+class BoundedExecutor:
+    """A fixed-size thread pool with a per-call timeout and queue metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        default_timeout: Optional[float] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.name = name
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout or None
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{name}-io"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._max_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    def _invoke(self, func: Callable, enqueued_at: float) -> Any:
+        started = time.monotonic()
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += started - enqueued_at
+        try:
+            result = func()
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        else:
+            with self._lock:
+                self._completed += 1
+            return result
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._total_run += time.monotonic() - started
+
+    def _forget_cancelled(self, future: Future) -> None:
+        # A future cancelled before a worker picked it up never reaches
+        # _invoke (wait_for timeout, caller cancelled, shutdown)
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    async def run(
+        self,
+        func: Callable,
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            BlockingCallTimeout: The call did not finish within ``timeout``
+                (or the executor default).  The worker thread keeps running
+                until the underlying call returns, but the caller is released.
+        """
+        call = functools.partial(func, *args, **kwargs) if args or kwargs else func
+        with self._lock:
+            self._queued += 1
+            self._submitted += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+        try:
+            future = self._pool.submit(self._invoke, call, time.monotonic())
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(self._forget_cancelled)
+
+        limit = self.default_timeout if timeout is None else timeout
+        wrapped = asyncio.wrap_future(future)
+        if not limit:
+            return await wrapped
+        try:
+            return await asyncio.wait_for(wrapped, limit)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            logger.warning(
+                f"{self.name} executor call timed out after {limit:g}s "
+                f"(queued={self._queued}, active={self._active})"
+            )
+            raise BlockingCallTimeout(self.name, limit) from None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool size, queue depth and call outcomes."""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "max_workers": self.max_workers,
+                "timeout_seconds": self.default_timeout,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "active": self._active,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": (
+                    round(self._total_wait / finished * 1000, 2) if finished else 0.0
+                ),
+                "avg_run_ms": (
+                    round(self._total_run / finished * 1000, 2) if finished else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _env_number(name: str, default: float, cast=int):
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
+_EXECUTOR_DEFAULTS = {
+    "redmine": ("REDMINE_EXECUTOR_WORKERS", 16, "REDMINE_CALL_TIMEOUT", 60.0),
+    "warehouse": ("WAREHOUSE_EXECUTOR_WORKERS", 8, "WAREHOUSE_CALL_TIMEOUT", 120.0),
+}
+
+_executors: Dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Return the process-wide executor called ``name``, creating it lazily."""
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            workers_env, workers, timeout_env, timeout = _EXECUTOR_DEFAULTS.get(
+                name, (f"{name.upper()}_EXECUTOR_WORKERS", 4, None, 60.0)
+            )
+            executor = BoundedExecutor(
+                name,
+                max_workers=max(1, _env_number(workers_env, workers)),
+                default_timeout=(
+                    _env_number(timeout_env, timeout, float) if timeout_env else timeout
+                ),
+            )
+            _executors[name] = executor
+        return executor
+
+
+async def run_redmine(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Redmine API call on the Redmine executor.
+
+    Lazy python-redmine ResourceSets only hit the network when iterated, so
+    callers must materialise them inside ``func`` (e.g. ``lambda:
+    list(redmine.issue.filter(...))``).  Long-running jobs (syncs, backfills)
+    pass ``timeout=0`` so they are awaited to completion instead of being
+    reported as timed out while the worker keeps going.
+    """
+    return await get_executor("redmine").run(func, *args, **kwargs)
+
+
+async def run_warehouse(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking warehouse (PostgreSQL) call on the warehouse executor."""
+    return await get_executor("warehouse").run(func, *args, **kwargs)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, Any]]:
+    """Return stats for every executor created so far."""
+    return {name: ex.get_stats() for name, ex in list(_executors.items())}
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down all executors (used on process exit and in tests)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
@@ -0,0 +1,367 @@
+"""Concurrent offset pagination for Redmine list endpoints.
+
+Redmine list endpoints (``issues.json``, ``projects.json``, ...) return
+``total_count`` with every page.  :class:`OffsetPaginator` reads it from the
+first page and then fetches the remaining offsets concurrently, keeping at
+most ``concurrency`` requests in flight.  Pages are still delivered in offset
+order, and records that shift across a page boundary while the fetch is in
+progress (an issue created or deleted mid-pull) are only delivered once.
+
+Sync jobs consume the pages as a stream: :func:`iter_issue_pages` yields
+one page at a time and :func:`load_pages` writes each page before the next
+one is requested, so a project of any size syncs in memory bounded by the
+page size and the in-flight window.
+
+Tools that accept a ``limit`` above the 100-per-request API cap use
+:func:`fetch_window`, which splits the window into 100-record sub-requests
+fetched concurrently (bounded across all tool calls) and returns them in
+offset order.
+
+List tools hand out opaque cursors (:func:`encode_cursor`) carrying the
+validated filters and the next offset, signed with an HMAC so a cursor
+returned by a client can be used without validating its contents again.
+
+Configuration (environment):
+    REDMINE_PAGE_CONCURRENCY    pages fetched in parallel per pull (default 4,
+                                1 restores strictly sequential paging)
+    SYNC_BATCH_SIZE             issues per page for sync jobs (default 100)
+    REDMINE_SUBREQUEST_CONCURRENCY
+                                sub-requests of large tool limits in flight
+                                across all tool calls (default 8)
+    REDMINE_CURSOR_SECRET       key for signing cursors (default: random per
+                                process, so cursors expire on restart)
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def _default_concurrency() -> int:
+    return _env_positive_int("REDMINE_PAGE_CONCURRENCY", 4)
+
+
+def default_page_size() -> int:
+    """Page size used by sync jobs (``SYNC_BATCH_SIZE``, default 100)."""
+    return _env_positive_int("SYNC_BATCH_SIZE", DEFAULT_PAGE_SIZE)
+
+
+class OffsetPaginator:
+    """Iterate over the pages of an offset/limit paginated endpoint.
+
+    Args:
+        fetch: Callable taking the query params of one page and returning the
+            decoded JSON body, e.g. ``lambda p: transport.get_json("issues.json", p)``.
+        params: Query params shared by every page (``offset``/``limit`` are
+            managed by the paginator).
+        page_size: Records requested per page.
+        concurrency: Maximum pages in flight; defaults to
+            ``REDMINE_PAGE_CONCURRENCY``.
+        container: Key of the record list in the response body.
+        key: Record field used to drop duplicates.
+        sort: Sort order requested unless ``params`` already sets one.  A
+            stable ascending order means records created during the pull land
+            after the pages being fetched instead of shifting them.
+
+    Iterating yields one de-duplicated list of records per page, in order.
+    ``total_count`` is available once the first page has been fetched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[Dict[str, Any]], Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: Optional[int] = None,
+        container: str = "issues",
+        key: str = "id",
+        sort: Optional[str] = "id",
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self.fetch = fetch
+        self.params = dict(params or {})
+        if sort:
+            self.params.setdefault("sort", sort)
+        self.page_size = page_size
+        self.concurrency = concurrency or _default_concurrency()
+        self.container = container
+        self.key = key
+        self.total_count: Optional[int] = None
+        self.duplicates = 0
+        self._seen: set = set()
+
+    def _fetch(self, offset: int) -> Dict[str, Any]:
+        return self.fetch({**self.params, "offset": offset, "limit": self.page_size})
+
+    def _unique(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        page = []
+        for record in records:
+            record_key = record.get(self.key)
+            if record_key is not None:
+                if record_key in self._seen:
+                    self.duplicates += 1
+                    continue
+                self._seen.add(record_key)
+            page.append(record)
+        return page
+
+    def __iter__(self) -> Iterator[List[Dict[str, Any]]]:
+        return self.pages()
+
+    def pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each page's records in offset order."""
+        self._seen = set()
+        self.duplicates = 0
+
+        data = self._fetch(0)
+        records = data.get(self.container, [])
+        self.total_count = data.get("total_count")
+        yield self._unique(records)
+        if len(records) < self.page_size:
+            return
+
+        offset, last_len = 0, len(records)
+        if self.total_count is not None and self.concurrency > 1:
+            offsets = iter(range(self.page_size, self.total_count, self.page_size))
+            window = deque()
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="redmine-page"
+            ) as pool:
+                try:
+                    for next_offset in islice(offsets, self.concurrency):
+                        window.append(
+                            (next_offset, pool.submit(self._fetch, next_offset))
+                        )
+                    while window:
+                        offset, future = window.popleft()
+                        next_offset = next(offsets, None)
+                        if next_offset is not None:
+                            window.append(
+                                (next_offset, pool.submit(self._fetch, next_offset))
+                            )
+                        data = future.result()
+                        records = data.get(self.container, [])
+                        last_len = len(records)
+                        yield self._unique(records)
+                finally:
+                    for _, pending in window:
+                        pending.cancel()
+
+            # Records created during the pull push the tail past the
+            # original total_count; pick those up sequentially.
+            latest_total = data.get("total_count", self.total_count)
+            if last_len < self.page_size or offset + self.page_size >= latest_total:
+                self._log_duplicates()
+                return
+
+        while True:
+            offset += self.page_size
+            data = self._fetch(offset)
+            records = data.get(self.container, [])
+            yield self._unique(records)
+            if len(records) < self.page_size:
+                break
+        self._log_duplicates()
+
+    def _log_duplicates(self) -> None:
+        if self.duplicates:
+            logger.debug(
+                f"Dropped {self.duplicates} {self.container} that shifted "
+                f"between pages during the fetch"
+            )
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        """Yield records one by one across all pages."""
+        for page in self.pages():
+            yield from page
+
+    def fetch_all(self) -> List[Dict[str, Any]]:
+        """Fetch every page and return the records as one list."""
+        return list(self.items())
+
+
+def iter_issue_pages(
+    params: Dict[str, Any],
+    page_size: Optional[int] = None,
+    timeout: Optional[float] = 60,
+    concurrency: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield ``issues.json`` pages for ``params`` over the shared transport."""
+    from .transport import get_redmine_transport
+
+    transport = get_redmine_transport()
+    yield from OffsetPaginator(
+        lambda page_params: transport.get_json(
+            "issues.json", page_params, timeout=timeout
+        ),
+        params=params,
+        page_size=page_size or default_page_size(),
+        concurrency=concurrency,
+    )
+
+
+def load_pages(
+    pages: Iterable[List[Dict[str, Any]]],
+    load: Callable[[List[Dict[str, Any]]], int],
+    transform: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+    label: str = "issues",
+) -> Tuple[int, int]:
+    """Run a fetch -> transform -> load pipeline one page at a time.
+
+    Each page is handed to ``load`` (which returns the number of records it
+    wrote) and released before the next page is consumed.  Errors propagate
+    to the caller: a fetch error (raised once the transport has exhausted its
+    retries) leaves the pages loaded so far in place, but must not be
+    mistaken for a complete sync.
+
+    Returns:
+        Tuple of (fetched_count, loaded_count)
+    """
+    fetched = loaded = 0
+    pages = iter(pages)
+    while True:
+        try:
+            page = next(pages)
+        except StopIteration:
+            break
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch {label} after {fetched} records "
+                f"({loaded} loaded): {e}"
+            )
+            raise
+
+        fetched += len(page)
+        if transform is not None:
+            page = transform(page)
+        if page:
+            loaded += load(page)
+        logger.debug(f"Loaded {loaded}/{fetched} {label}")
+    return fetched, loaded
+
+
+# One semaphore per event loop (asyncio primitives are bound to a loop)
+_subrequest_semaphores: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _subrequest_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _subrequest_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(
+            _env_positive_int("REDMINE_SUBREQUEST_CONCURRENCY", 8)
+        )
+        _subrequest_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def fetch_window(
+    fetch: Callable[[int, int], Awaitable[Tuple[List[Any], Optional[int]]]],
+    offset: int,
+    limit: int,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[List[Any]], Optional[int]]:
+    """Fetch ``limit`` records from ``offset`` in ``page_size`` sub-requests.
+
+    ``fetch(offset, limit)`` returns one page of records and the total count
+    (or None if unknown).  The first page is fetched alone; if it is full the
+    rest of the window (clipped to the total when known) is requested
+    concurrently.
+
+    Returns:
+        Tuple of (pages in offset order, total count or None)
+    """
+    semaphore = _subrequest_semaphore()
+
+    async def fetch_page(page_offset: int, page_limit: int):
+        async with semaphore:
+            return await fetch(page_offset, page_limit)
+
+    first_limit = min(limit, page_size)
+    records, total = await fetch_page(offset, first_limit)
+    if limit <= page_size or len(records) < first_limit:
+        return [records], total
+
+    end = offset + limit if total is None else min(offset + limit, total)
+    results = await asyncio.gather(
+        *(
+            fetch_page(page_offset, min(page_size, end - page_offset))
+            for page_offset in range(offset + page_size, end, page_size)
+        )
+    )
+    pages = [records]
+    for page, page_total in results:
+        pages.append(page)
+        if page_total is not None:
+            total = page_total
+    return pages, total
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor that was tampered with or signed by another key."""
+
+
+_cursor_key: Optional[bytes] = None
+
+
+def _get_cursor_key() -> bytes:
+    global _cursor_key
+    if _cursor_key is None:
+        secret = os.getenv("REDMINE_CURSOR_SECRET")
+        _cursor_key = secret.encode() if secret else secrets.token_bytes(32)
+    return _cursor_key
+
+
+def _sign(payload: bytes) -> str:
+    digest = hmac.new(_get_cursor_key(), payload, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode ``state`` (JSON-serializable) as a signed, URL-safe token."""
+    payload = json.dumps(state, separators=(",", ":"), sort_keys=True, default=str)
+    body = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+    return f"{body}.{_sign(body.encode())}"
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """Return the state of a token made by :func:`encode_cursor`."""
+    body, _, signature = str(token).partition(".")
+    if not signature or not hmac.compare_digest(signature, _sign(body.encode())):
+        raise InvalidCursorError("Invalid or expired pagination cursor.")
+    return json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
@@ -0,0 +1,244 @@
+"""Adaptive rate limiting for Redmine API traffic.
+
+:class:`AdaptiveRateLimiter` combines a token bucket (requests per second)
+with an AIMD (additive increase, multiplicative decrease) concurrency limit.
+Every request sent through :class:`~.transport.PooledHTTPAdapter` - the
+python-redmine client and the raw ``*.json`` callers alike - acquires a slot
+before it goes out and reports its outcome when it returns:
+
+* a success faster than the latency target grows the concurrency limit by
+  one per window of successful requests and nudges the rate up;
+* a 429, a 5xx or a connection error/timeout halves both (at most once per
+  cooldown period, so one burst of failures counts as one congestion
+  event), and a ``Retry-After`` header pauses the bucket.
+
+Throughput therefore follows the headroom the server actually has.
+
+Configuration (environment):
+    REDMINE_RATE_LIMIT          initial requests per second (default 20,
+                                0 disables limiting)
+    REDMINE_RATE_LIMIT_MAX      ceiling the rate may grow to (default 100)
+    REDMINE_MAX_CONCURRENCY     ceiling for in-flight requests (default: the
+                                HTTP pool size)
+    REDMINE_LATENCY_TARGET_MS   responses slower than this do not grow the
+                                limits (default 1000)
+"""
+
+import logging
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the delay in seconds encoded in a ``Retry-After`` header."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """Token bucket plus AIMD concurrency limit shared by all Redmine calls."""
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        max_rate: float = 100.0,
+        min_rate: float = 1.0,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 20,
+        min_concurrency: int = 1,
+        latency_target: float = 1.0,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = max(max_rate, rate)
+        self.min_rate = min(min_rate, rate)
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+
+        self._cond = threading.Condition()
+        self._rate = float(rate)
+        self._limit = max(
+            self.min_concurrency, min(initial_concurrency, self.max_concurrency)
+        )
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._successes_in_window = 0
+        self._in_flight = 0
+
+        self._requests = 0
+        self._throttled = 0
+        self._overloads = 0
+        self._increases = 0
+        self._decreases = 0
+        self._total_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def _refill(self, now: float) -> None:
+        burst = max(1.0, float(self._limit))
+        self._tokens = min(burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    def acquire(self) -> float:
+        """Block until a token and a concurrency slot are free.
+
+        Returns:
+            The monotonic start time to pass back to :meth:`release`.
+        """
+        requested = time.monotonic()
+        waited = False
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if (
+                    self._in_flight < self._limit
+                    and self._tokens >= 1.0
+                    and now >= self._paused_until
+                ):
+                    self._tokens -= 1.0
+                    self._in_flight += 1
+                    self._requests += 1
+                    if waited:
+                        self._throttled += 1
+                    self._total_wait += now - requested
+                    return now
+
+                waited = True
+                if self._in_flight >= self._limit:
+                    # Woken by release(); the timeout guards against a
+                    # limit change that happened without a notify.
+                    timeout = 1.0
+                else:
+                    timeout = max(
+                        (1.0 - self._tokens) / self._rate, self._paused_until - now
+                    )
+                self._cond.wait(timeout)
+
+    def release(
+        self,
+        started: float,
+        status_code: Optional[int] = None,
+        error: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Record the outcome of a request and adapt the limits."""
+        now = time.monotonic()
+        latency = now - started
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if error or status_code in OVERLOAD_STATUSES:
+                self._on_overload(now, status_code, retry_after)
+            elif latency <= self.latency_target:
+                self._on_success()
+            self._cond.notify_all()
+
+    def _on_success(self) -> None:
+        self._successes_in_window += 1
+        if self._successes_in_window < self._limit:
+            return
+        # One full window of healthy responses: additive increase
+        self._successes_in_window = 0
+        grew = False
+        if self._limit < self.max_concurrency:
+            self._limit += 1
+            grew = True
+        if self._rate < self.max_rate:
+            self._rate = min(self.max_rate, self._rate + max(1.0, self._rate * 0.1))
+            grew = True
+        if grew:
+            self._increases += 1
+
+    def _on_overload(
+        self, now: float, status_code: Optional[int], retry_after: Optional[float]
+    ) -> None:
+        self._overloads += 1
+        self._successes_in_window = 0
+        if retry_after:
+            self._paused_until = max(
+                self._paused_until, now + min(retry_after, MAX_RETRY_AFTER)
+            )
+        if now - self._last_decrease < self.cooldown:
+            return
+        # Multiplicative decrease
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(self.min_concurrency, int(self._limit * self.decrease_factor))
+        self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+        logger.warning(
+            f"Redmine overloaded (status={status_code or 'error'}), backing off to "
+            f"{self._rate:.1f} req/s with {self._limit} concurrent requests"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the current rate, concurrency limit and counters."""
+        with self._cond:
+            return {
+                "rate_per_second": round(self._rate, 2),
+                "concurrency_limit": self._limit,
+                "in_flight": self._in_flight,
+                "max_concurrency": self.max_concurrency,
+                "max_rate": self.max_rate,
+                "paused_seconds": round(
+                    max(0.0, self._paused_until - time.monotonic()), 2
+                ),
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "overloads": self._overloads,
+                "increases": self._increases,
+                "decreases": self._decreases,
+                "avg_wait_ms": (
+                    round(self._total_wait / self._requests * 1000, 2)
+                    if self._requests
+                    else 0.0
+                ),
+            }
+
+    @classmethod
+    def from_env(cls, max_concurrency: int = 20) -> Optional["AdaptiveRateLimiter"]:
+        """Build a limiter from the environment, or None if disabled."""
+        try:
+            rate = float(os.getenv("REDMINE_RATE_LIMIT", "20"))
+            max_rate = float(os.getenv("REDMINE_RATE_LIMIT_MAX", "100"))
+            concurrency = int(os.getenv("REDMINE_MAX_CONCURRENCY", max_concurrency))
+            latency_ms = float(os.getenv("REDMINE_LATENCY_TARGET_MS", "1000"))
+        except ValueError as e:
+            logger.warning(f"Invalid Redmine rate limit settings ({e}), using defaults")
+            rate, max_rate, concurrency, latency_ms = 20.0, 100.0, max_concurrency, 1000
+        if rate <= 0:
+            return None
+        return cls(
+            rate=rate,
+            max_rate=max_rate,
+            max_concurrency=concurrency,
+            latency_target=latency_ms / 1000.0,
+        )
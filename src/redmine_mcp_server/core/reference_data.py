@@ -0,0 +1,284 @@
+"""In-memory catalog of slow-changing Redmine reference data.
+
+Issue statuses, trackers, priorities, roles, users, projects and groups
+rarely change, yet several hot paths used to fetch them on every call
+(resolving a status name in ``update_redmine_issue``, a project name for
+every subscription push, group members for every workload analysis).
+:class:`ReferenceCatalog` loads each dataset on first use and then answers
+name <-> id lookups from dictionaries.
+
+Once a dataset is older than its TTL the current copy keeps being served
+while a background thread reloads it, so callers never wait on a refresh.
+A lookup that misses forces one synchronous reload (at most once per
+``miss_refresh_interval``) to pick up entries created since the last load.
+If a reload fails the previous copy is kept.
+
+Datasets are loaded over the shared REST transport by default; other
+loaders (e.g. the python-redmine client) can be plugged in with
+:meth:`ReferenceCatalog.register`.
+
+Configuration (environment):
+    REDMINE_REFERENCE_TTL   seconds before a dataset is refreshed in the
+                            background (default 3600)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .pagination import OffsetPaginator
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], List[Dict[str, Any]]]
+
+# dataset -> (endpoint, container, paginated)
+REST_DATASETS = {
+    "statuses": ("issue_statuses.json", "issue_statuses", False),
+    "trackers": ("trackers.json", "trackers", False),
+    "priorities": ("enumerations/issue_priorities.json", "issue_priorities", False),
+    "roles": ("roles.json", "roles", False),
+    "users": ("users.json", "users", True),
+    "projects": ("projects.json", "projects", True),
+    "groups": ("groups.json", "groups", True),
+}
+
+
+def _rest_loader(endpoint: str, container: str, paginated: bool) -> Loader:
+    def load() -> List[Dict[str, Any]]:
+        from .transport import get_redmine_transport
+
+        transport = get_redmine_transport()
+        if not paginated:
+            return transport.get_json(endpoint).get(container, [])
+        return OffsetPaginator(
+            lambda params: transport.get_json(endpoint, params),
+            container=container,
+            sort=None,
+        ).fetch_all()
+
+    return load
+
+
+def _display_name(record: Dict[str, Any]) -> str:
+    name = record.get("name")
+    if name is None and ("firstname" in record or "lastname" in record):
+        name = f"{record.get('firstname', '')} {record.get('lastname', '')}".strip()
+    return str(name if name is not None else record.get("login", ""))
+
+
+class _Dataset:
+    __slots__ = ("records", "by_id", "by_name", "loaded_at", "refreshing")
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+        self.by_id = {str(r["id"]): r for r in records if r.get("id") is not None}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            for key in (_display_name(record), record.get("identifier")):
+                if key:
+                    self.by_name.setdefault(str(key).lower(), record)
+        self.loaded_at = time.monotonic()
+        self.refreshing = False
+
+
+class ReferenceCatalog:
+    """Lazily loaded, TTL-refreshed reference datasets with lookups."""
+
+    def __init__(
+        self,
+        loaders: Optional[Dict[str, Loader]] = None,
+        ttl: float = 3600.0,
+        miss_refresh_interval: float = 60.0,
+    ):
+        self.ttl = ttl
+        self.miss_refresh_interval = miss_refresh_interval
+        self._loaders: Dict[str, Loader] = {
+            name: _rest_loader(*spec) for name, spec in REST_DATASETS.items()
+        }
+        self._loaders.update(loaders or {})
+        self._datasets: Dict[str, _Dataset] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._loads = 0
+        self._background_refreshes = 0
+        self._failures = 0
+        self._hits = 0
+
+    def register(self, name: str, loader: Loader) -> None:
+        """Use ``loader`` for dataset ``name`` (drops any loaded copy)."""
+        with self._lock:
+            self._loaders[name] = loader
+            self._datasets.pop(name, None)
+
+    def _load(self, name: str) -> _Dataset:
+        loader = self._loaders.get(name)
+        if loader is None:
+            raise KeyError(f"Unknown reference dataset '{name}'")
+        requested = time.monotonic()
+        with self._lock:
+            load_lock = self._load_locks.setdefault(name, threading.Lock())
+        with load_lock:
+            with self._lock:
+                current = self._datasets.get(name)
+            if current is not None and current.loaded_at >= requested:
+                # Another caller finished loading while we waited
+                return current
+            try:
+                dataset = _Dataset(list(loader()))
+            except Exception:
+                with self._lock:
+                    self._failures += 1
+                    current = self._datasets.get(name)
+                    if current is not None:
+                        current.refreshing = False
+                raise
+            with self._lock:
+                self._datasets[name] = dataset
+                self._loads += 1
+            logger.debug(f"Loaded {len(dataset.records)} {name} into reference data")
+            return dataset
+
+    def _refresh_in_background(self, name: str) -> None:
+        def run():
+            try:
+                self._load(name)
+            except Exception as e:
+                logger.warning(f"Background refresh of {name} failed: {e}")
+
+        with self._lock:
+            self._background_refreshes += 1
+        threading.Thread(
+            target=run, name=f"reference-refresh-{name}", daemon=True
+        ).start()
+
+    def _dataset(self, name: str) -> _Dataset:
+        with self._lock:
+            dataset = self._datasets.get(name)
+            if dataset is not None:
+                self._hits += 1
+                stale = time.monotonic() - dataset.loaded_at >= self.ttl
+                if stale and not dataset.refreshing:
+                    dataset.refreshing = True
+                else:
+                    stale = False
+        if dataset is None:
+            return self._load(name)
+        if stale:
+            self._refresh_in_background(name)
+        return dataset
+
+    def _lookup(self, name: str, index: str, key: str) -> Optional[Dict[str, Any]]:
+        dataset = self._dataset(name)
+        record = getattr(dataset, index).get(key)
+        if (
+            record is None
+            and time.monotonic() - dataset.loaded_at >= self.miss_refresh_interval
+        ):
+            # Possibly created since the last load
+            try:
+                record = getattr(self._load(name), index).get(key)
+            except Exception as e:
+                logger.warning(f"Reloading {name} after a lookup miss failed: {e}")
+        return record
+
+    def get(self, name: str) -> List[Dict[str, Any]]:
+        """All records of dataset ``name`` (read-only)."""
+        return self._dataset(name).records
+
+    def find(self, name: str, id_or_name: Any) -> Optional[Dict[str, Any]]:
+        """Record whose id, name or identifier matches (case-insensitive)."""
+        record = self._dataset(name).by_id.get(str(id_or_name))
+        if record is not None:
+            return record
+        return self._lookup(name, "by_name", str(id_or_name).lower())
+
+    def id_for(self, name: str, value_name: str) -> Optional[int]:
+        """Id of the record called ``value_name`` in dataset ``name``."""
+        record = self._lookup(name, "by_name", str(value_name).lower())
+        return record.get("id") if record is not None else None
+
+    def name_for(self, name: str, record_id: Any) -> Optional[str]:
+        """Display name of record ``record_id`` in dataset ``name``."""
+        record = self._lookup(name, "by_id", str(record_id))
+        return _display_name(record) if record is not None else None
+
+    def group_members(self, group_name: str) -> Set[str]:
+        """Names of the users in the group called ``group_name``."""
+        group = self.find("groups", group_name)
+        if group is None:
+            return set()
+        name = f"group_members:{group['id']}"
+        if name not in self._loaders:
+            with self._lock:
+                self._loaders.setdefault(name, self._group_members_loader(group["id"]))
+        return {_display_name(user) for user in self.get(name)}
+
+    @staticmethod
+    def _group_members_loader(group_id: Any) -> Loader:
+        def load() -> List[Dict[str, Any]]:
+            from .transport import get_redmine_transport
+
+            data = get_redmine_transport().get_json(
+                f"groups/{group_id}.json", {"include": "users"}
+            )
+            return data.get("group", {}).get("users", [])
+
+        return load
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one dataset (or all) so the next access reloads it."""
+        with self._lock:
+            if name is None:
+                self._datasets.clear()
+            else:
+                self._datasets.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "ttl_seconds": self.ttl,
+                "datasets": {
+                    name: {
+                        "records": len(dataset.records),
+                        "age_seconds": round(now - dataset.loaded_at, 1),
+                    }
+                    for name, dataset in self._datasets.items()
+                },
+                "lookups": self._hits,
+                "loads": self._loads,
+                "background_refreshes": self._background_refreshes,
+                "failures": self._failures,
+            }
+
+
+_catalog: Optional[ReferenceCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_reference_catalog() -> ReferenceCatalog:
+    """Return the process-wide catalog."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                try:
+                    ttl = float(os.getenv("REDMINE_REFERENCE_TTL", "3600"))
+                except ValueError:
+                    logger.warning("Ignoring invalid REDMINE_REFERENCE_TTL")
+                    ttl = 3600.0
+                _catalog = ReferenceCatalog(ttl=ttl)
+    return _catalog
+
+
+def clear_reference_data() -> None:
+    """Forget all loaded datasets (used by tests)."""
+    if _catalog is not None:
+        _catalog.invalidate()
+
+
+def get_reference_stats() -> Dict[str, Any]:
+    return get_reference_catalog().get_stats()
@@ -0,0 +1,245 @@
+"""Retries and circuit breaking for Redmine HTTP calls.
+
+Both are applied inside :class:`~.transport.PooledHTTPAdapter`, so they cover
+the python-redmine client and every raw REST caller:
+
+* :class:`RetryPolicy` retries idempotent requests (GET/HEAD/OPTIONS) that
+  failed with a connection error, a timeout or a 429/502/503/504 response,
+  sleeping a full-jitter exponential backoff (or ``Retry-After``) between
+  attempts.
+* :class:`CircuitBreaker` (one per host, kept in a
+  :class:`CircuitBreakerRegistry`) opens after consecutive failures and then
+  rejects calls immediately with :class:`CircuitOpenError` instead of letting
+  every worker wait out a 30-60s timeout.  After ``reset_timeout`` one trial
+  request is let through; its outcome closes or re-opens the circuit.
+
+Configuration (environment):
+    REDMINE_RETRY_MAX               retries per idempotent request (default 3,
+                                    0 disables)
+    REDMINE_RETRY_BACKOFF_BASE      first backoff ceiling in seconds (default 0.5)
+    REDMINE_RETRY_BACKOFF_MAX       backoff ceiling in seconds (default 8)
+    REDMINE_BREAKER_FAILURES        consecutive failures that open the circuit
+                                    (default 5, 0 disables)
+    REDMINE_BREAKER_RESET_SECONDS   seconds before a trial request (default 30)
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without contacting Redmine while its circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(
+            f"Redmine at {host} is unavailable (circuit open, "
+            f"next attempt in {retry_in:.0f}s)"
+        )
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a transport exception is worth retrying."""
+    if isinstance(error, (CircuitOpenError, requests.exceptions.SSLError)):
+        return False
+    return isinstance(
+        error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    )
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for idempotent requests."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def should_retry(
+        self,
+        method: Optional[str],
+        attempt: int,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Whether attempt number ``attempt`` (0-based) may be retried."""
+        if attempt >= self.max_retries:
+            return False
+        if (method or "").upper() not in IDEMPOTENT_METHODS:
+            return False
+        if error is not None:
+            return is_transient_error(error)
+        return status_code in RETRY_STATUSES
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry ``attempt + 1`` (full jitter)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        try:
+            return cls(
+                max_retries=int(os.getenv("REDMINE_RETRY_MAX", "3")),
+                backoff_base=float(os.getenv("REDMINE_RETRY_BACKOFF_BASE", "0.5")),
+                backoff_max=float(os.getenv("REDMINE_RETRY_BACKOFF_MAX", "8")),
+            )
+        except ValueError as e:
+            logger.warning(f"Invalid Redmine retry settings ({e}), using defaults")
+            return cls()
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one Redmine host."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trips = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or raise :class:`CircuitOpenError`."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = True
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (now - self._opened_at))
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            trial_failed = self._state == self.HALF_OPEN
+            self._trial_in_flight = False
+            if trial_failed or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trips += 1
+                logger.warning(
+                    f"Circuit for {self.name} opened after {self._failures} "
+                    f"consecutive failures; failing fast for {self.reset_timeout:g}s"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "trips": self._trips,
+                "rejected": self._rejected,
+                "retry_in_seconds": (
+                    round(max(0.0, self.reset_timeout - (now - self._opened_at)), 1)
+                    if state == self.OPEN
+                    else 0.0
+                ),
+            }
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by host."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(host)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        host, self.failure_threshold, self.reset_timeout
+                    )
+                    self._breakers[host] = breaker
+        return breaker
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {host: b.get_stats() for host, b in list(self._breakers.items())}
+
+    def overall_state(self) -> str:
+        """Worst state across hosts (``closed`` when no host was contacted)."""
+        states = {b.state for b in list(self._breakers.values())}
+        for state in (CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+            if state in states:
+                return state
+        return CircuitBreaker.CLOSED
+
+    @classmethod
+    def from_env(cls) -> Optional["CircuitBreakerRegistry"]:
+        """Build a registry from the environment, or None if disabled."""
+        try:
+            failures = int(os.getenv("REDMINE_BREAKER_FAILURES", "5"))
+            reset = float(os.getenv("REDMINE_BREAKER_RESET_SECONDS", "30"))
+        except ValueError as e:
+            logger.warning(f"Invalid Redmine breaker settings ({e}), using defaults")
+            failures, reset = 5, 30.0
+        if failures <= 0:
+            return None
+        return cls(failure_threshold=failures, reset_timeout=reset)
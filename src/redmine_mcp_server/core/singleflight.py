@@ -0,0 +1,111 @@
+"""In-flight de-duplication of identical concurrent reads.
+
+When several agents ask for the same issue, project list or wiki page at the
+same time, only the first call (the leader) goes to Redmine; the others join
+it and receive the same result, or the same exception.  Nothing is cached:
+once the upstream fetch completes its key is forgotten, so the next call
+fetches fresh data.
+
+Results are shared between callers and must be treated as read-only.
+
+The upstream fetch runs as its own task, so a leader whose request is
+cancelled (e.g. the client disconnected) does not fail the callers that
+joined it.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_normalize(v) for v in value]
+        if isinstance(value, (set, frozenset)):
+            items.sort(key=repr)
+        return tuple(items)
+    if isinstance(value, (bool, type(None), float)):
+        return value
+    # Redmine accepts ids as ints or strings interchangeably
+    return str(value)
+
+
+def request_key(resource: str, *args: Any, **params: Any) -> Tuple[Hashable, ...]:
+    """Build a normalized key for a read of ``resource``.
+
+    Positional ``args`` identify the resource (id, title, ...) and ``params``
+    hold includes and filters; parameter order and int/str ids do not change
+    the key.
+    """
+    return (resource, _normalize(args), _normalize(params))
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls that share a key."""
+
+    def __init__(self, name: str = "redmine"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``func()``, or the identical call already in flight."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._calls.get(key)
+            if task is not None and task.get_loop() is loop and not task.done():
+                self._coalesced += 1
+            else:
+                task = loop.create_task(func())
+                self._calls[key] = task
+                self._leaders += 1
+                task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._calls.get(key) is task:
+                del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._leaders + self._coalesced
+            return {
+                "in_flight": len(self._calls),
+                "upstream_calls": self._leaders,
+                "coalesced": self._coalesced,
+                "coalesced_ratio": round(self._coalesced / total, 3) if total else 0.0,
+            }
+
+
+_group: Optional[SingleFlight] = None
+_group_lock = threading.Lock()
+
+
+def get_singleflight() -> SingleFlight:
+    """Return the process-wide group used by the read tools."""
+    global _group
+    if _group is None:
+        with _group_lock:
+            if _group is None:
+                _group = SingleFlight()
+    return _group
+
+
+async def coalesce(key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``func`` through the shared group under ``key``."""
+    return await get_singleflight().do(key, func)
+
+
+def get_singleflight_stats() -> Dict[str, Any]:
+    return get_singleflight().get_stats()
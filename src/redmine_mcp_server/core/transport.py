@@ -0,0 +1,356 @@
+"""Shared, pooled HTTP transport for the Redmine REST API.
+
+Services that talk to ``*.json`` endpoints directly (sync, analysis and
+reporting code) used to call ``requests.get`` for every page, which opens a
+fresh TCP/TLS connection each time.  This module provides a single
+process-wide keep-alive session that carries the same authentication and
+SSL settings ``redmine_handler`` builds for the python-redmine client.  The
+python-redmine client itself is wired to the same connection pool through
+:class:`PooledSyncEngine`, so the adaptive rate limiter attached to the pool
+(see :mod:`.ratelimit`) governs all Redmine traffic.
+
+Configuration (environment):
+    REDMINE_HTTP_POOL_MAXSIZE   keep-alive connections kept per host (default 20)
+    REDMINE_HTTP_POOL_BLOCK     wait for a free connection instead of opening
+                                an extra one when the pool is busy (default true)
+    REDMINE_HTTP_TIMEOUT        default request timeout in seconds (default 30)
+
+Rate limiting is configured through the ``REDMINE_RATE_LIMIT*`` variables
+described in :mod:`.ratelimit`; retries and circuit breaking through the
+``REDMINE_RETRY_*``/``REDMINE_BREAKER_*`` variables in :mod:`.resilience`.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from redminelib.engines.sync import SyncEngine
+
+from .ratelimit import AdaptiveRateLimiter, parse_retry_after
+from .resilience import (
+    FAILURE_STATUSES,
+    CircuitBreakerRegistry,
+    RetryPolicy,
+    is_transient_error,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter adding rate limiting, retries and a per-host circuit breaker.
+
+    Every attempt acquires a rate limiter slot and is admitted by the host's
+    circuit breaker; idempotent requests that fail transiently are retried
+    according to ``retry_policy``.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+        **kwargs: Any,
+    ):
+        self._stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.request_errors = 0
+        self.retries = 0
+        self.total_request_time = 0.0
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.breakers = breakers
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args: Any, **kwargs: Any):
+        breaker = (
+            self.breakers.get(urlparse(request.url).netloc)
+            if self.breakers is not None
+            else None
+        )
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_call()
+            retry_after = None
+            try:
+                response = self._send_once(request, *args, **kwargs)
+            except Exception as e:
+                if breaker is not None:
+                    if is_transient_error(e):
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if self.retry_policy is None or not self.retry_policy.should_retry(
+                    request.method, attempt, error=e
+                ):
+                    raise
+                reason = type(e).__name__
+            else:
+                if breaker is not None:
+                    if response.status_code in FAILURE_STATUSES:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                if self.retry_policy is None or not self.retry_policy.should_retry(
+                    request.method, attempt, status_code=response.status_code
+                ):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                reason = f"HTTP {response.status_code}"
+                response.close()
+
+            delay = self.retry_policy.backoff(attempt, retry_after)
+            attempt += 1
+            with self._stats_lock:
+                self.retries += 1
+            logger.info(
+                f"Retrying {request.method} {request.url} after {reason} "
+                f"(attempt {attempt}/{self.retry_policy.max_retries}, "
+                f"sleeping {delay:.2f}s)"
+            )
+            time.sleep(delay)
+
+    def _send_once(self, request, *args: Any, **kwargs: Any):
+        limiter = self.rate_limiter
+        started = limiter.acquire() if limiter is not None else time.monotonic()
+        response = None
+        try:
+            response = super().send(request, *args, **kwargs)
+            return response
+        except Exception:
+            with self._stats_lock:
+                self.request_errors += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self.requests_sent += 1
+                self.total_request_time += time.monotonic() - started
+            if limiter is not None:
+                if response is None:
+                    limiter.release(started, error=True)
+                else:
+                    limiter.release(
+                        started,
+                        status_code=response.status_code,
+                        retry_after=parse_retry_after(
+                            response.headers.get("Retry-After")
+                        ),
+                    )
+
+
+class RedmineTransport:
+    """A keep-alive ``requests`` session bound to one Redmine instance."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        pool_maxsize: int = 20,
+        pool_block: bool = True,
+        timeout: float = 30,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.rate_limiter = rate_limiter
+        self.breakers = breakers
+        self.adapter = PooledHTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            breakers=breakers,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.session.verify = verify
+        if cert:
+            self.session.cert = cert
+        if api_key:
+            self.session.headers["X-Redmine-API-Key"] = api_key
+        elif username and password:
+            self.session.auth = (username, password)
+
+    def url(self, endpoint: str) -> str:
+        """Resolve an endpoint such as ``issues.json`` against the base URL."""
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Issue a GET through the shared pool and return the raw response."""
+        return self.session.get(
+            self.url(endpoint),
+            params=params,
+            timeout=timeout or self.timeout,
+            **kwargs,
+        )
+
+    def get_json(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """GET ``endpoint`` and return the decoded JSON body.
+
+        Raises:
+            requests.HTTPError: The response status was not 2xx.
+        """
+        resp = self.get(endpoint, params=params, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return request counters and per-host connection pool statistics."""
+        hosts = {}
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            conn_pool = pools.get(key)
+            if conn_pool is None:
+                continue
+            hosts[f"{conn_pool.scheme}://{conn_pool.host}:{conn_pool.port}"] = {
+                "connections_opened": conn_pool.num_connections,
+                "requests": conn_pool.num_requests,
+                "idle": conn_pool.pool.qsize() if conn_pool.pool else 0,
+                "maxsize": self.pool_maxsize,
+            }
+        sent = self.adapter.requests_sent
+        return {
+            "base_url": self.base_url,
+            "requests_sent": sent,
+            "request_errors": self.adapter.request_errors,
+            "retries": self.adapter.retries,
+            "avg_request_ms": (
+                round(self.adapter.total_request_time / sent * 1000, 2) if sent else 0.0
+            ),
+            "hosts": hosts,
+            "rate_limiter": (
+                self.rate_limiter.get_stats() if self.rate_limiter else None
+            ),
+            "circuit_breakers": self.breakers.get_stats() if self.breakers else {},
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class PooledSyncEngine(SyncEngine):
+    """python-redmine engine whose sessions reuse the shared connection pool.
+
+    python-redmine still builds its own ``requests.Session`` (so per-client
+    headers and options are respected) but the HTTP adapter, and with it the
+    keep-alive connections, comes from the configured :class:`RedmineTransport`.
+    """
+
+    def create_session(self, **params):
+        session = SyncEngine.create_session(**params)
+        transport = _transport
+        if transport is not None:
+            session.mount("http://", transport.adapter)
+            session.mount("https://", transport.adapter)
+        return session
+
+
+_transport: Optional[RedmineTransport] = None
+_transport_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def configure_redmine_transport(
+    base_url: str,
+    api_key: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    requests_config: Optional[Dict[str, Any]] = None,
+) -> RedmineTransport:
+    """Create (or replace) the process-wide transport.
+
+    ``requests_config`` is the same ``verify``/``cert`` mapping passed to the
+    python-redmine client, so both clients share one SSL configuration.
+    """
+    global _transport
+    requests_config = requests_config or {}
+    pool_maxsize = max(1, _env_int("REDMINE_HTTP_POOL_MAXSIZE", 20))
+    transport = RedmineTransport(
+        base_url,
+        api_key=api_key,
+        username=username,
+        password=password,
+        verify=requests_config.get("verify", True),
+        cert=requests_config.get("cert"),
+        pool_maxsize=pool_maxsize,
+        pool_block=os.getenv("REDMINE_HTTP_POOL_BLOCK", "true").lower() == "true",
+        timeout=float(os.getenv("REDMINE_HTTP_TIMEOUT", "30")),
+        rate_limiter=AdaptiveRateLimiter.from_env(max_concurrency=pool_maxsize),
+        retry_policy=RetryPolicy.from_env(),
+        breakers=CircuitBreakerRegistry.from_env(),
+    )
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    if previous is not None:
+        previous.close()
+    return transport
+
+
+def get_redmine_transport() -> RedmineTransport:
+    """Return the shared transport, configuring it from the environment.
+
+    The transport is normally configured when ``redmine_handler`` is imported;
+    importing it here covers scheduler and service entry points that have not
+    done so yet.
+
+    Raises:
+        RuntimeError: REDMINE_URL or credentials are not configured.
+    """
+    if _transport is None:
+        from .. import redmine_handler  # noqa: F401  (configures the transport)
+
+    if _transport is None:
+        raise RuntimeError(
+            "Redmine transport is not configured. "
+            "Set REDMINE_URL and REDMINE_API_KEY (or username/password)."
+        )
+    return _transport
+
+
+def get_transport_stats() -> Optional[Dict[str, Any]]:
+    """Return stats for the shared transport, or None if not configured."""
+    return _transport.get_stats() if _transport is not None else None
+
+
+def get_circuit_state() -> Optional[str]:
+    """Return the worst Redmine circuit state, or None if not tracked."""
+    if _transport is None or _transport.breakers is None:
+        return None
+    return _transport.breakers.overall_state()
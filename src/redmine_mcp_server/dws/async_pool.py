@@ -0,0 +1,294 @@
+"""Event-loop native PostgreSQL connections for read-only warehouse tools.
+
+The MCP tools run on the event loop; the blocking pool in ``pool.py`` can
+only be used from them through the warehouse executor, so a burst of slow
+aggregate queries queues up behind its worker threads.  This pool uses
+psycopg2's asynchronous connections instead: queries are sent without
+blocking and completion is awaited with ``loop.add_reader`` /
+``loop.add_writer`` on the connection socket, so any number of tool calls
+can have queries in flight at once, bounded only by the pool size.
+
+Asynchronous psycopg2 connections are always in autocommit mode, which is
+why this pool serves reads only; writers keep using ``DataWarehouse``.
+Queries given as a ``statements.Statement`` are prepared once per
+connection and executed by name.
+
+One pool is kept per event loop (the server runs a single loop; tests
+create one per test).  psycopg2 is imported when a pool is first created.
+
+Configuration (environment):
+    WAREHOUSE_ASYNC_POOL_MAX  maximum open connections per loop (default 10)
+    WAREHOUSE_POOL_TIMEOUT    seconds to wait for a free connection
+                              (default 30, shared with the blocking pool)
+    WAREHOUSE_POOL_MAX_AGE    seconds before a connection is recycled
+                              (default 1800, 0 disables)
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .pool import WarehousePoolTimeout
+from .statements import Statement, registry
+
+logger = logging.getLogger(__name__)
+
+
+async def wait_ready(conn: Any) -> None:
+    """Drive ``conn.poll()`` until the pending connect or query completes."""
+    import psycopg2.extensions as ext
+
+    loop = asyncio.get_running_loop()
+    while True:
+        state = conn.poll()
+        if state == ext.POLL_OK:
+            return
+        if state == ext.POLL_READ:
+            add, remove = loop.add_reader, loop.remove_reader
+        elif state == ext.POLL_WRITE:
+            add, remove = loop.add_writer, loop.remove_writer
+        else:
+            raise RuntimeError(f"Unexpected psycopg2 poll state: {state}")
+
+        ready = loop.create_future()
+        fd = conn.fileno()
+        add(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            remove(fd)
+
+
+class AsyncWarehousePool:
+    """Bounded pool of asynchronous psycopg2 connections for one event loop."""
+
+    def __init__(
+        self,
+        maxconn: int = 10,
+        timeout: Optional[float] = 30.0,
+        max_age: Optional[float] = 1800.0,
+        **connect_kwargs: Any,
+    ):
+        if maxconn < 1:
+            raise ValueError("maxconn must be at least 1")
+        self.maxconn = maxconn
+        self.timeout = timeout or None
+        self.max_age = max_age or None
+        self._connect_kwargs = connect_kwargs
+        self._slots = asyncio.Semaphore(maxconn)
+        self._idle: List[Tuple[Any, float]] = []
+        self._closed = False
+        self._open = 0
+        self._in_use = 0
+        self._max_in_use = 0
+        self._checkouts = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._timeouts = 0
+        self._queries = 0
+        self._cancelled = 0
+
+    async def _connect(self) -> Tuple[Any, float]:
+        import psycopg2
+
+        conn = psycopg2.connect(async_=1, **self._connect_kwargs)
+        try:
+            await wait_ready(conn)
+        except BaseException:
+            conn.close()
+            raise
+        self._open += 1
+        return conn, time.monotonic()
+
+    def _discard(self, conn: Any) -> None:
+        self._open -= 1
+        if not conn.closed:
+            conn.close()
+
+    async def _checkout(self) -> Tuple[Any, float]:
+        now = time.monotonic()
+        while self._idle:
+            conn, opened_at = self._idle.pop()
+            if conn.closed or (self.max_age and now - opened_at >= self.max_age):
+                self._discard(conn)
+                continue
+            return conn, opened_at
+        return await self._connect()
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """Check out a connection, waiting up to ``timeout`` seconds for one.
+
+        Raises:
+            WarehousePoolTimeout: every connection stayed in use.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            raise WarehousePoolTimeout(timeout) from None
+        waited = time.monotonic() - started
+
+        try:
+            conn, opened_at = await self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._checkouts += 1
+        self._in_use += 1
+        self._max_in_use = max(self._max_in_use, self._in_use)
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        if waited >= 0.001:
+            self._waited += 1
+        try:
+            yield conn
+        finally:
+            self._in_use -= 1
+            if self._closed or conn.closed or conn.isexecuting():
+                self._discard(conn)
+            else:
+                self._idle.append((conn, opened_at))
+            self._slots.release()
+
+    async def fetchall(self, query: Any, params: Any = None) -> List[Dict[str, Any]]:
+        """Run a query and return every row as a dict."""
+        async with self.connection() as conn:
+            cur = await self._execute(conn, query, params)
+            return [dict(row) for row in cur.fetchall()]
+
+    async def fetchone(
+        self, query: Any, params: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        """Run a query and return its first row as a dict (None if empty)."""
+        async with self.connection() as conn:
+            cur = await self._execute(conn, query, params)
+            row = cur.fetchone()
+            return dict(row) if row else None
+
+    async def _execute(self, conn: Any, query: Any, params: Any) -> Any:
+        """Run ``query`` (SQL or a prepared ``Statement``) and return the cursor."""
+        from psycopg2.extras import RealDictCursor
+
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        if not isinstance(query, Statement):
+            await self._run(conn, cur, query, params)
+            return cur
+
+        if registry.needs_prepare(conn, query):
+            started = time.perf_counter()
+            await self._run(conn, cur, query.prepare_sql, None)
+            registry.mark_prepared(conn, query, time.perf_counter() - started)
+        started = time.perf_counter()
+        await self._run(conn, cur, query.execute_sql, tuple(params or ()))
+        registry.record(query, time.perf_counter() - started)
+        return cur
+
+    async def _run(self, conn: Any, cur: Any, query: Any, params: Any) -> None:
+        cur.execute(query, params)
+        self._queries += 1
+        try:
+            await wait_ready(conn)
+        except asyncio.CancelledError:
+            # Stop the server-side work; the connection is dropped on release
+            self._cancelled += 1
+            try:
+                conn.cancel()
+            finally:
+                conn.close()
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool size, checkout waits and query counts."""
+        return {
+            "max_connections": self.maxconn,
+            "open": self._open,
+            "in_use": self._in_use,
+            "max_in_use": self._max_in_use,
+            "checkouts": self._checkouts,
+            "waited": self._waited,
+            "timeouts": self._timeouts,
+            "avg_wait_ms": (
+                round(self._total_wait / self._checkouts * 1000, 2)
+                if self._checkouts
+                else 0.0
+            ),
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+            "queries": self._queries,
+            "cancelled": self._cancelled,
+        }
+
+    def close(self) -> None:
+        """Close the idle connections; checked-out ones close on release."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+# One pool per event loop, dropped with the loop
+_pools: "weakref.WeakKeyDictionary[Any, AsyncWarehousePool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def get_async_warehouse_pool(**connect_kwargs: Any) -> AsyncWarehousePool:
+    """Return the running loop's pool, creating it on first use.
+
+    ``connect_kwargs`` are only used by the call that creates the pool.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = AsyncWarehousePool(
+            maxconn=int(_env_float("WAREHOUSE_ASYNC_POOL_MAX", 10)),
+            timeout=_env_float("WAREHOUSE_POOL_TIMEOUT", 30),
+            max_age=_env_float("WAREHOUSE_POOL_MAX_AGE", 1800),
+            **connect_kwargs,
+        )
+        _pools[loop] = pool
+        logger.info(
+            f"Async warehouse connection pool created (max {pool.maxconn} connections)"
+        )
+    return pool
+
+
+def get_async_warehouse_pool_stats() -> Optional[Dict[str, Any]]:
+    """Return stats for the async pool(s), or None if none was created."""
+    pools = list(_pools.values())
+    if not pools:
+        return None
+    if len(pools) == 1:
+        return pools[0].get_stats()
+    stats: Dict[str, Any] = {}
+    for pool_stats in (pool.get_stats() for pool in pools):
+        for key, value in pool_stats.items():
+            merge = max if key.startswith(("max_", "avg_")) else sum
+            stats[key] = merge((stats.get(key, 0), value))
+    return stats
+
+
+def close_async_warehouse_pools() -> None:
+    """Close the idle connections of every async pool (shutdown, tests)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        pool.close()
+    if pools:
+        logger.info("Async warehouse connection pools closed")
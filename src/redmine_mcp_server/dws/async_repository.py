@@ -0,0 +1,132 @@
+"""
+Async read path of the data warehouse, for MCP tools
+
+Mirrors the read methods of ``DataWarehouse`` (same SQL, same result
+shapes) on top of the event-loop native pool in ``async_pool.py``, so a
+tool awaits its queries instead of parking a warehouse executor thread.
+Writes and the scheduler threads keep using the blocking ``DataWarehouse``.
+"""
+
+import asyncio
+import os
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+from psycopg2 import sql
+
+from .async_pool import AsyncWarehousePool, get_async_warehouse_pool
+from .statements import HIGH_PRIORITY_ISSUES, PROJECT_DAILY_SUMMARY, TOP_ASSIGNEES
+from .repository import (
+    ISSUE_CONTRIBUTOR_SUMMARY_SQL,
+    ISSUE_CONTRIBUTORS_SQL,
+    PROJECT_ROLE_DISTRIBUTION_SQL,
+    issues_snapshot_query,
+    project_daily_stats,
+    user_workload_query,
+)
+
+# ODS tables reported by get_ods_table_stats, with their freshness column
+ODS_STATUS_TABLES = {
+    "ods_issues": "updated_on",
+    "ods_projects": None,
+    "ods_journals": "created_on",
+    "ods_users": None,
+}
+
+
+class AsyncDataWarehouse:
+    """Read-only, awaitable access to the warehouse"""
+
+    def __init__(self, pool: Optional[AsyncWarehousePool] = None):
+        self.pool = pool or get_async_warehouse_pool(
+            host=os.getenv("WAREHOUSE_DB_HOST", "warehouse-db"),
+            port=os.getenv("WAREHOUSE_DB_PORT", "5432"),
+            dbname=os.getenv("WAREHOUSE_DB_NAME", "redmine_warehouse"),
+            user=os.getenv("WAREHOUSE_DB_USER", "redmine_warehouse"),
+            password=os.getenv("WAREHOUSE_DB_PASSWORD"),
+        )
+
+    async def get_issues_snapshot(
+        self,
+        project_id: int,
+        snapshot_date: date,
+        issue_ids: Optional[List[int]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
+        """See ``DataWarehouse.get_issues_snapshot``"""
+        query, params = issues_snapshot_query(
+            project_id, snapshot_date, issue_ids, columns
+        )
+        return await self.pool.fetchall(query, params)
+
+    async def get_project_daily_stats(
+        self, project_id: int, snapshot_date: date
+    ) -> Dict[str, Any]:
+        """See ``DataWarehouse.get_project_daily_stats``"""
+        summary = await self.pool.fetchone(
+            PROJECT_DAILY_SUMMARY, (project_id, snapshot_date.isoformat())
+        )
+        return project_daily_stats(project_id, snapshot_date, summary)
+
+    async def get_high_priority_issues(
+        self, project_id: int, snapshot_date: date, limit: int = 20
+    ) -> List[Dict]:
+        """See ``DataWarehouse.get_high_priority_issues``"""
+        return await self.pool.fetchall(
+            HIGH_PRIORITY_ISSUES, (project_id, snapshot_date.isoformat(), limit)
+        )
+
+    async def get_top_assignees(
+        self, project_id: int, snapshot_date: date, limit: int = 10
+    ) -> List[Dict]:
+        """See ``DataWarehouse.get_top_assignees``"""
+        return await self.pool.fetchall(
+            TOP_ASSIGNEES, (project_id, snapshot_date.isoformat(), limit)
+        )
+
+    async def get_issue_contributors(self, issue_id: int) -> List[Dict]:
+        """See ``DataWarehouse.get_issue_contributors``"""
+        return await self.pool.fetchall(ISSUE_CONTRIBUTORS_SQL, (issue_id,))
+
+    async def get_issue_contributor_summary(self, issue_id: int) -> Optional[Dict]:
+        """See ``DataWarehouse.get_issue_contributor_summary``"""
+        return await self.pool.fetchone(ISSUE_CONTRIBUTOR_SUMMARY_SQL, (issue_id,))
+
+    async def get_project_role_distribution(
+        self, project_id: int, snapshot_date: date
+    ) -> Optional[Dict]:
+        """See ``DataWarehouse.get_project_role_distribution``"""
+        return await self.pool.fetchone(
+            PROJECT_ROLE_DISTRIBUTION_SQL, (project_id, snapshot_date.isoformat())
+        )
+
+    async def get_user_workload(
+        self, user_id: int, year_month: str, project_id: Optional[int] = None
+    ) -> List[Dict]:
+        """See ``DataWarehouse.get_user_workload``"""
+        return await self.pool.fetchall(
+            *user_workload_query(user_id, year_month, project_id)
+        )
+
+    async def get_ods_table_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Row count and newest timestamp of each ODS table
+
+        Returns:
+            ``{table: {"count": int, "max_date": datetime or None}}``
+        """
+        queries = []
+        for table, column in ODS_STATUS_TABLES.items():
+            name = sql.Identifier("warehouse", table)
+            max_date = (
+                sql.SQL("(SELECT MAX({}) FROM {})").format(sql.Identifier(column), name)
+                if column
+                else sql.SQL("NULL")
+            )
+            queries.append(
+                sql.SQL(
+                    "SELECT (SELECT COUNT(*) FROM {}) AS count, {} AS max_date"
+                ).format(name, max_date)
+            )
+        # One query per table, in flight concurrently on separate connections
+        rows = await asyncio.gather(*(self.pool.fetchone(query) for query in queries))
+        return dict(zip(ODS_STATUS_TABLES, rows))
@@ -0,0 +1,282 @@
+"""Change-only issue history, ``warehouse.dwd_issue_history``.
+
+Instead of one ``dwd_issue_daily_snapshot`` row per issue per day, the
+history keeps one row per validity interval ``[valid_from, valid_to)``
+(``init-scripts/v0.11.0__issue_history.sql``).  Writing a day's state of an
+issue only changes rows when something changed:
+
+- project, status, priority or assignee differ from the open interval:
+  the open interval is closed at that day and a new one is opened;
+- only subject / updated_at differ, or the open interval started that
+  same day: the open interval is updated in place;
+- nothing differs: no row is written.
+
+Issues that were deleted or moved to a project the sync does not cover
+never show up again, so after a full sync of a project
+:func:`close_missing_issue_history` ends the open intervals of the issues
+it did not see.
+
+States older than the recorded history of an issue (before its open
+interval, or inside an interval that already ended) are not recorded but
+counted and logged, so writes must move forward in time per issue (the
+daily sync does; a backfill of days before the history started is
+rejected).  Readers do not query this table directly: the
+``warehouse.issue_snapshot_on(project, date)`` SQL function serves the
+daily snapshot shape from the daily rows or from the history.  The history
+only answers for days up to the last day written for the project
+(``dwd_issue_history_watermark``), so in ``daily`` mode, where it is not
+written, a day without daily rows stays empty.
+
+Configuration (environment):
+    SNAPSHOT_STORAGE    ``daily`` (default) writes dwd_issue_daily_snapshot,
+                        ``history`` writes dwd_issue_history
+"""
+
+import logging
+import os
+from datetime import date
+from typing import Any, Iterable, Optional, Sequence
+
+from psycopg2 import extensions
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_STORAGES = ("daily", "history")
+
+# Rows per statement in record_issue_history
+HISTORY_PAGE_SIZE = 1000
+
+# Column order of the rows passed to record_issue_history
+HISTORY_COLUMNS = (
+    "issue_id",
+    "project_id",
+    "day",
+    "subject",
+    "status_id",
+    "status_name",
+    "priority_id",
+    "priority_name",
+    "assigned_to_id",
+    "assigned_to_name",
+    "created_at",
+    "updated_at",
+)
+
+# VALUES rows are typed explicitly: a column that is NULL in every row of
+# a page would otherwise be resolved as text
+_HISTORY_TEMPLATE = (
+    "(%s::integer, %s::integer, %s::date, %s::text, %s::integer, %s::text, "
+    "%s::integer, %s::text, %s::integer, %s::text, "
+    "NULLIF(%s::text, '')::timestamp, NULLIF(%s::text, '')::timestamp)"
+)
+
+_RECORD_ISSUE_HISTORY_SQL = """
+    WITH incoming (
+        issue_id, project_id, day,
+        subject, status_id, status_name,
+        priority_id, priority_name,
+        assigned_to_id, assigned_to_name,
+        created_at, updated_at
+    ) AS (VALUES %s),
+    recorded AS (
+        INSERT INTO warehouse.dwd_issue_history_watermark AS w (
+            project_id, recorded_through
+        )
+        SELECT project_id, MAX(day) FROM incoming GROUP BY project_id
+        ON CONFLICT (project_id) DO UPDATE
+        SET recorded_through = GREATEST(w.recorded_through, EXCLUDED.recorded_through),
+            updated_at = CURRENT_TIMESTAMP
+    ),
+    closed AS (
+        UPDATE warehouse.dwd_issue_history h
+        SET valid_to = i.day
+        FROM incoming i
+        WHERE h.issue_id = i.issue_id
+          AND h.valid_to = 'infinity'
+          AND h.valid_from < i.day
+          AND (h.project_id, h.status_id, h.priority_id, h.assigned_to_id)
+              IS DISTINCT FROM
+              (i.project_id, i.status_id, i.priority_id, i.assigned_to_id)
+        RETURNING h.issue_id
+    ),
+    touched AS (
+        UPDATE warehouse.dwd_issue_history h
+        SET project_id = i.project_id,
+            subject = i.subject,
+            status_id = i.status_id,
+            status_name = i.status_name,
+            priority_id = i.priority_id,
+            priority_name = i.priority_name,
+            assigned_to_id = i.assigned_to_id,
+            assigned_to_name = i.assigned_to_name,
+            created_at = i.created_at,
+            updated_at = i.updated_at,
+            recorded_at = CURRENT_TIMESTAMP
+        FROM incoming i
+        WHERE h.issue_id = i.issue_id
+          AND h.valid_to = 'infinity'
+          AND h.valid_from <= i.day
+          AND (
+              h.valid_from = i.day
+              OR (h.project_id, h.status_id, h.priority_id, h.assigned_to_id)
+                 IS NOT DISTINCT FROM
+                 (i.project_id, i.status_id, i.priority_id, i.assigned_to_id)
+          )
+          AND (
+              h.project_id, h.subject, h.status_id, h.status_name,
+              h.priority_id, h.priority_name, h.assigned_to_id,
+              h.assigned_to_name, h.created_at, h.updated_at
+          ) IS DISTINCT FROM (
+              i.project_id, i.subject, i.status_id, i.status_name,
+              i.priority_id, i.priority_name, i.assigned_to_id,
+              i.assigned_to_name, i.created_at, i.updated_at
+          )
+        RETURNING h.issue_id
+    ),
+    inserted AS (
+        INSERT INTO warehouse.dwd_issue_history (
+            issue_id, project_id, valid_from,
+            subject, status_id, status_name,
+            priority_id, priority_name,
+            assigned_to_id, assigned_to_name,
+            created_at, updated_at
+        )
+        SELECT
+            i.issue_id, i.project_id, i.day,
+            i.subject, i.status_id, i.status_name,
+            i.priority_id, i.priority_name,
+            i.assigned_to_id, i.assigned_to_name,
+            i.created_at, i.updated_at
+        FROM incoming i
+        WHERE i.issue_id IN (SELECT issue_id FROM closed)
+           OR NOT EXISTS (
+               SELECT 1 FROM warehouse.dwd_issue_history h
+               WHERE h.issue_id = i.issue_id AND h.valid_to > i.day
+           )
+        RETURNING issue_id
+    )
+    -- Issues written, and states older than the recorded history
+    SELECT
+        COUNT(*) FILTER (
+            WHERE i.issue_id IN (SELECT issue_id FROM inserted)
+               OR i.issue_id IN (SELECT issue_id FROM touched)
+        ),
+        COUNT(*) FILTER (
+            WHERE NOT EXISTS (
+                SELECT 1 FROM warehouse.dwd_issue_history h
+                WHERE h.issue_id = i.issue_id
+                  AND h.valid_to = 'infinity'
+                  AND h.valid_from <= i.day
+            )
+              AND EXISTS (
+                SELECT 1 FROM warehouse.dwd_issue_history h
+                WHERE h.issue_id = i.issue_id AND h.valid_to > i.day
+            )
+        )
+    FROM incoming i
+"""
+
+
+# Open intervals of a project's issues the sync did not see that day.
+# Intervals opened before the day end at it; one opened that same day
+# (by an earlier sync) is removed, the issue is not there at the end of it.
+_MISSING_ISSUE_HISTORY_FILTER = """
+    WHERE project_id = %(project_id)s
+      AND valid_to = 'infinity'
+      AND issue_id <> ALL(%(issue_ids)s)
+      AND (%(created_since)s::date IS NULL OR created_at >= %(created_since)s::date)
+"""
+
+_CLOSE_MISSING_ISSUE_HISTORY_SQL = f"""
+    UPDATE warehouse.dwd_issue_history
+    SET valid_to = %(day)s, recorded_at = CURRENT_TIMESTAMP
+    {_MISSING_ISSUE_HISTORY_FILTER}
+      AND valid_from < %(day)s
+"""
+
+_DELETE_MISSING_ISSUE_HISTORY_SQL = f"""
+    DELETE FROM warehouse.dwd_issue_history
+    {_MISSING_ISSUE_HISTORY_FILTER}
+      AND valid_from = %(day)s
+"""
+
+
+def snapshot_storage() -> str:
+    """Storage the snapshot writers use, from ``SNAPSHOT_STORAGE``."""
+    storage = os.getenv("SNAPSHOT_STORAGE", "daily").strip().lower()
+    if storage not in SNAPSHOT_STORAGES:
+        logger.warning(f"Ignoring invalid SNAPSHOT_STORAGE={storage}, using daily")
+        return "daily"
+    return storage
+
+
+def record_issue_history(
+    conn: Any, rows: Iterable[Sequence[Any]], page_size: int = HISTORY_PAGE_SIZE
+) -> int:
+    """Record one day's state of each issue in ``rows``.
+
+    Rows follow ``HISTORY_COLUMNS``; when an issue appears more than once
+    the last row wins.  Runs on the caller's transaction.  States older
+    than the recorded history of their issue are logged and skipped.
+
+    Returns:
+        Number of issues whose history was written
+    """
+    latest = {row[0]: tuple(row) for row in rows}
+    if not latest:
+        return 0
+
+    # Tuple rows, whatever the connection's default cursor factory
+    with conn.cursor(cursor_factory=extensions.cursor) as cur:
+        results = execute_values(
+            cur,
+            _RECORD_ISSUE_HISTORY_SQL,
+            list(latest.values()),
+            template=_HISTORY_TEMPLATE,
+            page_size=page_size,
+            fetch=True,
+        )
+    written = sum(row[0] for row in results)
+    stale = sum(row[1] for row in results)
+    if stale:
+        logger.warning(
+            f"Skipped {stale} of {len(latest)} issue states older than "
+            f"their recorded history"
+        )
+    return written
+
+
+def close_missing_issue_history(
+    cur: Any,
+    project_id: int,
+    day: date,
+    issue_ids: Iterable[int],
+    created_since: Optional[date] = None,
+) -> int:
+    """End the open intervals of ``project_id`` issues missing on ``day``.
+
+    ``issue_ids`` are all the issues a full sync of the project returned
+    for ``day``; with ``created_since`` the sync only covered issues
+    created on or after that date, and older ones are left alone.  Runs on
+    the caller's cursor and transaction.
+
+    Returns:
+        Number of intervals ended
+    """
+    params = {
+        "project_id": project_id,
+        "day": day,
+        "issue_ids": sorted(set(issue_ids)),
+        "created_since": created_since,
+    }
+    cur.execute(_CLOSE_MISSING_ISSUE_HISTORY_SQL, params)
+    closed = cur.rowcount
+    cur.execute(_DELETE_MISSING_ISSUE_HISTORY_SQL, params)
+    closed += cur.rowcount
+    if closed:
+        logger.info(
+            f"Closed the history of {closed} issues no longer in project "
+            f"{project_id} on {day}"
+        )
+    return closed
@@ -0,0 +1,489 @@
+"""Set-based loader for ODS issue pages.
+
+Each page of ``issues.json`` records (optionally with journals) is loaded in
+one transaction:
+
+1. Records are converted to typed rows in Python.  A record that does not
+   fit the ODS column types or constraints is written to
+   ``warehouse.ods_quarantine`` with the error instead of aborting the page.
+2. The rows are streamed into temporary staging tables with
+   ``COPY ... FROM STDIN`` from an in-memory buffer.
+3. ``ods_issues``, ``ods_journals`` and ``ods_journal_details`` are merged
+   from staging with one ``INSERT ... SELECT ... ON CONFLICT`` each.
+
+Journal details are keyed by ``(journal_id, detail_ordinal)``, the position
+of the detail in the journal, so re-syncing an issue updates its history in
+place instead of appending it again.  The unique index for that key is
+created by the migration on a clean table, or otherwise built by
+:func:`compact_journal_details`, which first removes the duplicates left by
+the old append-only sync; the loader runs it once if the index is missing.
+"""
+
+import io
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from psycopg2 import extensions
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+ISSUE_COLUMNS = (
+    "issue_id",
+    "project_id",
+    "subject",
+    "description",
+    "status_id",
+    "priority_id",
+    "tracker_id",
+    "author_id",
+    "assigned_to_id",
+    "created_on",
+    "updated_on",
+    "done_ratio",
+    "due_date",
+    "estimated_hours",
+    "spent_hours",
+)
+JOURNAL_COLUMNS = ("journal_id", "issue_id", "user_id", "notes", "created_on")
+DETAIL_COLUMNS = (
+    "journal_id",
+    "detail_ordinal",
+    "property",
+    "name",
+    "old_value",
+    "new_value",
+)
+
+DETAIL_KEY_INDEX = "uq_ods_journal_details_key"
+COMPACTION_BATCH_SIZE = 5000
+
+# Temporary tables live for the pooled connection's session; rows are
+# cleared at the end of every transaction
+_STAGING_DDL = """
+    CREATE TEMP TABLE IF NOT EXISTS ods_issues_stage
+        (LIKE warehouse.ods_issues) ON COMMIT DELETE ROWS;
+    CREATE TEMP TABLE IF NOT EXISTS ods_journals_stage
+        (LIKE warehouse.ods_journals) ON COMMIT DELETE ROWS;
+    CREATE TEMP TABLE IF NOT EXISTS ods_journal_details_stage (
+        journal_id INTEGER NOT NULL,
+        detail_ordinal INTEGER NOT NULL,
+        property VARCHAR(50),
+        name VARCHAR(100),
+        old_value TEXT,
+        new_value TEXT
+    ) ON COMMIT DELETE ROWS;
+"""
+
+_QUARANTINE_DDL = """
+    CREATE TABLE IF NOT EXISTS warehouse.ods_quarantine (
+        quarantine_id SERIAL PRIMARY KEY,
+        source_table VARCHAR(50) NOT NULL,
+        record_id INTEGER,
+        project_id INTEGER,
+        payload JSONB,
+        error TEXT,
+        quarantined_at TIMESTAMP DEFAULT NOW()
+    )
+"""
+
+_MERGE_ISSUES = f"""
+    INSERT INTO warehouse.ods_issues ({", ".join(ISSUE_COLUMNS)})
+    SELECT {", ".join(ISSUE_COLUMNS)} FROM ods_issues_stage
+    ON CONFLICT (issue_id) DO UPDATE SET
+        subject = EXCLUDED.subject,
+        description = EXCLUDED.description,
+        status_id = EXCLUDED.status_id,
+        priority_id = EXCLUDED.priority_id,
+        assigned_to_id = EXCLUDED.assigned_to_id,
+        updated_on = EXCLUDED.updated_on,
+        done_ratio = EXCLUDED.done_ratio
+"""
+
+_MERGE_JOURNALS = f"""
+    INSERT INTO warehouse.ods_journals ({", ".join(JOURNAL_COLUMNS)})
+    SELECT {", ".join(JOURNAL_COLUMNS)} FROM ods_journals_stage
+    ON CONFLICT (journal_id) DO UPDATE SET
+        notes = EXCLUDED.notes
+"""
+
+# Unchanged details are not rewritten; details no longer present in a
+# staged journal are removed
+_MERGE_DETAILS = f"""
+    INSERT INTO warehouse.ods_journal_details AS d ({", ".join(DETAIL_COLUMNS)})
+    SELECT {", ".join(DETAIL_COLUMNS)} FROM ods_journal_details_stage
+    ON CONFLICT (journal_id, detail_ordinal) DO UPDATE SET
+        property = EXCLUDED.property,
+        name = EXCLUDED.name,
+        old_value = EXCLUDED.old_value,
+        new_value = EXCLUDED.new_value
+    WHERE (d.property, d.name, d.old_value, d.new_value) IS DISTINCT FROM
+        (EXCLUDED.property, EXCLUDED.name, EXCLUDED.old_value, EXCLUDED.new_value);
+    DELETE FROM warehouse.ods_journal_details d
+    USING ods_journals_stage s
+    WHERE d.journal_id = s.journal_id
+      AND NOT EXISTS (
+          SELECT 1 FROM ods_journal_details_stage ds
+          WHERE ds.journal_id = d.journal_id
+            AND ds.detail_ordinal = d.detail_ordinal
+      );
+"""
+
+# ========== Journal detail compaction ==========
+
+_DETAIL_KEY_STATE = "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)"
+
+_DELETE_DUPLICATE_DETAILS = """
+    DELETE FROM warehouse.ods_journal_details d
+    USING (
+        SELECT detail_id, row_number() OVER (
+            PARTITION BY journal_id, property, name, old_value, new_value
+            ORDER BY detail_id
+        ) AS copy
+        FROM warehouse.ods_journal_details
+        WHERE journal_id >= %s AND journal_id < %s
+    ) dup
+    WHERE d.detail_id = dup.detail_id AND dup.copy > 1
+"""
+
+# Details were inserted in API order, so detail_id order is the ordinal
+_NUMBER_DETAILS = """
+    UPDATE warehouse.ods_journal_details d
+    SET detail_ordinal = o.ordinal
+    FROM (
+        SELECT detail_id, row_number() OVER (
+            PARTITION BY journal_id ORDER BY detail_id
+        ) - 1 AS ordinal
+        FROM warehouse.ods_journal_details
+        WHERE journal_id >= %s AND journal_id < %s
+    ) o
+    WHERE d.detail_id = o.detail_id
+      AND d.detail_ordinal IS DISTINCT FROM o.ordinal
+"""
+
+
+class InvalidRecord(ValueError):
+    """A Redmine record that does not fit the ODS column types."""
+
+
+@dataclass
+class OdsLoadResult:
+    """Rows merged and quarantined for one page."""
+
+    issues: int = 0
+    journals: int = 0
+    details: int = 0
+    quarantined: List[Tuple[str, Optional[int], str]] = field(default_factory=list)
+
+
+# ========== Record -> row conversion ==========
+
+
+def _ref_id(record: Dict[str, Any], key: str) -> Any:
+    ref = record.get(key)
+    return ref.get("id") if isinstance(ref, dict) else None
+
+
+def _int(value: Any, name: str, required: bool = False) -> Optional[int]:
+    if value is None or value == "":
+        if required:
+            raise InvalidRecord(f"{name} is required")
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise InvalidRecord(f"{name} is not an integer: {value!r}")
+    try:
+        number = int(value)
+    except ValueError:
+        raise InvalidRecord(f"{name} is not an integer: {value!r}") from None
+    if not -(2**31) <= number < 2**31:
+        raise InvalidRecord(f"{name} out of range: {number}")
+    return number
+
+
+def _text(value: Any, name: str, max_length: Optional[int] = None) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value)
+    if "\x00" in text:
+        raise InvalidRecord(f"{name} contains a NUL character")
+    if max_length is not None and len(text) > max_length:
+        raise InvalidRecord(f"{name} longer than {max_length} characters")
+    return text
+
+
+def _timestamp(value: Any, name: str) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        # TIMESTAMP columns drop the zone, as PostgreSQL does for the string
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        raise InvalidRecord(f"{name} is not a timestamp: {value!r}") from None
+    return parsed.replace(tzinfo=None)
+
+
+def _date(value: Any, name: str) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise InvalidRecord(f"{name} is not a date: {value!r}") from None
+
+
+def _hours(value: Any, name: str) -> Optional[Decimal]:
+    if value is None or value == "":
+        return None
+    try:
+        hours = Decimal(str(value)).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        raise InvalidRecord(f"{name} is not a number: {value!r}") from None
+    if not hours.is_finite() or abs(hours) >= 10**8:
+        raise InvalidRecord(f"{name} out of range: {value!r}")
+    return hours
+
+
+def issue_row(issue: Dict[str, Any]) -> tuple:
+    """Typed ods_issues row for an issues.json record."""
+    return (
+        _int(issue.get("id"), "id", required=True),
+        _int(_ref_id(issue, "project"), "project.id", required=True),
+        _text(issue.get("subject"), "subject", 500),
+        _text(issue.get("description"), "description"),
+        _int(_ref_id(issue, "status"), "status.id"),
+        _int(_ref_id(issue, "priority"), "priority.id"),
+        _int(_ref_id(issue, "tracker"), "tracker.id"),
+        _int(_ref_id(issue, "author"), "author.id"),
+        _int(_ref_id(issue, "assigned_to"), "assigned_to.id"),
+        _timestamp(issue.get("created_on"), "created_on"),
+        _timestamp(issue.get("updated_on"), "updated_on"),
+        _int(issue.get("done_ratio"), "done_ratio"),
+        _date(issue.get("due_date"), "due_date"),
+        _hours(issue.get("estimated_hours"), "estimated_hours"),
+        _hours(issue.get("spent_hours"), "spent_hours"),
+    )
+
+
+def journal_row(issue_id: int, journal: Dict[str, Any]) -> tuple:
+    """Typed ods_journals row for one entry of an issue's ``journals``."""
+    user_id = _ref_id(journal, "user") or journal.get("user_id")
+    return (
+        _int(journal.get("id"), "journal.id", required=True),
+        issue_id,
+        _int(user_id, "journal.user.id", required=True),
+        _text(journal.get("notes"), "journal.notes"),
+        _timestamp(journal.get("created_on"), "journal.created_on"),
+    )
+
+
+def detail_row(journal_id: int, ordinal: int, detail: Dict[str, Any]) -> tuple:
+    """Typed ods_journal_details row for the ``ordinal``-th journal detail."""
+    return (
+        journal_id,
+        ordinal,
+        _text(detail.get("property"), "detail.property", 50),
+        _text(detail.get("name"), "detail.name", 100),
+        _text(detail.get("old_value"), "detail.old_value"),
+        _text(detail.get("new_value"), "detail.new_value"),
+    )
+
+
+# ========== COPY ==========
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(cur, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+    """Stream ``rows`` into ``table`` with COPY FROM STDIN (text format)."""
+    if not rows:
+        return
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+# ========== Page loader ==========
+
+
+class OdsIssueLoader:
+    """Loads pages of issues (with journals) into the ODS tables."""
+
+    def __init__(self, get_connection: Callable):
+        self.get_connection = get_connection
+        self._quarantine_ready = False
+        self._detail_key_ready = False
+
+    def load_page(self, project_id: int, issues: List[Dict[str, Any]]) -> OdsLoadResult:
+        """Load one page in a single transaction and return the row counts."""
+        result = OdsLoadResult()
+        issue_rows: Dict[int, tuple] = {}
+        journal_rows: Dict[int, tuple] = {}
+        detail_rows: Dict[int, List[tuple]] = {}
+        rejected: List[tuple] = []
+
+        def quarantine(source: str, record_id: Any, record: Any, error: Exception):
+            rejected.append((source, record_id, str(error), record))
+
+        for issue in issues:
+            try:
+                row = issue_row(issue)
+            except InvalidRecord as e:
+                quarantine("ods_issues", issue.get("id"), issue, e)
+                continue
+            issue_rows[row[0]] = row
+
+            for journal in issue.get("journals") or []:
+                try:
+                    journal_entry = journal_row(row[0], journal)
+                    details = [
+                        detail_row(journal_entry[0], ordinal, detail)
+                        for ordinal, detail in enumerate(journal.get("details") or [])
+                    ]
+                except InvalidRecord as e:
+                    quarantine("ods_journals", journal.get("id"), journal, e)
+                    continue
+                journal_rows[journal_entry[0]] = journal_entry
+                detail_rows[journal_entry[0]] = details
+
+        details = [row for rows in detail_rows.values() for row in rows]
+        if journal_rows and not self._detail_key_ready:
+            compact_journal_details(self.get_connection)
+            self._detail_key_ready = True
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                if rejected:
+                    self._quarantine(cur, project_id, rejected)
+                if issue_rows:
+                    cur.execute(_STAGING_DDL)
+                    copy_rows(
+                        cur,
+                        "ods_issues_stage",
+                        ISSUE_COLUMNS,
+                        list(issue_rows.values()),
+                    )
+                    copy_rows(
+                        cur,
+                        "ods_journals_stage",
+                        JOURNAL_COLUMNS,
+                        list(journal_rows.values()),
+                    )
+                    copy_rows(cur, "ods_journal_details_stage", DETAIL_COLUMNS, details)
+                    cur.execute(_MERGE_ISSUES)
+                    if journal_rows:
+                        cur.execute(_MERGE_JOURNALS)
+                        cur.execute(_MERGE_DETAILS)
+
+        result.issues = len(issue_rows)
+        result.journals = len(journal_rows)
+        result.details = len(details)
+        for source, record_id, error, _ in rejected:
+            result.quarantined.append((source, record_id, error))
+            logger.warning(f"Quarantined {source} record {record_id}: {error}")
+        return result
+
+    def _quarantine(self, cur, project_id: int, entries: List[tuple]) -> None:
+        if not self._quarantine_ready:
+            cur.execute(_QUARANTINE_DDL)
+            self._quarantine_ready = True
+        execute_values(
+            cur,
+            """
+            INSERT INTO warehouse.ods_quarantine (
+                source_table, record_id, project_id, payload, error
+            ) VALUES %s
+            """,
+            [
+                (
+                    source,
+                    record_id if isinstance(record_id, int) else None,
+                    project_id,
+                    json.dumps(record, default=str),
+                    error,
+                )
+                for source, record_id, error, record in entries
+            ],
+        )
+
+
+def compact_journal_details(
+    get_connection: Callable, batch_size: int = COMPACTION_BATCH_SIZE
+) -> Dict[str, int]:
+    """Remove duplicate journal details and build the natural-key index.
+
+    One-time job for tables written by the append-only sync.  Duplicates
+    (same journal and content) are deleted and ``detail_ordinal`` is filled
+    in ``batch_size`` journal ids at a time, each batch in its own short
+    transaction, and the unique index is then built with
+    ``CREATE INDEX CONCURRENTLY`` so syncs and readers are not blocked.
+    Does nothing once a valid index exists.
+
+    Returns:
+        Counts of deleted and renumbered rows and batches run
+    """
+    stats = {"deleted": 0, "renumbered": 0, "batches": 0}
+    index = f"warehouse.{DETAIL_KEY_INDEX}"
+
+    with get_connection() as conn:
+        # Tuple rows, whatever the connection's default cursor factory
+        with conn.cursor(cursor_factory=extensions.cursor) as cur:
+            cur.execute(_DETAIL_KEY_STATE, (index,))
+            state = cur.fetchone()
+            if state and state[0]:
+                return stats
+            cur.execute(
+                "SELECT min(journal_id), max(journal_id) "
+                "FROM warehouse.ods_journal_details"
+            )
+            low, high = cur.fetchone()
+
+    if low is not None:
+        for start in range(low, high + 1, batch_size):
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(_DELETE_DUPLICATE_DETAILS, (start, start + batch_size))
+                    stats["deleted"] += cur.rowcount
+                    cur.execute(_NUMBER_DETAILS, (start, start + batch_size))
+                    stats["renumbered"] += cur.rowcount
+            stats["batches"] += 1
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with get_connection() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                if state:
+                    # Left invalid by an interrupted concurrent build
+                    cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+                cur.execute(
+                    f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+                    f"{DETAIL_KEY_INDEX} ON warehouse.ods_journal_details "
+                    f"(journal_id, detail_ordinal)"
+                )
+        finally:
+            conn.autocommit = False
+
+    logger.info(
+        f"Compacted ods_journal_details: {stats['deleted']} duplicates removed, "
+        f"{stats['renumbered']} rows numbered in {stats['batches']} batches"
+    )
+    return stats
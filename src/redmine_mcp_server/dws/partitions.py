@@ -0,0 +1,213 @@
+"""Monthly partitions of ``warehouse.dwd_issue_daily_snapshot``.
+
+The snapshot table is range-partitioned by ``snapshot_date``, one partition
+per month named ``dwd_issue_daily_snapshot_pYYYYMM``
+(``init-scripts/v0.11.0__partition_issue_snapshot.sql``), so a day-scoped
+read or write only touches that month's partition and its indexes no
+matter how much history accumulates.
+
+- Writers call :func:`ensure_snapshot_partitions` with the dates they are
+  about to write, before opening their own transaction; months already
+  seen by this process are skipped without a round trip, others are
+  created by the ``warehouse.ensure_issue_snapshot_partition`` SQL function
+  on a separate autocommit connection, so a writer that rolls back cannot
+  take a partition with it that this process still thinks exists.
+- :func:`maintain_snapshot_partitions` runs daily from the sync scheduler:
+  it creates the partitions of the next months ahead of time and applies
+  the retention policy to months that fell out of the window.  Expired
+  partitions are detached with ``DETACH PARTITION CONCURRENTLY`` (kept as
+  standalone ``..._archived`` tables) or dropped.
+
+Configuration (environment):
+    SNAPSHOT_PARTITIONS_AHEAD   future months kept ready (default 3)
+    SNAPSHOT_RETENTION_MONTHS   months of history kept, counting the
+                                current one (default 0, keep everything)
+    SNAPSHOT_RETENTION_MODE     ``detach`` or ``drop`` (default detach)
+"""
+
+import logging
+import os
+import re
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TABLE = "dwd_issue_daily_snapshot"
+RETENTION_MODES = ("detach", "drop")
+
+_PARTITION_NAME = re.compile(rf"^{SNAPSHOT_TABLE}_p(\d{{4}})(\d{{2}})$")
+
+_LIST_PARTITIONS = f"""
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = to_regclass('warehouse.{SNAPSHOT_TABLE}')
+"""
+
+# Months whose partition this process has created or seen
+_known_months: set = set()
+_known_lock = threading.Lock()
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing ``day``."""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """``month`` (a first-of-month date) shifted by ``months``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(day: date) -> str:
+    """Name of the partition holding ``day``."""
+    return f"{SNAPSHOT_TABLE}_p{day:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month held by partition ``name``, or None for other tables."""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def ensure_snapshot_partitions(get_connection: Callable, days: Iterable[date]) -> None:
+    """Make sure the partitions holding ``days`` exist before writing to them.
+
+    Missing partitions are created in autocommit mode on a connection of
+    their own and only remembered once created, so call this before the
+    writer's transaction starts: creating a partition locks the parent
+    table, which the writer's transaction may already hold.
+    """
+    with _known_lock:
+        missing = sorted({month_start(day) for day in days} - _known_months)
+    if not missing:
+        return
+
+    with get_connection() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for month in missing:
+                    cur.execute(
+                        "SELECT warehouse.ensure_issue_snapshot_partition(%s)",
+                        (month,),
+                    )
+                    with _known_lock:
+                        _known_months.add(month)
+        finally:
+            conn.autocommit = False
+
+
+def forget_partitions() -> None:
+    """Forget the months seen by this process (tests, after retention)."""
+    with _known_lock:
+        _known_months.clear()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def list_snapshot_partitions(get_connection: Callable) -> Dict[str, date]:
+    """Attached monthly partitions, ``{name: month}``."""
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=extensions.cursor) as cur:
+            cur.execute(_LIST_PARTITIONS)
+            names = [row[0] for row in cur.fetchall()]
+    return {
+        name: month
+        for name, month in ((name, partition_month(name)) for name in names)
+        if month
+    }
+
+
+def expire_snapshot_partitions(
+    get_connection: Callable,
+    retention_months: int,
+    mode: str = "detach",
+    today: Optional[date] = None,
+) -> List[str]:
+    """Detach or drop partitions older than ``retention_months`` months.
+
+    The current month counts as the first retained month.  Each partition
+    is detached with ``DETACH PARTITION CONCURRENTLY``, which cannot run in
+    a transaction block and does not block readers or writers of the other
+    partitions; ``detach`` renames it to ``<name>_archived``, ``drop``
+    drops it.
+
+    Returns:
+        Names of the expired partitions
+    """
+    if mode not in RETENTION_MODES:
+        raise ValueError(f"Invalid retention mode: {mode}")
+    if retention_months <= 0:
+        return []
+
+    cutoff = add_months(month_start(today or date.today()), 1 - retention_months)
+    expired = sorted(
+        name
+        for name, month in list_snapshot_partitions(get_connection).items()
+        if month < cutoff
+    )
+
+    for name in expired:
+        with get_connection() as conn:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"ALTER TABLE warehouse.{SNAPSHOT_TABLE} "
+                        f"DETACH PARTITION warehouse.{name} CONCURRENTLY"
+                    )
+                    if mode == "drop":
+                        cur.execute(f"DROP TABLE warehouse.{name}")
+                    else:
+                        cur.execute(
+                            f"ALTER TABLE warehouse.{name} RENAME TO {name}_archived"
+                        )
+            finally:
+                conn.autocommit = False
+        logger.info(f"Snapshot partition {name} expired ({mode})")
+
+    if expired:
+        forget_partitions()
+    return expired
+
+
+def maintain_snapshot_partitions(
+    get_connection: Callable,
+    months_ahead: Optional[int] = None,
+    retention_months: Optional[int] = None,
+    mode: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """Create upcoming partitions and apply the retention policy.
+
+    Arguments default to the ``SNAPSHOT_*`` environment variables.
+
+    Returns:
+        ``{"months_ready": int, "expired": [partition names]}``
+    """
+    if months_ahead is None:
+        months_ahead = _env_int("SNAPSHOT_PARTITIONS_AHEAD", 3)
+    if retention_months is None:
+        retention_months = _env_int("SNAPSHOT_RETENTION_MONTHS", 0)
+    mode = mode or os.getenv("SNAPSHOT_RETENTION_MODE", "detach")
+
+    current = month_start(today or date.today())
+    months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+    ensure_snapshot_partitions(get_connection, months)
+
+    expired = expire_snapshot_partitions(get_connection, retention_months, mode, today)
+    return {"months_ready": len(months), "expired": expired}
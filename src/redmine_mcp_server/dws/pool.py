@@ -0,0 +1,263 @@
+"""Process-wide PostgreSQL connection pool for the data warehouse.
+
+Tools, services and schedulers each construct their own ``DataWarehouse``;
+they all check connections out of the single pool defined here instead of
+opening a private ``SimpleConnectionPool`` per instance.  The pool wraps
+psycopg2's thread-safe ``ThreadedConnectionPool`` and adds:
+
+- blocking checkout: callers wait up to a timeout for a free connection
+  instead of getting ``PoolError`` when all of them are in use
+- validation on checkout: closed connections are replaced, and connections
+  idle for a while are pinged with ``SELECT 1`` before being handed out
+- recycling: connections older than a maximum age are closed and reopened
+- checkout wait / in-use metrics, reported under ``warehouse_pool`` in
+  ``/health``
+
+psycopg2 is imported when the pool is first created, not when this module
+is imported.
+
+Configuration (environment):
+    WAREHOUSE_POOL_MIN            connections opened up front (default 1)
+    WAREHOUSE_POOL_MAX            maximum open connections (default 10)
+    WAREHOUSE_POOL_TIMEOUT        seconds to wait for a free connection
+                                  (default 30)
+    WAREHOUSE_POOL_MAX_AGE        seconds before a connection is recycled
+                                  (default 1800, 0 disables)
+    WAREHOUSE_POOL_VALIDATE_IDLE  ping connections idle at least this many
+                                  seconds on checkout (default 30, 0 pings
+                                  on every checkout)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WarehousePoolTimeout(TimeoutError):
+    """Raised when no warehouse connection becomes free in time."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"No warehouse connection available within {timeout:g}s")
+
+
+class WarehousePool:
+    """Thread-safe, blocking connection pool with validation and recycling."""
+
+    def __init__(
+        self,
+        minconn: int = 1,
+        maxconn: int = 10,
+        timeout: Optional[float] = 30.0,
+        max_age: Optional[float] = 1800.0,
+        validate_idle: Optional[float] = 30.0,
+        **connect_kwargs: Any,
+    ):
+        from psycopg2 import pool
+
+        if maxconn < 1 or minconn > maxconn:
+            raise ValueError("maxconn must be at least 1 and not below minconn")
+        self.maxconn = maxconn
+        self.timeout = timeout or None
+        self.max_age = max_age or None
+        self.validate_idle = validate_idle
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **connect_kwargs)
+        # psycopg2 closes returned connections once minconn are idle; keep up
+        # to maxconn open so busy periods do not reconnect on every checkout.
+        # This relies on psycopg2 internals: AbstractConnectionPool._putconn
+        # reads self.minconn on every return (psycopg2 2.x), and get_stats
+        # reads its _pool / _used containers.  Re-check both when upgrading
+        # psycopg2; tests/unit/test_warehouse_pool.py covers the behaviour.
+        self._pool.minconn = maxconn
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._opened_at: Dict[Any, float] = {}
+        self._returned_at: Dict[Any, float] = {}
+        self._in_use = 0
+        self._max_in_use = 0
+        self._checkouts = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._timeouts = 0
+        self._recycled = 0
+        self._invalidated = 0
+
+    def getconn(self, timeout: Optional[float] = None) -> Any:
+        """Check out a validated connection, waiting up to ``timeout`` seconds.
+
+        Raises:
+            WarehousePoolTimeout: every connection stayed in use.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        if not self._slots.acquire(timeout=timeout):
+            with self._lock:
+                self._timeouts += 1
+            raise WarehousePoolTimeout(timeout)
+        waited = time.monotonic() - started
+
+        try:
+            conn = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._max_in_use = max(self._max_in_use, self._in_use)
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            if waited >= 0.001:
+                self._waited += 1
+        return conn
+
+    def putconn(self, conn: Any, close: bool = False) -> None:
+        """Return a connection; broken or expired connections are closed."""
+        try:
+            now = time.monotonic()
+            with self._lock:
+                opened_at = self._opened_at.get(conn, now)
+            close = close or bool(conn.closed) or self._expired(opened_at, now)
+            with self._lock:
+                if close:
+                    self._forget(conn)
+                else:
+                    self._returned_at[conn] = now
+            self._pool.putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def closeall(self) -> None:
+        with self._lock:
+            self._opened_at.clear()
+            self._returned_at.clear()
+        self._pool.closeall()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size, checkout waits and recycling counters."""
+        with self._lock:
+            return {
+                "max_connections": self.maxconn,
+                "open": len(self._pool._pool) + len(self._pool._used),
+                "in_use": self._in_use,
+                "max_in_use": self._max_in_use,
+                "checkouts": self._checkouts,
+                "waited": self._waited,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": (
+                    round(self._total_wait / self._checkouts * 1000, 2)
+                    if self._checkouts
+                    else 0.0
+                ),
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+                "recycled": self._recycled,
+                "invalidated": self._invalidated,
+            }
+
+    def _checkout(self) -> Any:
+        # Each discarded connection is replaced by a freshly opened one, so
+        # maxconn + 1 attempts always end with a new connection or an error
+        for _ in range(self.maxconn + 1):
+            conn = self._pool.getconn()
+            now = time.monotonic()
+            with self._lock:
+                opened_at = self._opened_at.setdefault(conn, now)
+                returned_at = self._returned_at.pop(conn, None)
+
+            if self._expired(opened_at, now):
+                self._discard(conn, "_recycled")
+            elif conn.closed or (
+                returned_at is not None
+                and self.validate_idle is not None
+                and now - returned_at >= self.validate_idle
+                and not self._ping(conn)
+            ):
+                self._discard(conn, "_invalidated")
+            else:
+                return conn
+        raise RuntimeError("Could not obtain a usable warehouse connection")
+
+    def _expired(self, opened_at: float, now: float) -> bool:
+        return self.max_age is not None and now - opened_at >= self.max_age
+
+    def _discard(self, conn: Any, counter: str) -> None:
+        with self._lock:
+            self._forget(conn)
+            setattr(self, counter, getattr(self, counter) + 1)
+        self._pool.putconn(conn, close=True)
+
+    def _forget(self, conn: Any) -> None:
+        self._opened_at.pop(conn, None)
+        self._returned_at.pop(conn, None)
+
+    @staticmethod
+    def _ping(conn: Any) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding broken warehouse connection: {e}")
+            return False
+
+
+_pool: Optional[WarehousePool] = None
+_pool_lock = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}, using {default}")
+        return default
+
+
+def get_warehouse_pool(**connect_kwargs: Any) -> WarehousePool:
+    """Return the process-wide pool, creating it on first use.
+
+    ``connect_kwargs`` (host, dbname, cursor_factory, ...) are only used by
+    the call that creates the pool.  A failed creation is not cached, so the
+    next caller retries.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WarehousePool(
+                minconn=int(_env_float("WAREHOUSE_POOL_MIN", 1)),
+                maxconn=int(_env_float("WAREHOUSE_POOL_MAX", 10)),
+                timeout=_env_float("WAREHOUSE_POOL_TIMEOUT", 30),
+                max_age=_env_float("WAREHOUSE_POOL_MAX_AGE", 1800),
+                validate_idle=_env_float("WAREHOUSE_POOL_VALIDATE_IDLE", 30),
+                **connect_kwargs,
+            )
+            logger.info(
+                f"Warehouse connection pool created (max {_pool.maxconn} connections)"
+            )
+        return _pool
+
+
+def get_warehouse_pool_stats() -> Optional[Dict[str, Any]]:
+    """Return stats for the shared pool, or None if it was never created."""
+    return _pool.get_stats() if _pool is not None else None
+
+
+def close_warehouse_pool() -> None:
+    """Close every connection of the shared pool (process shutdown, tests)."""
+    global _pool
+    with _pool_lock:
+        previous, _pool = _pool, None
+    if previous is not None:
+        previous.closeall()
+        logger.info("Warehouse connection pool closed")
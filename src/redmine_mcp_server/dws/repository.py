@@ -7,14 +7,226 @@ PostgreSQL datawarehouse - 纯data访问层
 import os
 import logging
 from datetime import date
-from typing import Dict, List, Any, Optional
-from contextlib import contextmanager
-
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from contextlib import contextmanager, nullcontext
+
+from psycopg2.extras import RealDictCursor, execute_values
+
+from .history import (
+    HISTORY_COLUMNS,
+    close_missing_issue_history,
+    record_issue_history,
+    snapshot_storage,
+)
+from .partitions import ensure_snapshot_partitions
+from .pool import get_warehouse_pool
+from .statements import (
+    HIGH_PRIORITY_ISSUES,
+    PROJECT_DAILY_SUMMARY,
+    TOP_ASSIGNEES,
+    Statement,
+    execute_prepared,
+    issues_snapshot_statement,
+)
+from .summary import daily_summary_delta, refresh_daily_summary
 
 logger = logging.getLogger(__name__)
 
+# Columns of warehouse.dwd_issue_daily_snapshot that readers may project
+ISSUE_SNAPSHOT_COLUMNS = (
+    "id",
+    "issue_id",
+    "project_id",
+    "snapshot_date",
+    "subject",
+    "status_id",
+    "status_name",
+    "priority_id",
+    "priority_name",
+    "assigned_to_id",
+    "assigned_to_name",
+    "created_at",
+    "updated_at",
+    "is_new",
+    "is_closed",
+    "is_updated",
+    "created_at_snapshot",
+)
+
+
+# Rows per multi-row INSERT statement in upsert_issues_batch
+SNAPSHOT_UPSERT_PAGE_SIZE = 1000
+
+_UPSERT_ISSUE_SNAPSHOT_SQL = """
+    INSERT INTO warehouse.dwd_issue_daily_snapshot (
+        issue_id, project_id, snapshot_date,
+        subject, status_id, status_name,
+        priority_id, priority_name,
+        assigned_to_id, assigned_to_name,
+        created_at, updated_at,
+        is_new, is_closed, is_updated
+    ) VALUES %s
+    ON CONFLICT (issue_id, snapshot_date) DO UPDATE SET
+        status_id = EXCLUDED.status_id,
+        status_name = EXCLUDED.status_name,
+        priority_id = EXCLUDED.priority_id,
+        priority_name = EXCLUDED.priority_name,
+        assigned_to_id = EXCLUDED.assigned_to_id,
+        assigned_to_name = EXCLUDED.assigned_to_name,
+        updated_at = EXCLUDED.updated_at,
+        is_updated = EXCLUDED.is_updated
+"""
+
+
+def _issue_snapshot_row(
+    issue: Dict[str, Any],
+    snapshot_date: date,
+    is_new: bool,
+    is_closed: bool,
+    is_updated: bool,
+) -> tuple:
+    """Column values of one dwd_issue_daily_snapshot row"""
+    assigned_to = issue.get("assigned_to") or {}
+    return (
+        issue["id"],
+        issue.get("project", {}).get("id"),
+        snapshot_date,
+        issue.get("subject", ""),
+        issue.get("status", {}).get("id"),
+        issue.get("status", {}).get("name"),
+        issue.get("priority", {}).get("id"),
+        issue.get("priority", {}).get("name"),
+        assigned_to.get("id"),
+        assigned_to.get("name"),
+        issue.get("created_on", ""),
+        issue.get("updated_on", ""),
+        is_new,
+        is_closed,
+        is_updated,
+    )
+
+
+def _history_row(snapshot_row: tuple) -> tuple:
+    """The dwd_issue_history values of a snapshot row (its leading columns)"""
+    return snapshot_row[: len(HISTORY_COLUMNS)]
+
+
+def _select_list(columns: Optional[Sequence[str]], allowed: Sequence[str]) -> str:
+    """Build a quoted SELECT column list, or ``*`` when ``columns`` is None."""
+    if columns is None:
+        return "*"
+    unknown = [column for column in columns if column not in allowed]
+    if unknown or not columns:
+        raise ValueError(f"Invalid columns: {unknown or columns}")
+    return ", ".join(f'"{column}"' for column in columns)
+
+
+# ========== Read queries (shared with async_repository) ==========
+
+ISSUE_CONTRIBUTORS_SQL = """
+    SELECT
+        user_id, user_name, role_category, highest_role_name,
+        journal_count, first_contribution, last_contribution,
+        status_change_count, note_count
+    FROM warehouse.dws_issue_contributors
+    WHERE issue_id = %s
+    ORDER BY
+        CASE role_category
+            WHEN 'manager' THEN 1
+            WHEN 'implementation' THEN 2
+            WHEN 'developer' THEN 3
+            WHEN 'tester' THEN 4
+            ELSE 5
+        END,
+        journal_count DESC
+"""
+
+ISSUE_CONTRIBUTOR_SUMMARY_SQL = """
+    SELECT * FROM warehouse.dws_issue_contributor_summary
+    WHERE issue_id = %s
+"""
+
+PROJECT_ROLE_DISTRIBUTION_SQL = """
+    SELECT * FROM warehouse.dws_project_role_distribution
+    WHERE project_id = %s AND snapshot_date = %s
+"""
+
+USER_PROJECT_WORKLOAD_SQL = """
+    SELECT * FROM warehouse.dws_user_monthly_workload
+    WHERE user_id = %s AND year_month = %s AND project_id = %s
+"""
+
+USER_WORKLOAD_SQL = """
+    SELECT * FROM warehouse.dws_user_monthly_workload
+    WHERE user_id = %s AND year_month = %s
+    ORDER BY project_id
+"""
+
+
+def issues_snapshot_query(
+    project_id: int,
+    snapshot_date: date,
+    issue_ids: Optional[List[int]] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Tuple[Statement, List[Any]]:
+    """Prepared statement and parameters for ``get_issues_snapshot``."""
+    statement = issues_snapshot_statement(
+        _select_list(columns, ISSUE_SNAPSHOT_COLUMNS), issue_ids is not None
+    )
+    params = [project_id, snapshot_date.isoformat()]
+    if issue_ids is not None:
+        params.append(list(issue_ids))
+    return statement, params
+
+
+def user_workload_query(user_id: int, year_month: str, project_id: Optional[int]):
+    """Query and parameters for ``get_user_workload``."""
+    if project_id:
+        return USER_PROJECT_WORKLOAD_SQL, (user_id, year_month, project_id)
+    return USER_WORKLOAD_SQL, (user_id, year_month)
+
+
+def project_daily_stats(
+    project_id: int, snapshot_date: date, summary: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Daily statistics from a dws_project_daily_summary row (or None)."""
+    if summary:
+        return {
+            "project_id": project_id,
+            "date": snapshot_date.isoformat(),
+            "total": summary["total_issues"],
+            "today_new": summary["new_issues"],
+            "today_closed": summary["closed_issues"],
+            "today_updated": summary.get("updated_issues", 0),
+            "by_status": {
+                "新建": summary.get("status_new", 0),
+                "进行中": summary.get("status_in_progress", 0),
+                "已解决": summary.get("status_resolved", 0),
+                "已shutdown": summary.get("status_closed", 0),
+                "反馈": summary.get("status_feedback", 0),
+            },
+            "by_priority": {
+                "立刻": summary.get("priority_immediate", 0),
+                "紧急": summary.get("priority_urgent", 0),
+                "高": summary.get("priority_high", 0),
+                "普通": summary.get("priority_normal", 0),
+                "低": summary.get("priority_low", 0),
+            },
+            "from_cache": True,
+        }
+
+    return {
+        "project_id": project_id,
+        "date": snapshot_date.isoformat(),
+        "total": 0,
+        "today_new": 0,
+        "today_closed": 0,
+        "today_updated": 0,
+        "by_status": {},
+        "by_priority": {},
+        "from_cache": False,
+    }
+
 
 class DataWarehouse:
     """Redmine PostgreSQL datawarehouse - data访问层"""
@@ -25,16 +237,15 @@ class DataWarehouse:
         self.db_name = os.getenv("WAREHOUSE_DB_NAME", "redmine_warehouse")
         self.db_user = os.getenv("WAREHOUSE_DB_USER", "redmine_warehouse")
         self.db_password = os.getenv("WAREHOUSE_DB_PASSWORD")
+        self.snapshot_storage = snapshot_storage()
 
         self.connection_pool = None
         self._init_pool()
 
     def _init_pool(self):
-        """initializedatabaseconnection池"""
+        """attach to the process-wide connection pool (created on first use)"""
         try:
-            self.connection_pool = pool.SimpleConnectionPool(
-                1,
-                10,
+            self.connection_pool = get_warehouse_pool(
                 host=self.db_host,
                 port=self.db_port,
                 dbname=self.db_name,
@@ -76,65 +287,25 @@ class DataWarehouse:
         is_updated: bool = False,
     ):
         """insert或update单个 Issue 快照"""
+        row = _issue_snapshot_row(issue, snapshot_date, is_new, is_closed, is_updated)
+        if self.snapshot_storage == "daily":
+            ensure_snapshot_partitions(self.get_connection, [snapshot_date])
         with self.get_connection() as conn:
+            if self.snapshot_storage == "history":
+                record_issue_history(conn, [_history_row(row)])
+                return
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO warehouse.dwd_issue_daily_snapshot (
-                        issue_id, project_id, snapshot_date,
-                        subject, status_id, status_name,
-                        priority_id, priority_name,
-                        assigned_to_id, assigned_to_name,
-                        created_at, updated_at,
-                        is_new, is_closed, is_updated
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                    ON CONFLICT (issue_id, snapshot_date) DO UPDATE SET
-                        status_id = EXCLUDED.status_id,
-                        status_name = EXCLUDED.status_name,
-                        priority_id = EXCLUDED.priority_id,
-                        priority_name = EXCLUDED.priority_name,
-                        assigned_to_id = EXCLUDED.assigned_to_id,
-                        assigned_to_name = EXCLUDED.assigned_to_name,
-                        updated_at = EXCLUDED.updated_at,
-                        is_updated = EXCLUDED.is_updated
-                """,
-                    (
-                        issue["id"],
-                        issue.get("project", {}).get("id"),
-                        snapshot_date,
-                        issue.get("subject", ""),
-                        issue.get("status", {}).get("id"),
-                        issue.get("status", {}).get("name"),
-                        issue.get("priority", {}).get("id"),
-                        issue.get("priority", {}).get("name"),
-                        (
-                            issue.get("assigned_to", {}).get("id")
-                            if issue.get("assigned_to")
-                            else None
-                        ),
-                        (
-                            issue.get("assigned_to", {}).get("name")
-                            if issue.get("assigned_to")
-                            else None
-                        ),
-                        issue.get("created_on", ""),
-                        issue.get("updated_on", ""),
-                        is_new,
-                        is_closed,
-                        is_updated,
-                    ),
-                )
+                execute_values(cur, _UPSERT_ISSUE_SNAPSHOT_SQL, [row])
 
     def refresh_dws_project_daily_summary(self, project_id: int, snapshot_date: date):
-        """刷新project每日汇总表"""
+        """刷新project每日汇总表
+
+        Full recompute from the snapshots.  Snapshot writers keep the row
+        up to date incrementally; this repairs it or rebuilds it after
+        bulk loads such as the backfill.
+        """
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT warehouse.refresh_dws_project_daily_summary(%s, %s)",
-                    (project_id, snapshot_date),
-                )
+            refresh_daily_summary(conn, project_id, snapshot_date)
 
     def upsert_issues_batch(
         self,
@@ -142,44 +313,140 @@ class DataWarehouse:
         issues: List[Dict[str, Any]],
         snapshot_date: date,
         previous_map: Dict[int, Dict],
+        refresh_summary: bool = True,
     ):
-        """批量insert或update Issue 快照"""
+        """批量insert或update Issue 快照
+
+        All rows are written with multi-row ``INSERT ... ON CONFLICT``
+        statements of up to ``SNAPSHOT_UPSERT_PAGE_SIZE`` rows.  With
+        ``refresh_summary`` the summary row is adjusted in the same
+        transaction by the change in bucket counts of just these issues
+        (``dws/summary.py``), so a small batch costs a small update.
+
+        With ``SNAPSHOT_STORAGE=history`` the same rows go to
+        ``dwd_issue_history`` instead, which only writes the issues whose
+        state changed (see ``dws/history.py``).
+        """
+        # One row per issue: a statement may not update the same row twice
+        rows = {}
+        for issue in issues:
+            issue_id = issue["id"]
+            prev = previous_map.get(issue_id, {})
+
+            is_new = issue_id not in previous_map
+            is_closed = (
+                issue.get("status", {}).get("name") == "已shutdown"
+                and prev.get("status_name") != "已shutdown"
+            )
+            is_updated = issue.get("updated_on", "")[:10] == snapshot_date.isoformat()
+
+            rows[issue_id] = _issue_snapshot_row(
+                issue, snapshot_date, is_new, is_closed, is_updated
+            )
+
+        if not rows:
+            return
+
+        if self.snapshot_storage == "daily":
+            ensure_snapshot_partitions(self.get_connection, [snapshot_date])
         with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                for issue in issues:
-                    issue_id = issue["id"]
-                    prev = previous_map.get(issue_id, {})
-
-                    is_new = issue_id not in previous_map
-                    is_closed = (
-                        issue.get("status", {}).get("name") == "已shutdown"
-                        and prev.get("status_name") != "已shutdown"
+            summary = (
+                daily_summary_delta(conn, project_id, snapshot_date, list(rows))
+                if refresh_summary
+                else nullcontext()
+            )
+            with summary, conn.cursor() as cur:
+                if self.snapshot_storage == "history":
+                    record_issue_history(
+                        conn,
+                        [_history_row(row) for row in rows.values()],
+                        page_size=SNAPSHOT_UPSERT_PAGE_SIZE,
                     )
-                    is_updated = (
-                        issue.get("updated_on", "")[:10] == snapshot_date.isoformat()
+                else:
+                    execute_values(
+                        cur,
+                        _UPSERT_ISSUE_SNAPSHOT_SQL,
+                        list(rows.values()),
+                        page_size=SNAPSHOT_UPSERT_PAGE_SIZE,
                     )
 
-                    self.upsert_issue(
-                        issue, snapshot_date, is_new, is_closed, is_updated
-                    )
+    def upsert_issues_page(
+        self,
+        project_id: int,
+        issues: List[Dict[str, Any]],
+        snapshot_date: date,
+        previous_date: date,
+    ) -> int:
+        """Upsert one page of issues and adjust the summary row by its delta.
+
+        Only the previous-day snapshot rows of the issues on this page are
+        loaded for the new/closed comparison, so memory stays bounded by the
+        page size.  Returns the number of issues written.
+
+        The history storage derives the flags from its intervals, so it
+        skips the previous-day read.
+        """
+        previous_map = {}
+        if self.snapshot_storage != "history":
+            previous = self.get_issues_snapshot(
+                project_id,
+                previous_date,
+                issue_ids=[issue["id"] for issue in issues],
+                columns=["issue_id", "status_name"],
+            )
+            previous_map = {row["issue_id"]: row for row in previous}
+        self.upsert_issues_batch(project_id, issues, snapshot_date, previous_map)
+        return len(issues)
 
-                # Refresh summary table
-                self.refresh_dws_project_daily_summary(project_id, snapshot_date)
+    def close_missing_issues(
+        self,
+        project_id: int,
+        snapshot_date: date,
+        issue_ids: Sequence[int],
+        created_since: Optional[date] = None,
+    ) -> int:
+        """End the history of issues a full project sync no longer returned.
+
+        ``issue_ids`` are every issue written for ``snapshot_date`` by a
+        full sync of the project (created on or after ``created_since``
+        when given).  Only the history storage needs this: daily rows of
+        missing issues are simply not written.  The summary row of the day
+        is recomputed when intervals were ended.
+
+        Returns:
+            Number of history intervals ended
+        """
+        if self.snapshot_storage != "history":
+            return 0
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                closed = close_missing_issue_history(
+                    cur, project_id, snapshot_date, issue_ids, created_since
+                )
+            if closed:
+                refresh_daily_summary(conn, project_id, snapshot_date)
+        return closed
 
     # ========== Read Operations (MCP Tools only) ==========
 
-    def get_issues_snapshot(self, project_id: int, snapshot_date: date) -> List[Dict]:
-        """get指定date的 Issue 快照"""
+    def get_issues_snapshot(
+        self,
+        project_id: int,
+        snapshot_date: date,
+        issue_ids: Optional[List[int]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict]:
+        """get指定date的 Issue 快照 (optionally only for ``issue_ids``)
+
+        ``columns`` limits the SELECT list to the given snapshot columns;
+        unknown names raise ValueError.
+        """
+        query, params = issues_snapshot_query(
+            project_id, snapshot_date, issue_ids, columns
+        )
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT * FROM warehouse.dwd_issue_daily_snapshot
-                    WHERE project_id = %s AND snapshot_date = %s
-                """,
-                    (project_id, snapshot_date.isoformat()),
-                )
-
+                execute_prepared(cur, query, params)
                 return [dict(row) for row in cur.fetchall()]
 
     def get_project_daily_stats(
@@ -188,52 +455,10 @@ class DataWarehouse:
         """getproject每日statistics（从汇总表）"""
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT * FROM warehouse.dws_project_daily_summary
-                    WHERE project_id = %s AND snapshot_date = %s
-                """,
-                    (project_id, snapshot_date.isoformat()),
+                execute_prepared(
+                    cur, PROJECT_DAILY_SUMMARY, (project_id, snapshot_date.isoformat())
                 )
-
-                summary = cur.fetchone()
-
-                if summary:
-                    return {
-                        "project_id": project_id,
-                        "date": snapshot_date.isoformat(),
-                        "total": summary["total_issues"],
-                        "today_new": summary["new_issues"],
-                        "today_closed": summary["closed_issues"],
-                        "today_updated": summary.get("updated_issues", 0),
-                        "by_status": {
-                            "新建": summary.get("status_new", 0),
-                            "进行中": summary.get("status_in_progress", 0),
-                            "已解决": summary.get("status_resolved", 0),
-                            "已shutdown": summary.get("status_closed", 0),
-                            "反馈": summary.get("status_feedback", 0),
-                        },
-                        "by_priority": {
-                            "立刻": summary.get("priority_immediate", 0),
-                            "紧急": summary.get("priority_urgent", 0),
-                            "高": summary.get("priority_high", 0),
-                            "普通": summary.get("priority_normal", 0),
-                            "低": summary.get("priority_low", 0),
-                        },
-                        "from_cache": True,
-                    }
-
-                return {
-                    "project_id": project_id,
-                    "date": snapshot_date.isoformat(),
-                    "total": 0,
-                    "today_new": 0,
-                    "today_closed": 0,
-                    "today_updated": 0,
-                    "by_status": {},
-                    "by_priority": {},
-                    "from_cache": False,
-                }
+                return project_daily_stats(project_id, snapshot_date, cur.fetchone())
 
     def get_high_priority_issues(
         self, project_id: int, snapshot_date: date, limit: int = 20
@@ -241,22 +466,9 @@ class DataWarehouse:
         """get高priority Issue"""
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT issue_id, subject, priority_name, status_name,
-                           assigned_to_name, created_at, due_date
-                    FROM warehouse.dwd_issue_daily_snapshot
-                    WHERE project_id = %s
-                      AND snapshot_date = %s
-                      AND priority_name IN ('立刻', '紧急', '高')
-                    ORDER BY
-                        CASE priority_name
-                            WHEN '立刻' THEN 1
-                            WHEN '紧急' THEN 2
-                            WHEN '高' THEN 3
-                        END
-                    LIMIT %s
-                """,
+                execute_prepared(
+                    cur,
+                    HIGH_PRIORITY_ISSUES,
                     (project_id, snapshot_date.isoformat(), limit),
                 )
 
@@ -268,21 +480,9 @@ class DataWarehouse:
         """get人员job量 TOP N"""
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT
-                        assigned_to_name,
-                        COUNT(*) as total,
-                        SUM(CASE WHEN status_name IN ('新建', '进行中', 'test中') THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN priority_name IN ('立刻', '紧急', '高') THEN 1 ELSE 0 END) as high_priority
-                    FROM warehouse.dwd_issue_daily_snapshot
-                    WHERE project_id = %s
-                      AND snapshot_date = %s
-                      AND assigned_to_name IS NOT NULL
-                    GROUP BY assigned_to_name
-                    ORDER BY total DESC
-                    LIMIT %s
-                """,
+                execute_prepared(
+                    cur,
+                    TOP_ASSIGNEES,
                     (project_id, snapshot_date.isoformat(), limit),
                 )
 
@@ -340,23 +540,7 @@ class DataWarehouse:
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT
-                        user_id, user_name, role_category, highest_role_name,
-                        journal_count, first_contribution, last_contribution,
-                        status_change_count, note_count
-                    FROM warehouse.dws_issue_contributors
-                    WHERE issue_id = %s
-                    ORDER BY
-                        CASE role_category
-                            WHEN 'manager' THEN 1
-                            WHEN 'implementation' THEN 2
-                            WHEN 'developer' THEN 3
-                            WHEN 'tester' THEN 4
-                            ELSE 5
-                        END,
-                        journal_count DESC
-                """,
+                    ISSUE_CONTRIBUTORS_SQL,
                     (issue_id,),
                 )
                 return [dict(row) for row in cur.fetchall()]
@@ -366,10 +550,7 @@ class DataWarehouse:
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT * FROM warehouse.dws_issue_contributor_summary
-                    WHERE issue_id = %s
-                """,
+                    ISSUE_CONTRIBUTOR_SUMMARY_SQL,
                     (issue_id,),
                 )
                 row = cur.fetchone()
@@ -450,10 +631,7 @@ class DataWarehouse:
         with self.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    SELECT * FROM warehouse.dws_project_role_distribution
-                    WHERE project_id = %s AND snapshot_date = %s
-                """,
+                    PROJECT_ROLE_DISTRIBUTION_SQL,
                     (project_id, snapshot_date.isoformat()),
                 )
                 row = cur.fetchone()
@@ -510,27 +688,13 @@ class DataWarehouse:
         """getuser工作量statistics"""
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                if project_id:
-                    cur.execute(
-                        """
-                        SELECT * FROM warehouse.dws_user_monthly_workload
-                        WHERE user_id = %s AND year_month = %s AND project_id = %s
-                    """,
-                        (user_id, year_month, project_id),
-                    )
-                else:
-                    cur.execute(
-                        """
-                        SELECT * FROM warehouse.dws_user_monthly_workload
-                        WHERE user_id = %s AND year_month = %s
-                        ORDER BY project_id
-                    """,
-                        (user_id, year_month),
-                    )
+                cur.execute(*user_workload_query(user_id, year_month, project_id))
                 return [dict(row) for row in cur.fetchall()]
 
     def close(self):
-        """shutdownconnection池"""
-        if self.connection_pool:
-            self.connection_pool.closeall()
-            logger.info("Database connection pool closed")
+        """release this handle; the shared pool stays open for other callers
+
+        Use ``dws.pool.close_warehouse_pool()`` to close the connections at
+        process shutdown.
+        """
+        self.connection_pool = None
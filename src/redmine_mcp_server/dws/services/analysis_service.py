@@ -11,11 +11,14 @@ This is a simplified approach based on user groups rather than journal analysis.
 """
 
 import logging
-import requests
 import os
 from typing import Dict, List, Set, Optional, Tuple
 from datetime import datetime
 
+from ...core.transport import RedmineTransport, get_redmine_transport
+from ...core.pagination import OffsetPaginator
+from ...core.reference_data import get_reference_catalog
+
 REDMINE_URL = os.getenv("REDMINE_URL")
 REDMINE_API_KEY = os.getenv("REDMINE_API_KEY")
 
@@ -57,6 +60,9 @@ ROLE_PRIORITY = {
     "other": 5,
 }
 
+# Groups whose members count as developers
+DEV_TEAM_NAMES = ("Semi Dev Team", "Semi SPC Team")
+
 
 class DevTestAnalyzer:
     def __init__(self):
@@ -67,53 +73,27 @@ class DevTestAnalyzer:
         self.dev_teams: Set[str] = set()
         self._load_dev_teams()
 
-    def _load_dev_teams(self):
-        """Load developer team members"""
-        try:
-            # Get Semi Dev Team
-            dev_team = self._get_team_members("Semi Dev Team")
-            self.dev_teams.update(dev_team)
+    @property
+    def transport(self) -> RedmineTransport:
+        """Shared keep-alive Redmine transport (resolved lazily)"""
+        return get_redmine_transport()
 
-            # Get Semi SPC Team
-            spc_team = self._get_team_members("Semi SPC Team")
-            self.dev_teams.update(spc_team)
-
-            logger.info(f"Loaded {len(self.dev_teams)} developer team members")
-        except Exception as e:
-            logger.error(f"Failed to load developer teams: {e}")
+    def _load_dev_teams(self):
+        """Load developer team members from the reference-data catalog"""
+        dev_teams = set()
+        for team_name in DEV_TEAM_NAMES:
+            dev_teams.update(self._get_team_members(team_name))
+        self.dev_teams = dev_teams
+        logger.debug(f"Loaded {len(self.dev_teams)} developer team members")
 
     def _get_team_members(self, team_name: str) -> Set[str]:
         """Get member names from a team/group"""
-        members = set()
         try:
-            # Search for group by name
-            resp = requests.get(
-                f"{self.base_url}/groups.json",
-                headers=self.headers,
-                params={"name": team_name},
-                timeout=30,
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                groups = data.get("groups", [])
-                if groups:
-                    group_id = groups[0]["id"]
-                    # Get group details with members
-                    resp2 = requests.get(
-                        f"{self.base_url}/groups/{group_id}.json",
-                        headers=self.headers,
-                        params={"include": "users,memberships"},
-                        timeout=30,
-                    )
-                    if resp2.status_code == 200:
-                        group_data = resp2.json()
-                        group = group_data.get("group", {})
-                        users = group.get("users", [])
-                        for user in users:
-                            members.add(user.get("name", ""))
+            # Group list and members are kept in memory and refreshed on a TTL
+            return get_reference_catalog().group_members(team_name)
         except Exception as e:
             logger.error(f"Failed to get team {team_name} members: {e}")
-        return members
+            return set()
 
     def is_developer(self, user_name: str) -> bool:
         """Check if user is a developer"""
@@ -123,7 +103,7 @@ class DevTestAnalyzer:
         """Analyze developer/tester workload for a project"""
         logger.info(f"Analyzing dev/test workload for project {project_id}")
 
-        # Reload teams to ensure fresh data
+        # Served from memory; the catalog refreshes groups in the background
         self._load_dev_teams()
 
         try:
@@ -191,32 +171,10 @@ class DevTestAnalyzer:
 
     def _get_resolved_issues(self, project_id: int) -> List[Dict]:
         """Get all resolved issues for a project"""
-        all_issues = []
-        offset = 0
-        limit = 100
-
-        while True:
-            resp = requests.get(
-                f"{self.base_url}/issues.json",
-                headers=self.headers,
-                params={
-                    "project_id": project_id,
-                    "status_id": self.status_resolved_id,
-                    "limit": limit,
-                    "offset": offset,
-                },
-                timeout=60,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
-
-            if len(issues) < limit:
-                break
-            offset += limit
-
-        return all_issues
+        return OffsetPaginator(
+            lambda params: self.transport.get_json("issues.json", params, timeout=60),
+            params={"project_id": project_id, "status_id": self.status_resolved_id},
+        ).fetch_all()
 
     def _get_resolver(self, issue: Dict) -> Optional[str]:
         """Get the person who resolved the issue"""
@@ -244,9 +202,8 @@ class DevTestAnalyzer:
 
     def _get_issue_journals(self, issue_id: int) -> List[Dict]:
         """Get journals for an issue"""
-        resp = requests.get(
-            f"{self.base_url}/issues/{issue_id}.json",
-            headers=self.headers,
+        resp = self.transport.get(
+            f"issues/{issue_id}.json",
             params={"include": "journals"},
             timeout=30,
         )
@@ -422,9 +379,8 @@ class DevTestAnalyzer:
 
         try:
             # Get project details with memberships
-            resp = requests.get(
-                f"{self.base_url}/projects/{project_id}.json",
-                headers=self.headers,
+            resp = self.transport.get(
+                f"projects/{project_id}.json",
                 params={"include": "memberships"},
                 timeout=30,
             )
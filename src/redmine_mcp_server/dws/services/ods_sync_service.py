@@ -11,25 +11,28 @@ import os
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-import requests
-
-from .redmine_handler import REDMINE_URL, REDMINE_API_KEY, logger
+from ...redmine_handler import REDMINE_URL, REDMINE_API_KEY, logger
+from ...core.transport import get_redmine_transport
+from ...core.pagination import OffsetPaginator, default_page_size, load_pages
+from ..ods_loader import OdsIssueLoader, compact_journal_details
 from ..repository import DataWarehouse
 
 
 class ODSSyncService:
     """ODS Layer Synchronization Service"""
 
-    def __init__(self, batch_size: int = 100):
-        self.batch_size = batch_size
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or default_page_size()
         self.warehouse: Optional[DataWarehouse] = None
         self._init_warehouse()
+        self.loader = OdsIssueLoader(self.warehouse.get_connection)
 
-        # API configuration
+        # API configuration (shared keep-alive transport)
+        self.transport = get_redmine_transport()
         self.api_url = f"{REDMINE_URL}/issues.json"
         self.headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
 
-        logger.info(f"ODSSyncService initialized (batch_size={batch_size})")
+        logger.info(f"ODSSyncService initialized (batch_size={self.batch_size})")
 
     def _init_warehouse(self):
         """Initialize warehouse connection"""
@@ -58,9 +61,8 @@ class ODSSyncService:
                 offset = 0
 
                 while True:
-                    resp = requests.get(
+                    resp = self.transport.get(
                         projects_url,
-                        headers=self.headers,
                         params={"limit": self.batch_size, "offset": offset},
                         timeout=30,
                     )
@@ -94,7 +96,7 @@ class ODSSyncService:
         """Sync single project metadata to ODS"""
         try:
             projects_url = f"{REDMINE_URL}/projects/{project_id}.json"
-            resp = requests.get(projects_url, headers=self.headers, timeout=10)
+            resp = self.transport.get(projects_url, timeout=10)
             resp.raise_for_status()
             data = resp.json()
             project = data.get("project", {})
@@ -168,7 +170,7 @@ class ODSSyncService:
             # Get project creation date
             try:
                 projects_url = f"{REDMINE_URL}/projects/{project_id}.json"
-                resp = requests.get(projects_url, headers=self.headers, timeout=10)
+                resp = self.transport.get(projects_url, timeout=10)
                 resp.raise_for_status()
                 data = resp.json()
                 created_on = data.get("project", {}).get("created_on", "")
@@ -195,7 +197,7 @@ class ODSSyncService:
         self, project_id: int, params: Dict[str, Any]
     ) -> Tuple[int, int]:
         """
-        Fetch issues from API and sync to ODS
+        Fetch issues from API and sync to ODS page by page
 
         Args:
             project_id: Project ID
@@ -204,58 +206,37 @@ class ODSSyncService:
         Returns:
             Tuple of (fetched_count, synced_count)
         """
-        all_issues = []
-        offset = 0
-
-        # Add base parameters
-        base_params = {
-            "project_id": project_id,
-            "status_id": "*",
-            "limit": self.batch_size,
-            "offset": offset,
-            **params,
-        }
-
-        # Paginate through all issues
-        while True:
-            try:
-                base_params["offset"] = offset
-                resp = requests.get(
-                    self.api_url, headers=self.headers, params=base_params, timeout=60
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                logger.debug(
-                    f"Fetched {len(all_issues)} issues for project {project_id}"
-                )
-
-                if len(issues) < self.batch_size:
-                    break
-
-                offset += self.batch_size
+        paginator = OffsetPaginator(
+            lambda page_params: self.transport.get_json(
+                self.api_url, page_params, timeout=60
+            ),
+            params={"project_id": project_id, "status_id": "*", **params},
+            page_size=self.batch_size,
+        )
 
-            except Exception as e:
-                logger.error(f"Failed to fetch issues: {e}")
-                break
+        # Each page is written to ODS before the next one is consumed
+        fetched_count, synced_count = load_pages(
+            paginator,
+            lambda issues: self._sync_issues_to_ods(project_id, issues),
+            label=f"issues for project {project_id}",
+        )
 
-        if not all_issues:
+        if not fetched_count:
             logger.info(f"No issues to sync for project {project_id}")
             return (0, 0)
 
-        # Sync to ODS
-        synced_count = self._sync_issues_to_ods(project_id, all_issues)
-
         logger.info(
-            f"Synced {synced_count}/{len(all_issues)} issues to ODS for project {project_id}"
+            f"Synced {synced_count}/{fetched_count} issues to ODS for project {project_id}"
         )
-        return (len(all_issues), synced_count)
+        return (fetched_count, synced_count)
 
     def _sync_issues_to_ods(self, project_id: int, issues: List[Dict]) -> int:
         """
-        Sync issues to ODS layer
+        Sync one page of issues (and their journals) to ODS layer
+
+        The page is staged with COPY and merged set-based in one transaction;
+        records that do not fit the ODS tables are quarantined instead of
+        aborting the page (see ``dws/ods_loader.py``).
 
         Args:
             project_id: Project ID
@@ -264,111 +245,26 @@ class ODSSyncService:
         Returns:
             Number of issues synced
         """
-        count = 0
-        with self.warehouse.get_connection() as conn:
-            with conn.cursor() as cur:
-                for issue in issues:
-                    try:
-                        # Sync issue
-                        cur.execute(
-                            """
-                            INSERT INTO warehouse.ods_issues (
-                                issue_id, project_id, subject, description,
-                                status_id, priority_id, tracker_id,
-                                author_id, assigned_to_id,
-                                created_on, updated_on, done_ratio,
-                                due_date, estimated_hours, spent_hours
-                            ) VALUES (
-                                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                            )
-                            ON CONFLICT (issue_id) DO UPDATE SET
-                                subject = EXCLUDED.subject,
-                                description = EXCLUDED.description,
-                                status_id = EXCLUDED.status_id,
-                                priority_id = EXCLUDED.priority_id,
-                                assigned_to_id = EXCLUDED.assigned_to_id,
-                                updated_on = EXCLUDED.updated_on,
-                                done_ratio = EXCLUDED.done_ratio
-                        """,
-                            (
-                                issue.get("id"),
-                                issue.get("project", {}).get("id"),
-                                issue.get("subject"),
-                                issue.get("description"),
-                                issue.get("status", {}).get("id"),
-                                issue.get("priority", {}).get("id"),
-                                issue.get("tracker", {}).get("id"),
-                                issue.get("author", {}).get("id"),
-                                (
-                                    issue.get("assigned_to", {}).get("id")
-                                    if issue.get("assigned_to")
-                                    else None
-                                ),
-                                issue.get("created_on"),
-                                issue.get("updated_on"),
-                                issue.get("done_ratio"),
-                                issue.get("due_date"),
-                                issue.get("estimated_hours"),
-                                issue.get("spent_hours"),
-                            ),
-                        )
-
-                        # Sync journals if included
-                        if "journals" in issue:
-                            self._sync_journals_to_ods(
-                                cur, issue.get("id"), issue.get("journals", [])
-                            )
-
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to sync issue {issue.get('id')}: {e}")
-                        continue
+        result = self.loader.load_page(project_id, issues)
+        if result.quarantined:
+            logger.warning(
+                f"{len(result.quarantined)} records quarantined for project "
+                f"{project_id}"
+            )
+        return result.issues
 
-        return count
+    def compact_journal_details(self) -> Dict[str, int]:
+        """
+        Remove duplicate journal details left by the append-only sync
 
-    def _sync_journals_to_ods(self, cur, issue_id: int, journals: List[Dict]):
-        """Sync journals to ODS layer"""
-        for journal in journals:
-            try:
-                cur.execute(
-                    """
-                    INSERT INTO warehouse.ods_journals (
-                        journal_id, issue_id, user_id, notes,
-                        created_on, private_notes
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (journal_id) DO UPDATE SET
-                        notes = EXCLUDED.notes,
-                        private_notes = EXCLUDED.private_notes
-                """,
-                    (
-                        journal.get("id"),
-                        issue_id,
-                        journal.get("user_id"),
-                        journal.get("notes"),
-                        journal.get("created_on"),
-                        journal.get("private_notes"),
-                    ),
-                )
+        Runs automatically before the first page with journals is loaded;
+        call it directly to compact ahead of a sync. Returns immediately
+        once the ``(journal_id, detail_ordinal)`` index exists.
 
-                # Sync journal details
-                for detail in journal.get("details", []):
-                    cur.execute(
-                        """
-                        INSERT INTO warehouse.ods_journal_details (
-                            journal_id, name, old_value, new_value, prop_key
-                        ) VALUES (%s, %s, %s, %s, %s)
-                    """,
-                        (
-                            journal.get("id"),
-                            detail.get("name"),
-                            detail.get("old_value"),
-                            detail.get("new_value"),
-                            detail.get("prop_key"),
-                        ),
-                    )
-            except Exception as e:
-                logger.error(f"Failed to sync journal: {e}")
-                continue
+        Returns:
+            Counts of deleted and renumbered rows
+        """
+        return compact_journal_details(self.warehouse.get_connection)
 
     def sync_ods_users(self, user_ids: Optional[List[int]] = None) -> int:
         """
@@ -391,9 +287,7 @@ class ODSSyncService:
 
             while True:
                 params["offset"] = offset
-                resp = requests.get(
-                    users_url, headers=self.headers, params=params, timeout=30
-                )
+                resp = self.transport.get(users_url, params=params, timeout=30)
                 resp.raise_for_status()
                 data = resp.json()
                 users = data.get("users", [])
@@ -28,14 +28,31 @@ WAREHOUSE_DB_NAME = os.getenv("WAREHOUSE_DB_NAME", "redmine_warehouse")
 WAREHOUSE_DB_USER = os.getenv("WAREHOUSE_DB_USER", "redmine_warehouse")
 WAREHOUSE_DB_PASSWORD = os.getenv("WAREHOUSE_DB_PASSWORD")
 
-import psycopg2
 from psycopg2.extras import RealDictCursor
 
+from ..pool import get_warehouse_pool
+
+# 各表最新datatime字段
+FRESHNESS_CHECKS = {
+    "ods_issues": "updated_on",
+    "dwd_issue_daily_snapshot": "snapshot_date",
+    "dws_project_daily_summary": "snapshot_date",
+    "ads_project_health_report": "snapshot_date",
+}
+
+# 近 30 天的快照date数
+SNAPSHOT_CONTINUITY_SQL = """
+    SELECT COUNT(DISTINCT snapshot_date) as unique_dates
+    FROM warehouse.dws_project_daily_summary
+    WHERE snapshot_date >= CURRENT_DATE - INTERVAL '30 days'
+"""
+
 
 class DataQualityMonitor:
     """data质量监控器"""
 
     def __init__(self):
+        self.pool = None
         self.conn = None
         self.cursor = None
 
@@ -51,9 +68,9 @@ class DataQualityMonitor:
         }
 
     def connect_db(self):
-        """connectiondatabase"""
+        """从共享connection池getconnection"""
         try:
-            self.conn = psycopg2.connect(
+            self.pool = get_warehouse_pool(
                 host=WAREHOUSE_DB_HOST,
                 port=WAREHOUSE_DB_PORT,
                 dbname=WAREHOUSE_DB_NAME,
@@ -61,6 +78,7 @@ class DataQualityMonitor:
                 password=WAREHOUSE_DB_PASSWORD,
                 cursor_factory=RealDictCursor,
             )
+            self.conn = self.pool.getconn()
             self.cursor = self.conn.cursor()
             logger.info("Database connected for quality monitoring")
         except Exception as e:
@@ -68,12 +86,15 @@ class DataQualityMonitor:
             raise
 
     def close_db(self):
-        """shutdowndatabaseconnection"""
+        """归还connection到共享connection池"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
-        logger.info("Database connection closed")
+            # An open or failed transaction is rolled back by the pool
+            self.pool.putconn(self.conn)
+            self.conn = None
+        logger.info("Database connection returned to pool")
 
     def get_table_row_counts(self) -> Dict[str, int]:
         """get所有表行数"""
@@ -106,14 +127,7 @@ class DataQualityMonitor:
         freshness = {}
 
         # check各表最新datatime
-        checks = {
-            "ods_issues": "updated_on",
-            "dwd_issue_daily_snapshot": "snapshot_date",
-            "dws_project_daily_summary": "snapshot_date",
-            "ads_project_health_report": "snapshot_date",
-        }
-
-        for table, date_column in checks.items():
+        for table, date_column in FRESHNESS_CHECKS.items():
             try:
                 self.cursor.execute(f"""
                     SELECT MAX({date_column}) as max_date 
@@ -214,11 +228,7 @@ class DataQualityMonitor:
             }
 
             # check快照date是否连续
-            self.cursor.execute("""
-                SELECT COUNT(DISTINCT snapshot_date) as unique_dates
-                FROM warehouse.dws_project_daily_summary
-                WHERE snapshot_date >= CURRENT_DATE - INTERVAL '30 days'
-            """)
+            self.cursor.execute(SNAPSHOT_CONTINUITY_SQL)
             result = self.cursor.fetchone()
             unique_dates = result["unique_dates"] if result else 0
 
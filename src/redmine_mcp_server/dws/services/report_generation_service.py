@@ -10,7 +10,8 @@ import os
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import requests
+from ...core.transport import get_redmine_transport
+from ...core.pagination import OffsetPaginator
 
 logger = logging.getLogger(__name__)
 
@@ -30,36 +31,20 @@ class ReportGenerationService:
         logger.info("ReportGenerationService initialized")
 
     def redmine_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Call Redmine REST API"""
-        url = f"{self.redmine_url}/{endpoint}"
-        all_params = {"key": self.api_key, **(params or {})}
-        resp = requests.get(url, params=all_params, timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+        """Call Redmine REST API over the shared keep-alive transport"""
+        return get_redmine_transport().get_json(endpoint, params)
+
+    def _fetch_all_issues(self, project_id: int) -> List[Dict[str, Any]]:
+        """Fetch every issue of a project, paging concurrently"""
+        return OffsetPaginator(
+            lambda params: self.redmine_get("issues.json", params),
+            params={"project_id": project_id, "status_id": "*"},
+        ).fetch_all()
 
     def get_project_stats(self, project_id: int) -> Dict[str, Any]:
         """Get basic project statistics"""
         try:
-            all_issues = []
-            offset = 0
-            limit = 100
-
-            while True:
-                data = self.redmine_get(
-                    "issues.json",
-                    {
-                        "project_id": project_id,
-                        "status_id": "*",
-                        "limit": limit,
-                        "offset": offset,
-                    },
-                )
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                if len(issues) < limit:
-                    break
-                offset += limit
+            all_issues = self._fetch_all_issues(project_id)
 
             # Basic statistics
             total = len(all_issues)
@@ -227,26 +212,7 @@ class ReportGenerationService:
         week_closed = 0
 
         # 重新get Issue 来计算本周data
-        all_issues = []
-        offset = 0
-        limit = 100
-
-        while True:
-            data = self.redmine_get(
-                "issues.json",
-                {
-                    "project_id": project_id,
-                    "status_id": "*",
-                    "limit": limit,
-                    "offset": offset,
-                },
-            )
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
-
-            if len(issues) < limit:
-                break
-            offset += limit
+        all_issues = self._fetch_all_issues(project_id)
 
         for issue in all_issues:
             created_on = issue.get("created_on", "")
@@ -329,26 +295,7 @@ class ReportGenerationService:
         month_closed = 0
 
         # get Issue 计算本月data
-        all_issues = []
-        offset = 0
-        limit = 100
-
-        while True:
-            data = self.redmine_get(
-                "issues.json",
-                {
-                    "project_id": project_id,
-                    "status_id": "*",
-                    "limit": limit,
-                    "offset": offset,
-                },
-            )
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
-
-            if len(issues) < limit:
-                break
-            offset += limit
+        all_issues = self._fetch_all_issues(project_id)
 
         for issue in all_issues:
             created_on = issue.get("created_on", "")
@@ -11,7 +11,8 @@ import os
 import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import requests
+from ...core.reference_data import get_reference_catalog
+from ...core.transport import get_redmine_transport
 
 logger = logging.getLogger(__name__)
 
@@ -31,12 +32,8 @@ class SubscriptionPushService:
         logger.info("SubscriptionPushService initialized")
 
     def redmine_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Call Redmine REST API"""
-        url = f"{self.redmine_url}/{endpoint}"
-        all_params = {"key": self.api_key, **(params or {})}
-        resp = requests.get(url, params=all_params, timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+        """Call Redmine REST API over the shared keep-alive transport"""
+        return get_redmine_transport().get_json(endpoint, params)
 
     def get_project_stats(self, project_id: int) -> Dict[str, Any]:
         """Get project statistics (backward compatibility)"""
@@ -98,12 +95,13 @@ class SubscriptionPushService:
                 logger.error(f"Failed to generate report for project {project_id}")
                 return False
 
-            # Get project name
+            # Get project name (from memory after the first push)
             try:
-                project_data = self.redmine_get(f"projects/{project_id}.json")
-                project_name = project_data["project"]["name"]
-            except:
-                project_name = f"Project {project_id}"
+                project_name = get_reference_catalog().name_for("projects", project_id)
+            except Exception as e:
+                logger.warning(f"Failed to look up name of project {project_id}: {e}")
+                project_name = None
+            project_name = project_name or f"Project {project_id}"
 
             # Push based on channel
             if channel == "email":
@@ -7,18 +7,19 @@ Reconstruct daily snapshots from Issue creation date and journals
 import os
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import requests
-
+from typing import Dict, Iterator, List, Any, Optional
+from ..history import HISTORY_COLUMNS, record_issue_history
+from ..partitions import ensure_snapshot_partitions
 from ..repository import DataWarehouse
 from ...redmine_handler import REDMINE_URL, REDMINE_API_KEY, logger
+from ...core.pagination import default_page_size, iter_issue_pages, load_pages
 
 
 class BackfillSync:
     """Backfill historical daily snapshots"""
 
-    def __init__(self, batch_size: int = 100):
-        self.batch_size = batch_size
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or default_page_size()
         self.warehouse: Optional[DataWarehouse] = None
         self._init_warehouse()
 
@@ -31,50 +32,50 @@ class BackfillSync:
             logger.error(f"BackfillSync: Failed to initialize warehouse: {e}")
             raise
 
+    def iter_project_issue_pages(
+        self, project_id: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of a project's issues with full journals
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Iterator over pages of up to batch_size issues
+        """
+        logger.info(f"Fetching all issues for project {project_id}...")
+        return iter_issue_pages(
+            {
+                "project_id": project_id,
+                "status_id": "*",
+                "include": "journals",  # Include journals for history
+            },
+            page_size=self.batch_size,
+            timeout=60,
+        )
+
     def get_project_issues(self, project_id: int) -> List[Dict[str, Any]]:
         """
         Get all issues for a project with full journals
 
+        Holds the whole project in memory; backfill_project streams pages
+        through iter_project_issue_pages instead.
+
         Args:
             project_id: Project ID
 
         Returns:
             List of issues with journals
         """
-        api_url = f"{REDMINE_URL}/issues.json"
-        headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-
         all_issues = []
-        offset = 0
-
-        logger.info(f"Fetching all issues for project {project_id}...")
-
-        while True:
-            try:
-                params = {
-                    "project_id": project_id,
-                    "status_id": "*",
-                    "limit": self.batch_size,
-                    "offset": offset,
-                    "include": "journals",  # Include journals for history
-                }
-
-                resp = requests.get(api_url, headers=headers, params=params, timeout=60)
-                resp.raise_for_status()
-                data = resp.json()
-                issues = data.get("issues", [])
+        try:
+            for issues in self.iter_project_issue_pages(project_id):
                 all_issues.extend(issues)
-
                 logger.info(f"Fetched {len(all_issues)} issues...")
-
-                if len(issues) < self.batch_size:
-                    break
-
-                offset += self.batch_size
-
-            except Exception as e:
-                logger.error(f"Failed to fetch issues: {e}")
-                break
+        except Exception as e:
+            logger.error(f"Failed to fetch issues after {len(all_issues)}: {e}")
+            raise
 
         logger.info(f"Total issues fetched: {len(all_issues)}")
         return all_issues
@@ -183,25 +184,11 @@ class BackfillSync:
 
         return timeline
 
-    def backfill_project(self, project_id: int, start_date: Optional[datetime] = None):
-        """
-        Backfill daily snapshots for a project
-
-        Args:
-            project_id: Project ID
-            start_date: Optional start date (default: project creation)
-        """
-        logger.info(f"Starting backfill for project {project_id}...")
-
-        # Get all issues with journals
-        issues = self.get_project_issues(project_id)
-
-        if not issues:
-            logger.warning(f"No issues found for project {project_id}")
-            return
-
-        # Build timelines for all issues
-        all_snapshots = {}  # date -> list of snapshots
+    def _group_snapshots(
+        self, issues: List[Dict[str, Any]], start_date: Optional[datetime] = None
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """Build timelines for a page of issues, grouped by snapshot date"""
+        snapshots = {}  # date -> list of snapshots
 
         for issue in issues:
             timeline = self.build_issue_timeline(issue)
@@ -213,72 +200,124 @@ class BackfillSync:
                 if start_date and date < start_date.date():
                     continue
 
-                if date not in all_snapshots:
-                    all_snapshots[date] = []
+                if date not in snapshots:
+                    snapshots[date] = []
 
-                all_snapshots[date].append(state)
+                snapshots[date].append(state)
 
-        logger.info(f"Built snapshots for {len(all_snapshots)} days")
+        return snapshots
 
-        # Save snapshots to warehouse
-        total_saved = 0
-        for date in sorted(all_snapshots.keys()):
-            snapshots = all_snapshots[date]
+    def _save_snapshots(self, date, snapshots: List[Dict[str, Any]]) -> int:
+        """Save one day's issue snapshots
 
-            try:
-                # Save issue snapshots
-                with self.warehouse.get_connection() as conn:
-                    with conn.cursor() as cur:
-                        for state in snapshots:
-                            cur.execute(
-                                """
-                                INSERT INTO warehouse.dwd_issue_daily_snapshot (
-                                    issue_id, project_id, snapshot_date,
-                                    subject, status_id, status_name,
-                                    priority_id, priority_name,
-                                    assigned_to_id, assigned_to_name,
-                                    created_at, updated_at,
-                                    is_new, is_closed, is_updated
-                                ) VALUES (
-                                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                                )
-                                ON CONFLICT (issue_id, snapshot_date) DO UPDATE SET
-                                    status_id = EXCLUDED.status_id,
-                                    status_name = EXCLUDED.status_name,
-                                    priority_id = EXCLUDED.priority_id,
-                                    priority_name = EXCLUDED.priority_name,
-                                    assigned_to_id = EXCLUDED.assigned_to_id,
-                                    assigned_to_name = EXCLUDED.assigned_to_name,
-                                    updated_at = EXCLUDED.updated_at,
-                                    is_closed = EXCLUDED.is_closed
-                            """,
-                                (
-                                    state["issue_id"],
-                                    state["project_id"],
-                                    date,
-                                    state["subject"],
-                                    state["status_id"],
-                                    state["status_name"],
-                                    state["priority_id"],
-                                    state["priority_name"],
-                                    state["assigned_to_id"],
-                                    state["assigned_to_name"],
-                                    state["created_at"],
-                                    state["updated_at"],
-                                    state["is_new"],
-                                    state["is_closed"],
-                                    state["is_updated"],
-                                ),
-                            )
-
-                # Refresh daily summary
-                self.warehouse.refresh_daily_summary(project_id, date)
-
-                total_saved += len(snapshots)
-                logger.info(f"Saved {len(snapshots)} snapshots for {date}")
+        Returns:
+            Number of snapshots written; the history storage skips states
+            that did not change or are older than its recorded history
+        """
+        if self.warehouse.snapshot_storage == "history":
+            rows = [
+                tuple(
+                    date if column == "day" else state[column]
+                    for column in HISTORY_COLUMNS
+                )
+                for state in snapshots
+            ]
+            with self.warehouse.get_connection() as conn:
+                return record_issue_history(conn, rows)
+
+        ensure_snapshot_partitions(self.warehouse.get_connection, [date])
+        with self.warehouse.get_connection() as conn:
+            with conn.cursor() as cur:
+                for state in snapshots:
+                    cur.execute(
+                        """
+                        INSERT INTO warehouse.dwd_issue_daily_snapshot (
+                            issue_id, project_id, snapshot_date,
+                            subject, status_id, status_name,
+                            priority_id, priority_name,
+                            assigned_to_id, assigned_to_name,
+                            created_at, updated_at,
+                            is_new, is_closed, is_updated
+                        ) VALUES (
+                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        )
+                        ON CONFLICT (issue_id, snapshot_date) DO UPDATE SET
+                            status_id = EXCLUDED.status_id,
+                            status_name = EXCLUDED.status_name,
+                            priority_id = EXCLUDED.priority_id,
+                            priority_name = EXCLUDED.priority_name,
+                            assigned_to_id = EXCLUDED.assigned_to_id,
+                            assigned_to_name = EXCLUDED.assigned_to_name,
+                            updated_at = EXCLUDED.updated_at,
+                            is_closed = EXCLUDED.is_closed
+                    """,
+                        (
+                            state["issue_id"],
+                            state["project_id"],
+                            date,
+                            state["subject"],
+                            state["status_id"],
+                            state["status_name"],
+                            state["priority_id"],
+                            state["priority_name"],
+                            state["assigned_to_id"],
+                            state["assigned_to_name"],
+                            state["created_at"],
+                            state["updated_at"],
+                            state["is_new"],
+                            state["is_closed"],
+                            state["is_updated"],
+                        ),
+                    )
+        return len(snapshots)
+
+    def backfill_project(self, project_id: int, start_date: Optional[datetime] = None):
+        """
+        Backfill daily snapshots for a project
+
+        Issues are fetched and saved page by page, so memory stays bounded by
+        the page size; daily summaries are refreshed once all pages are in.
 
+        Args:
+            project_id: Project ID
+            start_date: Optional start date (default: project creation)
+        """
+        logger.info(f"Starting backfill for project {project_id}...")
+
+        touched_dates = set()
+
+        def save_page(issues: List[Dict[str, Any]]) -> int:
+            saved = 0
+            snapshots_by_date = self._group_snapshots(issues, start_date)
+            for date in sorted(snapshots_by_date.keys()):
+                snapshots = snapshots_by_date[date]
+                try:
+                    written = self._save_snapshots(date, snapshots)
+                    touched_dates.add(date)
+                    saved += written
+                    logger.debug(f"Saved {written} snapshots for {date}")
+                except Exception as e:
+                    logger.error(f"Failed to save snapshots for {date}: {e}")
+            return saved
+
+        fetched, total_saved = load_pages(
+            self.iter_project_issue_pages(project_id),
+            save_page,
+            label=f"issues for project {project_id}",
+        )
+
+        if not fetched:
+            logger.warning(f"No issues found for project {project_id}")
+            return
+
+        logger.info(f"Built snapshots for {len(touched_dates)} days")
+
+        # Refresh daily summaries
+        for date in sorted(touched_dates):
+            try:
+                self.warehouse.refresh_dws_project_daily_summary(project_id, date)
             except Exception as e:
-                logger.error(f"Failed to save snapshots for {date}: {e}")
+                logger.error(f"Failed to refresh daily summary for {date}: {e}")
 
         logger.info(
             f"Backfill completed for project {project_id}: {total_saved} snapshots saved"
@@ -290,7 +329,7 @@ class BackfillSync:
             self.warehouse.close()
 
 
-def backfill_all_projects(project_ids: List[int], batch_size: int = 100):
+def backfill_all_projects(project_ids: List[int], batch_size: Optional[int] = None):
     """
     Backfill all projects
 
@@ -302,7 +341,10 @@ def backfill_all_projects(project_ids: List[int], batch_size: int = 100):
 
     try:
         for project_id in project_ids:
-            sync.backfill_project(project_id)
+            try:
+                sync.backfill_project(project_id)
+            except Exception as e:
+                logger.error(f"Backfill failed for project {project_id}: {e}")
     finally:
         sync.close()
 
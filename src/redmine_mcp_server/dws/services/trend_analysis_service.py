@@ -10,7 +10,8 @@ import os
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-import requests
+from ...core.transport import get_redmine_transport
+from ...core.pagination import OffsetPaginator
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +25,8 @@ class TrendAnalysisService:
         logger.info("TrendAnalysisService initialized")
 
     def redmine_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Call Redmine REST API"""
-        url = f"{self.redmine_url}/{endpoint}"
-        all_params = {"key": self.api_key, **(params or {})}
-        resp = requests.get(url, params=all_params, timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+        """Call Redmine REST API over the shared keep-alive transport"""
+        return get_redmine_transport().get_json(endpoint, params)
 
     def get_historical_issues(
         self, project_id: int, days: int = 7
@@ -45,32 +42,17 @@ class TrendAnalysisService:
             Issue list
         """
         all_issues = []
-        offset = 0
-        limit = 100
+        paginator = OffsetPaginator(
+            lambda params: self.redmine_get("issues.json", params),
+            params={"project_id": project_id, "status_id": "*", "include": "journals"},
+        )
 
         # get所有 Issue（包含历史记录）
-        while True:
-            try:
-                data = self.redmine_get(
-                    "issues.json",
-                    {
-                        "project_id": project_id,
-                        "status_id": "*",
-                        "limit": limit,
-                        "offset": offset,
-                        "include": "journals",
-                    },
-                )
-                issues = data.get("issues", [])
+        try:
+            for issues in paginator:
                 all_issues.extend(issues)
-
-                if len(issues) < limit:
-                    break
-                offset += limit
-
-            except Exception as e:
-                logger.error(f"Failed to fetch issues: {e}")
-                break
+        except Exception as e:
+            logger.error(f"Failed to fetch issues: {e}")
 
         return all_issues
 
@@ -0,0 +1,212 @@
+"""Prepared statements for the hot warehouse read queries.
+
+The daily-stats family of reads (project summary, high-priority issues,
+top assignees, issue snapshots) runs the same few SQL texts over and over.
+Each :class:`Statement` is sent once per connection with ``PREPARE`` and
+then run with ``EXECUTE name (...)``, so PostgreSQL parses and plans it
+once per connection instead of on every call.
+
+The registry remembers which statements each connection has prepared
+(connections are weakly referenced, so recycled connections are simply
+forgotten and prepare again) and keeps per-statement timings, reported
+under ``warehouse_statements`` in ``/health``.  Prepared statements live
+for the whole session and are not undone by a rollback, so the blocking
+pool's transactions and the async pool's autocommit connections can both
+use them.
+"""
+
+import hashlib
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class Statement:
+    """A named query with ``$1``, ``$2``, ... parameters."""
+
+    name: str
+    text: str
+    param_count: int
+
+    @property
+    def prepare_sql(self) -> str:
+        return f"PREPARE {self.name} AS {self.text}"
+
+    @property
+    def execute_sql(self) -> str:
+        if not self.param_count:
+            return f"EXECUTE {self.name}"
+        return f"EXECUTE {self.name} ({', '.join(['%s'] * self.param_count)})"
+
+
+class StatementRegistry:
+    """Tracks prepared statements per connection and their timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prepared: "weakref.WeakKeyDictionary[Any, set]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def needs_prepare(self, conn: Any, statement: Statement) -> bool:
+        with self._lock:
+            return statement.name not in self._prepared.get(conn, ())
+
+    def mark_prepared(self, conn: Any, statement: Statement, seconds: float) -> None:
+        with self._lock:
+            self._prepared.setdefault(conn, set()).add(statement.name)
+            stats = self._entry(statement)
+            stats["prepares"] += 1
+            stats["prepare_ms"] += seconds * 1000
+
+    def record(self, statement: Statement, seconds: float) -> None:
+        with self._lock:
+            stats = self._entry(statement)
+            stats["calls"] += 1
+            stats["total_ms"] += seconds * 1000
+            stats["max_ms"] = max(stats["max_ms"], seconds * 1000)
+
+    def _entry(self, statement: Statement) -> Dict[str, float]:
+        return self._stats.setdefault(
+            statement.name,
+            {
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "prepares": 0,
+                "prepare_ms": 0.0,
+            },
+        )
+
+    def execute(self, cur: Any, statement: Statement, params: Sequence = ()) -> None:
+        """Run ``statement`` on a blocking cursor, preparing it first if needed."""
+        conn = cur.connection
+        if self.needs_prepare(conn, statement):
+            started = time.perf_counter()
+            cur.execute(statement.prepare_sql)
+            self.mark_prepared(conn, statement, time.perf_counter() - started)
+        started = time.perf_counter()
+        cur.execute(statement.execute_sql, tuple(params))
+        self.record(statement, time.perf_counter() - started)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-statement call counts and execution / prepare times."""
+        with self._lock:
+            return {
+                name: {
+                    "calls": int(stats["calls"]),
+                    "avg_ms": (
+                        round(stats["total_ms"] / stats["calls"], 2)
+                        if stats["calls"]
+                        else 0.0
+                    ),
+                    "max_ms": round(stats["max_ms"], 2),
+                    "prepares": int(stats["prepares"]),
+                    "avg_prepare_ms": (
+                        round(stats["prepare_ms"] / stats["prepares"], 2)
+                        if stats["prepares"]
+                        else 0.0
+                    ),
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Forget prepared connections and timings (tests)."""
+        with self._lock:
+            self._prepared = weakref.WeakKeyDictionary()
+            self._stats.clear()
+
+
+registry = StatementRegistry()
+
+
+def execute_prepared(cur: Any, statement: Statement, params: Sequence = ()) -> None:
+    """Run ``statement`` on ``cur`` through the shared registry."""
+    registry.execute(cur, statement, params)
+
+
+def get_statement_stats() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Return per-statement timings, or None before any statement ran."""
+    return registry.get_stats() or None
+
+
+# ========== Hot read statements ==========
+
+# Snapshot reads go through warehouse.issue_snapshot_on(project, date),
+# which serves dwd_issue_daily_snapshot rows or reconstructs them from
+# dwd_issue_history (init-scripts/v0.11.0__issue_history.sql).
+
+# Only the columns project_daily_stats reads
+PROJECT_DAILY_SUMMARY = Statement(
+    "rmcp_project_daily_summary",
+    """
+    SELECT total_issues, new_issues, closed_issues,
+           status_new, status_in_progress, status_resolved, status_closed,
+           priority_immediate, priority_urgent, priority_high,
+           priority_normal, priority_low
+    FROM warehouse.dws_project_daily_summary
+    WHERE project_id = $1 AND snapshot_date = $2
+    """,
+    2,
+)
+
+HIGH_PRIORITY_ISSUES = Statement(
+    "rmcp_high_priority_issues",
+    """
+    SELECT issue_id, subject, priority_name, status_name,
+           assigned_to_name, created_at
+    FROM warehouse.issue_snapshot_on($1, $2)
+    WHERE priority_name IN ('立刻', '紧急', '高')
+    ORDER BY
+        CASE priority_name
+            WHEN '立刻' THEN 1
+            WHEN '紧急' THEN 2
+            WHEN '高' THEN 3
+        END
+    LIMIT $3
+    """,
+    3,
+)
+
+TOP_ASSIGNEES = Statement(
+    "rmcp_top_assignees",
+    """
+    SELECT
+        assigned_to_name,
+        COUNT(*) as total,
+        SUM(CASE WHEN status_name IN ('新建', '进行中', 'test中') THEN 1 ELSE 0 END) as in_progress,
+        SUM(CASE WHEN priority_name IN ('立刻', '紧急', '高') THEN 1 ELSE 0 END) as high_priority
+    FROM warehouse.issue_snapshot_on($1, $2)
+    WHERE assigned_to_name IS NOT NULL
+    GROUP BY assigned_to_name
+    ORDER BY total DESC
+    LIMIT $3
+    """,
+    3,
+)
+
+
+@lru_cache(maxsize=64)
+def issues_snapshot_statement(column_list: str, by_issue_ids: bool) -> Statement:
+    """Snapshot query for a validated, quoted column list (``*`` for all).
+
+    One statement per distinct column list / id filter combination; callers
+    only use a handful of them.
+    """
+    digest = hashlib.sha1(column_list.encode()).hexdigest()[:10]
+    text = f"""
+    SELECT {column_list} FROM warehouse.issue_snapshot_on($1, $2)
+    """
+    if by_issue_ids:
+        text += "WHERE issue_id = ANY($3)\n"
+    return Statement(
+        f"rmcp_issues_snapshot_{digest}{'_ids' if by_issue_ids else ''}",
+        text,
+        3 if by_issue_ids else 2,
+    )
@@ -0,0 +1,113 @@
+"""Incremental maintenance of ``warehouse.dws_project_daily_summary``.
+
+A full refresh recounts every snapshot row of a project and day.  Writers
+that only touch some issues use :func:`daily_summary_delta` instead:
+
+1. the summary row is locked (``FOR UPDATE``), so concurrent writers of the
+   same project and day apply their deltas one after the other;
+2. the buckets of the issues about to be written are counted;
+3. the caller writes its rows;
+4. the same issues are counted again and the per-bucket difference is
+   added to the summary row.
+
+All of it runs in the caller's transaction, and the counts come from
+``warehouse.summarize_issue_snapshots`` (``init-scripts/
+v0.11.0__summary_delta.sql``), which also backs the full refresh, so both
+paths agree on the bucket definitions.  A day without a summary row yet is
+fully recomputed after the write.  ``refresh_daily_summary`` remains
+available to repair a drifted row.
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Dict, Iterator, Sequence
+
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+# Counted columns of dws_project_daily_summary
+SUMMARY_COLUMNS = (
+    "total_issues",
+    "new_issues",
+    "closed_issues",
+    "status_new",
+    "status_in_progress",
+    "status_resolved",
+    "status_closed",
+    "priority_immediate",
+    "priority_urgent",
+    "priority_high",
+    "priority_normal",
+    "priority_low",
+)
+
+_LOCK_SUMMARY_SQL = """
+    SELECT 1 FROM warehouse.dws_project_daily_summary
+    WHERE project_id = %s AND snapshot_date = %s
+    FOR UPDATE
+"""
+
+_SUMMARY_COUNTS_SQL = f"""
+    SELECT {", ".join(SUMMARY_COLUMNS)}
+    FROM warehouse.summarize_issue_snapshots(%s, %s, %s)
+"""
+
+_APPLY_SUMMARY_DELTA_SQL = f"""
+    UPDATE warehouse.dws_project_daily_summary
+    SET {", ".join(f"{column} = {column} + %s" for column in SUMMARY_COLUMNS)}
+    WHERE project_id = %s AND snapshot_date = %s
+"""
+
+
+def refresh_daily_summary(conn: Any, project_id: int, day: date) -> None:
+    """Recompute the summary row of ``project_id`` on ``day`` from scratch."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT warehouse.refresh_dws_project_daily_summary(%s, %s)",
+            (project_id, day),
+        )
+
+
+def summary_counts(
+    conn: Any, project_id: int, day: date, issue_ids: Sequence[int]
+) -> Dict[str, int]:
+    """Summary bucket counts of ``issue_ids`` in ``project_id`` on ``day``."""
+    with conn.cursor(cursor_factory=extensions.cursor) as cur:
+        cur.execute(_SUMMARY_COUNTS_SQL, (project_id, day, list(issue_ids)))
+        row = cur.fetchone()
+    return dict(zip(SUMMARY_COLUMNS, row))
+
+
+@contextmanager
+def daily_summary_delta(
+    conn: Any, project_id: int, day: date, issue_ids: Sequence[int]
+) -> Iterator[None]:
+    """Keep the summary row in step with the writes made inside the block.
+
+    ``issue_ids`` must cover every snapshot row of ``day`` the block
+    writes.  The block runs on ``conn``'s transaction; nothing is applied
+    if it raises.
+    """
+    with conn.cursor() as cur:
+        cur.execute(_LOCK_SUMMARY_SQL, (project_id, day))
+        exists = cur.fetchone() is not None
+
+    if not exists:
+        yield
+        refresh_daily_summary(conn, project_id, day)
+        return
+
+    before = summary_counts(conn, project_id, day, issue_ids)
+    yield
+    after = summary_counts(conn, project_id, day, issue_ids)
+
+    delta = [after[column] - before[column] for column in SUMMARY_COLUMNS]
+    if any(delta):
+        with conn.cursor() as cur:
+            cur.execute(_APPLY_SUMMARY_DELTA_SQL, (*delta, project_id, day))
+        logger.debug(
+            f"Summary of project {project_id} on {day} adjusted by "
+            f"{dict(zip(SUMMARY_COLUMNS, delta))}"
+        )
@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import os
 import sys
@@ -17,28 +18,26 @@ logging.basicConfig(
 
 # Import MCP from new location
 from .mcp.server import mcp  # noqa: E402
-
-# Scheduler imports
-try:
-    from .scheduler.tasks import (
-        init_scheduler as init_sync_scheduler,
-        shutdown_scheduler as shutdown_sync_scheduler,
-    )
-except ImportError:
-    init_sync_scheduler = None
-    shutdown_sync_scheduler = None  # noqa: E402
-
-try:
-    from .scheduler.subscription_scheduler import (
-        init_subscription_scheduler,
-        shutdown_subscription_scheduler,
-    )
-except ImportError:
-    init_subscription_scheduler = None
-    shutdown_subscription_scheduler = None  # noqa: E402
+from .core.executor import get_executor_stats  # noqa: E402
+from .core.cache import get_cache_stats  # noqa: E402
+from .core.reference_data import get_reference_stats  # noqa: E402
+from .core.singleflight import get_singleflight_stats  # noqa: E402
+from .core.transport import get_circuit_state, get_transport_stats  # noqa: E402
+from .dws.async_pool import (  # noqa: E402
+    close_async_warehouse_pools,
+    get_async_warehouse_pool_stats,
+)
+from .dws.pool import close_warehouse_pool, get_warehouse_pool_stats  # noqa: E402
+from .dws.statements import get_statement_stats  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Background schedulers (and the apscheduler/psycopg2 imports and warehouse
+# pools they bring) belong to the long-lived HTTP server only.  They start
+# with the HTTP app or main(), never on import, so stdio sessions spawned per
+# MCP host connection stay cheap.
+_schedulers_started = False
+
 
 def get_version() -> str:
     try:
@@ -47,10 +46,23 @@ def get_version() -> str:
         return "dev"
 
 
-# Initialize schedulers at module level (runs on import)
 def _initialize_schedulers():
-    """Initialize schedulers when module is imported"""
-    logger.info(f"Redmine MCP Server v{get_version()} starting...")
+    """Start the subscription manager and background schedulers (once)"""
+    global _schedulers_started
+    if _schedulers_started:
+        return
+    _schedulers_started = True
+    logger.info(f"Redmine MCP Server v{get_version()} starting schedulers...")
+
+    try:
+        from .scheduler.tasks import init_scheduler as init_sync_scheduler
+    except ImportError:
+        init_sync_scheduler = None
+
+    try:
+        from .scheduler.subscription_scheduler import init_subscription_scheduler
+    except ImportError:
+        init_subscription_scheduler = None
 
     # 1. Initialize subscription manager
     try:
@@ -82,10 +94,6 @@ def _initialize_schedulers():
             logger.warning("Continuing without sync scheduler")
 
 
-# Initialize schedulers when running with uvicorn (imported)
-_initialize_schedulers()
-
-
 # Apply settings at module level
 mcp.settings.host = os.getenv("SERVER_HOST", "0.0.0.0")
 mcp.settings.port = int(os.getenv("SERVER_PORT", "8000"))
@@ -94,6 +102,23 @@ mcp.settings.stateless_http = True
 # Export the Starlette/FastAPI app for testing and external use
 app = mcp.streamable_http_app()
 
+_mcp_lifespan = app.router.lifespan_context
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(app):
+    """Start the schedulers when the HTTP app is served (e.g. by uvicorn)"""
+    _initialize_schedulers()
+    try:
+        async with _mcp_lifespan(app):
+            yield
+    finally:
+        close_async_warehouse_pools()
+        close_warehouse_pool()
+
+
+app.router.lifespan_context = _lifespan
+
 
 # Add health check endpoint
 @app.route("/health", methods=["GET"])
@@ -106,6 +131,15 @@ async def health_check(request):
             "status": "healthy",
             "version": get_version(),
             "timestamp": datetime.now().isoformat(),
+            "executors": get_executor_stats(),
+            "request_coalescing": get_singleflight_stats(),
+            "redmine_cache": get_cache_stats(),
+            "reference_data": get_reference_stats(),
+            "redmine_circuit": get_circuit_state(),
+            "redmine_transport": get_transport_stats(),
+            "warehouse_pool": get_warehouse_pool_stats(),
+            "warehouse_async_pool": get_async_warehouse_pool_stats(),
+            "warehouse_statements": get_statement_stats(),
         }
     )
 
@@ -146,6 +180,8 @@ def main():
 
     if transport == "stdio":
         mcp.settings.port = 0
+    else:
+        _initialize_schedulers()
 
     mcp.run(transport=transport)
 
@@ -7,7 +7,6 @@ MCP Server - Main Entry Point
 import os
 import logging
 from dotenv import load_dotenv
-from redminelib import Redmine
 from mcp.server.fastmcp import FastMCP
 
 # Load environment variables
@@ -16,18 +15,11 @@ load_dotenv()
 # Initialize logging
 logger = logging.getLogger(__name__)
 
-# Initialize Redmine client
-redmine = None
-REDMINE_URL = os.getenv("REDMINE_URL")
-REDMINE_API_KEY = os.getenv("REDMINE_API_KEY")
-
-if REDMINE_URL and REDMINE_API_KEY:
-    try:
-        redmine = Redmine(REDMINE_URL, key=REDMINE_API_KEY)
-        logger.info("Redmine client initialized successfully")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Redmine client: {e}")
-else:
+# Reuse the Redmine client built by redmine_handler so both share the same
+# auth/SSL settings and the pooled keep-alive transport
+from ..redmine_handler import redmine, REDMINE_URL, REDMINE_API_KEY  # noqa: E402
+
+if redmine is None:
     logger.warning("Redmine credentials not configured")
 
 # Initialize MCP server
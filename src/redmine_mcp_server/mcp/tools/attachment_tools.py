@@ -4,16 +4,18 @@
 Redmine MCP - Project Status Summary Tools (DWS-powered)
 """
 
+import asyncio
+from importlib.util import find_spec
+
 from ..server import mcp, redmine, logger
+from ...core.executor import run_redmine, run_warehouse
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timedelta, date
 
-try:
-    from ...dws.repository import DataWarehouse
-
-    DWS_AVAILABLE = True
-except ImportError:
-    DWS_AVAILABLE = False
+# Only check that the driver is installed; psycopg2 and the repository are
+# imported on first use so loading the tool modules stays cheap
+DWS_AVAILABLE = find_spec("psycopg2") is not None
+if not DWS_AVAILABLE:
     logger.warning("DWS repository not available, will fallback to Redmine API")
 
 
@@ -34,6 +36,12 @@ async def summarize_project_status(project_id: int, days: int = 30) -> Dict[str,
 
 
 async def _summarize_from_dws(project_id: int, days: int = 30) -> Dict[str, Any]:
+    return await run_warehouse(_summarize_from_dws_sync, project_id, days)
+
+
+def _summarize_from_dws_sync(project_id: int, days: int = 30) -> Dict[str, Any]:
+    from ...dws.repository import DataWarehouse
+
     warehouse = None
     try:
         warehouse = DataWarehouse()
@@ -127,23 +135,29 @@ async def _summarize_from_api(project_id: int, days: int = 30) -> Dict[str, Any]
     if not redmine:
         return {"error": "Redmine client not initialized."}
     try:
-        project = redmine.project.get(project_id)
+        project = await run_redmine(redmine.project.get, project_id)
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         date_filter = ">=" + start_date.strftime("%Y-%m-%d")
 
-        created_issues = list(
-            redmine.issue.filter(project_id=project_id, created_on=date_filter)
-        )
-        updated_issues = list(
-            redmine.issue.filter(project_id=project_id, updated_on=date_filter)
+        created_issues, updated_issues, all_issues = await asyncio.gather(
+            run_redmine(
+                lambda: list(
+                    redmine.issue.filter(project_id=project_id, created_on=date_filter)
+                )
+            ),
+            run_redmine(
+                lambda: list(
+                    redmine.issue.filter(project_id=project_id, updated_on=date_filter)
+                )
+            ),
+            run_redmine(lambda: list(redmine.issue.filter(project_id=project_id))),
         )
         created_stats = _analyze_issues(created_issues)
         updated_stats = _analyze_issues(updated_issues)
 
         total_created = len(created_issues)
         total_updated = len(updated_issues)
-        all_issues = list(redmine.issue.filter(project_id=project_id))
         all_stats = _analyze_issues(all_issues)
 
         return {
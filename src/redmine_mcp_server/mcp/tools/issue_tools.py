@@ -6,10 +6,19 @@ Redmine MCP - Issue Management Tools
 Tools for managing Redmine issues.
 """
 
+import logging
 from typing import Dict, Any, List, Optional, Union
 from ...redmine_handler import _ensure_cleanup_started
 from ..server import mcp, redmine, logger
-from ...redmine_handler import _handle_redmine_error
+from ...redmine_handler import (
+    _handle_redmine_error,
+    _get_issue_dict,
+    _get_issues_batch,
+    _list_my_issues,
+)
+from ...core.cache import cached_read
+from ...core.executor import run_redmine
+from ...core.singleflight import request_key
 
 
 @mcp.tool()
@@ -38,25 +47,7 @@ async def get_redmine_issue(
     # Ensure cleanup task is started (lazy initialization)
     await _ensure_cleanup_started()
     try:
-        # python-redmine is synchronous, so we don't use await here for the library call
-        includes = []
-        if include_journals:
-            includes.append("journals")
-        if include_attachments:
-            includes.append("attachments")
-
-        if includes:
-            issue = redmine.issue.get(issue_id, include=",".join(includes))
-        else:
-            issue = redmine.issue.get(issue_id)
-
-        result = _issue_to_dict(issue)
-        if include_journals:
-            result["journals"] = _journals_to_list(issue)
-        if include_attachments:
-            result["attachments"] = _attachments_to_list(issue)
-
-        return result
+        return await _get_issue_dict(issue_id, include_journals, include_attachments)
     except Exception as e:
         return _handle_redmine_error(
             e,
@@ -65,6 +56,48 @@ async def get_redmine_issue(
         )
 
 
+@mcp.tool()
+async def get_redmine_issues(
+    issue_ids: List[int],
+    include_journals: bool = False,
+    include_attachments: bool = False,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Retrieve several Redmine issues by ID in one call.
+
+    Prefer this over calling ``get_redmine_issue`` in a loop: base records
+    for up to 50 issues come back in a single request.
+
+    Args:
+        issue_ids: IDs of the issues to retrieve (at most 200; duplicates
+            are ignored)
+        include_journals: Include journals (comments) for each issue.
+            Defaults to ``False``; requires one request per issue.
+        include_attachments: Include attachment metadata for each issue.
+            Defaults to ``False``; requires one request per issue.
+        fields: Issue fields to return (e.g. ``["id", "subject", "status"]``).
+            ``None`` returns all fields.
+
+    Returns:
+        Dictionary with ``"issues"`` (in the requested order) and
+        ``"not_found"`` (IDs that do not exist or are not visible). If some
+        issues could not be fetched they are listed under ``"errors"``. On
+        failure a dictionary with an ``"error"`` key is returned.
+    """
+    if not redmine:
+        return {"error": "Redmine client not initialized."}
+
+    await _ensure_cleanup_started()
+    try:
+        return await _get_issues_batch(
+            issue_ids, include_journals, include_attachments, fields
+        )
+    except Exception as e:
+        return _handle_redmine_error(
+            e, f"fetching issues {issue_ids}", {"resource_type": "issues"}
+        )
+
+
 @mcp.tool()
 async def list_redmine_projects() -> List[Dict[str, Any]]:
     """
@@ -75,21 +108,26 @@ async def list_redmine_projects() -> List[Dict[str, Any]]:
     if not redmine:
         return [{"error": "Redmine client not initialized."}]
     try:
-        projects = redmine.project.all()
-        return [
-            {
-                "id": project.id,
-                "name": project.name,
-                "identifier": project.identifier,
-                "description": getattr(project, "description", ""),
-                "created_on": (
-                    project.created_on.isoformat()
-                    if getattr(project, "created_on", None) is not None
-                    else None
-                ),
-            }
-            for project in projects
-        ]
+
+        def _fetch() -> List[Dict[str, Any]]:
+            return [
+                {
+                    "id": project.id,
+                    "name": project.name,
+                    "identifier": project.identifier,
+                    "description": getattr(project, "description", ""),
+                    "created_on": (
+                        project.created_on.isoformat()
+                        if getattr(project, "created_on", None) is not None
+                        else None
+                    ),
+                }
+                for project in redmine.project.all()
+            ]
+
+        return await cached_read(
+            request_key("projects"), [], lambda: run_redmine(_fetch)
+        )
     except Exception as e:
         return [_handle_redmine_error(e, "listing projects")]
 
@@ -113,6 +151,8 @@ async def list_my_redmine_issues(
             - sort: Sort order (e.g., "updated_on:desc")
             - status_id: Filter by status ID
             - project_id: Filter by project ID
+            - cursor: ``next_cursor`` from a previous paginated response;
+                      continues that listing (other arguments are ignored)
             - [other Redmine API filters]
 
     Returns:
@@ -128,13 +168,17 @@ async def list_my_redmine_issues(
         ... )
         {
             "issues": [...],
-            "pagination": {"total": 150, "has_next": True, "next_offset": 75, ...}
+            "pagination": {
+                "total": 150, "has_next": True, "next_offset": 75,
+                "next_cursor": "eyJ...", ...
+            }
         }
 
     Performance:
         - Memory efficient: Uses server-side pagination
         - Token efficient: Default limit keeps response under 2000 tokens
         - Time efficient: Typically <500ms for limit=25
+        - One request per page: the total comes with the page itself
     """
     if not redmine:
         logging.error("Redmine client not initialized")
@@ -143,137 +187,4 @@ async def list_my_redmine_issues(
     # Ensure cleanup task is started (lazy initialization)
     await _ensure_cleanup_started()
 
-    try:
-        # Handle MCP interface wrapping parameters in 'filters' key
-        if "filters" in filters and isinstance(filters["filters"], dict):
-            actual_filters = filters["filters"]
-        else:
-            actual_filters = filters
-
-        # Extract pagination parameters
-        limit = actual_filters.pop("limit", 25)
-        offset = actual_filters.pop("offset", 0)
-        include_pagination_info = actual_filters.pop("include_pagination_info", False)
-
-        # Use actual_filters for remaining Redmine filters
-        filters = actual_filters
-
-        # Log request for monitoring
-        filter_keys = list(filters.keys()) if filters else []
-        logging.info(
-            f"Pagination request: limit={limit}, offset={offset}, filters={filter_keys}"
-        )
-
-        # Validate and sanitize parameters
-        if limit is not None:
-            if not isinstance(limit, int):
-                try:
-                    limit = int(limit)
-                except (ValueError, TypeError):
-                    logging.warning(
-                        f"Invalid limit type {type(limit)}, using default 25"
-                    )
-                    limit = 25
-
-            if limit <= 0:
-                logging.debug(f"Limit {limit} <= 0, returning empty result")
-                empty_result = []
-                if include_pagination_info:
-                    empty_result = {
-                        "issues": [],
-                        "pagination": {
-                            "total": 0,
-                            "limit": limit,
-                            "offset": offset,
-                            "count": 0,
-                            "has_next": False,
-                            "has_previous": False,
-                            "next_offset": None,
-                            "previous_offset": None,
-                        },
-                    }
-                return empty_result
-
-            # Cap at reasonable maximum
-            original_limit = limit
-            limit = min(limit, 1000)
-            if original_limit > limit:
-                logging.warning(
-                    f"Limit {original_limit} exceeds maximum 1000, capped to {limit}"
-                )
-
-        # Validate offset
-        if not isinstance(offset, int) or offset < 0:
-            logging.warning(f"Invalid offset {offset}, reset to 0")
-            offset = 0
-
-        # Use python-redmine ResourceSet native pagination
-        # Server-side filtering more efficient than client-side
-        redmine_filters = {
-            "assigned_to_id": "me",
-            "offset": offset,
-            "limit": min(limit or 25, 100),  # Redmine API max per request
-            **filters,
-        }
-
-        # Get paginated issues from Redmine
-        logging.debug(f"Calling redmine.issue.filter with: {redmine_filters}")
-        issues = redmine.issue.filter(**redmine_filters)
-
-        # Convert ResourceSet to list (triggers server-side pagination)
-        issues_list = list(issues)
-        logging.debug(
-            f"Retrieved {len(issues_list)} issues with offset={offset}, limit={limit}"
-        )
-
-        # Convert to dictionaries
-        result_issues = [_issue_to_dict(issue) for issue in issues_list]
-
-        # Handle metadata response format
-        if include_pagination_info:
-            # Get total count from a separate query without offset/limit
-            try:
-                # Create clean query for total count (no pagination parameters)
-                count_filters = {"assigned_to_id": "me", **filters}
-                count_query = redmine.issue.filter(**count_filters)
-                # Must evaluate the query first to get accurate total_count
-                list(count_query)  # Trigger evaluation
-                total_count = count_query.total_count
-                logging.debug(f"Got total count from separate query: {total_count}")
-            except Exception as e:
-                logging.warning(
-                    f"Could not get total count: {e}, using estimated value"
-                )
-                # For unknown total, use a conservative estimate
-                if len(result_issues) == limit:
-                    # If we got a full page, there might be more
-                    total_count = offset + len(result_issues) + 1
-                else:
-                    # If we got less than requested, this is likely the end
-                    total_count = offset + len(result_issues)
-
-            pagination_info = {
-                "total": total_count,
-                "limit": limit,
-                "offset": offset,
-                "count": len(result_issues),
-                "has_next": len(result_issues) == limit,
-                "has_previous": offset > 0,
-                "next_offset": offset + limit if len(result_issues) == limit else None,
-                "previous_offset": max(0, offset - limit) if offset > 0 else None,
-            }
-
-            result = {"issues": result_issues, "pagination": pagination_info}
-
-            logging.info(
-                f"Returning paginated response: {len(result_issues)} issues, "
-                f"total={total_count}"
-            )
-            return result
-
-        # Log success and return simple list
-        logging.info(f"Successfully retrieved {len(result_issues)} issues")
-        return result_issues
-
-    except Exception as e:
-        return [_handle_redmine_error(e, "listing assigned issues")]
+    return await _list_my_issues(filters)
@@ -7,6 +7,7 @@ Tools for triggering ODS layer synchronization.
 """
 
 from ..server import mcp, logger
+from ...core.executor import run_redmine
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
@@ -45,7 +46,7 @@ async def sync_ods_incremental(
 
         from ...scheduler.tasks import sync_ods_layer_incremental
 
-        result = sync_ods_layer_incremental(project_ids)
+        result = await run_redmine(sync_ods_layer_incremental, project_ids)
 
         logger.info(f"MCP: Incremental ODS sync completed: {result}")
         return result
@@ -106,7 +107,7 @@ async def sync_ods_full(
 
         from ...scheduler.tasks import sync_ods_layer_full
 
-        result = sync_ods_layer_full(project_ids, parsed_date)
+        result = await run_redmine(sync_ods_layer_full, project_ids, parsed_date)
 
         if from_date:
             result["from_date"] = from_date
@@ -119,6 +120,44 @@ async def sync_ods_full(
         return {"error": f"Failed to sync ODS layer: {str(e)}"}
 
 
+async def _query_ods_sync_status() -> Dict[str, Any]:
+    """Collect ODS table counts and freshness from the warehouse."""
+    from ...dws.async_repository import AsyncDataWarehouse
+
+    table_stats = await AsyncDataWarehouse().get_ods_table_stats()
+
+    counts = {}
+    latest_dates = {}
+    for table, row in table_stats.items():
+        counts[table] = row["count"] if row else 0
+        # Latest update time if applicable
+        if row and row["max_date"]:
+            latest_dates[table] = (
+                row["max_date"].isoformat()
+                if hasattr(row["max_date"], "isoformat")
+                else str(row["max_date"])
+            )
+
+    # Check data freshness
+    status = "OK"
+    issues = []
+
+    for table, max_date_str in latest_dates.items():
+        if max_date_str:
+            max_date = datetime.fromisoformat(max_date_str)
+            age_hours = (datetime.now() - max_date).total_seconds() / 3600
+            if age_hours > 24:
+                status = "STALE"
+                issues.append(f"{table} data is {age_hours:.1f} hours old")
+
+    return {
+        "table_counts": counts,
+        "latest_data": latest_dates,
+        "status": status,
+        "issues": issues if issues else None,
+    }
+
+
 @mcp.tool()
 async def get_ods_sync_status() -> Dict[str, Any]:
     """
@@ -144,66 +183,7 @@ async def get_ods_sync_status() -> Dict[str, Any]:
         }
     """
     try:
-        from ...dws.repository import DataWarehouse
-
-        warehouse = None
-        try:
-            warehouse = DataWarehouse()
-
-            with warehouse.get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Get table counts
-                    tables = ["ods_issues", "ods_projects", "ods_journals", "ods_users"]
-                    counts = {}
-                    latest_dates = {}
-
-                    for table in tables:
-                        cur.execute(f"SELECT COUNT(*) as count FROM warehouse.{table}")
-                        result = cur.fetchone()
-                        counts[table] = result["count"] if result else 0
-
-                        # Get latest update time if applicable
-                        if table in ["ods_issues", "ods_journals"]:
-                            date_col = (
-                                "updated_on" if table == "ods_issues" else "created_on"
-                            )
-                            cur.execute(
-                                f"SELECT MAX({date_col}) as max_date FROM warehouse.{table}"
-                            )
-                            result = cur.fetchone()
-                            if result and result["max_date"]:
-                                latest_dates[table] = (
-                                    result["max_date"].isoformat()
-                                    if hasattr(result["max_date"], "isoformat")
-                                    else str(result["max_date"])
-                                )
-
-                    # Check data freshness
-                    status = "OK"
-                    issues = []
-
-                    for table, max_date_str in latest_dates.items():
-                        if max_date_str:
-                            max_date = datetime.fromisoformat(max_date_str)
-                            age_hours = (
-                                datetime.now() - max_date
-                            ).total_seconds() / 3600
-                            if age_hours > 24:
-                                status = "STALE"
-                                issues.append(
-                                    f"{table} data is {age_hours:.1f} hours old"
-                                )
-
-                    return {
-                        "table_counts": counts,
-                        "latest_data": latest_dates,
-                        "status": status,
-                        "issues": issues if issues else None,
-                    }
-
-        finally:
-            if warehouse:
-                warehouse.close()
+        return await _query_ods_sync_status()
 
     except Exception as e:
         logger.error(f"MCP: Failed to get ODS sync status: {e}")
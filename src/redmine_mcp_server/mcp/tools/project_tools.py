@@ -1,4 +1,5 @@
 import os
+import logging
 from typing import Dict, Any, List, Optional, Union
 
 #!/usr/bin/env python3
@@ -8,7 +9,8 @@ Redmine MCP - Project Management Tools
 """
 
 from ..server import mcp, redmine, logger
-from ...redmine_handler import _handle_redmine_error
+from ...redmine_handler import _handle_redmine_error, _issues_to_dicts
+from ...core.executor import run_redmine
 
 
 @mcp.tool()
@@ -147,23 +149,18 @@ async def search_redmine_issues(
 
         # Perform search with pagination
         logging.debug(f"Calling redmine.issue.search with: {search_params}")
-        results = redmine.issue.search(query, **search_params)
 
-        if results is None:
-            results = []
+        def _search() -> List[Dict[str, Any]]:
+            results = redmine.issue.search(query, **search_params)
+            # Convert to dictionaries with optional field selection
+            return _issues_to_dicts(results, fields) if results is not None else []
 
-        # Convert results to list
-        issues_list = list(results)
+        result_issues = await run_redmine(_search)
         logging.debug(
-            f"Retrieved {len(issues_list)} issues with "
+            f"Retrieved {len(result_issues)} issues with "
             f"offset={offset}, limit={limit}"
         )
 
-        # Convert to dictionaries with optional field selection
-        result_issues = [
-            _issue_to_dict_selective(issue, fields) for issue in issues_list
-        ]
-
         # Handle metadata response format
         if include_pagination_info:
             # Search API doesn't provide total_count
@@ -10,7 +10,11 @@ Redmine MCP - Search Management Tools
 
 from ...redmine_handler import _ensure_cleanup_started
 from ..server import mcp, redmine, logger
-from ...redmine_handler import _handle_redmine_error
+from ...redmine_handler import _handle_redmine_error, _resources_to_dicts
+from ...core.cache import cached_read, entity_tag
+from ...core.executor import run_redmine
+from ...core.pagination import fetch_window
+from ...core.singleflight import request_key
 
 
 @mcp.tool()
@@ -27,7 +31,8 @@ async def search_entire_redmine(
         query: Text to search for. Case sensitivity controlled by server DB config.
         resources: Filter by resource types. Allowed: ['issues', 'wiki_pages']
                    Default: None (searches both issues and wiki_pages)
-        limit: Maximum number of results to return (max 100)
+        limit: Maximum number of results to return (max 1000; more than 100
+               are fetched as concurrent requests of 100)
         offset: Pagination offset for server-side pagination
 
     Returns:
@@ -53,23 +58,63 @@ async def search_entire_redmine(
         else:
             resources = allowed_types
 
-        # Cap limit at 100 (Redmine API maximum)
-        limit = min(limit, 100)
+        # Cap limit at 1000; above the API maximum of 100 per request the
+        # window is fetched as concurrent sub-requests
+        limit = min(limit, 1000)
         if limit <= 0:
             limit = 100
 
-        # Build search options
-        search_options = {
-            "resources": resources,
-            "limit": limit,
-            "offset": offset,
-        }
+        def _search_page(page_offset: int, page_limit: int):
+            categorized = redmine.search(
+                query, resources=resources, limit=page_limit, offset=page_offset
+            )
+            # (type, result) pairs; plugin and other unsupported results count
+            # towards the page size but are dropped below
+            records = []
+            for resource_type, resource_set in (categorized or {}).items():
+                if resource_type == "unknown":
+                    records.extend(
+                        (resource_type, None)
+                        for plugin_results in resource_set.values()
+                        for _ in plugin_results
+                    )
+                elif not hasattr(resource_set, "__iter__"):
+                    continue
+                elif resource_type not in allowed_types:
+                    records.extend((resource_type, None) for _ in resource_set)
+                else:
+                    records.extend(
+                        (resource_type, result)
+                        for result in _resources_to_dicts(resource_set, resource_type)
+                    )
+            return records, None
 
         # Execute search
-        categorized_results = redmine.search(query, **search_options)
+        pages, _ = await fetch_window(
+            lambda page_offset, page_limit: run_redmine(
+                _search_page, page_offset, page_limit
+            ),
+            offset,
+            limit,
+        )
+
+        # Process categorized results, in page order
+        all_results = []
+        results_by_type: Dict[str, int] = {}
+
+        for page in pages:
+            for resource_type, result in page:
+                # Skip 'unknown' category (plugin resources) and types that
+                # were not requested
+                if resource_type not in allowed_types:
+                    continue
+                all_results.append(result)
+                results_by_type[resource_type] = (
+                    results_by_type.get(resource_type, 0) + 1
+                )
 
         # Handle empty results (python-redmine returns None)
-        if not categorized_results:
+        if not all_results:
             return {
                 "results": [],
                 "results_by_type": {},
@@ -77,29 +122,6 @@ async def search_entire_redmine(
                 "query": query,
             }
 
-        # Process categorized results
-        all_results = []
-        results_by_type: Dict[str, int] = {}
-
-        for resource_type, resource_set in categorized_results.items():
-            # Skip 'unknown' category (plugin resources)
-            if resource_type == "unknown":
-                continue
-
-            # Skip if not in allowed types
-            if resource_type not in allowed_types:
-                continue
-
-            # Handle both ResourceSet and dict (for 'unknown')
-            if hasattr(resource_set, "__iter__"):
-                count = 0
-                for resource in resource_set:
-                    result_dict = _resource_to_dict(resource, resource_type)
-                    all_results.append(result_dict)
-                    count += 1
-                if count > 0:
-                    results_by_type[resource_type] = count
-
         return {
             "results": all_results,
             "results_by_type": results_by_type,
@@ -209,15 +231,29 @@ async def get_redmine_wiki_page(
     try:
         await _ensure_cleanup_started()
 
-        # Retrieve wiki page
-        if version:
-            wiki_page = redmine.wiki_page.get(
-                wiki_page_title, project_id=project_id, version=version
-            )
-        else:
-            wiki_page = redmine.wiki_page.get(wiki_page_title, project_id=project_id)
-
-        return _wiki_page_to_dict(wiki_page, include_attachments)
+        def _fetch() -> Dict[str, Any]:
+            # Retrieve wiki page
+            if version:
+                wiki_page = redmine.wiki_page.get(
+                    wiki_page_title, project_id=project_id, version=version
+                )
+            else:
+                wiki_page = redmine.wiki_page.get(
+                    wiki_page_title, project_id=project_id
+                )
+            return _wiki_page_to_dict(wiki_page, include_attachments)
+
+        return await cached_read(
+            request_key(
+                "wiki_page",
+                project_id,
+                wiki_page_title,
+                version=version or None,
+                attachments=include_attachments,
+            ),
+            [entity_tag("wiki_page", wiki_page_title)],
+            lambda: run_redmine(_fetch),
+        )
 
     except Exception as e:
         return _handle_redmine_error(
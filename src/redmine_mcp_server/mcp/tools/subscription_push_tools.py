@@ -7,6 +7,7 @@ Manually trigger subscription report push
 """
 
 from ..server import mcp, logger
+from ...core.executor import run_redmine, run_warehouse
 from typing import Dict, Any, Optional
 
 
@@ -34,9 +35,9 @@ async def push_subscription_reports(
         if project_id:
             from ...dws.services.subscription_service import get_subscription_manager
 
-            manager = get_subscription_manager()
+            manager = await run_warehouse(get_subscription_manager)
 
-            all_subs = manager.list_all_subscriptions()
+            all_subs = await run_warehouse(manager.list_all_subscriptions)
             project_subs = [
                 s
                 for s in all_subs
@@ -52,7 +53,7 @@ async def push_subscription_reports(
             }
 
             for sub in project_subs:
-                success = service.push_subscription(sub)
+                success = await run_redmine(service.push_subscription, sub)
                 if success:
                     results["success"] += 1
                 else:
@@ -67,11 +68,11 @@ async def push_subscription_reports(
 
         else:
             if report_type == "daily":
-                results = service.push_due_subscriptions("daily")
+                results = await run_redmine(service.push_due_subscriptions, "daily")
             elif report_type == "weekly":
-                results = service.push_due_subscriptions("weekly")
+                results = await run_redmine(service.push_due_subscriptions, "weekly")
             elif report_type == "monthly":
-                results = service.push_due_subscriptions("monthly")
+                results = await run_redmine(service.push_due_subscriptions, "monthly")
             else:
                 return {
                     "error": f"Invalid report type: {report_type}",
@@ -114,7 +115,8 @@ async def send_project_report_email(
 
         service = SubscriptionPushService()
 
-        report = service.generate_report(
+        report = await run_redmine(
+            service.generate_report,
             project_id,
             report_type,
             report_level,
@@ -129,7 +131,9 @@ async def send_project_report_email(
             }
 
         try:
-            project_data = service.redmine_get(f"projects/{project_id}.json")
+            project_data = await run_redmine(
+                service.redmine_get, f"projects/{project_id}.json"
+            )
             project_name = project_data["project"]["name"]
         except:
             project_name = f"Project {project_id}"
@@ -9,7 +9,16 @@ from typing import Dict, Any, List, Optional, Union
 import os
 from datetime import datetime
 from ..server import mcp, redmine, logger
-from ...redmine_handler import _handle_redmine_error
+from ...redmine_handler import (
+    _handle_redmine_error,
+    _wiki_page_to_dict,
+    _ensure_cleanup_started,
+    _refresh_project_snapshot,
+    _read_project_daily_stats,
+)
+from ...core.cache import entity_tag, invalidate
+from ...core.executor import run_redmine, run_warehouse
+from ...core.file_manager import AttachmentFileManager
 
 
 @mcp.tool()
@@ -38,7 +47,8 @@ async def create_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Create wiki page
-        wiki_page = redmine.wiki_page.create(
+        wiki_page = await run_redmine(
+            redmine.wiki_page.create,
             project_id=project_id,
             title=wiki_page_title,
             text=text,
@@ -81,15 +91,21 @@ async def update_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Update wiki page
-        redmine.wiki_page.update(
-            wiki_page_title,
-            project_id=project_id,
-            text=text,
-            comments=comments if comments else None,
-        )
+        try:
+            await run_redmine(
+                redmine.wiki_page.update,
+                wiki_page_title,
+                project_id=project_id,
+                text=text,
+                comments=comments if comments else None,
+            )
+        finally:
+            invalidate(entity_tag("wiki_page", wiki_page_title))
 
         # Fetch updated page to return current state
-        wiki_page = redmine.wiki_page.get(wiki_page_title, project_id=project_id)
+        wiki_page = await run_redmine(
+            redmine.wiki_page.get, wiki_page_title, project_id=project_id
+        )
 
         return _wiki_page_to_dict(wiki_page)
 
@@ -123,7 +139,12 @@ async def delete_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Delete wiki page
-        redmine.wiki_page.delete(wiki_page_title, project_id=project_id)
+        try:
+            await run_redmine(
+                redmine.wiki_page.delete, wiki_page_title, project_id=project_id
+            )
+        finally:
+            invalidate(entity_tag("wiki_page", wiki_page_title))
 
         return {
             "success": True,
@@ -165,15 +186,13 @@ async def get_project_daily_stats(
     project_id: int, date: Optional[str] = None, compare_with: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get project daily statistics with time-series comparison。Uses PostgreSQL warehouse, 97% lower token consumption。"""
-    from datetime import timedelta
-    from ..dws.repository import DataWarehouse
-    import requests
+    from ...dws.async_repository import AsyncDataWarehouse
 
     if not redmine:
         return {"error": "Redmine client not initialized."}
 
     try:
-        warehouse = DataWarehouse()
+        warehouse = AsyncDataWarehouse()
 
         # Parse date
         from datetime import date as date_class
@@ -183,72 +202,19 @@ async def get_project_daily_stats(
         )
 
         # Check if today data exists
-        existing_data = warehouse.get_issues_snapshot(project_id, query_date)
+        existing_data = await warehouse.get_issues_snapshot(
+            project_id, query_date, columns=["issue_id"]
+        )
 
         if not existing_data:
             # First query, sync latest data
             logger.info(f"No snapshot for {query_date}, syncing from Redmine API...")
-
-            api_url = f"{REDMINE_URL}/issues.json"
-            headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-
-            # Paginate to get all issues
-            all_issues = []
-            offset = 0
-            limit = 100
-
-            while True:
-                resp = requests.get(
-                    api_url,
-                    headers=headers,
-                    params={"project_id": project_id, "limit": limit, "offset": offset},
-                    timeout=30,
-                )
-                data = resp.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                if len(issues) < limit:
-                    break
-
-                offset += limit
-                logger.info(f"Fetched {len(all_issues)} issues...")
-
-            # Sync to warehouse
-            yesterday = query_date - timedelta(days=1)
-            previous_issues = warehouse.get_issues_snapshot(project_id, yesterday)
-            previous_map = {i["issue_id"]: i for i in previous_issues}
-            warehouse.upsert_issues_batch(
-                project_id, all_issues, query_date, previous_map
-            )
-            logger.info(f"Synced {len(all_issues)} issues to warehouse")
+            await run_redmine(_refresh_project_snapshot, project_id, query_date)
 
         # Get statistics from warehouse
-        stats = warehouse.get_project_daily_stats(project_id, query_date)
-
-        # Get high priority issues
-        high_priority = warehouse.get_high_priority_issues(
-            project_id, query_date, limit=20
+        stats = await _read_project_daily_stats(
+            warehouse, project_id, query_date, compare_with
         )
-        stats["high_priority_count"] = len(high_priority)
-        stats["high_priority_issues"] = [
-            {**issue, "url": f"{REDMINE_URL}/issues/{issue['issue_id']}"}
-            for issue in high_priority
-        ]
-
-        # Get assignee workload
-        stats["top_assignees"] = warehouse.get_top_assignees(
-            project_id, query_date, limit=10
-        )
-
-        # Add comparison data
-        if compare_with == "yesterday":
-            yesterday = query_date - timedelta(days=1)
-            yday_stats = warehouse.get_project_daily_stats(project_id, yesterday)
-            stats["yesterday_new"] = yday_stats.get("today_new", 0)
-            stats["yesterday_closed"] = yday_stats.get("today_closed", 0)
-            stats["change_new"] = stats["today_new"] - stats["yesterday_new"]
-            stats["change_closed"] = stats["today_closed"] - stats["yesterday_closed"]
 
         stats["from_cache"] = True
         return stats
@@ -359,8 +325,9 @@ async def subscribe_project(
     if channel == "email" and not user_email:
         user_email = channel_id
 
-    manager = get_subscription_manager()
-    result = manager.subscribe(
+    manager = await run_warehouse(get_subscription_manager)
+    result = await run_warehouse(
+        manager.subscribe,
         user_id=user_id,
         project_id=project_id,
         channel=channel,
@@ -390,8 +357,8 @@ async def list_my_subscriptions() -> Dict[str, Any]:
     from ...dws.services.subscription_service import get_subscription_manager
 
     try:
-        manager = get_subscription_manager()
-        subscriptions = manager.list_all_subscriptions()
+        manager = await run_warehouse(get_subscription_manager)
+        subscriptions = await run_warehouse(manager.list_all_subscriptions)
 
         return {
             "success": True,
@@ -425,7 +392,7 @@ async def unsubscribe_project(
     from ...dws.services.subscription_service import get_subscription_manager
 
     try:
-        manager = get_subscription_manager()
+        manager = await run_warehouse(get_subscription_manager)
 
         # Use default user_id if not provided
         if not user_id:
@@ -433,10 +400,15 @@ async def unsubscribe_project(
 
         if project_id:
             # Unsubscribe specific project
-            result = manager.unsubscribe(user_id=user_id, project_id=project_id, channel=channel)
+            result = await run_warehouse(
+                manager.unsubscribe,
+                user_id=user_id,
+                project_id=project_id,
+                channel=channel,
+            )
         else:
             # Unsubscribe all for user
-            result = manager.unsubscribe_all(user_id=user_id)
+            result = await run_warehouse(manager.unsubscribe_all, user_id=user_id)
 
         return {
             "success": True,
@@ -5,6 +5,7 @@ Redmine MCP Tools - Subscription Management
 """
 
 from ..server import mcp, redmine, logger
+from ...core.executor import run_warehouse
 from typing import Dict, Any, List, Optional, Union
 
 
@@ -22,9 +23,11 @@ async def unsubscribe_project(project_id: Optional[int] = None) -> Dict[str, Any
     from ...dws.services.subscription_service import get_subscription_manager
 
     user_id = "default_user"
-    manager = get_subscription_manager()
+    manager = await run_warehouse(get_subscription_manager)
 
-    result = manager.unsubscribe(user_id=user_id, project_id=project_id)
+    result = await run_warehouse(
+        manager.unsubscribe, user_id=user_id, project_id=project_id
+    )
 
     # Close warehouse connection
 
@@ -42,9 +45,9 @@ async def list_my_subscriptions() -> List[Dict[str, Any]]:
     from ...dws.services.subscription_service import get_subscription_manager
 
     user_id = "default_user"
-    manager = get_subscription_manager()
+    manager = await run_warehouse(get_subscription_manager)
 
-    result = manager.get_user_subscriptions(user_id)
+    result = await run_warehouse(manager.get_user_subscriptions, user_id)
 
     # Close warehouse connection
 
@@ -61,8 +64,8 @@ async def get_subscription_stats() -> Dict[str, Any]:
     """
     from ...dws.services.subscription_service import get_subscription_manager
 
-    manager = get_subscription_manager()
-    result = manager.get_stats()
+    manager = await run_warehouse(get_subscription_manager)
+    result = await run_warehouse(manager.get_stats)
 
     # Close warehouse connection
 
@@ -83,14 +86,14 @@ async def generate_subscription_report(
     Returns:
         Report data
     """
-    from .subscription_reporter import get_reporter
+    from ...dws.services.report_service import get_reporter
 
-    reporter = get_reporter()
+    reporter = await run_warehouse(get_reporter)
 
     if level == "detailed":
-        return reporter.generate_detailed_report(project_id)
+        return await run_warehouse(reporter.generate_detailed_report, project_id)
     else:
-        return reporter.generate_brief_report(project_id)
+        return await run_warehouse(reporter.generate_brief_report, project_id)
 
 
 @mcp.tool()
@@ -105,15 +108,15 @@ async def trigger_full_sync(project_id: Optional[int] = None) -> Dict[str, Any]:
         Sync result
     """
     from ...scheduler.tasks import get_scheduler
-    from ..dws.repository import DataWarehouse
 
     scheduler = get_scheduler()
 
     if project_id:
         # Sync single project
         try:
-            warehouse = DataWarehouse()
-            count = scheduler._sync_project(project_id, incremental=False)
+            count = await run_warehouse(
+                scheduler._sync_project, project_id, incremental=False
+            )
             return {
                 "success": True,
                 "project_id": project_id,
@@ -1,5 +1,7 @@
 import os
+import json
 import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
@@ -10,7 +12,14 @@ Redmine MCP - Wiki Management Tools
 """
 
 from ..server import mcp, redmine, logger
-from ...redmine_handler import _handle_redmine_error
+from ...redmine_handler import (
+    _handle_redmine_error,
+    _issue_to_dict,
+    _ensure_cleanup_started,
+)
+from ...core.cache import entity_tag, invalidate
+from ...core.executor import run_redmine
+from ...core.reference_data import get_reference_catalog
 
 
 @mcp.tool()
@@ -24,9 +33,18 @@ async def create_redmine_issue(
     if not redmine:
         return {"error": "Redmine client not initialized."}
     try:
-        issue = redmine.issue.create(
-            project_id=project_id, subject=subject, description=description, **fields
-        )
+        try:
+            issue = await run_redmine(
+                redmine.issue.create,
+                project_id=project_id,
+                subject=subject,
+                description=description,
+                **fields,
+            )
+        finally:
+            # A parent's derived fields (dates, done ratio) follow its children
+            if fields.get("parent_issue_id"):
+                invalidate(entity_tag("issue", fields["parent_issue_id"]))
         return _issue_to_dict(issue)
     except Exception as e:
         return _handle_redmine_error(e, f"creating issue in project {project_id}")
@@ -45,19 +63,27 @@ async def update_redmine_issue(issue_id: int, fields: Dict[str, Any]) -> Dict[st
 
     # Convert status name to id if requested
     if "status_name" in fields and "status_id" not in fields:
-        name = str(fields.pop("status_name")).lower()
+        name = str(fields.pop("status_name"))
         try:
-            statuses = redmine.issue_status.all()
-            for status in statuses:
-                if getattr(status, "name", "").lower() == name:
-                    fields["status_id"] = status.id
-                    break
+            # Served from the reference-data catalog; loads on first use only
+            status_id = await run_redmine(
+                get_reference_catalog().id_for, "statuses", name
+            )
+            if status_id is not None:
+                fields["status_id"] = status_id
         except Exception as e:
             logger.warning(f"Error resolving status name '{name}': {e}")
 
     try:
-        redmine.issue.update(issue_id, **fields)
-        updated_issue = redmine.issue.get(issue_id)
+        try:
+            await run_redmine(redmine.issue.update, issue_id, **fields)
+        finally:
+            # Invalidate even on error: a timed-out write may still have landed
+            tags = [entity_tag("issue", issue_id)]
+            if fields.get("parent_issue_id"):
+                tags.append(entity_tag("issue", fields["parent_issue_id"]))
+            invalidate(*tags)
+        updated_issue = await run_redmine(redmine.issue.get, issue_id)
         return _issue_to_dict(updated_issue)
     except Exception as e:
         return _handle_redmine_error(
@@ -96,7 +122,7 @@ async def get_redmine_attachment_download_url(
 
     try:
         # Get attachment metadata from Redmine
-        attachment = redmine.attachment.get(attachment_id)
+        attachment = await run_redmine(redmine.attachment.get, attachment_id)
 
         # Server-controlled configuration (secure)
         attachments_dir = Path(os.getenv("ATTACHMENTS_DIR", "./attachments"))
@@ -109,7 +135,9 @@ async def get_redmine_attachment_download_url(
         file_id = str(uuid.uuid4())
 
         # Download using existing approach - keeps original filename
-        downloaded_path = attachment.download(savepath=str(attachments_dir))
+        downloaded_path = await run_redmine(
+            attachment.download, savepath=str(attachments_dir)
+        )
 
         # Get file info
         original_filename = getattr(
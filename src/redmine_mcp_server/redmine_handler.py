@@ -30,10 +30,11 @@ import asyncio
 import logging
 from datetime import datetime, timedelta, date, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from dotenv import load_dotenv
 from redminelib import Redmine
+from redminelib.resultsets import ResourceSet
 from redminelib.exceptions import (
     ResourceNotFoundError,
     VersionMismatchError,
@@ -55,6 +56,32 @@ from mcp.server.fastmcp import FastMCP
 
 # from .ads_reports import register_ads_tools
 from .core.file_manager import AttachmentFileManager
+from .core.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    fetch_window,
+    iter_issue_pages,
+)
+from .core.reference_data import get_reference_catalog, get_reference_stats
+from .core.resilience import CircuitOpenError
+from .core.cache import cached_read, entity_tag, get_cache_stats, invalidate
+from .core.singleflight import get_singleflight_stats, request_key
+from .core.transport import (
+    PooledSyncEngine,
+    configure_redmine_transport,
+    get_circuit_state,
+    get_transport_stats,
+)
+from .dws.async_pool import get_async_warehouse_pool_stats
+from .dws.pool import get_warehouse_pool_stats
+from .dws.statements import get_statement_stats
+from .core.executor import (
+    BlockingCallTimeout,
+    get_executor_stats,
+    run_redmine,
+    run_warehouse,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -145,14 +172,29 @@ if REDMINE_URL and (REDMINE_API_KEY or (REDMINE_USERNAME and REDMINE_PASSWORD)):
                 requests_config["cert"] = REDMINE_SSL_CLIENT_CERT
                 logger.info("Using client certificate for mutual TLS")
 
+        # Shared keep-alive connection pool for python-redmine and the raw
+        # REST callers (sync, analysis and report services)
+        configure_redmine_transport(
+            REDMINE_URL,
+            api_key=REDMINE_API_KEY,
+            username=REDMINE_USERNAME,
+            password=REDMINE_PASSWORD,
+            requests_config=requests_config,
+        )
+
         # Initialize with SSL configuration
         if REDMINE_API_KEY:
             if requests_config:
                 redmine = Redmine(
-                    REDMINE_URL, key=REDMINE_API_KEY, requests=requests_config
+                    REDMINE_URL,
+                    key=REDMINE_API_KEY,
+                    requests=requests_config,
+                    engine=PooledSyncEngine,
                 )
             else:
-                redmine = Redmine(REDMINE_URL, key=REDMINE_API_KEY)
+                redmine = Redmine(
+                    REDMINE_URL, key=REDMINE_API_KEY, engine=PooledSyncEngine
+                )
         else:
             if requests_config:
                 redmine = Redmine(
@@ -160,18 +202,39 @@ if REDMINE_URL and (REDMINE_API_KEY or (REDMINE_USERNAME and REDMINE_PASSWORD)):
                     username=REDMINE_USERNAME,
                     password=REDMINE_PASSWORD,
                     requests=requests_config,
+                    engine=PooledSyncEngine,
                 )
             else:
                 redmine = Redmine(
                     REDMINE_URL,
                     username=REDMINE_USERNAME,
                     password=REDMINE_PASSWORD,
+                    engine=PooledSyncEngine,
                 )
         logger.info("Redmine client initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing Redmine client: {e}")
         redmine = None
 
+
+def _load_issue_statuses() -> List[Dict[str, Any]]:
+    """Load issue statuses for the reference-data catalog."""
+    if not redmine:
+        raise RuntimeError("Redmine client not initialized.")
+    return [
+        {
+            "id": status.id,
+            "name": status.name,
+            "is_closed": getattr(status, "is_closed", False),
+        }
+        for status in redmine.issue_status.all()
+    ]
+
+
+# Statuses are loaded through the python-redmine client like the tools that
+# use them; the other datasets come over the shared REST transport
+get_reference_catalog().register("statuses", _load_issue_statuses)
+
 # Initialize FastMCP server
 mcp = FastMCP("redmine_mcp_tools")
 
@@ -289,7 +352,21 @@ async def health_check(request):
     # Initialize cleanup task on first health check (lazy initialization)
     await _ensure_cleanup_started()
 
-    return JSONResponse({"status": "ok", "service": "redmine_mcp_tools"})
+    return JSONResponse(
+        {
+            "status": "ok",
+            "service": "redmine_mcp_tools",
+            "executors": get_executor_stats(),
+            "request_coalescing": get_singleflight_stats(),
+            "redmine_cache": get_cache_stats(),
+            "reference_data": get_reference_stats(),
+            "redmine_circuit": get_circuit_state(),
+            "redmine_transport": get_transport_stats(),
+            "warehouse_pool": get_warehouse_pool_stats(),
+            "warehouse_async_pool": get_async_warehouse_pool_stats(),
+            "warehouse_statements": get_statement_stats(),
+        }
+    )
 
 
 @mcp.custom_route("/files/{file_id}", methods=["GET"])
@@ -390,6 +467,16 @@ def _handle_redmine_error(
             )
         }
 
+    # Checked before ConnectionError, which CircuitOpenError subclasses
+    if isinstance(e, CircuitOpenError):
+        logger.warning(f"Circuit open during {operation}: {e}")
+        return {
+            "error": (
+                f"Redmine at {redmine_url} is temporarily unavailable after "
+                f"repeated failures. Please retry in {max(1, round(e.retry_in))}s"
+            )
+        }
+
     # Connection-level errors (from requests library)
     if isinstance(e, RequestsConnectionError):
         logger.error(f"Connection error during {operation}: {e}")
@@ -401,6 +488,16 @@ def _handle_redmine_error(
             )
         }
 
+    if isinstance(e, BlockingCallTimeout):
+        logger.error(f"Executor timeout during {operation}: {e}")
+        return {
+            "error": (
+                f"Request to Redmine at {redmine_url} did not complete within "
+                f"{e.timeout:g}s. Please check: 1) Redmine server load, "
+                "2) REDMINE_CALL_TIMEOUT setting"
+            )
+        }
+
     if isinstance(e, RequestsTimeout):
         logger.error(f"Timeout during {operation}: {e}")
         return {
@@ -471,50 +568,60 @@ def _handle_redmine_error(
     return {"error": f"An unexpected error occurred while {operation}: {str(e)}"}
 
 
+def _resource_ref(value: Any) -> Optional[Dict[str, Any]]:
+    return {"id": value.id, "name": value.name} if value is not None else None
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+# Field name -> extractor for python-redmine Issue objects.  getattr defaults
+# cover attributes the search API may not return.
+_ISSUE_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda issue: getattr(issue, "id", None),
+    "subject": lambda issue: getattr(issue, "subject", ""),
+    "description": lambda issue: getattr(issue, "description", ""),
+    "project": lambda issue: _resource_ref(getattr(issue, "project", None)),
+    "status": lambda issue: _resource_ref(getattr(issue, "status", None)),
+    "priority": lambda issue: _resource_ref(getattr(issue, "priority", None)),
+    "author": lambda issue: _resource_ref(getattr(issue, "author", None)),
+    "assigned_to": lambda issue: _resource_ref(getattr(issue, "assigned_to", None)),
+    "created_on": lambda issue: _isoformat(getattr(issue, "created_on", None)),
+    "updated_on": lambda issue: _isoformat(getattr(issue, "updated_on", None)),
+}
+
+
+def _is_all_fields(fields: Optional[List[str]]) -> bool:
+    return fields is None or fields == ["*"] or fields == ["all"]
+
+
+def _compile_issue_projection(
+    fields: Optional[List[str]],
+    extractors: Optional[Dict[str, Callable[[Any], Any]]] = None,
+) -> Callable[[Any], Dict[str, Any]]:
+    """Turn a ``fields`` list into an extractor that evaluates only those fields.
+
+    Compile once per request and apply it to every issue.  Unknown and
+    duplicate field names are dropped; the output keeps the requested order.
+    ``extractors`` defaults to the python-redmine Issue extractors.
+    """
+    extractors = _ISSUE_FIELDS if extractors is None else extractors
+    keys = list(extractors) if _is_all_fields(fields) else dict.fromkeys(fields)
+    selected = [(key, extractors[key]) for key in keys if key in extractors]
+
+    def project(issue: Any) -> Dict[str, Any]:
+        return {key: extract(issue) for key, extract in selected}
+
+    return project
+
+
+_project_all_issue_fields = _compile_issue_projection(None)
+
+
 def _issue_to_dict(issue: Any) -> Dict[str, Any]:
     """Convert a python-redmine Issue object to a serializable dict."""
-    # Use getattr for all potentially missing attributes (search API may not return all)
-    assigned = getattr(issue, "assigned_to", None)
-    project = getattr(issue, "project", None)
-    status = getattr(issue, "status", None)
-    priority = getattr(issue, "priority", None)
-    author = getattr(issue, "author", None)
-
-    return {
-        "id": getattr(issue, "id", None),
-        "subject": getattr(issue, "subject", ""),
-        "description": getattr(issue, "description", ""),
-        "project": (
-            {"id": project.id, "name": project.name} if project is not None else None
-        ),
-        "status": (
-            {"id": status.id, "name": status.name} if status is not None else None
-        ),
-        "priority": (
-            {"id": priority.id, "name": priority.name} if priority is not None else None
-        ),
-        "author": (
-            {"id": author.id, "name": author.name} if author is not None else None
-        ),
-        "assigned_to": (
-            {
-                "id": assigned.id,
-                "name": assigned.name,
-            }
-            if assigned is not None
-            else None
-        ),
-        "created_on": (
-            issue.created_on.isoformat()
-            if getattr(issue, "created_on", None) is not None
-            else None
-        ),
-        "updated_on": (
-            issue.updated_on.isoformat()
-            if getattr(issue, "updated_on", None) is not None
-            else None
-        ),
-    }
+    return _project_all_issue_fields(issue)
 
 
 def _resource_to_dict(resource: Any, resource_type: str) -> Dict[str, Any]:
@@ -631,55 +738,141 @@ def _issue_to_dict_selective(
         # Returns all fields (same as _issue_to_dict)
     """
     # Handle "all fields" cases
-    if fields is None or fields == ["*"] or fields == ["all"]:
+    if _is_all_fields(fields):
         return _issue_to_dict(issue)
 
-    # Build field mapping with all available fields
-    # Use getattr for all potentially missing attributes (search API may not return all)
-    assigned = getattr(issue, "assigned_to", None)
-    project = getattr(issue, "project", None)
-    status = getattr(issue, "status", None)
-    priority = getattr(issue, "priority", None)
-    author = getattr(issue, "author", None)
-
-    all_fields = {
-        "id": getattr(issue, "id", None),
-        "subject": getattr(issue, "subject", ""),
-        "description": getattr(issue, "description", ""),
-        "project": (
-            {"id": project.id, "name": project.name} if project is not None else None
-        ),
-        "status": (
-            {"id": status.id, "name": status.name} if status is not None else None
-        ),
-        "priority": (
-            {"id": priority.id, "name": priority.name} if priority is not None else None
-        ),
-        "author": (
-            {"id": author.id, "name": author.name} if author is not None else None
-        ),
-        "assigned_to": (
-            {
-                "id": assigned.id,
-                "name": assigned.name,
-            }
-            if assigned is not None
-            else None
-        ),
-        "created_on": (
-            issue.created_on.isoformat()
-            if getattr(issue, "created_on", None) is not None
-            else None
-        ),
-        "updated_on": (
-            issue.updated_on.isoformat()
-            if getattr(issue, "updated_on", None) is not None
-            else None
-        ),
+    # Only the requested fields are evaluated (silently skip invalid names)
+    return _compile_issue_projection(fields)(issue)
+
+
+# Raw JSON fast path
+#
+# python-redmine wraps every issue in a Resource that lazily converts nested
+# dicts to Resources and parses timestamps on attribute access, only for the
+# converters above to read them back and call isoformat().  For list and
+# search results the raw REST payload (ResourceSet.values()) is converted
+# directly; the output is identical to the Resource-based converters.
+
+_REDMINE_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _json_datetime(value: Any) -> Any:
+    """Timestamp from a Redmine payload as python-redmine would decode it."""
+    try:
+        return datetime.strptime(value, _REDMINE_DATETIME_FORMAT)
+    except (TypeError, ValueError):
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            return value
+
+
+def _json_isoformat(value: Any) -> Optional[str]:
+    """Equivalent of ``issue.created_on.isoformat()`` for a raw value."""
+    if value is None:
+        return None
+    # "2024-01-02T03:04:05Z" -> "2024-01-02T03:04:05" without parsing
+    if isinstance(value, str) and len(value) == 20 and value[-1] == "Z":
+        return value[:-1]
+    decoded = _json_datetime(value)
+    return decoded.isoformat() if hasattr(decoded, "isoformat") else decoded
+
+
+def _json_ref(value: Any) -> Optional[Dict[str, Any]]:
+    if value is None:
+        return None
+    return {"id": value.get("id"), "name": value.get("name")}
+
+
+# Field name -> extractor for raw issues.json records (see _ISSUE_FIELDS)
+_ISSUE_JSON_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "id": lambda raw: raw.get("id"),
+    "subject": lambda raw: raw.get("subject", ""),
+    "description": lambda raw: raw.get("description", ""),
+    "project": lambda raw: _json_ref(raw.get("project")),
+    "status": lambda raw: _json_ref(raw.get("status")),
+    "priority": lambda raw: _json_ref(raw.get("priority")),
+    "author": lambda raw: _json_ref(raw.get("author")),
+    "assigned_to": lambda raw: _json_ref(raw.get("assigned_to")),
+    "created_on": lambda raw: _json_isoformat(raw.get("created_on")),
+    "updated_on": lambda raw: _json_isoformat(raw.get("updated_on")),
+}
+
+
+def _issue_json_to_dict(
+    raw: Dict[str, Any], fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Raw ``issues.json`` record -> same dict as ``_issue_to_dict_selective``.
+
+    Only the requested ``fields`` are computed.
+    """
+    return _compile_issue_projection(fields, _ISSUE_JSON_FIELDS)(raw)
+
+
+def _excerpt(text: Any) -> Any:
+    if not text:
+        return None
+    return text[:200] + "..." if len(text) > 200 else text
+
+
+def _resource_json_to_dict(raw: Dict[str, Any], resource_type: str) -> Dict[str, Any]:
+    """Raw search/list record -> same dict as ``_resource_to_dict``."""
+    if "subject" in raw:
+        title = raw["subject"]
+    elif "title" in raw:
+        title = raw["title"]
+    else:
+        title = raw.get("name")
+
+    project = raw.get("project")
+    if project is not None:
+        project_name = project.get("name") if isinstance(project, dict) else project
+        project_id = project.get("id") if isinstance(project, dict) else None
+    else:
+        project_name, project_id = None, raw.get("project_id") or None
+
+    status = raw.get("status")
+    if "status" in raw:
+        status = status.get("name") if isinstance(status, dict) else str(status)
+
+    updated_on = raw.get("updated_on")
+    if updated_on:
+        # str(datetime), as _resource_to_dict produces
+        updated_on = str(_json_datetime(updated_on))
+
+    return {
+        "id": raw.get("id"),
+        "type": resource_type,
+        "title": title,
+        "project": project_name,
+        "project_id": project_id,
+        "status": status,
+        "updated_on": updated_on or None,
+        "excerpt": _excerpt(raw.get("description")) or _excerpt(raw.get("text")),
     }
 
-    # Return only requested fields (silently skip invalid field names)
-    return {key: all_fields[key] for key in fields if key in all_fields}
+
+def _issues_to_dicts(
+    issues: Any, fields: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """Convert an issue query result, using the raw JSON fast path when the
+    result is a python-redmine ResourceSet."""
+    if isinstance(issues, ResourceSet):
+        project = _compile_issue_projection(fields, _ISSUE_JSON_FIELDS)
+        return [project(raw) for raw in issues.values()]
+    if _is_all_fields(fields):
+        return [_issue_to_dict(issue) for issue in issues]
+    project = _compile_issue_projection(fields)
+    return [project(issue) for issue in issues]
+
+
+def _resources_to_dicts(resources: Any, resource_type: str) -> List[Dict[str, Any]]:
+    """Search results counterpart of :func:`_issues_to_dicts`."""
+    if isinstance(resources, ResourceSet):
+        return [
+            _resource_json_to_dict(raw, resource_type) for raw in resources.values()
+        ]
+    return [_resource_to_dict(resource, resource_type) for resource in resources]
 
 
 def _journals_to_list(issue: Any) -> List[Dict[str, Any]]:
@@ -786,25 +979,7 @@ async def get_redmine_issue(
     # Ensure cleanup task is started (lazy initialization)
     await _ensure_cleanup_started()
     try:
-        # python-redmine is synchronous, so we don't use await here for the library call
-        includes = []
-        if include_journals:
-            includes.append("journals")
-        if include_attachments:
-            includes.append("attachments")
-
-        if includes:
-            issue = redmine.issue.get(issue_id, include=",".join(includes))
-        else:
-            issue = redmine.issue.get(issue_id)
-
-        result = _issue_to_dict(issue)
-        if include_journals:
-            result["journals"] = _journals_to_list(issue)
-        if include_attachments:
-            result["attachments"] = _attachments_to_list(issue)
-
-        return result
+        return await _get_issue_dict(issue_id, include_journals, include_attachments)
     except Exception as e:
         return _handle_redmine_error(
             e,
@@ -813,6 +988,206 @@ async def get_redmine_issue(
         )
 
 
+def _fetch_issue_dict(
+    issue_id: int, include_journals: bool, include_attachments: bool
+) -> Dict[str, Any]:
+    """Fetch one issue and convert it (blocking; run via ``run_redmine``)."""
+    includes = []
+    if include_journals:
+        includes.append("journals")
+    if include_attachments:
+        includes.append("attachments")
+
+    # The conversion may touch lazy attributes, so it stays off the event loop
+    if includes:
+        issue = redmine.issue.get(issue_id, include=",".join(includes))
+    else:
+        issue = redmine.issue.get(issue_id)
+
+    result = _issue_to_dict(issue)
+    if include_journals:
+        result["journals"] = _journals_to_list(issue)
+    if include_attachments:
+        result["attachments"] = _attachments_to_list(issue)
+    return result
+
+
+async def _get_issue_dict(
+    issue_id: int, include_journals: bool = True, include_attachments: bool = True
+) -> Dict[str, Any]:
+    """Issue dict as returned by ``get_redmine_issue``.
+
+    Served from the read cache when fresh; identical concurrent misses share
+    one upstream fetch.  The result is shared and must not be modified.
+    """
+    return await cached_read(
+        request_key(
+            "issue",
+            issue_id,
+            journals=include_journals,
+            attachments=include_attachments,
+        ),
+        [entity_tag("issue", issue_id)],
+        lambda: run_redmine(
+            _fetch_issue_dict, issue_id, include_journals, include_attachments
+        ),
+    )
+
+
+MAX_BATCH_ISSUES = 200
+# ids per issues.json?issue_id=... request; chunks are fetched concurrently
+ISSUE_ID_CHUNK_SIZE = 50
+
+
+def _batch_concurrency() -> int:
+    try:
+        return max(1, int(os.getenv("REDMINE_BATCH_CONCURRENCY", "8")))
+    except ValueError:
+        return 8
+
+
+def _filter_issues_by_id(
+    issue_ids: List[int], fields: Optional[List[str]]
+) -> Dict[int, Dict[str, Any]]:
+    """Fetch base records for ``issue_ids`` with one issues.json request."""
+    issues = redmine.issue.filter(
+        issue_id=",".join(str(issue_id) for issue_id in issue_ids),
+        status_id="*",
+        limit=len(issue_ids),
+    )
+    if isinstance(issues, ResourceSet):
+        project = _compile_issue_projection(fields, _ISSUE_JSON_FIELDS)
+        return {raw["id"]: project(raw) for raw in issues.values()}
+    return {issue.id: _issue_to_dict_selective(issue, fields) for issue in issues}
+
+
+def _select_issue_fields(
+    issue: Dict[str, Any], fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Apply a ``fields`` projection to an issue dict, keeping journals and
+    attachments that were explicitly requested."""
+    if _is_all_fields(fields):
+        return issue
+    selected = {key: issue[key] for key in fields if key in issue}
+    for key in ("journals", "attachments"):
+        if key in issue:
+            selected[key] = issue[key]
+    return selected
+
+
+async def _get_issues_batch(
+    issue_ids: List[int],
+    include_journals: bool = False,
+    include_attachments: bool = False,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Fetch several issues with as few round trips as possible.
+
+    Without journals/attachments the base records come from
+    ``issues.json?issue_id=...&status_id=*`` in chunks of
+    ``ISSUE_ID_CHUNK_SIZE``.  Journals and attachments are only available
+    per issue, so those requests are fanned out (sharing the
+    ``get_redmine_issue`` cache), at most ``REDMINE_BATCH_CONCURRENCY`` at a
+    time.
+    """
+    ids = list(dict.fromkeys(int(issue_id) for issue_id in issue_ids))
+    if len(ids) > MAX_BATCH_ISSUES:
+        return {
+            "error": (
+                f"Too many issue ids ({len(ids)}); at most {MAX_BATCH_ISSUES} "
+                "can be fetched per call"
+            )
+        }
+
+    semaphore = asyncio.Semaphore(_batch_concurrency())
+    found: Dict[int, Dict[str, Any]] = {}
+    errors: List[Dict[str, Any]] = []
+
+    if include_journals or include_attachments:
+
+        async def fetch_one(issue_id: int) -> None:
+            async with semaphore:
+                try:
+                    issue = await _get_issue_dict(
+                        issue_id, include_journals, include_attachments
+                    )
+                except ResourceNotFoundError:
+                    return
+                except Exception as e:
+                    error = _handle_redmine_error(e, f"fetching issue {issue_id}")
+                    errors.append({"id": issue_id, "error": error["error"]})
+                    return
+            found[issue_id] = _select_issue_fields(issue, fields)
+
+        await asyncio.gather(*(fetch_one(issue_id) for issue_id in ids))
+    else:
+
+        async def fetch_chunk(chunk: List[int]) -> None:
+            async with semaphore:
+                found.update(await run_redmine(_filter_issues_by_id, chunk, fields))
+
+        chunks = []
+        for start in range(0, len(ids), ISSUE_ID_CHUNK_SIZE):
+            end = start + ISSUE_ID_CHUNK_SIZE
+            chunks.append(ids[start:end])
+        await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+    failed = {error["id"] for error in errors}
+    result: Dict[str, Any] = {
+        "issues": [found[issue_id] for issue_id in ids if issue_id in found],
+        "not_found": [
+            issue_id
+            for issue_id in ids
+            if issue_id not in found and issue_id not in failed
+        ],
+    }
+    if errors:
+        result["errors"] = errors
+    return result
+
+
+@mcp.tool()
+async def get_redmine_issues(
+    issue_ids: List[int],
+    include_journals: bool = False,
+    include_attachments: bool = False,
+    fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Retrieve several Redmine issues by ID in one call.
+
+    Prefer this over calling ``get_redmine_issue`` in a loop: base records
+    for up to 50 issues come back in a single request.
+
+    Args:
+        issue_ids: IDs of the issues to retrieve (at most 200; duplicates
+            are ignored)
+        include_journals: Include journals (comments) for each issue.
+            Defaults to ``False``; requires one request per issue.
+        include_attachments: Include attachment metadata for each issue.
+            Defaults to ``False``; requires one request per issue.
+        fields: Issue fields to return (e.g. ``["id", "subject", "status"]``).
+            ``None`` returns all fields.
+
+    Returns:
+        Dictionary with ``"issues"`` (in the requested order) and
+        ``"not_found"`` (IDs that do not exist or are not visible). If some
+        issues could not be fetched they are listed under ``"errors"``. On
+        failure a dictionary with an ``"error"`` key is returned.
+    """
+    if not redmine:
+        return {"error": "Redmine client not initialized."}
+
+    await _ensure_cleanup_started()
+    try:
+        return await _get_issues_batch(
+            issue_ids, include_journals, include_attachments, fields
+        )
+    except Exception as e:
+        return _handle_redmine_error(
+            e, f"fetching issues {issue_ids}", {"resource_type": "issues"}
+        )
+
+
 @mcp.tool()
 async def list_redmine_projects() -> List[Dict[str, Any]]:
     """
@@ -823,21 +1198,26 @@ async def list_redmine_projects() -> List[Dict[str, Any]]:
     if not redmine:
         return [{"error": "Redmine client not initialized."}]
     try:
-        projects = redmine.project.all()
-        return [
-            {
-                "id": project.id,
-                "name": project.name,
-                "identifier": project.identifier,
-                "description": getattr(project, "description", ""),
-                "created_on": (
-                    project.created_on.isoformat()
-                    if getattr(project, "created_on", None) is not None
-                    else None
-                ),
-            }
-            for project in projects
-        ]
+
+        def _fetch() -> List[Dict[str, Any]]:
+            return [
+                {
+                    "id": project.id,
+                    "name": project.name,
+                    "identifier": project.identifier,
+                    "description": getattr(project, "description", ""),
+                    "created_on": (
+                        project.created_on.isoformat()
+                        if getattr(project, "created_on", None) is not None
+                        else None
+                    ),
+                }
+                for project in redmine.project.all()
+            ]
+
+        return await cached_read(
+            request_key("projects"), [], lambda: run_redmine(_fetch)
+        )
     except Exception as e:
         return [_handle_redmine_error(e, "listing projects")]
 
@@ -861,6 +1241,8 @@ async def list_my_redmine_issues(
             - sort: Sort order (e.g., "updated_on:desc")
             - status_id: Filter by status ID
             - project_id: Filter by project ID
+            - cursor: ``next_cursor`` from a previous paginated response;
+                      continues that listing (other arguments are ignored)
             - [other Redmine API filters]
 
     Returns:
@@ -876,13 +1258,17 @@ async def list_my_redmine_issues(
         ... )
         {
             "issues": [...],
-            "pagination": {"total": 150, "has_next": True, "next_offset": 75, ...}
+            "pagination": {
+                "total": 150, "has_next": True, "next_offset": 75,
+                "next_cursor": "eyJ...", ...
+            }
         }
 
     Performance:
         - Memory efficient: Uses server-side pagination
         - Token efficient: Default limit keeps response under 2000 tokens
         - Time efficient: Typically <500ms for limit=25
+        - One request per page: the total comes with the page itself
     """
     if not redmine:
         logging.error("Redmine client not initialized")
@@ -891,6 +1277,22 @@ async def list_my_redmine_issues(
     # Ensure cleanup task is started (lazy initialization)
     await _ensure_cleanup_started()
 
+    return await _list_my_issues(filters)
+
+
+def _resource_set_total(resource_set: Any) -> Optional[int]:
+    """``total_count`` of an evaluated ResourceSet, if Redmine returned one."""
+    try:
+        total = resource_set.total_count
+    except Exception:
+        return None
+    return total if isinstance(total, int) else None
+
+
+async def _list_my_issues(
+    filters: Dict[str, Any],
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """Body of ``list_my_redmine_issues`` (shared with ``mcp/tools``)."""
     try:
         # Handle MCP interface wrapping parameters in 'filters' key
         if "filters" in filters and isinstance(filters["filters"], dict):
@@ -899,6 +1301,7 @@ async def list_my_redmine_issues(
             actual_filters = filters
 
         # Extract pagination parameters
+        cursor = actual_filters.pop("cursor", None)
         limit = actual_filters.pop("limit", 25)
         offset = actual_filters.pop("offset", 0)
         include_pagination_info = actual_filters.pop("include_pagination_info", False)
@@ -906,6 +1309,15 @@ async def list_my_redmine_issues(
         # Use actual_filters for remaining Redmine filters
         filters = actual_filters
 
+        if cursor:
+            # Filters, limit and offset were validated when the cursor was made
+            try:
+                state = decode_cursor(cursor)
+            except (InvalidCursorError, ValueError):
+                return [{"error": "Invalid or expired pagination cursor."}]
+            filters, limit, offset = state["filters"], state["limit"], state["offset"]
+            include_pagination_info = True
+
         # Log request for monitoring
         filter_keys = list(filters.keys()) if filters else []
         logging.info(
@@ -913,7 +1325,7 @@ async def list_my_redmine_issues(
         )
 
         # Validate and sanitize parameters
-        if limit is not None:
+        if limit is not None and not cursor:
             if not isinstance(limit, int):
                 try:
                     limit = int(limit)
@@ -938,6 +1350,7 @@ async def list_my_redmine_issues(
                             "has_previous": False,
                             "next_offset": None,
                             "previous_offset": None,
+                            "next_cursor": None,
                         },
                     }
                 return empty_result
@@ -951,64 +1364,88 @@ async def list_my_redmine_issues(
                 )
 
         # Validate offset
-        if not isinstance(offset, int) or offset < 0:
+        if not cursor and (not isinstance(offset, int) or offset < 0):
             logging.warning(f"Invalid offset {offset}, reset to 0")
             offset = 0
 
         # Use python-redmine ResourceSet native pagination
         # Server-side filtering more efficient than client-side
-        redmine_filters = {
-            "assigned_to_id": "me",
-            "offset": offset,
-            "limit": min(limit or 25, 100),  # Redmine API max per request
-            **filters,
-        }
+        redmine_filters = {"assigned_to_id": "me", **filters}
 
-        # Get paginated issues from Redmine
-        logging.debug(f"Calling redmine.issue.filter with: {redmine_filters}")
-        issues = redmine.issue.filter(**redmine_filters)
+        def _fetch_page(page_offset: int, page_limit: int):
+            resource_set = redmine.issue.filter(
+                **redmine_filters, offset=page_offset, limit=page_limit
+            )
+            # Evaluating the ResourceSet also reads total_count from the response
+            issues = _issues_to_dicts(resource_set)
+            return issues, _resource_set_total(resource_set)
 
-        # Convert ResourceSet to list (triggers server-side pagination)
-        issues_list = list(issues)
-        logging.debug(
-            f"Retrieved {len(issues_list)} issues with offset={offset}, limit={limit}"
+        # Limits above the API max (100 per request) are split into
+        # concurrent sub-requests
+        logging.debug(f"Calling redmine.issue.filter with: {redmine_filters}")
+        pages, total_count = await fetch_window(
+            lambda page_offset, page_limit: run_redmine(
+                _fetch_page, page_offset, page_limit
+            ),
+            offset,
+            limit or 25,
         )
+        fetched = sum(len(page) for page in pages)
+        logging.debug(f"Retrieved {fetched} issues with offset={offset}, limit={limit}")
 
-        # Convert to dictionaries
-        result_issues = [_issue_to_dict(issue) for issue in issues_list]
+        # Drop issues that shifted into a later sub-request while the pages
+        # were being fetched
+        result_issues = []
+        seen: set = set()
+        for page in pages:
+            result_issues.extend(issue for issue in page if issue["id"] not in seen)
+            seen.update(issue["id"] for issue in page)
 
         # Handle metadata response format
         if include_pagination_info:
-            # Get total count from a separate query without offset/limit
-            try:
-                # Create clean query for total count (no pagination parameters)
-                count_filters = {"assigned_to_id": "me", **filters}
-                count_query = redmine.issue.filter(**count_filters)
-                # Must evaluate the query first to get accurate total_count
-                list(count_query)  # Trigger evaluation
-                total_count = count_query.total_count
-                logging.debug(f"Got total count from separate query: {total_count}")
-            except Exception as e:
-                logging.warning(
-                    f"Could not get total count: {e}, using estimated value"
-                )
+            if total_count is None:
+                # Total missing from the page response: probe with limit=1
+                # rather than downloading every matching issue
+                try:
+                    count_filters = {"assigned_to_id": "me", **filters, "limit": 1}
+
+                    def _count() -> Optional[int]:
+                        count_query = redmine.issue.filter(**count_filters)
+                        list(count_query)
+                        return _resource_set_total(count_query)
+
+                    total_count = await run_redmine(_count)
+                    logging.debug(f"Got total count from limit=1 probe: {total_count}")
+                except Exception as e:
+                    logging.warning(f"Could not get total count: {e}")
+            if total_count is None:
+                logging.warning("Total count unavailable, using estimated value")
                 # For unknown total, use a conservative estimate
-                if len(result_issues) == limit:
+                if fetched == limit:
                     # If we got a full page, there might be more
-                    total_count = offset + len(result_issues) + 1
+                    total_count = offset + fetched + 1
                 else:
                     # If we got less than requested, this is likely the end
-                    total_count = offset + len(result_issues)
+                    total_count = offset + fetched
 
+            has_next = fetched > 0 and offset + fetched < total_count
+            next_offset = offset + fetched if has_next else None
             pagination_info = {
                 "total": total_count,
                 "limit": limit,
                 "offset": offset,
                 "count": len(result_issues),
-                "has_next": len(result_issues) == limit,
+                "has_next": has_next,
                 "has_previous": offset > 0,
-                "next_offset": offset + limit if len(result_issues) == limit else None,
+                "next_offset": next_offset,
                 "previous_offset": max(0, offset - limit) if offset > 0 else None,
+                "next_cursor": (
+                    encode_cursor(
+                        {"filters": filters, "limit": limit, "offset": next_offset}
+                    )
+                    if has_next
+                    else None
+                ),
             }
 
             result = {"issues": result_issues, "pagination": pagination_info}
@@ -1163,23 +1600,18 @@ async def search_redmine_issues(
 
         # Perform search with pagination
         logging.debug(f"Calling redmine.issue.search with: {search_params}")
-        results = redmine.issue.search(query, **search_params)
 
-        if results is None:
-            results = []
+        def _search() -> List[Dict[str, Any]]:
+            results = redmine.issue.search(query, **search_params)
+            # Convert to dictionaries with optional field selection
+            return _issues_to_dicts(results, fields) if results is not None else []
 
-        # Convert results to list
-        issues_list = list(results)
+        result_issues = await run_redmine(_search)
         logging.debug(
-            f"Retrieved {len(issues_list)} issues with "
+            f"Retrieved {len(result_issues)} issues with "
             f"offset={offset}, limit={limit}"
         )
 
-        # Convert to dictionaries with optional field selection
-        result_issues = [
-            _issue_to_dict_selective(issue, fields) for issue in issues_list
-        ]
-
         # Handle metadata response format
         if include_pagination_info:
             # Search API doesn't provide total_count
@@ -1222,9 +1654,18 @@ async def create_redmine_issue(
     if not redmine:
         return {"error": "Redmine client not initialized."}
     try:
-        issue = redmine.issue.create(
-            project_id=project_id, subject=subject, description=description, **fields
-        )
+        try:
+            issue = await run_redmine(
+                redmine.issue.create,
+                project_id=project_id,
+                subject=subject,
+                description=description,
+                **fields,
+            )
+        finally:
+            # A parent's derived fields (dates, done ratio) follow its children
+            if fields.get("parent_issue_id"):
+                invalidate(entity_tag("issue", fields["parent_issue_id"]))
         return _issue_to_dict(issue)
     except Exception as e:
         return _handle_redmine_error(e, f"creating issue in project {project_id}")
@@ -1243,19 +1684,27 @@ async def update_redmine_issue(issue_id: int, fields: Dict[str, Any]) -> Dict[st
 
     # Convert status name to id if requested
     if "status_name" in fields and "status_id" not in fields:
-        name = str(fields.pop("status_name")).lower()
+        name = str(fields.pop("status_name"))
         try:
-            statuses = redmine.issue_status.all()
-            for status in statuses:
-                if getattr(status, "name", "").lower() == name:
-                    fields["status_id"] = status.id
-                    break
+            # Served from the reference-data catalog; loads on first use only
+            status_id = await run_redmine(
+                get_reference_catalog().id_for, "statuses", name
+            )
+            if status_id is not None:
+                fields["status_id"] = status_id
         except Exception as e:
             logger.warning(f"Error resolving status name '{name}': {e}")
 
     try:
-        redmine.issue.update(issue_id, **fields)
-        updated_issue = redmine.issue.get(issue_id)
+        try:
+            await run_redmine(redmine.issue.update, issue_id, **fields)
+        finally:
+            # Invalidate even on error: a timed-out write may still have landed
+            tags = [entity_tag("issue", issue_id)]
+            if fields.get("parent_issue_id"):
+                tags.append(entity_tag("issue", fields["parent_issue_id"]))
+            invalidate(*tags)
+        updated_issue = await run_redmine(redmine.issue.get, issue_id)
         return _issue_to_dict(updated_issue)
     except Exception as e:
         return _handle_redmine_error(
@@ -1294,7 +1743,7 @@ async def get_redmine_attachment_download_url(
 
     try:
         # Get attachment metadata from Redmine
-        attachment = redmine.attachment.get(attachment_id)
+        attachment = await run_redmine(redmine.attachment.get, attachment_id)
 
         # Server-controlled configuration (secure)
         attachments_dir = Path(os.getenv("ATTACHMENTS_DIR", "./attachments"))
@@ -1307,7 +1756,9 @@ async def get_redmine_attachment_download_url(
         file_id = str(uuid.uuid4())
 
         # Download using existing approach - keeps original filename
-        downloaded_path = attachment.download(savepath=str(attachments_dir))
+        downloaded_path = await run_redmine(
+            attachment.download, savepath=str(attachments_dir)
+        )
 
         # Get file info
         original_filename = getattr(
@@ -1422,7 +1873,7 @@ async def summarize_project_status(project_id: int, days: int = 30) -> Dict[str,
     try:
         # Validate project exists
         try:
-            project = redmine.project.get(project_id)
+            project = await run_redmine(redmine.project.get, project_id)
         except ResourceNotFoundError:
             return {"error": f"Project {project_id} not found."}
 
@@ -1431,14 +1882,20 @@ async def summarize_project_status(project_id: int, days: int = 30) -> Dict[str,
         start_date = end_date - timedelta(days=days)
         date_filter = f">={start_date.strftime('%Y-%m-%d')}"
 
-        # Get issues created in the date range
-        created_issues = list(
-            redmine.issue.filter(project_id=project_id, created_on=date_filter)
-        )
-
-        # Get issues updated in the date range
-        updated_issues = list(
-            redmine.issue.filter(project_id=project_id, updated_on=date_filter)
+        # Issues created / updated in the date range and all project issues
+        # are independent queries, so fetch them concurrently
+        created_issues, updated_issues, all_issues = await asyncio.gather(
+            run_redmine(
+                lambda: list(
+                    redmine.issue.filter(project_id=project_id, created_on=date_filter)
+                )
+            ),
+            run_redmine(
+                lambda: list(
+                    redmine.issue.filter(project_id=project_id, updated_on=date_filter)
+                )
+            ),
+            run_redmine(lambda: list(redmine.issue.filter(project_id=project_id))),
         )
 
         # Analyze created issues
@@ -1451,8 +1908,7 @@ async def summarize_project_status(project_id: int, days: int = 30) -> Dict[str,
         total_created = len(created_issues)
         total_updated = len(updated_issues)
 
-        # Get all project issues for context
-        all_issues = list(redmine.issue.filter(project_id=project_id))
+        # All project issues for context
         all_stats = _analyze_issues(all_issues)
 
         return {
@@ -1546,7 +2002,8 @@ async def search_entire_redmine(
         query: Text to search for. Case sensitivity controlled by server DB config.
         resources: Filter by resource types. Allowed: ['issues', 'wiki_pages']
                    Default: None (searches both issues and wiki_pages)
-        limit: Maximum number of results to return (max 100)
+        limit: Maximum number of results to return (max 1000; more than 100
+               are fetched as concurrent requests of 100)
         offset: Pagination offset for server-side pagination
 
     Returns:
@@ -1572,23 +2029,63 @@ async def search_entire_redmine(
         else:
             resources = allowed_types
 
-        # Cap limit at 100 (Redmine API maximum)
-        limit = min(limit, 100)
+        # Cap limit at 1000; above the API maximum of 100 per request the
+        # window is fetched as concurrent sub-requests
+        limit = min(limit, 1000)
         if limit <= 0:
             limit = 100
 
-        # Build search options
-        search_options = {
-            "resources": resources,
-            "limit": limit,
-            "offset": offset,
-        }
+        def _search_page(page_offset: int, page_limit: int):
+            categorized = redmine.search(
+                query, resources=resources, limit=page_limit, offset=page_offset
+            )
+            # (type, result) pairs; plugin and other unsupported results count
+            # towards the page size but are dropped below
+            records = []
+            for resource_type, resource_set in (categorized or {}).items():
+                if resource_type == "unknown":
+                    records.extend(
+                        (resource_type, None)
+                        for plugin_results in resource_set.values()
+                        for _ in plugin_results
+                    )
+                elif not hasattr(resource_set, "__iter__"):
+                    continue
+                elif resource_type not in allowed_types:
+                    records.extend((resource_type, None) for _ in resource_set)
+                else:
+                    records.extend(
+                        (resource_type, result)
+                        for result in _resources_to_dicts(resource_set, resource_type)
+                    )
+            return records, None
 
         # Execute search
-        categorized_results = redmine.search(query, **search_options)
+        pages, _ = await fetch_window(
+            lambda page_offset, page_limit: run_redmine(
+                _search_page, page_offset, page_limit
+            ),
+            offset,
+            limit,
+        )
+
+        # Process categorized results, in page order
+        all_results = []
+        results_by_type: Dict[str, int] = {}
+
+        for page in pages:
+            for resource_type, result in page:
+                # Skip 'unknown' category (plugin resources) and types that
+                # were not requested
+                if resource_type not in allowed_types:
+                    continue
+                all_results.append(result)
+                results_by_type[resource_type] = (
+                    results_by_type.get(resource_type, 0) + 1
+                )
 
         # Handle empty results (python-redmine returns None)
-        if not categorized_results:
+        if not all_results:
             return {
                 "results": [],
                 "results_by_type": {},
@@ -1596,29 +2093,6 @@ async def search_entire_redmine(
                 "query": query,
             }
 
-        # Process categorized results
-        all_results = []
-        results_by_type: Dict[str, int] = {}
-
-        for resource_type, resource_set in categorized_results.items():
-            # Skip 'unknown' category (plugin resources)
-            if resource_type == "unknown":
-                continue
-
-            # Skip if not in allowed types
-            if resource_type not in allowed_types:
-                continue
-
-            # Handle both ResourceSet and dict (for 'unknown')
-            if hasattr(resource_set, "__iter__"):
-                count = 0
-                for resource in resource_set:
-                    result_dict = _resource_to_dict(resource, resource_type)
-                    all_results.append(result_dict)
-                    count += 1
-                if count > 0:
-                    results_by_type[resource_type] = count
-
         return {
             "results": all_results,
             "results_by_type": results_by_type,
@@ -1728,15 +2202,29 @@ async def get_redmine_wiki_page(
     try:
         await _ensure_cleanup_started()
 
-        # Retrieve wiki page
-        if version:
-            wiki_page = redmine.wiki_page.get(
-                wiki_page_title, project_id=project_id, version=version
-            )
-        else:
-            wiki_page = redmine.wiki_page.get(wiki_page_title, project_id=project_id)
-
-        return _wiki_page_to_dict(wiki_page, include_attachments)
+        def _fetch() -> Dict[str, Any]:
+            # Retrieve wiki page
+            if version:
+                wiki_page = redmine.wiki_page.get(
+                    wiki_page_title, project_id=project_id, version=version
+                )
+            else:
+                wiki_page = redmine.wiki_page.get(
+                    wiki_page_title, project_id=project_id
+                )
+            return _wiki_page_to_dict(wiki_page, include_attachments)
+
+        return await cached_read(
+            request_key(
+                "wiki_page",
+                project_id,
+                wiki_page_title,
+                version=version or None,
+                attachments=include_attachments,
+            ),
+            [entity_tag("wiki_page", wiki_page_title)],
+            lambda: run_redmine(_fetch),
+        )
 
     except Exception as e:
         return _handle_redmine_error(
@@ -1772,7 +2260,8 @@ async def create_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Create wiki page
-        wiki_page = redmine.wiki_page.create(
+        wiki_page = await run_redmine(
+            redmine.wiki_page.create,
             project_id=project_id,
             title=wiki_page_title,
             text=text,
@@ -1815,15 +2304,21 @@ async def update_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Update wiki page
-        redmine.wiki_page.update(
-            wiki_page_title,
-            project_id=project_id,
-            text=text,
-            comments=comments if comments else None,
-        )
+        try:
+            await run_redmine(
+                redmine.wiki_page.update,
+                wiki_page_title,
+                project_id=project_id,
+                text=text,
+                comments=comments if comments else None,
+            )
+        finally:
+            invalidate(entity_tag("wiki_page", wiki_page_title))
 
         # Fetch updated page to return current state
-        wiki_page = redmine.wiki_page.get(wiki_page_title, project_id=project_id)
+        wiki_page = await run_redmine(
+            redmine.wiki_page.get, wiki_page_title, project_id=project_id
+        )
 
         return _wiki_page_to_dict(wiki_page)
 
@@ -1857,7 +2352,12 @@ async def delete_redmine_wiki_page(
         await _ensure_cleanup_started()
 
         # Delete wiki page
-        redmine.wiki_page.delete(wiki_page_title, project_id=project_id)
+        try:
+            await run_redmine(
+                redmine.wiki_page.delete, wiki_page_title, project_id=project_id
+            )
+        finally:
+            invalidate(entity_tag("wiki_page", wiki_page_title))
 
         return {
             "success": True,
@@ -1893,21 +2393,88 @@ async def cleanup_attachment_files() -> Dict[str, Any]:
         return {"error": f"An error occurred during cleanup: {str(e)}"}
 
 
+def _sync_project_snapshot(warehouse: Any, project_id: int, query_date: date) -> int:
+    """Stream a fresh project snapshot from Redmine into the warehouse (blocking).
+
+    Each page is upserted before the next one is consumed, so memory stays
+    bounded by the page size regardless of project size.  The pages keep the
+    daily summary up to date as they are written.
+    """
+    yesterday = query_date - timedelta(days=1)
+    synced = 0
+    for issues in iter_issue_pages({"project_id": project_id}, timeout=30):
+        synced += warehouse.upsert_issues_page(
+            project_id, issues, query_date, yesterday
+        )
+        logger.info(f"Synced {synced} issues...")
+
+    logger.info(f"Synced {synced} issues to warehouse")
+    return synced
+
+
+def _refresh_project_snapshot(project_id: int, query_date: date) -> int:
+    """Run ``_sync_project_snapshot`` with its own warehouse handle (blocking)."""
+    from .dws.repository import DataWarehouse
+
+    warehouse = DataWarehouse()
+    try:
+        return _sync_project_snapshot(warehouse, project_id, query_date)
+    finally:
+        warehouse.close()
+
+
+async def _read_project_daily_stats(
+    warehouse: Any, project_id: int, query_date: date, compare_with: Optional[str]
+) -> Dict[str, Any]:
+    """Assemble daily statistics from an ``AsyncDataWarehouse``.
+
+    The summary, high-priority, assignee and comparison queries are
+    independent and run concurrently.
+    """
+    reads = [
+        warehouse.get_project_daily_stats(project_id, query_date),
+        warehouse.get_high_priority_issues(project_id, query_date, limit=20),
+        warehouse.get_top_assignees(project_id, query_date, limit=10),
+    ]
+    if compare_with == "yesterday":
+        yesterday = query_date - timedelta(days=1)
+        reads.append(warehouse.get_project_daily_stats(project_id, yesterday))
+    stats, high_priority, top_assignees, *compared = await asyncio.gather(*reads)
+
+    # High priority issues
+    stats["high_priority_count"] = len(high_priority)
+    stats["high_priority_issues"] = [
+        {**issue, "url": f"{REDMINE_URL}/issues/{issue['issue_id']}"}
+        for issue in high_priority
+    ]
+
+    # Assignee workload
+    stats["top_assignees"] = top_assignees
+
+    # Add comparison data
+    if compare_with == "yesterday":
+        yday_stats = compared[0]
+        stats["yesterday_new"] = yday_stats.get("today_new", 0)
+        stats["yesterday_closed"] = yday_stats.get("today_closed", 0)
+        stats["change_new"] = stats["today_new"] - stats["yesterday_new"]
+        stats["change_closed"] = stats["today_closed"] - stats["yesterday_closed"]
+
+    return stats
+
+
 @mcp.tool()
 @mcp.tool()
 async def get_project_daily_stats(
     project_id: int, date: Optional[str] = None, compare_with: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get project daily statistics with time-series comparison. Uses PostgreSQL warehouse, 97% lower token consumption."""
-    from datetime import timedelta
-    from ..dws.repository import DataWarehouse
-    import requests
+    from .dws.async_repository import AsyncDataWarehouse
 
     if not redmine:
         return {"error": "Redmine client not initialized."}
 
     try:
-        warehouse = DataWarehouse()
+        warehouse = AsyncDataWarehouse()
 
         # Parse date
         from datetime import date as date_class
@@ -1917,73 +2484,24 @@ async def get_project_daily_stats(
         )
 
         # Check if today data exists
-        existing_data = warehouse.get_issues_snapshot(project_id, query_date)
+        existing_data = await warehouse.get_issues_snapshot(
+            project_id, query_date, columns=["issue_id"]
+        )
 
         if not existing_data:
             # First query, sync latest data
             logger.info(f"No snapshot for {query_date}, syncing from Redmine API...")
-
-            api_url = f"{REDMINE_URL}/issues.json"
-            headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-
-            # Paginate to get all issues
-            all_issues = []
-            offset = 0
-            limit = 100
-
-            while True:
-                resp = requests.get(
-                    api_url,
-                    headers=headers,
-                    params={"project_id": project_id, "limit": limit, "offset": offset},
-                    timeout=30,
-                )
-                data = resp.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                if len(issues) < limit:
-                    break
-
-                offset += limit
-                logger.info(f"Fetched {len(all_issues)} issues...")
-
-            # Sync to warehouse
-            yesterday = query_date - timedelta(days=1)
-            previous_issues = warehouse.get_issues_snapshot(project_id, yesterday)
-            previous_map = {i["issue_id"]: i for i in previous_issues}
-            warehouse.upsert_issues_batch(
-                project_id, all_issues, query_date, previous_map
+            # A full project sync takes minutes: no call timeout, so the
+            # caller waits for it instead of retrying into a second sync
+            await run_redmine(
+                _refresh_project_snapshot, project_id, query_date, timeout=0
             )
-            logger.info(f"Synced {len(all_issues)} issues to warehouse")
 
         # Get statistics from warehouse
-        stats = warehouse.get_project_daily_stats(project_id, query_date)
-
-        # Get high priority issues
-        high_priority = warehouse.get_high_priority_issues(
-            project_id, query_date, limit=20
-        )
-        stats["high_priority_count"] = len(high_priority)
-        stats["high_priority_issues"] = [
-            {**issue, "url": f"{REDMINE_URL}/issues/{issue['issue_id']}"}
-            for issue in high_priority
-        ]
-
-        # Get assignee workload
-        stats["top_assignees"] = warehouse.get_top_assignees(
-            project_id, query_date, limit=10
+        stats = await _read_project_daily_stats(
+            warehouse, project_id, query_date, compare_with
         )
 
-        # Add comparison data
-        if compare_with == "yesterday":
-            yesterday = query_date - timedelta(days=1)
-            yday_stats = warehouse.get_project_daily_stats(project_id, yesterday)
-            stats["yesterday_new"] = yday_stats.get("today_new", 0)
-            stats["yesterday_closed"] = yday_stats.get("today_closed", 0)
-            stats["change_new"] = stats["today_new"] - stats["yesterday_new"]
-            stats["change_closed"] = stats["today_closed"] - stats["yesterday_closed"]
-
         stats["from_cache"] = True
         return stats
 
@@ -2123,8 +2641,8 @@ async def trigger_full_sync(project_id: Optional[int] = None) -> Dict[str, Any]:
     Returns:
         Sync result
     """
-    from .redmine_scheduler import get_scheduler
-    from ..dws.repository import DataWarehouse
+    from .scheduler.tasks import get_scheduler
+    from .dws.repository import DataWarehouse
 
     scheduler = get_scheduler()
 
@@ -2180,7 +2698,7 @@ async def trigger_progressive_sync() -> Dict[str, Any]:
     Returns:
         Sync result
     """
-    from .redmine_scheduler import get_scheduler
+    from .scheduler.tasks import get_scheduler
 
     scheduler = get_scheduler()
 
@@ -2219,7 +2737,7 @@ async def get_sync_progress() -> Dict[str, Any]:
     Returns:
         Sync progress status
     """
-    from .redmine_scheduler import get_scheduler
+    from .scheduler.tasks import get_scheduler
 
     scheduler = get_scheduler()
 
@@ -2247,24 +2765,16 @@ async def get_sync_progress() -> Dict[str, Any]:
     }
 
 
-@mcp.tool()
-async def analyze_dev_tester_workload(
+def _analyze_dev_tester_workload_blocking(
     project_id: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """
-    Analyze developer and tester workload based on issue resolution flow
-
-    Developer: Person who changes status to "已解决"
-    Tester: Person assigned when status changes to "已解决"
-
-    Args:
-        project_id: Specific project ID (optional, analyze all subscribed if None)
-
-    Returns:
-        Analysis report
-    """
-    from .dev_test_analyzer import DevTestAnalyzer, analyze_project, analyze_projects
-    from .redmine_scheduler import get_scheduler
+    """Blocking implementation of ``analyze_dev_tester_workload``."""
+    from .dws.services.analysis_service import (
+        DevTestAnalyzer,
+        analyze_project,
+        analyze_projects,
+    )
+    from .scheduler.tasks import get_scheduler
 
     try:
         if project_id:
@@ -2294,21 +2804,32 @@ async def analyze_dev_tester_workload(
 
 
 @mcp.tool()
-async def backfill_historical_data(
-    project_id: Optional[int] = None, from_date: Optional[str] = None
+async def analyze_dev_tester_workload(
+    project_id: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
-    Backfill historical daily snapshots from Redmine journals
+    Analyze developer and tester workload based on issue resolution flow
+
+    Developer: Person who changes status to "已解决"
+    Tester: Person assigned when status changes to "已解决"
 
     Args:
-        project_id: Specific project ID (optional, backfill all if None)
-        from_date: Start date in YYYY-MM-DD format (optional)
+        project_id: Specific project ID (optional, analyze all subscribed if None)
 
     Returns:
-        Backfill result
+        Analysis report
     """
-    from .backfill_sync import BackfillSync, backfill_all_projects
-    from .redmine_scheduler import get_scheduler
+    return await run_redmine(
+        _analyze_dev_tester_workload_blocking, project_id, timeout=0
+    )
+
+
+def _backfill_historical_data_blocking(
+    project_id: Optional[int] = None, from_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Blocking implementation of ``backfill_historical_data``."""
+    from .dws.services.sync_service import BackfillSync, backfill_all_projects
+    from .scheduler.tasks import get_scheduler
 
     try:
         if project_id:
@@ -2357,21 +2878,28 @@ async def backfill_historical_data(
 
 
 @mcp.tool()
-async def analyze_issue_contributors(issue_id: int) -> Dict[str, Any]:
+async def backfill_historical_data(
+    project_id: Optional[int] = None, from_date: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    分析 Issue 的贡献者（按角色分类）
-
-    从数仓中获取 Issue 的所有贡献者，按角色优先级排序：
-    - 管理人员 > 实施人员 > 开发人员 > 测试人员
+    Backfill historical daily snapshots from Redmine journals
 
     Args:
-        issue_id: Issue ID
+        project_id: Specific project ID (optional, backfill all if None)
+        from_date: Start date in YYYY-MM-DD format (optional)
 
     Returns:
-        贡献者列表和汇总统计
+        Backfill result
     """
-    from ..dws.repository import DataWarehouse
-    from .dev_test_analyzer import DevTestAnalyzer
+    return await run_redmine(
+        _backfill_historical_data_blocking, project_id, from_date, timeout=0
+    )
+
+
+def _analyze_issue_contributors_blocking(issue_id: int) -> Dict[str, Any]:
+    """Blocking implementation of ``analyze_issue_contributors``."""
+    from .dws.repository import DataWarehouse
+    from .dws.services.analysis_service import DevTestAnalyzer
 
     try:
         warehouse = DataWarehouse()
@@ -2446,23 +2974,56 @@ async def analyze_issue_contributors(issue_id: int) -> Dict[str, Any]:
         return {"error": f"Failed to analyze contributors: {str(e)}"}
 
 
+async def _analyze_issue_contributors(issue_id: int) -> Dict[str, Any]:
+    """Read contributors from the warehouse, analyzing from Redmine on a miss."""
+    from .dws.async_repository import AsyncDataWarehouse
+
+    try:
+        warehouse = AsyncDataWarehouse()
+        contributors, summary = await asyncio.gather(
+            warehouse.get_issue_contributors(issue_id),
+            warehouse.get_issue_contributor_summary(issue_id),
+        )
+    except Exception as e:
+        logger.error(f"Failed to analyze contributors: {e}")
+        return {"error": f"Failed to analyze contributors: {str(e)}"}
+
+    if contributors:
+        return {
+            "issue_id": issue_id,
+            "contributors": contributors,
+            "summary": summary,
+            "from_cache": True,
+        }
+
+    # Not analyzed yet: fetch journals from Redmine and store (blocking)
+    return await run_warehouse(_analyze_issue_contributors_blocking, issue_id)
+
+
 @mcp.tool()
-async def get_project_role_distribution(
-    project_id: int, date: Optional[str] = None
-) -> Dict[str, Any]:
+async def analyze_issue_contributors(issue_id: int) -> Dict[str, Any]:
     """
-    Get project role distribution
+    分析 Issue 的贡献者（按角色分类）
+
+    从数仓中获取 Issue 的所有贡献者，按角色优先级排序：
+    - 管理人员 > 实施人员 > 开发人员 > 测试人员
 
     Args:
-        project_id: project_id
-        date: 日期（YYYY-MM-DD），默认今天
+        issue_id: Issue ID
 
     Returns:
-        各角色的人员数量
+        贡献者列表和汇总统计
     """
+    return await _analyze_issue_contributors(issue_id)
+
+
+def _get_project_role_distribution_blocking(
+    project_id: int, date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Blocking implementation of ``get_project_role_distribution``."""
     from datetime import date as date_class
-    from ..dws.repository import DataWarehouse
-    from .dev_test_analyzer import DevTestAnalyzer
+    from .dws.repository import DataWarehouse
+    from .dws.services.analysis_service import DevTestAnalyzer
 
     try:
         warehouse = DataWarehouse()
@@ -2513,34 +3074,64 @@ async def get_project_role_distribution(
         return {"error": f"Failed to get role distribution: {str(e)}"}
 
 
+async def _get_project_role_distribution(
+    project_id: int, date: Optional[str] = None
+) -> Dict[str, Any]:
+    """Read the role distribution, calculating it from Redmine on a miss."""
+    from datetime import date as date_class
+    from .dws.async_repository import AsyncDataWarehouse
+
+    try:
+        query_date = (
+            datetime.strptime(date, "%Y-%m-%d").date() if date else date_class.today()
+        )
+        distribution = await AsyncDataWarehouse().get_project_role_distribution(
+            project_id, query_date
+        )
+    except Exception as e:
+        logger.error(f"Failed to get role distribution: {e}")
+        return {"error": f"Failed to get role distribution: {str(e)}"}
+
+    if distribution:
+        return dict(distribution)
+
+    # Not calculated yet: load member roles from Redmine and store (blocking)
+    return await run_warehouse(
+        _get_project_role_distribution_blocking, project_id, date
+    )
+
+
 @mcp.tool()
-async def get_user_workload(
-    user_id: int, year_month: Optional[str] = None, project_id: Optional[int] = None
+async def get_project_role_distribution(
+    project_id: int, date: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Get user workload statistics
+    Get project role distribution
 
     Args:
-        user_id: user_id
-        year_month: 年月（YYYY-MM），默认本月
-        project_id: project_id(optional)
+        project_id: project_id
+        date: 日期（YYYY-MM-DD），默认今天
 
     Returns:
-        工作量统计信息
+        各角色的人员数量
     """
-    from datetime import datetime
-    from ..dws.repository import DataWarehouse
+    return await _get_project_role_distribution(project_id, date)
+
+
+async def _get_user_workload(
+    user_id: int, year_month: Optional[str] = None, project_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Implementation of ``get_user_workload``."""
+    from .dws.async_repository import AsyncDataWarehouse
 
     if not year_month:
         year_month = datetime.now().strftime("%Y-%m")
 
     try:
-        warehouse = DataWarehouse()
-
         # 查询数仓
-        workload_data = warehouse.get_user_workload(user_id, year_month, project_id)
-
-        warehouse.close()
+        workload_data = await AsyncDataWarehouse().get_user_workload(
+            user_id, year_month, project_id
+        )
 
         if workload_data:
             if project_id:
@@ -2569,21 +3160,29 @@ async def get_user_workload(
 
 
 @mcp.tool()
-async def trigger_contributor_sync(
-    project_id: Optional[int] = None, issue_ids: Optional[List[int]] = None
+async def get_user_workload(
+    user_id: int, year_month: Optional[str] = None, project_id: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    触发贡献者分析同步
+    Get user workload statistics
 
     Args:
-        project_id: project_id(optional, analyze entire project)
-        issue_ids: Issue ID 列表（可选，分析特定 Issue）
+        user_id: user_id
+        year_month: 年月（YYYY-MM），默认本月
+        project_id: project_id(optional)
 
     Returns:
-        同步结果
+        工作量统计信息
     """
-    from .dev_test_analyzer import DevTestAnalyzer
-    from ..dws.repository import DataWarehouse
+    return await _get_user_workload(user_id, year_month, project_id)
+
+
+def _trigger_contributor_sync_blocking(
+    project_id: Optional[int] = None, issue_ids: Optional[List[int]] = None
+) -> Dict[str, Any]:
+    """Blocking implementation of ``trigger_contributor_sync``."""
+    from .dws.services.analysis_service import DevTestAnalyzer
+    from .dws.repository import DataWarehouse
 
     try:
         if not redmine:
@@ -2671,6 +3270,25 @@ async def trigger_contributor_sync(
         return {"error": f"Failed to trigger contributor sync: {str(e)}"}
 
 
+@mcp.tool()
+async def trigger_contributor_sync(
+    project_id: Optional[int] = None, issue_ids: Optional[List[int]] = None
+) -> Dict[str, Any]:
+    """
+    触发贡献者分析同步
+
+    Args:
+        project_id: project_id(optional, analyze entire project)
+        issue_ids: Issue ID 列表（可选，分析特定 Issue）
+
+    Returns:
+        同步结果
+    """
+    return await run_redmine(
+        _trigger_contributor_sync_blocking, project_id, issue_ids, timeout=0
+    )
+
+
 def get_version() -> str:
     """Get server version"""
     try:
@@ -2690,6 +3308,15 @@ def get_health_status() -> Dict[str, Any]:
         "status": "healthy",
         "version": get_version(),
         "timestamp": datetime.now().isoformat(),
+        "executors": get_executor_stats(),
+        "request_coalescing": get_singleflight_stats(),
+        "redmine_cache": get_cache_stats(),
+        "reference_data": get_reference_stats(),
+        "redmine_circuit": get_circuit_state(),
+        "redmine_transport": get_transport_stats(),
+        "warehouse_pool": get_warehouse_pool_stats(),
+        "warehouse_async_pool": get_async_warehouse_pool_stats(),
+        "warehouse_statements": get_statement_stats(),
     }
 
 
@@ -15,6 +15,35 @@ from typing import List, Optional, Dict
 
 logger = logging.getLogger(__name__)
 
+# Latest daily summary of one project
+LATEST_PROJECT_SUMMARY_SQL = """
+    SELECT * FROM warehouse.dws_project_daily_summary
+    WHERE project_id = %s
+    ORDER BY snapshot_date DESC
+    LIMIT 1
+"""
+
+# Monthly contributor report of one project, from its issue contributors
+PROJECT_CONTRIBUTOR_REPORT_SQL = """
+    INSERT INTO warehouse.ads_contributor_report (
+        project_id, year_month, user_id, user_name,
+        role_category, total_issues, total_journals,
+        resolved_issues, report_date
+    )
+    SELECT
+        ic.project_id, %s, ic.user_id, ic.user_name,
+        ic.role_category, COUNT(DISTINCT ic.issue_id),
+        SUM(ic.journal_count), SUM(ic.status_change_count),
+        CURRENT_DATE
+    FROM warehouse.dws_issue_contributors ic
+    WHERE ic.project_id = %s
+    GROUP BY ic.project_id, ic.user_id, ic.user_name, ic.role_category
+    ON CONFLICT (project_id, year_month, user_id) DO UPDATE SET
+        total_issues = EXCLUDED.total_issues,
+        total_journals = EXCLUDED.total_journals,
+        resolved_issues = EXCLUDED.resolved_issues
+"""
+
 
 class ADSReportScheduler:
     """ADS 报表scheduler"""
@@ -62,15 +91,7 @@ class ADSReportScheduler:
                 for project_id in project_ids:
                     try:
                         # get最新statisticsdata
-                        cur.execute(
-                            """
-                            SELECT * FROM warehouse.dws_project_daily_summary
-                            WHERE project_id = %s
-                            ORDER BY snapshot_date DESC
-                            LIMIT 1
-                        """,
-                            (project_id,),
-                        )
+                        cur.execute(LATEST_PROJECT_SUMMARY_SQL, (project_id,))
 
                         summary = cur.fetchone()
 
@@ -196,26 +217,7 @@ class ADSReportScheduler:
                 for project_id in project_ids:
                     try:
                         cur.execute(
-                            """
-                            INSERT INTO warehouse.ads_contributor_report (
-                                project_id, year_month, user_id, user_name,
-                                role_category, total_issues, total_journals,
-                                resolved_issues, report_date
-                            )
-                            SELECT
-                                ic.project_id, %s, ic.user_id, ic.user_name,
-                                ic.role_category, COUNT(DISTINCT ic.issue_id),
-                                SUM(ic.journal_count), SUM(ic.status_change_count),
-                                CURRENT_DATE
-                            FROM warehouse.dws_issue_contributors ic
-                            WHERE ic.project_id = %s
-                            GROUP BY ic.user_id, ic.user_name, ic.role_category
-                            ON CONFLICT (project_id, year_month, user_id) DO UPDATE SET
-                                total_issues = EXCLUDED.total_issues,
-                                total_journals = EXCLUDED.total_journals,
-                                resolved_issues = EXCLUDED.resolved_issues
-                        """,
-                            (year_month, project_id),
+                            PROJECT_CONTRIBUTOR_REPORT_SQL, (year_month, project_id)
                         )
 
                         count += 1
@@ -7,12 +7,16 @@ import os
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 import requests
 
 
+from ..dws.partitions import maintain_snapshot_partitions
 from ..dws.repository import DataWarehouse
 from ..redmine_handler import REDMINE_URL, REDMINE_API_KEY, logger
+from ..core.transport import get_redmine_transport
+from ..core.pagination import iter_issue_pages, load_pages
 
 
 class RedmineSyncScheduler:
@@ -76,9 +80,9 @@ class RedmineSyncScheduler:
     def _get_project_created_date(self, project_id: int) -> Optional[datetime]:
         """Get project creation date from Redmine API (returns naive datetime)"""
         try:
-            api_url = f"{REDMINE_URL}/projects/{project_id}.json"
-            headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-            resp = requests.get(api_url, headers=headers, timeout=10)
+            resp = get_redmine_transport().get(
+                f"projects/{project_id}.json", timeout=10
+            )
             resp.raise_for_status()
             data = resp.json()
             created_on = data.get("project", {}).get("created_on", "")
@@ -124,26 +128,17 @@ class RedmineSyncScheduler:
         if not self.warehouse:
             self._init_warehouse()
 
-        api_url = f"{REDMINE_URL}/issues.json"
-        headers = {"X-Redmine-API-Key": REDMINE_API_KEY}
-
-        all_issues: List[Dict[str, Any]] = []
-        filtered_issues: List[Dict[str, Any]] = []
-        offset = 0
-        limit = 100
-
         # Build query parameters
         # Use status_id=* to get ALL issues (including closed ones)
-        params = {
+        params: Dict[str, Any] = {
             "project_id": project_id,
             "status_id": "*",
-            "limit": limit,
-            "offset": offset,
         }
 
         # Determine date range for sync
         sync_start = None
         sync_end = None
+        project_created = None
 
         if progressive:
             # Progressive weekly sync: sync one week at a time from project
@@ -153,8 +148,11 @@ class RedmineSyncScheduler:
             if sync_end > datetime.now():
                 sync_end = datetime.now()
 
-            # Query from sync_start onwards, then filter client-side
-            params["created_on"] = f'>={sync_start.strftime("%Y-%m-%d")}'
+            # Query the week server-side, then filter client-side to the
+            # exact [sync_start, sync_end) window
+            params["created_on"] = (
+                f'><{sync_start.strftime("%Y-%m-%d")}|{sync_end.strftime("%Y-%m-%d")}'
+            )
             logger.info(f"Progressive sync for project {project_id}: from {
                     sync_start.strftime('%Y-%m-%d')}")
 
@@ -185,79 +183,66 @@ class RedmineSyncScheduler:
                     f"Full sync for project {project_id}, syncing all issues (no creation date found)"
                 )
 
-        # Paginate - fetch all issues (no total limit)
-        while True:
-            try:
-                resp = requests.get(api_url, headers=headers, params=params, timeout=30)
-                resp.raise_for_status()
-                data = resp.json()
-                issues = data.get("issues", [])
-                all_issues.extend(issues)
-
-                if len(issues) < self.batch_size:
-                    break
-
-                offset += self.batch_size
-                logger.debug(f"Fetched {len(all_issues)} issues...")
-
-            except Exception as e:
-                logger.error(f"Failed to fetch issues for project {project_id}: {e}")
-                break
-
-        # Filter issues by date range for progressive sync
-        if progressive and sync_start and sync_end:
-            for issue in all_issues:
+        def in_sync_window(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            """Keep issues created inside the progressive sync window"""
+            filtered = []
+            for issue in issues:
                 created_on = issue.get("created_on", "")
                 if created_on:
                     issue_date = datetime.fromisoformat(
                         created_on.replace("Z", "+00:00")
                     ).replace(tzinfo=None)
                     if sync_start <= issue_date < sync_end:
-                        filtered_issues.append(issue)
-                    elif issue_date >= sync_end:
-                        break  # Issues are sorted by date, can stop early
+                        filtered.append(issue)
+            return filtered
+
+        # Stream pages straight into the warehouse; each page adjusts the
+        # daily summary by the counts of its own issues.  A fetch or write error
+        # propagates so the caller records the project as failed and the
+        # progressive sync window is not advanced past missing pages.
+        today = datetime.now().date()
+        yesterday = today - timedelta(days=1)
+        seen_issue_ids = set()
+
+        def write_page(issues: List[Dict[str, Any]]) -> int:
+            seen_issue_ids.update(issue["id"] for issue in issues)
+            return self.warehouse.upsert_issues_page(
+                project_id, issues, today, yesterday
+            )
 
-            logger.info(f"Filtered {
-                    len(all_issues)} issues to {
-                    len(filtered_issues)} in date range [{
+        fetched, synced = load_pages(
+            iter_issue_pages(params, page_size=self.batch_size, timeout=30),
+            write_page,
+            transform=in_sync_window if progressive and sync_start else None,
+            label=f"issues for project {project_id}",
+        )
+        if progressive and sync_start:
+            logger.info(f"Filtered {fetched} issues to {synced} in date range [{
                     sync_start.strftime('%Y-%m-%d')}, {
                     sync_end.strftime('%Y-%m-%d')})")
-            issues_to_sync = filtered_issues
-        else:
-            issues_to_sync = all_issues
 
-        if not issues_to_sync:
+        if not synced:
             logger.info(f"No issues to sync for project {project_id}")
             return 0
 
-        # Get yesterday's snapshot for comparison
-        yesterday = datetime.now().date() - timedelta(days=1)
-        try:
-            previous_issues = self.warehouse.get_issues_snapshot(project_id, yesterday)
-            previous_map = {i["issue_id"]: i for i in previous_issues}
-        except Exception as e:
-            logger.warning(f"Failed to get previous snapshot: {e}")
-            previous_map = {}
+        logger.info(f"Synced {synced} issues for project {project_id}")
 
-        # Batch sync to warehouse
-        try:
-            self.warehouse.upsert_issues_batch(
-                project_id, issues_to_sync, datetime.now().date(), previous_map
+        if not incremental and not progressive:
+            # A full sync returned every issue of the project created since
+            # project_created: the history of the others has ended
+            self.warehouse.close_missing_issues(
+                project_id,
+                today,
+                seen_issue_ids,
+                created_since=project_created.date() if project_created else None,
             )
-            logger.info(f"Synced {
-                    len(issues_to_sync)} issues for project {project_id}")
-
-            # Update progress for progressive sync
-            if progressive and sync_end:
-                self.project_sync_progress[project_id] = sync_end
-                logger.debug(
-                    f"Project {project_id} sync progress updated to {sync_end}"
-                )
 
-            return len(issues_to_sync)
-        except Exception as e:
-            logger.error(f"Failed to upsert issues for project {project_id}: {e}")
-            return 0
+        # Update progress for progressive sync
+        if progressive and sync_end:
+            self.project_sync_progress[project_id] = sync_end
+            logger.debug(f"Project {project_id} sync progress updated to {sync_end}")
+
+        return synced
 
     def _sync_all_projects(self, full: bool = True, progressive: bool = False):
         """
@@ -318,6 +303,16 @@ class RedmineSyncScheduler:
         logger.info("Progressive sync completed")
         logger.info("Sync results: %s", sync_results)
 
+    def _maintain_snapshot_partitions(self):
+        """Create upcoming snapshot partitions and apply the retention policy"""
+        if not self.warehouse:
+            self._init_warehouse()
+        try:
+            result = maintain_snapshot_partitions(self.warehouse.get_connection)
+            logger.info(f"Snapshot partitions maintained: {result}")
+        except Exception as e:
+            logger.error(f"Snapshot partition maintenance failed: {e}")
+
     def start(self):
         """Start scheduler with incremental sync only (progressive sync is manual)"""
         import threading
@@ -345,6 +340,18 @@ class RedmineSyncScheduler:
                 misfire_grace_time=60,
             )
 
+            # Daily: create upcoming snapshot partitions, expire old ones
+            self.scheduler.add_job(
+                self._maintain_snapshot_partitions,
+                CronTrigger(hour=0, minute=30),
+                id="snapshot_partitions",
+                name="Snapshot partition maintenance (daily)",
+                replace_existing=True,
+                max_instances=1,
+                misfire_grace_time=3600,
+                next_run_time=datetime.now(),
+            )
+
             # Start scheduler in background thread
             def run_scheduler():
                 # Only run incremental sync automatically
@@ -102,3 +102,23 @@ def setup_test_env(monkeypatch):
     monkeypatch.setenv('WAREHOUSE_DB_NAME', 'redmine_warehouse_test')
     monkeypatch.setenv('WAREHOUSE_DB_USER', 'redmine_warehouse_test')
     monkeypatch.setenv('WAREHOUSE_DB_PASSWORD', 'TestWarehouseP@ss2026')
+
+
+@pytest.fixture(autouse=True)
+def clear_redmine_read_cache():
+    """Keep cached Redmine reads and reference data from leaking between tests."""
+    import sys
+
+    def clear():
+        # Tests import the package both as redmine_mcp_server and src.*
+        for prefix in ("", "src."):
+            cache = sys.modules.get(f"{prefix}redmine_mcp_server.core.cache")
+            if cache is not None:
+                cache.clear_read_cache()
+            reference = sys.modules.get(f"{prefix}redmine_mcp_server.core.reference_data")
+            if reference is not None:
+                reference.clear_reference_data()
+
+    clear()
+    yield
+    clear()
@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch, MagicMock
 # 添加 src 到路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from redmine_mcp_server.dws.pool import close_warehouse_pool
 from redmine_mcp_server.dws.repository import DataWarehouse
 
 
@@ -27,11 +28,14 @@ class TestDataWarehouse:
             'WAREHOUSE_DB_USER': 'redmine_warehouse',
             'WAREHOUSE_DB_PASSWORD': 'test_password'
         }):
+            # 每个测试使用新的进程级连接池
+            close_warehouse_pool()
             yield
+            close_warehouse_pool()
     
     def test_init(self, mock_env):
         """测试初始化"""
-        with patch('redmine_mcp_server.dws.repository.pool.SimpleConnectionPool') as mock_pool:
+        with patch('psycopg2.pool.ThreadedConnectionPool') as mock_pool:
             warehouse = DataWarehouse()
             
             assert warehouse.db_host == 'localhost'
@@ -42,8 +46,8 @@ class TestDataWarehouse:
     
     def test_get_connection(self, mock_env):
         """测试获取数据库连接"""
-        with patch('redmine_mcp_server.dws.repository.pool.SimpleConnectionPool') as mock_pool:
-            mock_conn = MagicMock()
+        with patch('psycopg2.pool.ThreadedConnectionPool') as mock_pool:
+            mock_conn = MagicMock(closed=0)
             mock_pool.return_value.getconn.return_value = mock_conn
             
             warehouse = DataWarehouse()
@@ -55,8 +59,8 @@ class TestDataWarehouse:
     
     def test_sync_issues(self, mock_env):
         """测试 Issue 同步"""
-        with patch('redmine_mcp_server.dws.repository.pool.SimpleConnectionPool') as mock_pool:
-            mock_conn = MagicMock()
+        with patch('psycopg2.pool.ThreadedConnectionPool') as mock_pool:
+            mock_conn = MagicMock(closed=0)
             mock_cursor = MagicMock()
             mock_pool.return_value.getconn.return_value = mock_conn
             mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
@@ -84,8 +88,8 @@ class TestDataWarehouse:
     
     def test_get_project_daily_stats(self, mock_env):
         """测试获取项目统计"""
-        with patch('redmine_mcp_server.dws.repository.pool.SimpleConnectionPool') as mock_pool:
-            mock_conn = MagicMock()
+        with patch('psycopg2.pool.ThreadedConnectionPool') as mock_pool:
+            mock_conn = MagicMock(closed=0)
             mock_cursor = MagicMock()
             mock_pool.return_value.getconn.return_value = mock_conn
             mock_conn.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Issue 解码微基准：python-redmine Resource 路径 vs 原始 JSON 快速路径
+
+对 1,000 条 issue 的页面分别用两条路径转换为工具输出的 dict，
+比较每条 issue 的平均耗时。不需要 Redmine 连接。
+
+运行方式:
+    python tests/manual/bench_issue_decode.py [--issues 1000] [--repeat 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from redminelib import Redmine  # noqa: E402
+
+from redmine_mcp_server.redmine_handler import (  # noqa: E402
+    _issue_to_dict_selective,
+    _issues_to_dicts,
+)
+
+
+def make_page(count):
+    """Build an issues.json-style page of ``count`` records."""
+    return [
+        {
+            "id": i,
+            "project": {"id": 1, "name": "Web App"},
+            "tracker": {"id": 1, "name": "Bug"},
+            "status": {"id": 2, "name": "In Progress", "is_closed": False},
+            "priority": {"id": 3, "name": "High"},
+            "author": {"id": 5, "name": "Alice"},
+            "assigned_to": {"id": 6, "name": "Bob"},
+            "subject": f"Issue {i}",
+            "description": "Steps to reproduce... " * 10,
+            "start_date": "2025-01-01",
+            "done_ratio": 0,
+            "custom_fields": [{"id": 1, "name": "Severity", "value": "Major"}],
+            "created_on": "2025-01-02T03:04:05Z",
+            "updated_on": "2025-01-03T10:00:00Z",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    client = Redmine("http://redmine.example", key="benchmark")
+    page = make_page(args.issues)
+
+    for fields in (None, ["id", "subject", "status"]):
+
+        def resource_path():
+            resource_set = client.issue.to_resource_set(page)
+            return [_issue_to_dict_selective(issue, fields) for issue in resource_set]
+
+        def raw_path():
+            return _issues_to_dicts(client.issue.to_resource_set(page), fields)
+
+        assert resource_path() == raw_path()
+        before = best_of(args.repeat, resource_path) / args.issues * 1e6
+        after = best_of(args.repeat, raw_path) / args.issues * 1e6
+
+        label = "all fields" if fields is None else f"fields={fields}"
+        print(f"{args.issues} issues, {label}")
+        print(f"  Resource path: {before:8.2f} µs/issue")
+        print(f"  Raw JSON path: {after:8.2f} µs/issue  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
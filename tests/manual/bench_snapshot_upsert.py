@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Issue 快照写入基准：逐条 upsert vs 批量多行 upsert
+
+向 warehouse.dwd_issue_daily_snapshot 写入合成 issue，比较
+逐条 upsert_issue（每条一次连接和提交）与 upsert_issues_batch
+（多行 INSERT ... ON CONFLICT，单个事务）的 rows/s。
+需要可写的 warehouse 数据库（WAREHOUSE_DB_* 环境变量），
+结束后删除写入的测试数据。
+
+运行方式:
+    python tests/manual/bench_snapshot_upsert.py [--issues 5000] [--project-id 999999]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from redmine_mcp_server.dws.repository import DataWarehouse  # noqa: E402
+
+SNAPSHOT_DATE = date(2000, 1, 1)
+
+
+def make_issues(count, project_id, offset):
+    return [
+        {
+            "id": offset + i,
+            "project": {"id": project_id, "name": "Benchmark"},
+            "subject": f"Issue {i}",
+            "status": {"id": 1, "name": "New"},
+            "priority": {"id": 2, "name": "Normal"},
+            "assigned_to": {"id": 5, "name": "Alice"} if i % 2 else None,
+            "created_on": "2000-01-01T00:00:00Z",
+            "updated_on": "2000-01-01T00:00:00Z",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def cleanup(warehouse, project_id):
+    with warehouse.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM warehouse.dwd_issue_daily_snapshot "
+                "WHERE project_id = %s AND snapshot_date = %s",
+                (project_id, SNAPSHOT_DATE),
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--project-id", type=int, default=999999)
+    args = parser.parse_args()
+
+    warehouse = DataWarehouse()
+    # High ids that do not collide with real issues
+    per_row = make_issues(args.issues, args.project_id, 900_000_000)
+    batch = make_issues(args.issues, args.project_id, 910_000_000)
+
+    try:
+        start = time.perf_counter()
+        for issue in per_row:
+            warehouse.upsert_issue(issue, SNAPSHOT_DATE, is_new=True)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warehouse.upsert_issues_batch(
+            args.project_id, batch, SNAPSHOT_DATE, {}, refresh_summary=False
+        )
+        after = time.perf_counter() - start
+    finally:
+        cleanup(warehouse, args.project_id)
+
+    print(f"{args.issues} issues")
+    print(f"  per-row upsert: {args.issues / before:10.0f} rows/s")
+    print(
+        f"  batch upsert:   {args.issues / after:10.0f} rows/s  ({before / after:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
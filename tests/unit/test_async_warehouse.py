@@ -0,0 +1,275 @@
+"""
+Tests for the async warehouse read path.
+
+Tests cover:
+- wait_ready suspending on the connection socket instead of blocking the loop
+- AsyncWarehousePool: concurrent queries overlap, size bound, checkout
+  timeout, connection reuse and cancellation of in-flight queries
+- Prepared statements sent once per async connection
+- AsyncDataWarehouse issuing the same SQL as DataWarehouse
+- Daily stats assembled from concurrent reads
+"""
+
+import asyncio
+import socket
+import time
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import psycopg2.extensions as ext
+import pytest
+
+from redmine_mcp_server.dws import repository, statements
+from redmine_mcp_server.dws.async_pool import AsyncWarehousePool
+from redmine_mcp_server.dws.async_repository import AsyncDataWarehouse
+from redmine_mcp_server.dws.pool import WarehousePoolTimeout
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        self.conn.queries.append((query, params))
+        self.conn.executing = True
+        # The "server" answers after conn.delay seconds
+        asyncio.get_running_loop().call_later(
+            self.conn.delay, self.conn.server.send, b"x"
+        )
+
+    def fetchall(self):
+        return list(self.conn.rows)
+
+    def fetchone(self):
+        return self.conn.rows[0] if self.conn.rows else None
+
+
+class FakeAsyncConnection:
+    """psycopg2 async connection stand-in driven by a real socket."""
+
+    def __init__(self, rows=(), delay=0.05):
+        self.client, self.server = socket.socketpair()
+        self.client.setblocking(False)
+        self.rows = list(rows)
+        self.delay = delay
+        self.queries = []
+        self.executing = False
+        self.cancelled = False
+        self.closed = 0
+
+    def fileno(self):
+        return self.client.fileno()
+
+    def poll(self):
+        if not self.executing:
+            return ext.POLL_OK
+        try:
+            self.client.recv(1)
+        except BlockingIOError:
+            return ext.POLL_READ
+        self.executing = False
+        return ext.POLL_OK
+
+    def isexecuting(self):
+        return self.executing
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def cancel(self):
+        self.cancelled = True
+
+    def close(self):
+        self.closed = 1
+        self.client.close()
+        self.server.close()
+
+
+@pytest.fixture
+def connections():
+    created = []
+
+    def connect(**kwargs):
+        assert kwargs["async_"] == 1
+        conn = FakeAsyncConnection(rows=[{"n": 1}])
+        created.append(conn)
+        return conn
+
+    with patch("psycopg2.connect", side_effect=connect):
+        yield created
+    for conn in created:
+        if not conn.closed:
+            conn.close()
+
+
+@pytest.mark.unit
+class TestAsyncWarehousePool:
+    """Tests for AsyncWarehousePool."""
+
+    async def test_queries_overlap_on_the_loop(self, connections):
+        pool = AsyncWarehousePool(maxconn=5)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        started = time.monotonic()
+        results = await asyncio.gather(*(pool.fetchall("SELECT 1") for _ in range(5)))
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+
+        assert results == [[{"n": 1}]] * 5
+        # Five 50 ms queries in flight together, loop kept running meanwhile
+        assert elapsed < 0.2
+        assert ticks >= 3
+        assert pool.get_stats()["max_in_use"] == 5
+
+    async def test_connections_are_reused(self, connections):
+        pool = AsyncWarehousePool(maxconn=2)
+
+        for _ in range(3):
+            assert await pool.fetchone("SELECT 1") == {"n": 1}
+
+        assert len(connections) == 1
+        assert pool.get_stats()["queries"] == 3
+
+    async def test_size_bound_and_waits(self, connections):
+        pool = AsyncWarehousePool(maxconn=2)
+
+        await asyncio.gather(*(pool.fetchall("SELECT 1") for _ in range(4)))
+
+        stats = pool.get_stats()
+        assert len(connections) == 2
+        assert stats["max_in_use"] == 2
+        assert stats["waited"] == 2
+
+    async def test_checkout_timeout(self, connections):
+        pool = AsyncWarehousePool(maxconn=1, timeout=0.01)
+
+        async with pool.connection():
+            with pytest.raises(WarehousePoolTimeout):
+                async with pool.connection():
+                    pass
+
+        assert pool.get_stats()["timeouts"] == 1
+
+    async def test_cancelled_query_is_cancelled_server_side(self, connections):
+        pool = AsyncWarehousePool(maxconn=1)
+        task = asyncio.create_task(pool.fetchall("SELECT pg_sleep(10)"))
+        await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        conn = connections[0]
+        assert conn.cancelled and conn.closed
+        stats = pool.get_stats()
+        assert (stats["open"], stats["in_use"], stats["cancelled"]) == (0, 0, 1)
+        # The slot is free again
+        assert await pool.fetchone("SELECT 1") == {"n": 1}
+
+    async def test_statement_prepared_once_per_connection(self, connections):
+        pool = AsyncWarehousePool(maxconn=1)
+        statement = statements.Statement("rmcp_async_test", "SELECT $1", 1)
+
+        await pool.fetchone(statement, (1,))
+        await pool.fetchone(statement, (2,))
+
+        assert connections[0].queries == [
+            (statement.prepare_sql, None),
+            (statement.execute_sql, (1,)),
+            (statement.execute_sql, (2,)),
+        ]
+        assert statements.registry.get_stats()["rmcp_async_test"]["prepares"] == 1
+
+
+@pytest.fixture
+def async_pool():
+    pool = AsyncMock()
+    pool.fetchall.return_value = []
+    pool.fetchone.return_value = None
+    return pool
+
+
+@pytest.mark.unit
+class TestAsyncDataWarehouse:
+    """Tests for AsyncDataWarehouse."""
+
+    async def test_same_sql_as_blocking_repository(self, async_pool):
+        warehouse = AsyncDataWarehouse(pool=async_pool)
+
+        await warehouse.get_issue_contributors(7)
+        await warehouse.get_user_workload(5, "2025-01")
+        await warehouse.get_user_workload(5, "2025-01", project_id=3)
+
+        assert [call.args for call in async_pool.fetchall.call_args_list] == [
+            (repository.ISSUE_CONTRIBUTORS_SQL, (7,)),
+            (repository.USER_WORKLOAD_SQL, (5, "2025-01")),
+            (repository.USER_PROJECT_WORKLOAD_SQL, (5, "2025-01", 3)),
+        ]
+
+    async def test_daily_stats_without_summary(self, async_pool):
+        warehouse = AsyncDataWarehouse(pool=async_pool)
+
+        stats = await warehouse.get_project_daily_stats(3, date(2025, 1, 2))
+
+        assert stats["total"] == 0 and stats["from_cache"] is False
+        async_pool.fetchone.assert_awaited_once_with(
+            statements.PROJECT_DAILY_SUMMARY, (3, "2025-01-02")
+        )
+
+    async def test_ods_table_stats_query_every_table(self, async_pool):
+        async_pool.fetchone.return_value = {"count": 4, "max_date": None}
+        warehouse = AsyncDataWarehouse(pool=async_pool)
+
+        stats = await warehouse.get_ods_table_stats()
+
+        assert set(stats) == {"ods_issues", "ods_projects", "ods_journals", "ods_users"}
+        assert async_pool.fetchone.await_count == 4
+
+
+@pytest.mark.unit
+class TestReadProjectDailyStats:
+    """Tests for redmine_handler._read_project_daily_stats."""
+
+    async def test_reads_run_concurrently(self):
+        from redmine_mcp_server.redmine_handler import _read_project_daily_stats
+
+        in_flight = 0
+        max_in_flight = 0
+
+        def read(result):
+            async def run(*args, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return result() if callable(result) else result
+
+            return run
+
+        warehouse = AsyncMock()
+        warehouse.get_project_daily_stats.side_effect = read(
+            lambda: {"today_new": 3, "today_closed": 1}
+        )
+        warehouse.get_high_priority_issues.side_effect = read([{"issue_id": 9}])
+        warehouse.get_top_assignees.side_effect = read([])
+
+        stats = await _read_project_daily_stats(
+            warehouse, 3, date(2025, 1, 2), "yesterday"
+        )
+
+        assert max_in_flight == 4
+        assert stats["high_priority_count"] == 1
+        assert stats["high_priority_issues"][0]["url"].endswith("/issues/9")
+        assert (stats["change_new"], stats["change_closed"]) == (0, 0)
+        assert warehouse.get_project_daily_stats.await_args_list[1].args == (
+            3,
+            date(2025, 1, 1),
+        )
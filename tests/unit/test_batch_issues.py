@@ -0,0 +1,146 @@
+"""
+Tests for the get_redmine_issues batch tool.
+
+Tests cover:
+- Base records for many ids fetched with one issue_id filter request
+- Chunking of large id lists
+- Input order, de-duplication and not_found reporting
+- Field projection
+- Bounded concurrency of per-issue journal/attachment fetches
+- The per-call id limit
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server import redmine_handler
+
+
+def _issue(issue_id):
+    return MagicMock(id=issue_id)
+
+
+def _full_dict(issue):
+    return {"id": issue.id, "subject": f"Issue {issue.id}", "status": "New"}
+
+
+@pytest.fixture
+def handler_patches():
+    """Patch the client and the conversion helpers used by the batch tool."""
+    mock_redmine = MagicMock()
+    with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+        redmine_handler, "_issue_to_dict", _full_dict
+    ), patch.object(
+        redmine_handler,
+        "_issue_to_dict_selective",
+        lambda issue, fields=None: {
+            k: v for k, v in _full_dict(issue).items() if fields is None or k in fields
+        },
+    ), patch.object(
+        redmine_handler, "_journals_to_list", lambda issue: []
+    ), patch.object(
+        redmine_handler, "_attachments_to_list", lambda issue: []
+    ), patch.object(
+        redmine_handler, "_ensure_cleanup_started"
+    ):
+        yield mock_redmine
+
+
+@pytest.mark.unit
+class TestGetRedmineIssues:
+    """Tests for get_redmine_issues."""
+
+    @pytest.mark.asyncio
+    async def test_base_records_use_one_filter_request(self, handler_patches):
+        handler_patches.issue.filter.return_value = [_issue(3), _issue(1)]
+
+        result = await redmine_handler.get_redmine_issues([1, 2, 3, 1])
+
+        handler_patches.issue.filter.assert_called_once_with(
+            issue_id="1,2,3", status_id="*", limit=3
+        )
+        handler_patches.issue.get.assert_not_called()
+        assert [issue["id"] for issue in result["issues"]] == [1, 3]
+        assert result["not_found"] == [2]
+        assert "errors" not in result
+
+    @pytest.mark.asyncio
+    async def test_large_id_lists_are_chunked(self, handler_patches):
+        handler_patches.issue.filter.side_effect = lambda issue_id, **kw: [
+            _issue(int(i)) for i in issue_id.split(",")
+        ]
+
+        result = await redmine_handler.get_redmine_issues(list(range(1, 121)))
+
+        assert handler_patches.issue.filter.call_count == 3
+        assert [issue["id"] for issue in result["issues"]] == list(range(1, 121))
+
+    @pytest.mark.asyncio
+    async def test_fields_projection(self, handler_patches):
+        handler_patches.issue.filter.return_value = [_issue(1)]
+
+        result = await redmine_handler.get_redmine_issues([1], fields=["id"])
+
+        assert result["issues"] == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_details_are_fetched_with_bounded_concurrency(
+        self, handler_patches, monkeypatch
+    ):
+        monkeypatch.setenv("REDMINE_BATCH_CONCURRENCY", "2")
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_get(issue_id, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            if issue_id == 4:
+                raise redmine_handler.ResourceNotFoundError()
+            return _issue(issue_id)
+
+        handler_patches.issue.get.side_effect = slow_get
+
+        result = await redmine_handler.get_redmine_issues(
+            [1, 2, 3, 4, 5], include_journals=True, fields=["id"]
+        )
+
+        assert peak <= 2
+        assert handler_patches.issue.get.call_count == 5
+        assert result["issues"][0] == {"id": 1, "journals": []}
+        assert [issue["id"] for issue in result["issues"]] == [1, 2, 3, 5]
+        assert result["not_found"] == [4]
+        handler_patches.issue.filter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_detail_fetch_is_reported_per_issue(self, handler_patches):
+        def get(issue_id, **kwargs):
+            if issue_id == 2:
+                raise ConnectionError("down")
+            return _issue(issue_id)
+
+        handler_patches.issue.get.side_effect = get
+
+        result = await redmine_handler.get_redmine_issues(
+            [1, 2], include_attachments=True
+        )
+
+        assert [issue["id"] for issue in result["issues"]] == [1]
+        assert result["not_found"] == []
+        assert [error["id"] for error in result["errors"]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_too_many_ids_rejected(self, handler_patches):
+        ids = list(range(redmine_handler.MAX_BATCH_ISSUES + 1))
+
+        result = await redmine_handler.get_redmine_issues(ids)
+
+        assert "error" in result
+        handler_patches.issue.filter.assert_not_called()
@@ -0,0 +1,230 @@
+"""
+Tests for the Redmine read-through cache.
+
+Tests cover:
+- TTL expiry and per-resource TTLs
+- LRU eviction by entry count and by size
+- Tag invalidation and generation checks for in-flight reads
+- Hit/miss/eviction counters
+- Read-through behaviour of cached_read
+- Write tools invalidating cached issue and wiki reads
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.core import cache as cache_module
+from redmine_mcp_server.core.cache import ReadCache, cached_read, entity_tag
+
+
+def _key(resource, *ident):
+    return (resource, tuple(str(i) for i in ident), ())
+
+
+@pytest.fixture
+def read_cache(monkeypatch):
+    """Install a fresh process-wide cache for the test."""
+    cache = ReadCache(max_entries=10)
+    monkeypatch.setattr(cache_module, "_cache", cache)
+    monkeypatch.setattr(cache_module, "_cache_configured", True)
+    return cache
+
+
+@pytest.mark.unit
+class TestReadCache:
+    """Tests for ReadCache."""
+
+    def test_get_returns_stored_value_until_ttl(self):
+        cache = ReadCache(ttls={"issue": 0.05})
+
+        cache.set(_key("issue", 1), {"id": 1})
+        assert cache.get(_key("issue", 1)) == {"id": 1}
+
+        time.sleep(0.06)
+        assert cache.get(_key("issue", 1)) is cache_module._MISSING
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_zero_ttl_disables_a_resource(self):
+        cache = ReadCache(ttls={"projects": 0})
+
+        assert not cache.set(_key("projects"), [])
+        assert cache.get_stats()["entries"] == 0
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = ReadCache(max_entries=2)
+        cache.set(_key("issue", 1), 1)
+        cache.set(_key("issue", 2), 2)
+        cache.get(_key("issue", 1))
+
+        cache.set(_key("issue", 3), 3)
+
+        assert cache.get(_key("issue", 2)) is cache_module._MISSING
+        assert cache.get(_key("issue", 1)) == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_evicts_to_stay_under_byte_limit(self):
+        cache = ReadCache(max_bytes=250)
+        for i in range(3):
+            cache.set(_key("issue", i), {"description": "x" * 100})
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= 250
+
+    def test_oversized_value_is_not_stored(self):
+        cache = ReadCache(max_bytes=10)
+
+        assert not cache.set(_key("issue", 1), {"description": "x" * 100})
+
+    def test_invalidate_drops_tagged_entries_only(self):
+        cache = ReadCache()
+        tag = entity_tag("issue", 1)
+        cache.set(_key("issue", 1, "journals"), 1, [tag])
+        cache.set(_key("issue", 1), 1, [tag])
+        cache.set(_key("issue", 2), 2, [entity_tag("issue", 2)])
+
+        assert cache.invalidate(entity_tag("issue", "1")) == 2
+        assert cache.get(_key("issue", 2)) == 2
+        assert cache.get_stats()["entries"] == 1
+
+    def test_read_started_before_invalidation_is_not_stored(self):
+        cache = ReadCache()
+        tags = [entity_tag("issue", 1)]
+        generation = cache.generation(tags)
+
+        cache.invalidate(*tags)
+
+        assert not cache.set(_key("issue", 1), "stale", tags, generation)
+        assert cache.get_stats()["stale_writes_skipped"] == 1
+
+    def test_hit_ratio(self):
+        cache = ReadCache()
+        cache.set(_key("issue", 1), 1)
+        cache.get(_key("issue", 1))
+        cache.get(_key("issue", 2))
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_CACHE_TTL_ISSUE", "5")
+
+        assert ReadCache.from_env().ttls["issue"] == 5
+
+    def test_from_env_disabled(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_CACHE_MAX_ENTRIES", "0")
+
+        assert ReadCache.from_env() is None
+
+
+@pytest.mark.unit
+class TestCachedRead:
+    """Tests for cached_read."""
+
+    @pytest.mark.asyncio
+    async def test_second_read_is_served_from_memory(self, read_cache):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return {"id": 1}
+
+        for _ in range(3):
+            assert await cached_read(_key("issue", 1), [], fetch) == {"id": 1}
+
+        assert calls == 1
+        assert read_cache.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, read_cache):
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            raise ConnectionError("down")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await cached_read(_key("issue", 1), [], fetch)
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_read_is_not_hidden_by_stale_result(self, read_cache):
+        tag = entity_tag("issue", 1)
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            await release.wait()
+            return "before write"
+
+        async def fresh_fetch():
+            return "after write"
+
+        stale = asyncio.ensure_future(cached_read(_key("issue", 1), [tag], slow_fetch))
+        await asyncio.sleep(0)
+        read_cache.invalidate(tag)
+        fresh = await cached_read(_key("issue", 1), [tag], fresh_fetch)
+        release.set()
+
+        assert fresh == "after write"
+        assert await stale == "before write"
+        assert read_cache.get(_key("issue", 1)) == "after write"
+
+
+@pytest.mark.unit
+class TestToolInvalidation:
+    """Write tools invalidate the entities they modify."""
+
+    @pytest.mark.asyncio
+    async def test_update_issue_invalidates_cached_issue(self, read_cache):
+        from redmine_mcp_server import redmine_handler
+
+        mock_redmine = MagicMock()
+        mock_redmine.issue.get.side_effect = lambda issue_id, **kw: MagicMock(
+            id=issue_id, subject=f"v{mock_redmine.issue.get.call_count}"
+        )
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler,
+            "_issue_to_dict",
+            lambda issue: {"id": issue.id, "subject": issue.subject},
+        ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+            get = redmine_handler.get_redmine_issue
+            first = await get(5, include_journals=False, include_attachments=False)
+            again = await get(5, include_journals=False, include_attachments=False)
+            await redmine_handler.update_redmine_issue(5, {"subject": "new"})
+            after = await get(5, include_journals=False, include_attachments=False)
+
+        assert first == again == {"id": 5, "subject": "v1"}
+        # update_redmine_issue re-fetched once (v2); the read after it is fresh
+        assert after == {"id": 5, "subject": "v3"}
+
+    @pytest.mark.asyncio
+    async def test_wiki_update_and_delete_invalidate_page(self, read_cache):
+        from redmine_mcp_server import redmine_handler
+
+        mock_redmine = MagicMock()
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler,
+            "_wiki_page_to_dict",
+            lambda page, *args: {"title": "Home"},
+        ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+            await redmine_handler.get_redmine_wiki_page("proj", "Home")
+            assert read_cache.get_stats()["entries"] == 1
+
+            await redmine_handler.update_redmine_wiki_page("proj", "Home", "text")
+            assert read_cache.get_stats()["entries"] == 0
+
+            await redmine_handler.get_redmine_wiki_page("proj", "Home")
+            mock_redmine.wiki_page.delete.side_effect = TimeoutError("slow")
+            await redmine_handler.delete_redmine_wiki_page("proj", "Home")
+
+        # Invalidated even though the delete raised
+        assert read_cache.get_stats()["entries"] == 0
@@ -0,0 +1,243 @@
+"""
+Tests for the bounded blocking-I/O executors.
+
+Tests cover:
+- Running blocking calls off the event loop
+- Worker bound and queue depth metrics
+- Per-call timeout handling, including calls that time out while queued
+- Error mapping in _handle_redmine_error
+- Long-running Redmine jobs awaited past the call timeout
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.core.executor import (
+    BlockingCallTimeout,
+    BoundedExecutor,
+    get_executor,
+    get_executor_stats,
+    run_redmine,
+)
+
+
+@pytest.mark.unit
+class TestBoundedExecutor:
+    """Tests for BoundedExecutor."""
+
+    @pytest.fixture
+    def executor(self):
+        executor = BoundedExecutor("test", max_workers=2, default_timeout=5)
+        yield executor
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_from_worker_thread(self, executor):
+        """Calls run on a pool thread, not on the event loop thread."""
+        loop_thread = threading.get_ident()
+
+        result = await executor.run(lambda: threading.get_ident())
+
+        assert result != loop_thread
+        stats = executor.get_stats()
+        assert stats["completed"] == 1
+        assert stats["queue_depth"] == 0
+        assert stats["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_passes_args_and_kwargs(self, executor):
+        result = await executor.run(lambda a, b=0: a + b, 2, b=3)
+        assert result == 5
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_queue_depth_tracked(self, executor):
+        """Only max_workers calls run at once; the rest wait in the queue."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        await asyncio.gather(*(executor.run(work) for _ in range(6)))
+
+        stats = executor.get_stats()
+        assert peak == 2
+        assert stats["completed"] == 6
+        assert stats["max_queue_depth"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, executor):
+        """A slow blocking call does not block other coroutines."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        await asyncio.gather(executor.run(time.sleep, 0.2), ticker())
+
+        assert ticks == 5
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_blocking_call_timeout(self, executor):
+        with pytest.raises(BlockingCallTimeout) as exc_info:
+            await executor.run(time.sleep, 0.5, timeout=0.05)
+
+        assert exc_info.value.executor_name == "test"
+        assert isinstance(exc_info.value, TimeoutError)
+        assert executor.get_stats()["timed_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_call_timing_out_leaves_queue(self, executor):
+        """A call cancelled before a worker picked it up is not left queued."""
+        release = threading.Event()
+        busy = [
+            asyncio.ensure_future(executor.run(release.wait, timeout=0))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        try:
+            with pytest.raises(BlockingCallTimeout):
+                await executor.run(lambda: None, timeout=0.05)
+
+            assert executor.get_stats()["queue_depth"] == 0
+        finally:
+            release.set()
+            await asyncio.gather(*busy)
+        stats = executor.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_queued_call_leaves_queue(self, executor):
+        release = threading.Event()
+        busy = [
+            asyncio.ensure_future(executor.run(release.wait, timeout=0))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        try:
+            queued = asyncio.ensure_future(executor.run(lambda: None))
+            await asyncio.sleep(0.05)
+            assert executor.get_stats()["queue_depth"] == 1
+
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+
+            assert executor.get_stats()["queue_depth"] == 0
+        finally:
+            release.set()
+            await asyncio.gather(*busy)
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_and_are_counted(self, executor):
+        def boom():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError, match="bad"):
+            await executor.run(boom)
+
+        assert executor.get_stats()["failed"] == 1
+
+    def test_rejects_non_positive_worker_count(self):
+        with pytest.raises(ValueError):
+            BoundedExecutor("bad", max_workers=0)
+
+
+@pytest.mark.unit
+class TestNamedExecutors:
+    """Tests for the process-wide named executors."""
+
+    def test_get_executor_is_singleton(self):
+        assert get_executor("redmine") is get_executor("redmine")
+
+    @pytest.mark.asyncio
+    async def test_run_redmine_reports_stats(self):
+        assert await run_redmine(lambda: 42) == 42
+        assert "redmine" in get_executor_stats()
+
+    def test_handle_redmine_error_maps_timeout(self):
+        from redmine_mcp_server.redmine_handler import _handle_redmine_error
+
+        result = _handle_redmine_error(
+            BlockingCallTimeout("redmine", 60), "fetching issue 1"
+        )
+
+        assert "did not complete within 60s" in result["error"]
+
+
+@pytest.mark.unit
+class TestLongRunningJobs:
+    """Sync and backfill tools are not cut off by REDMINE_CALL_TIMEOUT."""
+
+    @pytest.fixture
+    def short_timeout(self):
+        executor = get_executor("redmine")
+        default = executor.default_timeout
+        executor.default_timeout = 0.05
+        yield
+        executor.default_timeout = default
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "tool, blocking, args",
+        [
+            (
+                "analyze_dev_tester_workload",
+                "_analyze_dev_tester_workload_blocking",
+                (1,),
+            ),
+            ("backfill_historical_data", "_backfill_historical_data_blocking", (1,)),
+            ("trigger_contributor_sync", "_trigger_contributor_sync_blocking", (1,)),
+        ],
+    )
+    async def test_job_outlives_call_timeout(self, short_timeout, tool, blocking, args):
+        from redmine_mcp_server import redmine_handler
+
+        def slow(*args):
+            time.sleep(0.2)
+            return {"success": True}
+
+        with patch.object(redmine_handler, blocking, slow):
+            result = await getattr(redmine_handler, tool)(*args)
+
+        assert result == {"success": True}
+
+    @pytest.mark.asyncio
+    async def test_daily_stats_sync_outlives_call_timeout(self, short_timeout):
+        from redmine_mcp_server import redmine_handler
+
+        synced = []
+
+        def slow_sync(project_id, query_date):
+            time.sleep(0.2)
+            synced.append(project_id)
+            return 1
+
+        warehouse = MagicMock()
+        warehouse.return_value.get_issues_snapshot = AsyncMock(return_value=[])
+        with patch.object(redmine_handler, "redmine", MagicMock()), patch.object(
+            redmine_handler, "_refresh_project_snapshot", slow_sync
+        ), patch.object(
+            redmine_handler, "_read_project_daily_stats", AsyncMock(return_value={})
+        ), patch(
+            "redmine_mcp_server.dws.async_repository.AsyncDataWarehouse", warehouse
+        ):
+            result = await redmine_handler.get_project_daily_stats(7, "2025-01-02")
+
+        assert result == {"from_cache": True}
+        assert synced == [7]
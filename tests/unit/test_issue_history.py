@@ -0,0 +1,278 @@
+"""
+Tests for the change-only issue history storage.
+
+Tests cover:
+- SNAPSHOT_STORAGE parsing
+- record_issue_history: typed VALUES, last row per issue, paging, counting
+  written rows and logging states older than the history
+- close_missing_issue_history: closing and removing open intervals
+- DataWarehouse writers switching to the history in history mode
+- Closing missing issues only in history mode, with a summary refresh
+- Backfill snapshots written to the history and counted as written
+- Snapshot reads going through warehouse.issue_snapshot_on
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.dws import history, repository, statements
+from redmine_mcp_server.dws.history import (
+    HISTORY_COLUMNS,
+    close_missing_issue_history,
+    record_issue_history,
+    snapshot_storage,
+)
+from redmine_mcp_server.dws.repository import DataWarehouse
+from redmine_mcp_server.dws.services import sync_service
+from redmine_mcp_server.dws.services.sync_service import BackfillSync
+
+SNAPSHOT_DATE = date(2025, 1, 2)
+
+
+def _issue(issue_id, status="New"):
+    return {
+        "id": issue_id,
+        "project": {"id": 3},
+        "subject": f"Issue {issue_id}",
+        "status": {"id": 1, "name": status},
+        "priority": {"id": 2, "name": "Normal"},
+        "assigned_to": {"id": 7, "name": "Alice"},
+        "created_on": "2025-01-01T00:00:00Z",
+        "updated_on": "2025-01-02T08:00:00Z",
+    }
+
+
+def _row(issue_id, status_id=1):
+    return (issue_id, 3, SNAPSHOT_DATE, "S", status_id, "New", 2, "Normal")
+
+
+@pytest.fixture
+def warehouse(monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_STORAGE", "history")
+    with patch.object(DataWarehouse, "_init_pool"):
+        warehouse = DataWarehouse()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    warehouse.connection_pool = MagicMock()
+    warehouse.connection_pool.getconn.return_value = conn
+    with patch.object(repository, "record_issue_history") as record, patch.object(
+        repository, "execute_values"
+    ) as execute_values, patch.object(
+        repository, "ensure_snapshot_partitions"
+    ) as ensure, patch.object(
+        repository, "daily_summary_delta"
+    ):
+        yield warehouse, cursor, record, execute_values, ensure
+
+
+@pytest.mark.unit
+class TestSnapshotStorage:
+    """Tests for snapshot_storage."""
+
+    def test_default_is_daily(self, monkeypatch):
+        monkeypatch.delenv("SNAPSHOT_STORAGE", raising=False)
+        assert snapshot_storage() == "daily"
+
+    def test_history(self, monkeypatch):
+        monkeypatch.setenv("SNAPSHOT_STORAGE", " History ")
+        assert snapshot_storage() == "history"
+
+    def test_invalid_falls_back_to_daily(self, monkeypatch):
+        monkeypatch.setenv("SNAPSHOT_STORAGE", "weekly")
+        assert snapshot_storage() == "daily"
+
+
+@pytest.mark.unit
+class TestRecordIssueHistory:
+    """Tests for record_issue_history."""
+
+    def test_last_row_per_issue_wins(self):
+        conn = MagicMock()
+        with patch.object(history, "execute_values") as execute_values:
+            execute_values.return_value = [(2, 0)]
+            count = record_issue_history(conn, [_row(1), _row(2), _row(1, 5)])
+
+        assert count == 2
+        cur, sql, rows = execute_values.call_args.args
+        assert cur is conn.cursor.return_value.__enter__.return_value
+        assert rows == [_row(1, 5), _row(2)]
+        assert "VALUES %s" in sql and "dwd_issue_history" in sql
+        assert "dwd_issue_history_watermark" in sql
+        kwargs = execute_values.call_args.kwargs
+        assert kwargs["page_size"] == history.HISTORY_PAGE_SIZE
+        assert kwargs["template"].count("%s") == len(HISTORY_COLUMNS)
+        assert kwargs["fetch"] is True
+
+    def test_counts_summed_over_pages(self, caplog):
+        rows = [_row(issue_id) for issue_id in range(1, 6)]
+        with patch.object(history, "execute_values") as execute_values:
+            execute_values.return_value = [(1, 1), (0, 2)]
+            count = record_issue_history(MagicMock(), rows, page_size=3)
+
+        assert count == 1
+        assert "Skipped 3 of 5 issue states" in caplog.text
+
+    def test_empty_rows_write_nothing(self):
+        with patch.object(history, "execute_values") as execute_values:
+            assert record_issue_history(MagicMock(), []) == 0
+        execute_values.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCloseMissingIssueHistory:
+    """Tests for close_missing_issue_history."""
+
+    def test_open_intervals_closed_then_same_day_removed(self):
+        cur = MagicMock()
+        cur.rowcount = 2
+
+        closed = close_missing_issue_history(
+            cur, 3, SNAPSHOT_DATE, [5, 1, 5], created_since=date(2024, 1, 1)
+        )
+
+        assert closed == 4
+        (update, params), (delete, _) = [
+            call.args for call in cur.execute.call_args_list
+        ]
+        assert update.lstrip().startswith("UPDATE warehouse.dwd_issue_history")
+        assert "valid_from < %(day)s" in update
+        assert delete.lstrip().startswith("DELETE FROM warehouse.dwd_issue_history")
+        assert "valid_from = %(day)s" in delete
+        assert params == {
+            "project_id": 3,
+            "day": SNAPSHOT_DATE,
+            "issue_ids": [1, 5],
+            "created_since": date(2024, 1, 1),
+        }
+
+
+@pytest.mark.unit
+class TestHistoryWriters:
+    """Tests for DataWarehouse writers with SNAPSHOT_STORAGE=history."""
+
+    def test_batch_writes_history_rows(self, warehouse):
+        warehouse, cursor, record, execute_values, ensure = warehouse
+
+        warehouse.upsert_issues_batch(3, [_issue(1), _issue(2)], SNAPSHOT_DATE, {})
+
+        _, rows = record.call_args.args
+        assert [len(row) for row in rows] == [len(HISTORY_COLUMNS)] * 2
+        assert rows[0][:4] == (1, 3, SNAPSHOT_DATE, "Issue 1")
+        assert rows[0][8:10] == (7, "Alice")
+        execute_values.assert_not_called()
+        ensure.assert_not_called()
+        cursor.execute.assert_not_called()
+        repository.daily_summary_delta.assert_called_once()
+
+    def test_single_issue(self, warehouse):
+        warehouse, _, record, execute_values, _ = warehouse
+
+        warehouse.upsert_issue(_issue(4), SNAPSHOT_DATE)
+
+        _, rows = record.call_args.args
+        assert rows[0][0] == 4
+        execute_values.assert_not_called()
+
+    def test_page_skips_previous_day_read(self, warehouse):
+        warehouse, _, record, _, _ = warehouse
+
+        with patch.object(warehouse, "get_issues_snapshot") as previous:
+            assert (
+                warehouse.upsert_issues_page(
+                    3, [_issue(1)], SNAPSHOT_DATE, date(2025, 1, 1)
+                )
+                == 1
+            )
+
+        previous.assert_not_called()
+        record.assert_called_once()
+
+    def test_backfill_writes_history(self, warehouse):
+        warehouse = warehouse[0]
+        sync = BackfillSync.__new__(BackfillSync)
+        sync.warehouse = warehouse
+        state = dict(zip(HISTORY_COLUMNS, _row(9) + (None, None, "", "")))
+        state.update(is_new=True, is_closed=False, is_updated=False)
+
+        with patch.object(
+            sync_service, "record_issue_history", return_value=0
+        ) as backfill_record, patch.object(
+            sync_service, "ensure_snapshot_partitions"
+        ) as ensure:
+            assert sync._save_snapshots(date(2024, 5, 6), [state]) == 0
+
+        _, rows = backfill_record.call_args.args
+        assert rows == [
+            (9, 3, date(2024, 5, 6), "S", 1, "New", 2, "Normal", None, None, "", "")
+        ]
+        ensure.assert_not_called()
+
+    def test_backfill_counts_written_snapshots(self, warehouse, caplog):
+        sync = BackfillSync.__new__(BackfillSync)
+        sync.warehouse = warehouse[0]
+        days = {date(2024, 5, 6): ["a", "b"], date(2024, 5, 7): ["c"]}
+
+        with patch.object(
+            sync, "iter_project_issue_pages", return_value=iter([[_issue(9)]])
+        ), patch.object(sync, "_group_snapshots", return_value=days), patch.object(
+            sync, "_save_snapshots", side_effect=[2, 0]
+        ), patch.object(
+            sync.warehouse, "refresh_dws_project_daily_summary"
+        ), caplog.at_level(
+            "INFO", logger=sync_service.logger.name
+        ):
+            sync.backfill_project(3)
+
+        assert "2 snapshots saved" in caplog.text
+
+    def test_missing_issues_closed(self, warehouse):
+        warehouse, cursor, _, _, _ = warehouse
+
+        with patch.object(
+            repository, "close_missing_issue_history", return_value=2
+        ) as close, patch.object(repository, "refresh_daily_summary") as refresh:
+            assert warehouse.close_missing_issues(3, SNAPSHOT_DATE, [1, 2]) == 2
+
+        close.assert_called_once_with(cursor, 3, SNAPSHOT_DATE, [1, 2], None)
+        assert refresh.call_args.args[1:] == (3, SNAPSHOT_DATE)
+
+    def test_nothing_closed_skips_refresh(self, warehouse):
+        warehouse = warehouse[0]
+
+        with patch.object(
+            repository, "close_missing_issue_history", return_value=0
+        ), patch.object(repository, "refresh_daily_summary") as refresh:
+            assert warehouse.close_missing_issues(3, SNAPSHOT_DATE, [1]) == 0
+
+        refresh.assert_not_called()
+
+    def test_daily_mode_closes_nothing(self, warehouse):
+        warehouse = warehouse[0]
+        warehouse.snapshot_storage = "daily"
+
+        with patch.object(repository, "close_missing_issue_history") as close:
+            assert warehouse.close_missing_issues(3, SNAPSHOT_DATE, [1]) == 0
+
+        close.assert_not_called()
+        warehouse.connection_pool.getconn.assert_not_called()
+
+
+@pytest.mark.unit
+class TestSnapshotReads:
+    """Snapshot reads work on either storage."""
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            statements.HIGH_PRIORITY_ISSUES,
+            statements.TOP_ASSIGNEES,
+            statements.issues_snapshot_statement("*", False),
+            statements.issues_snapshot_statement('"issue_id"', True),
+        ],
+        ids=lambda statement: statement.name,
+    )
+    def test_reads_use_issue_snapshot_on(self, statement):
+        assert "warehouse.issue_snapshot_on($1, $2)" in statement.text
+        assert "dwd_issue_daily_snapshot" not in statement.text
@@ -0,0 +1,136 @@
+"""
+Tests for the raw JSON fast path used by list and search tools.
+
+Tests cover:
+- _issue_json_to_dict matching _issue_to_dict / _issue_to_dict_selective
+  on real python-redmine Resources built from the same payload
+- Records with missing or null fields
+- _resource_json_to_dict matching _resource_to_dict for search results
+- _issues_to_dicts choosing the fast path for ResourceSets only
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from redminelib import Redmine
+
+from redmine_mcp_server.redmine_handler import (
+    _issue_json_to_dict,
+    _issue_to_dict,
+    _issue_to_dict_selective,
+    _issues_to_dicts,
+    _resource_json_to_dict,
+    _resource_to_dict,
+)
+
+ISSUE = {
+    "id": 42,
+    "project": {"id": 1, "name": "Web App"},
+    "tracker": {"id": 1, "name": "Bug"},
+    "status": {"id": 2, "name": "In Progress", "is_closed": False},
+    "priority": {"id": 3, "name": "High"},
+    "author": {"id": 5, "name": "Alice"},
+    "assigned_to": {"id": 6, "name": "Bob"},
+    "subject": "Login fails",
+    "description": "Steps to reproduce...",
+    "created_on": "2025-01-02T03:04:05Z",
+    "updated_on": "2025-01-03T10:00:00Z",
+}
+
+
+@pytest.fixture
+def client():
+    # No request is sent: resources are built from local payloads
+    return Redmine("http://redmine.example", key="test")
+
+
+@pytest.mark.unit
+class TestIssueJsonToDict:
+    """The fast path produces the same dicts as the Resource converters."""
+
+    def test_full_record(self, client):
+        resource = client.issue.to_resource(dict(ISSUE))
+
+        assert _issue_json_to_dict(dict(ISSUE)) == _issue_to_dict(resource)
+
+    def test_sparse_record(self, client):
+        raw = {"id": 7, "subject": None, "created_on": "2025-01-02"}
+        resource = client.issue.to_resource(dict(raw))
+
+        assert _issue_json_to_dict(raw) == _issue_to_dict(resource)
+
+    @pytest.mark.parametrize(
+        "fields",
+        [["id", "subject"], ["status", "updated_on", "bogus"], ["*"], []],
+    )
+    def test_field_projection(self, client, fields):
+        resource = client.issue.to_resource(dict(ISSUE))
+
+        assert _issue_json_to_dict(dict(ISSUE), fields) == (
+            _issue_to_dict_selective(resource, fields)
+        )
+
+    def test_only_requested_fields_are_decoded(self):
+        raw = dict(ISSUE, created_on=object())
+
+        # created_on is not requested, so the unparseable value is never read
+        assert _issue_json_to_dict(raw, ["id"]) == {"id": 42}
+
+
+@pytest.mark.unit
+class TestResourceJsonToDict:
+    """Search results take the same fast path."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {
+                "id": 42,
+                "title": "Bug #42 (New): Login fails",
+                "description": "x" * 300,
+                "datetime": "2025-01-03T10:00:00Z",
+            },
+            ISSUE,
+        ],
+    )
+    def test_issue_matches_resource_converter(self, client, raw):
+        resource = client.issue.to_resource(dict(raw))
+
+        assert _resource_json_to_dict(dict(raw), "issues") == (
+            _resource_to_dict(resource, "issues")
+        )
+
+    def test_wiki_page(self):
+        # WikiPage Resources re-fetch missing attributes, so compare against
+        # the expected output instead of building one
+        raw = {"title": "Installation", "description": "See the guide"}
+
+        assert _resource_json_to_dict(raw, "wiki_pages") == {
+            "id": None,
+            "type": "wiki_pages",
+            "title": "Installation",
+            "project": None,
+            "project_id": None,
+            "status": None,
+            "updated_on": None,
+            "excerpt": "See the guide",
+        }
+
+
+@pytest.mark.unit
+class TestIssuesToDicts:
+    """Tests for _issues_to_dicts."""
+
+    def test_resource_set_uses_raw_payload(self, client):
+        resource_set = client.issue.to_resource_set([dict(ISSUE), {"id": 43}])
+
+        result = _issues_to_dicts(resource_set, ["id", "subject"])
+
+        assert result == [{"id": 42, "subject": "Login fails"}, {"id": 43, "subject": ""}]
+
+    def test_other_iterables_use_resource_converter(self):
+        issue = MagicMock(id=1, subject="S")
+
+        assert _issues_to_dicts([issue], ["id", "subject"]) == [
+            {"id": 1, "subject": "S"}
+        ]
@@ -0,0 +1,122 @@
+"""
+Tests for list_my_redmine_issues pagination metadata and cursors.
+
+Tests cover:
+- Signed cursor round trip and rejection of tampered cursors
+- total_count read from the page request (no unpaginated count query)
+- limit=1 probe when the page carries no total
+- Continuing a listing from next_cursor with the original filters
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from redmine_mcp_server import redmine_handler
+from redmine_mcp_server.core.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def _resource_set(issues, total_count=None):
+    resource_set = Mock()
+    resource_set.__iter__ = Mock(return_value=iter(issues))
+    resource_set.total_count = total_count
+    return resource_set
+
+
+@pytest.fixture
+def mock_redmine():
+    redmine = MagicMock()
+    with patch.object(redmine_handler, "redmine", redmine), patch.object(
+        redmine_handler, "_issue_to_dict", lambda issue: {"id": issue.id}
+    ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+        yield redmine
+
+
+@pytest.mark.unit
+class TestCursorCodec:
+    """Tests for encode_cursor/decode_cursor."""
+
+    def test_round_trip(self):
+        state = {"filters": {"project_id": 3}, "limit": 10, "offset": 20}
+
+        assert decode_cursor(encode_cursor(state)) == state
+
+    def test_tampered_cursor_is_rejected(self):
+        body, _, signature = encode_cursor({"offset": 20}).partition(".")
+        forged = encode_cursor({"offset": 0}).partition(".")[0]
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(f"{forged}.{signature}")
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(body)
+
+
+@pytest.mark.unit
+class TestListMyIssuesPagination:
+    """list_my_redmine_issues costs one request per page."""
+
+    @pytest.mark.asyncio
+    async def test_total_comes_from_the_page_request(self, mock_redmine):
+        mock_redmine.issue.filter.return_value = _resource_set(
+            [Mock(id=i) for i in range(10)], total_count=5000
+        )
+
+        result = await redmine_handler.list_my_redmine_issues(
+            limit=10, include_pagination_info=True
+        )
+
+        mock_redmine.issue.filter.assert_called_once_with(
+            assigned_to_id="me", offset=0, limit=10
+        )
+        assert result["pagination"]["total"] == 5000
+        assert result["pagination"]["next_offset"] == 10
+
+    @pytest.mark.asyncio
+    async def test_missing_total_is_probed_with_limit_one(self, mock_redmine):
+        mock_redmine.issue.filter.side_effect = [
+            _resource_set([Mock(id=1)]),
+            _resource_set([Mock(id=1)], total_count=42),
+        ]
+
+        result = await redmine_handler.list_my_redmine_issues(
+            limit=1, project_id=3, include_pagination_info=True
+        )
+
+        assert mock_redmine.issue.filter.call_args_list[1].kwargs == {
+            "assigned_to_id": "me",
+            "project_id": 3,
+            "limit": 1,
+        }
+        assert result["pagination"]["total"] == 42
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_continues_with_same_filters(self, mock_redmine):
+        mock_redmine.issue.filter.side_effect = [
+            _resource_set([Mock(id=1), Mock(id=2)], total_count=3),
+            _resource_set([Mock(id=3)], total_count=3),
+        ]
+
+        first = await redmine_handler.list_my_redmine_issues(
+            limit=2, status_id="open", include_pagination_info=True
+        )
+        second = await redmine_handler.list_my_redmine_issues(
+            cursor=first["pagination"]["next_cursor"]
+        )
+
+        mock_redmine.issue.filter.assert_called_with(
+            assigned_to_id="me", offset=2, limit=2, status_id="open"
+        )
+        assert second["issues"] == [{"id": 3}]
+        assert second["pagination"]["has_next"] is False
+        assert second["pagination"]["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_returns_error(self, mock_redmine):
+        result = await redmine_handler.list_my_redmine_issues(cursor="bogus.token")
+
+        assert "error" in result[0]
+        mock_redmine.issue.filter.assert_not_called()
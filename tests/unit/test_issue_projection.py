@@ -0,0 +1,138 @@
+"""
+Tests for compiled issue field projections.
+
+Tests cover:
+- _compile_issue_projection evaluating only the requested extractors
+- Requested order, duplicates and unknown field names
+- search_redmine_issues(fields=[...]) not touching unrequested attributes
+- Column lists pushed into warehouse snapshot queries
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from redmine_mcp_server import redmine_handler
+from redmine_mcp_server.dws.repository import DataWarehouse
+from redmine_mcp_server.redmine_handler import _compile_issue_projection
+
+
+class StrictIssue:
+    """Issue stand-in that fails on any attribute outside ``allowed``."""
+
+    def __init__(self, allowed, **values):
+        self._allowed = set(allowed)
+        self._values = values
+
+    def __getattr__(self, name):
+        if name.startswith("_") or name not in self._allowed:
+            raise AssertionError(f"unrequested attribute read: {name}")
+        return self._values[name]
+
+
+@pytest.mark.unit
+class TestCompileIssueProjection:
+    """Tests for _compile_issue_projection."""
+
+    def test_only_requested_extractors_run(self):
+        calls = []
+        extractors = {
+            name: (lambda issue, name=name: calls.append(name) or issue[name])
+            for name in ("id", "subject", "status")
+        }
+
+        project = _compile_issue_projection(["subject", "id"], extractors)
+        result = [project({"id": i, "subject": f"S{i}"}) for i in range(3)]
+
+        assert result[1] == {"subject": "S1", "id": 1}
+        assert "status" not in calls
+
+    def test_order_duplicates_and_unknown_fields(self):
+        project = _compile_issue_projection(["status", "id", "bogus", "id"])
+        issue = StrictIssue(["id", "status"], id=3, status=Mock(id=1))
+        issue._values["status"].name = "New"
+
+        assert list(project(issue)) == ["status", "id"]
+
+    @pytest.mark.parametrize("fields", [None, ["*"], ["all"]])
+    def test_all_fields(self, fields):
+        project = _compile_issue_projection(fields, {"a": len, "b": bool})
+
+        assert project("xy") == {"a": 2, "b": True}
+
+
+@pytest.mark.unit
+class TestSearchProjection:
+    """search_redmine_issues evaluates only the requested fields."""
+
+    @pytest.mark.asyncio
+    async def test_unrequested_attributes_are_not_read(self):
+        mock_redmine = MagicMock()
+        mock_redmine.issue.search.return_value = [
+            StrictIssue(["id", "subject"], id=i, subject=f"Issue {i}")
+            for i in (1, 2)
+        ]
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler, "_ensure_cleanup_started"
+        ):
+            result = await redmine_handler.search_redmine_issues(
+                "issue", fields=["id", "subject"]
+            )
+
+        assert result == [
+            {"id": 1, "subject": "Issue 1"},
+            {"id": 2, "subject": "Issue 2"},
+        ]
+
+
+@pytest.mark.unit
+class TestSnapshotColumns:
+    """Tests for DataWarehouse.get_issues_snapshot column lists."""
+
+    @pytest.fixture
+    def warehouse(self):
+        with patch.object(DataWarehouse, "_init_pool"):
+            warehouse = DataWarehouse()
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [{"issue_id": 1}]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        warehouse.connection_pool = MagicMock()
+        warehouse.connection_pool.getconn.return_value = conn
+        return warehouse, cursor
+
+    def test_columns_are_selected(self, warehouse):
+        warehouse, cursor = warehouse
+
+        rows = warehouse.get_issues_snapshot(
+            3, date(2025, 1, 2), issue_ids=[1], columns=["issue_id", "status_name"]
+        )
+
+        (prepare,), (execute, params) = [
+            call.args for call in cursor.execute.call_args_list
+        ]
+        assert 'SELECT "issue_id", "status_name" FROM' in prepare
+        assert "issue_id = ANY($3)" in prepare
+        assert params == (3, "2025-01-02", [1])
+        assert rows == [{"issue_id": 1}]
+
+    def test_default_selects_all_columns(self, warehouse):
+        warehouse, cursor = warehouse
+
+        warehouse.get_issues_snapshot(3, date(2025, 1, 2))
+
+        (prepare,), (execute, params) = [
+            call.args for call in cursor.execute.call_args_list
+        ]
+        assert "SELECT * FROM" in prepare
+        assert "ANY" not in prepare
+        assert params == (3, "2025-01-02")
+
+    def test_unknown_column_rejected(self, warehouse):
+        warehouse, cursor = warehouse
+
+        with pytest.raises(ValueError):
+            warehouse.get_issues_snapshot(3, date(2025, 1, 2), columns=["password"])
+        cursor.execute.assert_not_called()
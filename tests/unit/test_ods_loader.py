@@ -0,0 +1,264 @@
+"""
+Tests for the COPY-based ODS page loader.
+
+Tests cover:
+- Conversion of issues.json records to typed ODS rows
+- COPY text-format escaping
+- One transaction per page: COPY into staging, set-based merges
+- Quarantining bad issues and journals without losing the rest of the page
+- Journal detail upserts keyed by (journal_id, detail_ordinal)
+- One-time batched compaction of duplicate journal details
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.dws import ods_loader
+from redmine_mcp_server.dws.ods_loader import (
+    InvalidRecord,
+    OdsIssueLoader,
+    copy_rows,
+    issue_row,
+    journal_row,
+)
+
+ISSUE = {
+    "id": 42,
+    "project": {"id": 3, "name": "Web App"},
+    "tracker": {"id": 1, "name": "Bug"},
+    "status": {"id": 2, "name": "In Progress"},
+    "priority": {"id": 4, "name": "High"},
+    "author": {"id": 5, "name": "Alice"},
+    "subject": "Login fails",
+    "description": "Steps:\n\t1. open",
+    "done_ratio": 30,
+    "due_date": "2025-02-01",
+    "estimated_hours": 2.5,
+    "created_on": "2025-01-02T03:04:05Z",
+    "updated_on": "2025-01-03T10:00:00Z",
+    "journals": [
+        {
+            "id": 7,
+            "user": {"id": 5, "name": "Alice"},
+            "notes": "Fixed",
+            "created_on": "2025-01-03T10:00:00Z",
+            "details": [
+                {"property": "attr", "name": "status_id", "old_value": "1", "new_value": "2"}
+            ],
+        }
+    ],
+}
+
+
+def _copied(cur):
+    """Map staging table -> COPY payload from copy_expert calls."""
+    return {
+        call.args[0].split()[1]: call.args[1].getvalue()
+        for call in cur.copy_expert.call_args_list
+    }
+
+
+@pytest.fixture
+def connection():
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    get_connection = MagicMock()
+    get_connection.return_value.__enter__.return_value = conn
+    with patch.object(ods_loader, "execute_values") as execute_values, patch.object(
+        ods_loader, "compact_journal_details"
+    ):
+        yield get_connection, cur, execute_values
+
+
+@pytest.mark.unit
+class TestRowConversion:
+    """Tests for issue_row/journal_row."""
+
+    def test_issue_row_types(self):
+        row = dict(zip(ods_loader.ISSUE_COLUMNS, issue_row(ISSUE)))
+
+        assert row["project_id"] == 3
+        assert row["assigned_to_id"] is None
+        assert row["created_on"] == datetime(2025, 1, 2, 3, 4, 5)
+        assert row["due_date"] == date(2025, 2, 1)
+        assert row["estimated_hours"] == Decimal("2.50")
+        assert row["spent_hours"] is None
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"id": None},
+            {"project": None},
+            {"subject": "x" * 501},
+            {"due_date": "someday"},
+            {"status": {"id": "open"}},
+            {"estimated_hours": "NaN"},
+        ],
+    )
+    def test_invalid_issue(self, change):
+        with pytest.raises(InvalidRecord):
+            issue_row(dict(ISSUE, **change))
+
+    def test_journal_user_comes_from_user_ref(self):
+        assert journal_row(42, ISSUE["journals"][0])[:3] == (7, 42, 5)
+
+        with pytest.raises(InvalidRecord):
+            journal_row(42, {"id": 8, "notes": "anonymous"})
+
+
+@pytest.mark.unit
+class TestCopyRows:
+    """Tests for copy_rows."""
+
+    def test_text_format_escaping(self):
+        cur = MagicMock()
+
+        copy_rows(cur, "stage", ("a", "b", "c"), [("x\ty\\z", None, datetime(2025, 1, 2))])
+
+        sql, buffer = cur.copy_expert.call_args.args
+        assert sql == "COPY stage (a, b, c) FROM STDIN"
+        assert buffer.getvalue() == "x\\ty\\\\z\t\\N\t2025-01-02 00:00:00\n"
+
+    def test_no_rows_no_copy(self):
+        cur = MagicMock()
+
+        copy_rows(cur, "stage", ("a",), [])
+
+        cur.copy_expert.assert_not_called()
+
+
+@pytest.mark.unit
+class TestOdsIssueLoader:
+    """Tests for OdsIssueLoader.load_page."""
+
+    def test_page_is_staged_and_merged_in_one_transaction(self, connection):
+        get_connection, cur, execute_values = connection
+        issues = [ISSUE, dict(ISSUE, id=43, journals=[])]
+
+        result = OdsIssueLoader(get_connection).load_page(3, issues)
+
+        get_connection.assert_called_once()
+        copied = _copied(cur)
+        assert copied["ods_issues_stage"].count("\n") == 2
+        assert "Steps:\\n\\t1. open" in copied["ods_issues_stage"]
+        assert copied["ods_journals_stage"] == "7\t42\t5\tFixed\t2025-01-03 10:00:00\n"
+        assert copied["ods_journal_details_stage"] == "7\t0\tattr\tstatus_id\t1\t2\n"
+        statements = [call.args[0] for call in cur.execute.call_args_list]
+        assert any("INSERT INTO warehouse.ods_issues" in sql for sql in statements)
+        assert any(
+            "ON CONFLICT (journal_id, detail_ordinal)" in sql for sql in statements
+        )
+        execute_values.assert_not_called()
+        assert (result.issues, result.journals, result.details) == (2, 1, 1)
+        assert result.quarantined == []
+
+    def test_bad_records_are_quarantined(self, connection):
+        get_connection, cur, execute_values = connection
+        bad_journal = dict(ISSUE, id=44, journals=[{"id": 9, "notes": "no user"}])
+        issues = [dict(ISSUE, id=43, created_on="yesterday"), bad_journal]
+
+        result = OdsIssueLoader(get_connection).load_page(3, issues)
+
+        assert result.issues == 1
+        assert result.journals == 0
+        assert [entry[:2] for entry in result.quarantined] == [
+            ("ods_issues", 43),
+            ("ods_journals", 9),
+        ]
+        rows = execute_values.call_args.args[2]
+        assert [(row[0], row[1], row[2]) for row in rows] == [
+            ("ods_issues", 43, 3),
+            ("ods_journals", 9, 3),
+        ]
+        assert "ods_journals_stage" not in _copied(cur)
+
+    def test_duplicate_issue_ids_are_staged_once(self, connection):
+        get_connection, cur, _ = connection
+        issues = [dict(ISSUE, journals=[]), dict(ISSUE, subject="Renamed", journals=[])]
+
+        result = OdsIssueLoader(get_connection).load_page(3, issues)
+
+        assert result.issues == 1
+        assert "Renamed" in _copied(cur)["ods_issues_stage"]
+
+    def test_detail_ordinals_follow_api_order(self, connection):
+        get_connection, cur, _ = connection
+        journal = dict(
+            ISSUE["journals"][0],
+            details=[
+                {"property": "attr", "name": "status_id", "new_value": "2"},
+                {"property": "attr", "name": "done_ratio", "new_value": "50"},
+            ],
+        )
+
+        OdsIssueLoader(get_connection).load_page(3, [dict(ISSUE, journals=[journal])])
+
+        lines = _copied(cur)["ods_journal_details_stage"].splitlines()
+        assert [line.split("\t")[:3] for line in lines] == [
+            ["7", "0", "attr"],
+            ["7", "1", "attr"],
+        ]
+
+    def test_compaction_runs_once_per_loader(self, connection):
+        get_connection, _, _ = connection
+        loader = OdsIssueLoader(get_connection)
+
+        loader.load_page(3, [dict(ISSUE, journals=[])])
+        ods_loader.compact_journal_details.assert_not_called()
+        loader.load_page(3, [ISSUE])
+        loader.load_page(3, [ISSUE])
+
+        ods_loader.compact_journal_details.assert_called_once_with(get_connection)
+
+
+@pytest.mark.unit
+class TestCompactJournalDetails:
+    """Tests for compact_journal_details."""
+
+    @staticmethod
+    def _connections(index_state, bounds=(1, 12000)):
+        conn = MagicMock(autocommit=False)
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.side_effect = [index_state, bounds]
+        cur.rowcount = 2
+        get_connection = MagicMock()
+        get_connection.return_value.__enter__.return_value = conn
+        return get_connection, conn, cur
+
+    def test_valid_index_is_left_alone(self):
+        get_connection, _, cur = self._connections((True,))
+
+        stats = ods_loader.compact_journal_details(get_connection)
+
+        assert stats == {"deleted": 0, "renumbered": 0, "batches": 0}
+        assert cur.execute.call_count == 1
+
+    def test_dedupes_in_batches_then_builds_index_concurrently(self):
+        get_connection, conn, cur = self._connections(None)
+
+        stats = ods_loader.compact_journal_details(get_connection, batch_size=5000)
+
+        assert stats == {"deleted": 6, "renumbered": 6, "batches": 3}
+        ranges = [
+            call.args[1]
+            for call in cur.execute.call_args_list
+            if "DELETE FROM" in call.args[0]
+        ]
+        assert ranges == [(1, 5001), (5001, 10001), (10001, 15001)]
+        last = cur.execute.call_args.args[0]
+        assert last.startswith("CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS")
+        assert "(journal_id, detail_ordinal)" in last
+        assert conn.autocommit is False
+
+    def test_invalid_index_is_rebuilt(self):
+        get_connection, _, cur = self._connections((False,), bounds=(None, None))
+
+        stats = ods_loader.compact_journal_details(get_connection)
+
+        assert stats["batches"] == 0
+        statements = [call.args[0] for call in cur.execute.call_args_list]
+        assert statements[-2].startswith("DROP INDEX CONCURRENTLY")
+        assert statements[-1].startswith("CREATE UNIQUE INDEX CONCURRENTLY")
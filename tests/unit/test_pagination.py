@@ -0,0 +1,457 @@
+"""
+Tests for the concurrent offset paginator.
+
+Tests cover:
+- Reading total_count from the first page and fanning out the rest
+- In-order delivery with a bounded in-flight window
+- De-duplication of records that shift between pages
+- Picking up records created during the pull
+- Error propagation
+- Page-by-page fetch -> transform -> load pipeline
+- Streaming scheduler project sync, and failing it on a fetch error
+- Full scheduler sync closing the history of issues it no longer returned
+- Splitting large tool limits into concurrent sub-requests (fetch_window)
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.core.pagination import (
+    OffsetPaginator,
+    fetch_window,
+    load_pages,
+)
+
+
+class FakeEndpoint:
+    """Serves ``issues.json``-style pages from an in-memory list."""
+
+    def __init__(self, total, delay=0.0, jitter=False):
+        self.records = [{"id": i} for i in range(1, total + 1)]
+        self.delay = delay
+        self.jitter = jitter
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, params):
+        with self._lock:
+            self.calls.append(dict(params))
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            offset, limit = params["offset"], params["limit"]
+            if self.delay:
+                # Later offsets finish first when jitter is on
+                factor = 1.0 / (1 + offset // limit) if self.jitter else 1.0
+                time.sleep(self.delay * factor)
+            return {
+                "issues": self.records[offset : offset + limit],
+                "total_count": len(self.records),
+                "offset": offset,
+                "limit": limit,
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.mark.unit
+class TestOffsetPaginator:
+    """Tests for OffsetPaginator."""
+
+    def test_single_short_page(self):
+        endpoint = FakeEndpoint(total=3)
+        paginator = OffsetPaginator(endpoint, params={"project_id": 1})
+
+        assert paginator.fetch_all() == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert paginator.total_count == 3
+        assert len(endpoint.calls) == 1
+        assert endpoint.calls[0] == {
+            "project_id": 1,
+            "sort": "id",
+            "offset": 0,
+            "limit": 100,
+        }
+
+    def test_fetches_each_offset_once_in_order(self):
+        endpoint = FakeEndpoint(total=95, delay=0.01, jitter=True)
+        paginator = OffsetPaginator(endpoint, page_size=10, concurrency=4)
+
+        pages = list(paginator)
+
+        assert [r["id"] for page in pages for r in page] == list(range(1, 96))
+        assert sorted(c["offset"] for c in endpoint.calls) == list(range(0, 100, 10))
+
+    def test_exact_multiple_of_page_size_needs_no_extra_request(self):
+        endpoint = FakeEndpoint(total=40)
+        paginator = OffsetPaginator(endpoint, page_size=10, concurrency=3)
+
+        assert len(paginator.fetch_all()) == 40
+        assert len(endpoint.calls) == 4
+
+    def test_in_flight_window_is_bounded(self):
+        endpoint = FakeEndpoint(total=200, delay=0.02)
+        paginator = OffsetPaginator(endpoint, page_size=10, concurrency=3)
+
+        paginator.fetch_all()
+
+        assert endpoint.peak_in_flight <= 3
+        assert endpoint.peak_in_flight > 1
+
+    def test_concurrent_fetch_is_faster_than_sequential(self):
+        endpoint = FakeEndpoint(total=80, delay=0.05)
+
+        started = time.monotonic()
+        OffsetPaginator(endpoint, page_size=10, concurrency=8).fetch_all()
+        elapsed = time.monotonic() - started
+
+        # 1 page for total_count + 7 in parallel, versus 8 x 50ms sequentially
+        assert elapsed < 0.3
+
+    def test_sequential_when_concurrency_is_one(self):
+        endpoint = FakeEndpoint(total=25, delay=0.005)
+
+        records = OffsetPaginator(endpoint, page_size=10, concurrency=1).fetch_all()
+
+        assert [r["id"] for r in records] == list(range(1, 26))
+        assert [c["offset"] for c in endpoint.calls] == [0, 10, 20]
+        assert endpoint.peak_in_flight == 1
+
+    def test_duplicates_from_shifted_pages_are_dropped(self):
+        endpoint = FakeEndpoint(total=30)
+
+        def fetch(params):
+            data = endpoint(params)
+            if params["offset"] == 10:
+                # An earlier issue was deleted: page two starts one record late
+                data["issues"] = [{"id": 10}] + data["issues"][:-1]
+            return data
+
+        paginator = OffsetPaginator(fetch, page_size=10, concurrency=2)
+        ids = [r["id"] for r in paginator.fetch_all()]
+
+        assert ids.count(10) == 1
+        assert paginator.duplicates == 1
+
+    def test_records_added_during_pull_are_fetched(self):
+        endpoint = FakeEndpoint(total=20)
+
+        def fetch(params):
+            if params["offset"] == 10 and len(endpoint.records) == 20:
+                endpoint.records.extend({"id": i} for i in range(21, 26))
+            return endpoint(params)
+
+        records = OffsetPaginator(fetch, page_size=10, concurrency=2).fetch_all()
+
+        assert [r["id"] for r in records] == list(range(1, 26))
+
+    def test_missing_total_count_falls_back_to_sequential(self):
+        endpoint = FakeEndpoint(total=15)
+
+        def fetch(params):
+            data = endpoint(params)
+            del data["total_count"]
+            return data
+
+        records = OffsetPaginator(fetch, page_size=10, concurrency=4).fetch_all()
+
+        assert len(records) == 15
+
+    def test_page_error_propagates_after_earlier_pages(self):
+        endpoint = FakeEndpoint(total=50)
+
+        def fetch(params):
+            if params["offset"] == 20:
+                raise RuntimeError("boom")
+            return endpoint(params)
+
+        received = []
+        with pytest.raises(RuntimeError, match="boom"):
+            for page in OffsetPaginator(fetch, page_size=10, concurrency=2):
+                received.extend(page)
+
+        assert [r["id"] for r in received] == list(range(1, 21))
+
+    def test_explicit_sort_is_kept(self):
+        endpoint = FakeEndpoint(total=1)
+
+        OffsetPaginator(endpoint, params={"sort": "updated_on"}).fetch_all()
+
+        assert endpoint.calls[0]["sort"] == "updated_on"
+
+    def test_rejects_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            OffsetPaginator(lambda p: {}, page_size=0)
+
+
+@pytest.mark.unit
+class TestLoadPages:
+    """Tests for the page-by-page load pipeline."""
+
+    def test_loads_each_page_before_fetching_the_next(self):
+        events = []
+
+        def pages():
+            for n in range(3):
+                events.append(f"fetch {n}")
+                yield [{"id": n * 2 + 1}, {"id": n * 2 + 2}]
+
+        def load(page):
+            events.append(f"load {page[0]['id']}")
+            return len(page)
+
+        assert load_pages(pages(), load) == (6, 6)
+        assert events == [
+            "fetch 0",
+            "load 1",
+            "fetch 1",
+            "load 3",
+            "fetch 2",
+            "load 5",
+        ]
+
+    def test_transform_filters_before_load(self):
+        loaded = []
+
+        def load(page):
+            loaded.extend(page)
+            return len(page)
+
+        fetched, synced = load_pages(
+            [[{"id": 1}, {"id": 2}], [{"id": 3}]],
+            load,
+            transform=lambda page: [r for r in page if r["id"] != 2],
+        )
+
+        assert (fetched, synced) == (3, 2)
+        assert loaded == [{"id": 1}, {"id": 3}]
+
+    def test_fetch_error_propagates_after_loading_earlier_pages(self):
+        loaded = []
+
+        def pages():
+            yield [{"id": 1}]
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError, match="down"):
+            load_pages(pages(), lambda page: loaded.extend(page) or len(page))
+
+        assert loaded == [{"id": 1}]
+
+    def test_load_error_propagates(self):
+        def load(page):
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError, match="db down"):
+            load_pages([[{"id": 1}]], load)
+
+
+@pytest.mark.unit
+class TestFetchWindow:
+    """Tests for fetch_window."""
+
+    @staticmethod
+    def _endpoint(total, delay=0.0):
+        calls = []
+        active = peak = 0
+
+        async def fetch(offset, limit):
+            nonlocal active, peak
+            calls.append((offset, limit))
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(delay)
+            active -= 1
+            return list(range(offset, min(offset + limit, total))), total
+
+        return fetch, calls, lambda: peak
+
+    @pytest.mark.asyncio
+    async def test_small_limit_is_one_request(self):
+        fetch, calls, _ = self._endpoint(total=500)
+
+        pages, total = await fetch_window(fetch, 10, 25)
+
+        assert calls == [(10, 25)]
+        assert (pages, total) == ([list(range(10, 35))], 500)
+
+    @pytest.mark.asyncio
+    async def test_large_limit_is_split_and_merged_in_order(self):
+        fetch, calls, peak = self._endpoint(total=1000, delay=0.01)
+
+        pages, _ = await fetch_window(fetch, 0, 1000)
+
+        assert sorted(calls) == [(offset, 100) for offset in range(0, 1000, 100)]
+        assert [r for page in pages for r in page] == list(range(1000))
+        assert peak() > 1
+
+    @pytest.mark.asyncio
+    async def test_window_is_clipped_to_total(self):
+        fetch, calls, _ = self._endpoint(total=250)
+
+        pages, _ = await fetch_window(fetch, 0, 1000)
+
+        assert sorted(calls) == [(0, 100), (100, 100), (200, 50)]
+        assert sum(len(page) for page in pages) == 250
+
+    @pytest.mark.asyncio
+    async def test_short_first_page_stops(self):
+        fetch, calls, _ = self._endpoint(total=40)
+
+        await fetch_window(fetch, 0, 500)
+
+        assert calls == [(0, 100)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, monkeypatch):
+        from redmine_mcp_server.core import pagination
+
+        monkeypatch.setenv("REDMINE_SUBREQUEST_CONCURRENCY", "2")
+        monkeypatch.setattr(pagination, "_subrequest_semaphores", {})
+        fetch, _, peak = self._endpoint(total=1000, delay=0.01)
+
+        await fetch_window(fetch, 0, 1000)
+
+        assert peak() == 2
+
+    @pytest.mark.asyncio
+    async def test_list_my_redmine_issues_returns_full_large_limit(self):
+        from redmine_mcp_server import redmine_handler
+
+        def issue_filter(assigned_to_id, offset, limit, **filters):
+            resource_set = MagicMock()
+            resource_set.__iter__.return_value = iter(
+                [MagicMock(id=i) for i in range(offset, min(offset + limit, 1500))]
+            )
+            resource_set.total_count = 1500
+            return resource_set
+
+        mock_redmine = MagicMock()
+        mock_redmine.issue.filter.side_effect = issue_filter
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler, "_issue_to_dict", lambda issue: {"id": issue.id}
+        ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+            result = await redmine_handler.list_my_redmine_issues(
+                limit=1000, include_pagination_info=True
+            )
+
+        assert [issue["id"] for issue in result["issues"]] == list(range(1000))
+        assert mock_redmine.issue.filter.call_count == 10
+        assert result["pagination"]["next_offset"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_search_entire_redmine_returns_full_large_limit(self):
+        from redmine_mcp_server import redmine_handler
+
+        def search(query, resources, limit, offset):
+            return {
+                "issues": [MagicMock(id=i) for i in range(offset, offset + limit)]
+            }
+
+        mock_redmine = MagicMock()
+        mock_redmine.search.side_effect = search
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler,
+            "_resource_to_dict",
+            lambda resource, resource_type: {"id": resource.id},
+        ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+            result = await redmine_handler.search_entire_redmine("x", limit=300)
+
+        assert [r["id"] for r in result["results"]] == list(range(300))
+        assert result["results_by_type"] == {"issues": 300}
+        assert mock_redmine.search.call_count == 3
+
+
+@pytest.mark.unit
+class TestStreamingProjectSync:
+    """Scheduler project sync streams pages into the warehouse."""
+
+    def test_sync_project_advances_offset_and_upserts_per_page(self, monkeypatch):
+        from redmine_mcp_server.scheduler import tasks
+
+        endpoint = FakeEndpoint(total=250)
+        transport = MagicMock()
+        transport.get_json.side_effect = lambda endpoint_, params, timeout: endpoint(
+            params
+        )
+        monkeypatch.setattr(
+            "redmine_mcp_server.core.transport.get_redmine_transport",
+            lambda: transport,
+        )
+        monkeypatch.setenv("SYNC_BATCH_SIZE", "100")
+
+        with patch.object(tasks, "DataWarehouse") as mock_dw:
+            warehouse = mock_dw.return_value
+            warehouse.upsert_issues_page.side_effect = (
+                lambda project_id, issues, today, yesterday: len(issues)
+            )
+            scheduler = tasks.RedmineSyncScheduler(project_ids=[7])
+            count = scheduler._sync_project(7, incremental=True)
+
+        assert count == 250
+        assert sorted(c["offset"] for c in endpoint.calls) == [0, 100, 200]
+        assert all(c["project_id"] == 7 for c in endpoint.calls)
+        assert [
+            len(call.args[1]) for call in warehouse.upsert_issues_page.call_args_list
+        ] == [100, 100, 50]
+        # Each page adjusts the summary itself; no full recompute
+        warehouse.refresh_dws_project_daily_summary.assert_not_called()
+        # An incremental sync does not see every issue
+        warehouse.close_missing_issues.assert_not_called()
+
+    def test_full_sync_closes_missing_issues(self, monkeypatch):
+        from datetime import date, datetime
+
+        from redmine_mcp_server.scheduler import tasks
+
+        def pages(*args, **kwargs):
+            yield [{"id": 1}, {"id": 2}]
+            yield [{"id": 5}]
+
+        monkeypatch.setattr(tasks, "iter_issue_pages", pages)
+
+        with patch.object(tasks, "DataWarehouse") as mock_dw:
+            warehouse = mock_dw.return_value
+            warehouse.upsert_issues_page.side_effect = (
+                lambda project_id, issues, today, yesterday: len(issues)
+            )
+            scheduler = tasks.RedmineSyncScheduler(project_ids=[7])
+            with patch.object(
+                scheduler,
+                "_get_project_created_date",
+                return_value=datetime(2024, 3, 1, 9, 30),
+            ):
+                scheduler._sync_project(7, incremental=False)
+
+        args = warehouse.close_missing_issues.call_args
+        assert args.args[0] == 7
+        assert set(args.args[2]) == {1, 2, 5}
+        assert args.kwargs == {"created_since": date(2024, 3, 1)}
+
+    def test_fetch_error_fails_project_without_advancing_progress(self, monkeypatch):
+        from redmine_mcp_server.scheduler import tasks
+
+        def pages(*args, **kwargs):
+            yield [{"id": 1, "created_on": "2024-01-02T00:00:00Z"}]
+            raise TimeoutError("Redmine timed out")
+
+        monkeypatch.setattr(tasks, "iter_issue_pages", pages)
+
+        with patch.object(tasks, "DataWarehouse") as mock_dw:
+            mock_dw.return_value.upsert_issues_page.return_value = 1
+            scheduler = tasks.RedmineSyncScheduler(project_ids=[7])
+
+            with pytest.raises(TimeoutError):
+                scheduler._sync_project(7, incremental=False, progressive=True)
+
+        assert 7 not in scheduler.project_sync_progress
+        mock_dw.return_value.refresh_dws_project_daily_summary.assert_not_called()
+        mock_dw.return_value.close_missing_issues.assert_not_called()
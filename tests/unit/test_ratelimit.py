@@ -0,0 +1,222 @@
+"""
+Tests for the adaptive Redmine rate limiter.
+
+Tests cover:
+- Token bucket pacing
+- Concurrency limit enforcement
+- Additive increase on healthy responses
+- Multiplicative decrease on 429/5xx/errors, with cooldown
+- Retry-After handling
+- Integration with the pooled HTTP adapter
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from redmine_mcp_server.core.ratelimit import AdaptiveRateLimiter, parse_retry_after
+from redmine_mcp_server.core.transport import RedmineTransport
+
+
+def _response(status=200, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = b"{}"
+    resp.headers.update(headers or {})
+    return resp
+
+
+@pytest.mark.unit
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter."""
+
+    def test_token_bucket_paces_requests(self):
+        limiter = AdaptiveRateLimiter(
+            rate=50, max_rate=50, initial_concurrency=1, max_concurrency=1
+        )
+
+        started = time.monotonic()
+        for _ in range(6):
+            limiter.release(limiter.acquire(), status_code=200)
+        elapsed = time.monotonic() - started
+
+        # First token is available immediately, the other five take 20ms each
+        assert elapsed >= 0.09
+        assert limiter.get_stats()["throttled"] >= 1
+
+    def test_concurrency_limit_is_enforced(self):
+        limiter = AdaptiveRateLimiter(
+            rate=1000, initial_concurrency=2, max_concurrency=2
+        )
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal running, peak
+            started = limiter.acquire()
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            limiter.release(started, status_code=200)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert limiter.get_stats()["in_flight"] == 0
+
+    def test_healthy_responses_increase_limits(self):
+        limiter = AdaptiveRateLimiter(
+            rate=1000, max_rate=2000, initial_concurrency=2, max_concurrency=10
+        )
+
+        for _ in range(2):
+            limiter.release(limiter.acquire(), status_code=200)
+
+        assert limiter.limit == 3
+        assert limiter.rate > 1000
+
+    def test_slow_responses_do_not_increase_limits(self):
+        limiter = AdaptiveRateLimiter(
+            rate=1000, initial_concurrency=2, max_concurrency=10, latency_target=0.5
+        )
+
+        for _ in range(4):
+            limiter.release(time.monotonic() - 1.0, status_code=200)
+
+        assert limiter.limit == 2
+        assert limiter.rate == 1000
+
+    @pytest.mark.parametrize(
+        "outcome", [{"status_code": 429}, {"status_code": 503}, {"error": True}]
+    )
+    def test_overload_halves_limits(self, outcome):
+        limiter = AdaptiveRateLimiter(
+            rate=40, initial_concurrency=8, max_concurrency=8
+        )
+
+        limiter.release(limiter.acquire(), **outcome)
+
+        assert limiter.limit == 4
+        assert limiter.rate == 20
+        assert limiter.get_stats()["decreases"] == 1
+
+    def test_burst_of_failures_decreases_once_per_cooldown(self):
+        limiter = AdaptiveRateLimiter(
+            rate=40, initial_concurrency=8, max_concurrency=8, cooldown=10
+        )
+
+        for _ in range(3):
+            limiter.release(time.monotonic(), status_code=502)
+
+        stats = limiter.get_stats()
+        assert stats["overloads"] == 3
+        assert stats["decreases"] == 1
+        assert limiter.limit == 4
+
+    def test_limits_never_drop_below_minimum(self):
+        limiter = AdaptiveRateLimiter(
+            rate=2, min_rate=1, initial_concurrency=1, cooldown=0
+        )
+
+        for _ in range(5):
+            limiter.release(time.monotonic(), status_code=503)
+
+        assert limiter.limit == 1
+        assert limiter.rate == 1
+
+    def test_retry_after_pauses_the_bucket(self):
+        limiter = AdaptiveRateLimiter(rate=1000, initial_concurrency=4)
+
+        limiter.release(limiter.acquire(), status_code=429, retry_after=0.1)
+        assert limiter.get_stats()["paused_seconds"] > 0
+
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.09
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_RATE_LIMIT", "5")
+        monkeypatch.setenv("REDMINE_MAX_CONCURRENCY", "3")
+
+        limiter = AdaptiveRateLimiter.from_env(max_concurrency=20)
+
+        assert limiter.rate == 5
+        assert limiter.max_concurrency == 3
+
+    def test_from_env_disabled(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_RATE_LIMIT", "0")
+
+        assert AdaptiveRateLimiter.from_env() is None
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(rate=0)
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date_in_the_past(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+@pytest.mark.unit
+class TestAdapterIntegration:
+    """The pooled adapter feeds response outcomes into the limiter."""
+
+    def test_adapter_reports_status_and_retry_after(self):
+        limiter = AdaptiveRateLimiter(rate=1000, initial_concurrency=4)
+        transport = RedmineTransport(
+            "http://redmine.example.com", api_key="k", rate_limiter=limiter
+        )
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            return_value=_response(429, {"Retry-After": "0"}),
+        ):
+            transport.get("issues.json")
+
+        stats = transport.get_stats()["rate_limiter"]
+        assert stats["requests"] == 1
+        assert stats["overloads"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_adapter_counts_exceptions_as_overload(self):
+        limiter = AdaptiveRateLimiter(rate=1000, initial_concurrency=4)
+        transport = RedmineTransport(
+            "http://redmine.example.com", api_key="k", rate_limiter=limiter
+        )
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            side_effect=requests.Timeout("slow"),
+        ):
+            with pytest.raises(requests.Timeout):
+                transport.get("issues.json")
+
+        assert limiter.get_stats()["overloads"] == 1
+        assert limiter.limit == 2
+
+    def test_transport_without_limiter(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k")
+
+        assert transport.get_stats()["rate_limiter"] is None
@@ -0,0 +1,174 @@
+"""
+Tests for the reference-data catalog.
+
+Tests cover:
+- Lazy loading and name <-> id lookups from memory
+- Reload on a lookup miss, rate limited
+- Background refresh after the TTL while serving the old copy
+- Keeping the previous copy when a reload fails
+- Group member lookups
+- update_redmine_issue resolving status names without a round trip
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from redmine_mcp_server.core.reference_data import ReferenceCatalog
+
+STATUSES = [
+    {"id": 1, "name": "New", "is_closed": False},
+    {"id": 5, "name": "Closed", "is_closed": True},
+]
+
+
+class CountingLoader:
+    """Loader returning successive record lists and counting calls."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        result = self.results[min(self.calls, len(self.results) - 1)]
+        self.calls += 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.unit
+class TestReferenceCatalog:
+    """Tests for ReferenceCatalog."""
+
+    def test_lookups_load_once(self):
+        loader = CountingLoader(STATUSES)
+        catalog = ReferenceCatalog({"statuses": loader})
+
+        assert catalog.id_for("statuses", "closed") == 5
+        assert catalog.name_for("statuses", "1") == "New"
+        assert catalog.find("statuses", 5)["is_closed"] is True
+        assert loader.calls == 1
+
+    def test_miss_reloads_at_most_once_per_interval(self):
+        loader = CountingLoader(STATUSES, STATUSES + [{"id": 7, "name": "Review"}])
+        catalog = ReferenceCatalog({"statuses": loader}, miss_refresh_interval=0)
+
+        assert catalog.id_for("statuses", "review") == 7
+        assert loader.calls == 2
+
+        catalog.miss_refresh_interval = 3600
+        assert catalog.id_for("statuses", "unknown") is None
+        assert loader.calls == 2
+
+    def test_stale_dataset_is_served_while_refreshing(self):
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            if len(calls) > 1:
+                release.wait(1)
+                return [{"id": 1, "name": "Renamed"}]
+            return [{"id": 1, "name": "New"}]
+
+        catalog = ReferenceCatalog({"statuses": loader}, ttl=0.01)
+        assert catalog.name_for("statuses", 1) == "New"
+        time.sleep(0.02)
+
+        # Stale: the old copy is returned immediately
+        assert catalog.name_for("statuses", 1) == "New"
+        release.set()
+        for _ in range(100):
+            if catalog.name_for("statuses", 1) == "Renamed":
+                break
+            time.sleep(0.01)
+
+        assert catalog.name_for("statuses", 1) == "Renamed"
+        assert catalog.get_stats()["background_refreshes"] >= 1
+
+    def test_failed_reload_keeps_previous_copy(self):
+        loader = CountingLoader(STATUSES, ConnectionError("down"))
+        catalog = ReferenceCatalog({"statuses": loader}, miss_refresh_interval=0)
+
+        assert catalog.id_for("statuses", "missing") is None
+        assert catalog.id_for("statuses", "new") == 1
+        assert catalog.get_stats()["failures"] >= 1
+
+    def test_first_load_failure_propagates(self):
+        catalog = ReferenceCatalog({"statuses": CountingLoader(ConnectionError("x"))})
+
+        with pytest.raises(ConnectionError):
+            catalog.id_for("statuses", "new")
+
+    def test_concurrent_first_access_loads_once(self):
+        def slow():
+            time.sleep(0.05)
+            return STATUSES
+
+        loader = MagicMock(side_effect=slow)
+        catalog = ReferenceCatalog({"statuses": loader})
+
+        threads = [
+            threading.Thread(target=catalog.get, args=("statuses",)) for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert loader.call_count == 1
+
+    def test_group_members(self, monkeypatch):
+        transport = MagicMock()
+        transport.get_json.return_value = {
+            "group": {"users": [{"id": 3, "name": "Alice"}, {"id": 4, "name": "Bob"}]}
+        }
+        monkeypatch.setattr(
+            "redmine_mcp_server.core.transport.get_redmine_transport",
+            lambda: transport,
+        )
+        catalog = ReferenceCatalog(
+            {"groups": CountingLoader([{"id": 9, "name": "Semi Dev Team"}])}
+        )
+
+        assert catalog.group_members("Semi Dev Team") == {"Alice", "Bob"}
+        assert catalog.group_members("semi dev team") == {"Alice", "Bob"}
+        assert catalog.group_members("Unknown Team") == set()
+        transport.get_json.assert_called_once_with(
+            "groups/9.json", {"include": "users"}
+        )
+
+    def test_user_display_name_from_first_and_last_name(self):
+        catalog = ReferenceCatalog(
+            {"users": CountingLoader([{"id": 2, "firstname": "Ada", "lastname": "L"}])}
+        )
+
+        assert catalog.name_for("users", 2) == "Ada L"
+        assert catalog.id_for("users", "ada l") == 2
+
+
+@pytest.mark.unit
+class TestStatusNameResolution:
+    """update_redmine_issue resolves status names from the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_status_list_fetched_once_across_updates(self):
+        from redmine_mcp_server import redmine_handler
+
+        status = Mock(id=5, is_closed=True)
+        status.name = "Closed"
+        mock_redmine = MagicMock()
+        mock_redmine.issue_status.all.return_value = [status]
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler, "_issue_to_dict", lambda issue: {"id": 1}
+        ):
+            for _ in range(3):
+                await redmine_handler.update_redmine_issue(1, {"status_name": "closed"})
+
+        assert mock_redmine.issue_status.all.call_count == 1
+        for call in mock_redmine.issue.update.call_args_list:
+            assert call.kwargs == {"status_id": 5}
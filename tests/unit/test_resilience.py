@@ -0,0 +1,265 @@
+"""
+Tests for Redmine retries and circuit breaking.
+
+Tests cover:
+- Retry decisions by method, status and exception type
+- Jittered exponential backoff bounds and Retry-After
+- Circuit breaker opening, failing fast and half-open trials
+- Retries and breaker state inside the pooled HTTP adapter
+- Transport stats and the circuit-open error message
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from redmine_mcp_server.core.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    RetryPolicy,
+    is_transient_error,
+)
+from redmine_mcp_server.core.transport import RedmineTransport
+
+
+def _response(status=200, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = b"{}"
+    resp._content_consumed = True
+    resp.headers.update(headers or {})
+    return resp
+
+
+def _transport(max_retries=3, failure_threshold=5, reset_timeout=30.0):
+    return RedmineTransport(
+        "http://redmine.example.com",
+        api_key="k",
+        retry_policy=RetryPolicy(
+            max_retries=max_retries, backoff_base=0.001, backoff_max=0.01
+        ),
+        breakers=CircuitBreakerRegistry(
+            failure_threshold=failure_threshold, reset_timeout=reset_timeout
+        ),
+    )
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_retries_transient_statuses_for_get(self, status):
+        assert RetryPolicy().should_retry("GET", 0, status_code=status)
+
+    @pytest.mark.parametrize("status", [200, 404, 422, 500])
+    def test_does_not_retry_other_statuses(self, status):
+        assert not RetryPolicy().should_retry("GET", 0, status_code=status)
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE"])
+    def test_does_not_retry_non_idempotent_methods(self, method):
+        assert not RetryPolicy().should_retry(method, 0, status_code=503)
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.should_retry("GET", 1, status_code=503)
+        assert not policy.should_retry("GET", 2, status_code=503)
+
+    def test_transient_exceptions(self):
+        assert is_transient_error(requests.ConnectionError("reset"))
+        assert is_transient_error(requests.ReadTimeout("slow"))
+        assert not is_transient_error(requests.exceptions.SSLError("bad cert"))
+        assert not is_transient_error(CircuitOpenError("redmine", 5))
+        assert not is_transient_error(ValueError("bug"))
+
+    def test_backoff_is_jittered_within_exponential_ceiling(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=8.0)
+
+        for attempt, ceiling in [(0, 0.5), (1, 1.0), (3, 4.0), (6, 8.0)]:
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert len(set(delays)) > 1
+
+    def test_backoff_honours_capped_retry_after(self):
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=2.0)
+
+        assert policy.backoff(0, retry_after=1.5) >= 1.5
+        assert policy.backoff(0, retry_after=120) == 2.0
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_RETRY_MAX", "0")
+
+        assert RetryPolicy.from_env().max_retries == 0
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("redmine", failure_threshold=3)
+
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_in > 0
+
+        stats = breaker.get_stats()
+        assert stats["trips"] == 1
+        assert stats["rejected"] == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("redmine", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_a_single_trial(self):
+        breaker = CircuitBreaker("redmine", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_call()
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker("redmine", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.get_stats()["trips"] == 2
+
+    def test_registry_tracks_hosts_separately(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+
+        registry.get("a.example.com").record_failure()
+
+        assert registry.get("b.example.com").state == CircuitBreaker.CLOSED
+        assert registry.overall_state() == CircuitBreaker.OPEN
+        assert set(registry.get_stats()) == {"a.example.com", "b.example.com"}
+
+    def test_registry_from_env_disabled(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_BREAKER_FAILURES", "0")
+
+        assert CircuitBreakerRegistry.from_env() is None
+
+
+@pytest.mark.unit
+class TestAdapterResilience:
+    """The pooled adapter retries and consults the breaker."""
+
+    def test_get_is_retried_until_success(self):
+        transport = _transport()
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            side_effect=[
+                requests.ConnectionError("reset"),
+                _response(503),
+                _response(200),
+            ],
+        ) as mock_send:
+            response = transport.get("issues.json")
+
+        assert response.status_code == 200
+        assert mock_send.call_count == 3
+        stats = transport.get_stats()
+        assert stats["retries"] == 2
+        assert stats["circuit_breakers"]["redmine.example.com"]["state"] == "closed"
+
+    def test_gives_up_after_max_retries(self):
+        transport = _transport(max_retries=2)
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send", return_value=_response(503)
+        ) as mock_send:
+            response = transport.get("issues.json")
+
+        assert response.status_code == 503
+        assert mock_send.call_count == 3
+
+    def test_post_is_not_retried(self):
+        transport = _transport()
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send", return_value=_response(503)
+        ) as mock_send:
+            response = transport.session.post(transport.url("issues.json"), json={})
+
+        assert response.status_code == 503
+        assert mock_send.call_count == 1
+
+    def test_open_circuit_fails_fast(self):
+        transport = _transport(max_retries=0, failure_threshold=2)
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            side_effect=requests.ReadTimeout("slow"),
+        ) as mock_send:
+            for _ in range(2):
+                with pytest.raises(requests.ReadTimeout):
+                    transport.get("issues.json")
+            with pytest.raises(CircuitOpenError):
+                transport.get("issues.json")
+
+        assert mock_send.call_count == 2
+        breaker = transport.get_stats()["circuit_breakers"]["redmine.example.com"]
+        assert breaker["state"] == "open"
+        assert breaker["rejected"] == 1
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        transport = _transport(failure_threshold=1)
+
+        with patch("requests.adapters.HTTPAdapter.send", return_value=_response(404)):
+            transport.get("issues/1.json")
+            transport.get("issues/1.json")
+
+        assert transport.breakers.overall_state() == "closed"
+
+    def test_transport_without_resilience(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k")
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send", return_value=_response(503)
+        ) as mock_send:
+            transport.get("issues.json")
+
+        assert mock_send.call_count == 1
+        assert transport.get_stats()["circuit_breakers"] == {}
+
+
+@pytest.mark.unit
+class TestCircuitOpenErrorMessage:
+    """_handle_redmine_error explains an open circuit."""
+
+    def test_circuit_open_message(self):
+        from redmine_mcp_server.redmine_handler import _handle_redmine_error
+
+        result = _handle_redmine_error(
+            CircuitOpenError("redmine.example.com", 12.4), "fetching issue 1"
+        )
+
+        assert "temporarily unavailable" in result["error"]
+        assert "retry in 12s" in result["error"]
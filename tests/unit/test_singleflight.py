@@ -0,0 +1,165 @@
+"""
+Tests for single-flight coalescing of identical concurrent reads.
+
+Tests cover:
+- Request key normalization
+- Concurrent identical calls sharing one upstream fetch
+- Errors shared by every joined caller
+- Keys forgotten once the fetch completes (no caching)
+- A cancelled leader not failing joined callers
+- get_redmine_issue coalescing through the tool
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.core.singleflight import SingleFlight, request_key
+
+
+@pytest.mark.unit
+class TestRequestKey:
+    """Tests for request_key."""
+
+    def test_param_order_and_id_type_do_not_matter(self):
+        assert request_key("issue", 5, journals=True, attachments=False) == (
+            request_key("issue", "5", attachments=False, journals=True)
+        )
+
+    def test_includes_are_part_of_the_key(self):
+        assert request_key("issue", 5, journals=True) != request_key(
+            "issue", 5, journals=False
+        )
+
+    def test_resource_is_part_of_the_key(self):
+        assert request_key("issue", 5) != request_key("wiki_page", 5)
+
+    def test_filters_are_normalized(self):
+        assert request_key("issues", filters={"b": [1, 2], "a": 1}) == request_key(
+            "issues", filters={"a": "1", "b": (1, 2)}
+        )
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_fetch(self):
+        group = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(group.do("k", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"id": 1} for r in results)
+        stats = group.get_stats()
+        assert stats["upstream_calls"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_fetch_separately(self):
+        group = SingleFlight()
+
+        async def fetch(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(
+            group.do("a", lambda: fetch("a")), group.do("b", lambda: fetch("b"))
+        )
+
+        assert results == ["a", "b"]
+        assert group.get_stats()["upstream_calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_by_joined_callers(self):
+        group = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            raise ConnectionError("down")
+
+        results = await asyncio.gather(
+            *(group.do("k", fetch) for _ in range(3)), return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_completed_calls_are_not_cached(self):
+        group = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await group.do("k", fetch) == 1
+        assert await group.do("k", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        group = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        leader = asyncio.ensure_future(group.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "ok"
+        assert leader.cancelled()
+
+
+@pytest.mark.unit
+class TestToolCoalescing:
+    """Read tools send one upstream request per burst of identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_get_redmine_issue_burst_fetches_once(self):
+        from redmine_mcp_server import redmine_handler
+
+        gate = threading.Event()
+        mock_redmine = MagicMock()
+
+        def slow_get(issue_id, **kwargs):
+            gate.wait(1)
+            return MagicMock(id=issue_id)
+
+        mock_redmine.issue.get.side_effect = slow_get
+
+        with patch.object(redmine_handler, "redmine", mock_redmine), patch.object(
+            redmine_handler, "_issue_to_dict", lambda issue: {"id": issue.id}
+        ), patch.object(redmine_handler, "_ensure_cleanup_started"):
+            calls = [
+                redmine_handler.get_redmine_issue(
+                    7, include_journals=False, include_attachments=False
+                )
+                for _ in range(4)
+            ]
+            pending = asyncio.gather(*calls)
+            await asyncio.sleep(0.05)
+            gate.set()
+            results = await pending
+
+        assert results == [{"id": 7}] * 4
+        mock_redmine.issue.get.assert_called_once_with(7)
@@ -0,0 +1,177 @@
+"""
+Tests for the monthly partitions of dwd_issue_daily_snapshot.
+
+Tests cover:
+- Month arithmetic and partition naming
+- Partitions ensured once per month and process, on an autocommit
+  connection, and only remembered once created
+- Daily maintenance creating the upcoming months
+- Retention: cutoff month, detach (archive) and drop modes
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from redmine_mcp_server.dws import partitions
+from redmine_mcp_server.dws.partitions import (
+    add_months,
+    ensure_snapshot_partitions,
+    expire_snapshot_partitions,
+    maintain_snapshot_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    partitions.forget_partitions()
+    yield
+    partitions.forget_partitions()
+
+
+@pytest.fixture
+def connection():
+    conn = MagicMock(autocommit=False)
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchall.return_value = []
+    get_connection = MagicMock()
+    get_connection.return_value.__enter__.return_value = conn
+    return get_connection, conn, cur
+
+
+def _sql(cur):
+    return [call.args[0] for call in cur.execute.call_args_list]
+
+
+@pytest.mark.unit
+class TestNaming:
+    """Tests for month helpers and partition names."""
+
+    def test_add_months_across_years(self):
+        assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+        assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+    def test_partition_names_round_trip(self):
+        name = partition_name(date(2025, 3, 17))
+
+        assert name == "dwd_issue_daily_snapshot_p202503"
+        assert partition_month(name) == date(2025, 3, 1)
+        assert partition_month(name + "_archived") is None
+
+
+@pytest.mark.unit
+class TestEnsureSnapshotPartitions:
+    """Tests for ensure_snapshot_partitions."""
+
+    def test_one_call_per_new_month(self, connection):
+        get_connection, _, cur = connection
+
+        ensure_snapshot_partitions(
+            get_connection, [date(2025, 1, 2), date(2025, 1, 30), date(2025, 2, 1)]
+        )
+        ensure_snapshot_partitions(get_connection, [date(2025, 1, 15)])
+
+        assert [call.args[1] for call in cur.execute.call_args_list] == [
+            (date(2025, 1, 1),),
+            (date(2025, 2, 1),),
+        ]
+        get_connection.assert_called_once()
+
+    def test_created_in_autocommit(self, connection):
+        get_connection, conn, cur = connection
+        modes = []
+        cur.execute.side_effect = lambda *args: modes.append(conn.autocommit)
+
+        ensure_snapshot_partitions(get_connection, [date(2025, 1, 2)])
+
+        assert modes == [True]
+        assert conn.autocommit is False
+
+    def test_failed_creation_is_retried(self, connection):
+        get_connection, conn, cur = connection
+        cur.execute.side_effect = [None, RuntimeError("lock timeout")]
+
+        with pytest.raises(RuntimeError):
+            ensure_snapshot_partitions(
+                get_connection, [date(2025, 1, 2), date(2025, 2, 2)]
+            )
+        assert conn.autocommit is False
+        cur.execute.side_effect = None
+        ensure_snapshot_partitions(get_connection, [date(2025, 1, 2), date(2025, 2, 2)])
+
+        assert [call.args[1] for call in cur.execute.call_args_list] == [
+            (date(2025, 1, 1),),
+            (date(2025, 2, 1),),
+            (date(2025, 2, 1),),
+        ]
+
+
+@pytest.mark.unit
+class TestMaintenance:
+    """Tests for maintain_snapshot_partitions and retention."""
+
+    def test_upcoming_months_created(self, connection):
+        get_connection, _, cur = connection
+
+        result = maintain_snapshot_partitions(
+            get_connection, months_ahead=2, retention_months=0, today=date(2025, 12, 5)
+        )
+
+        assert result == {"months_ready": 3, "expired": []}
+        assert [call.args[1][0] for call in cur.execute.call_args_list] == [
+            date(2025, 12, 1),
+            date(2026, 1, 1),
+            date(2026, 2, 1),
+        ]
+
+    def test_detach_expired_months(self, connection):
+        get_connection, conn, cur = connection
+        cur.fetchall.return_value = [
+            ("dwd_issue_daily_snapshot_p202410",),
+            ("dwd_issue_daily_snapshot_p202411",),
+            ("dwd_issue_daily_snapshot_p202412",),
+            ("dwd_issue_daily_snapshot_p202501",),
+        ]
+
+        expired = expire_snapshot_partitions(
+            get_connection, retention_months=2, today=date(2025, 1, 20)
+        )
+
+        assert expired == [
+            "dwd_issue_daily_snapshot_p202410",
+            "dwd_issue_daily_snapshot_p202411",
+        ]
+        statements = _sql(cur)[1:]
+        assert statements[0] == (
+            "ALTER TABLE warehouse.dwd_issue_daily_snapshot "
+            "DETACH PARTITION warehouse.dwd_issue_daily_snapshot_p202410 "
+            "CONCURRENTLY"
+        )
+        assert statements[1].endswith("RENAME TO dwd_issue_daily_snapshot_p202410_archived")
+        assert len(statements) == 4
+        assert conn.autocommit is False
+
+    def test_drop_mode(self, connection):
+        get_connection, _, cur = connection
+        cur.fetchall.return_value = [("dwd_issue_daily_snapshot_p202401",)]
+
+        expire_snapshot_partitions(
+            get_connection, retention_months=12, mode="drop", today=date(2025, 6, 1)
+        )
+
+        assert _sql(cur)[-1] == "DROP TABLE warehouse.dwd_issue_daily_snapshot_p202401"
+
+    def test_retention_disabled(self, connection):
+        get_connection, _, cur = connection
+
+        assert expire_snapshot_partitions(get_connection, retention_months=0) == []
+        cur.execute.assert_not_called()
+
+    def test_invalid_mode(self, connection):
+        get_connection, _, _ = connection
+
+        with pytest.raises(ValueError):
+            expire_snapshot_partitions(get_connection, 3, mode="truncate")
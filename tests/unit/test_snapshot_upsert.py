@@ -0,0 +1,144 @@
+"""
+Tests for the set-based daily snapshot upsert.
+
+Tests cover:
+- upsert_issues_batch writing all rows through one connection and transaction
+- Multi-row statements chunked by SNAPSHOT_UPSERT_PAGE_SIZE
+- Summary delta maintained around the writes, inside the same transaction
+- new/closed/updated flags and duplicate issue ids
+- The month's partition ensured on the same cursor before writing
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.dws import repository
+from redmine_mcp_server.dws.repository import DataWarehouse
+
+SNAPSHOT_DATE = date(2025, 1, 2)
+
+
+def _issue(issue_id, status="New", updated_on="2025-01-01T00:00:00Z"):
+    return {
+        "id": issue_id,
+        "project": {"id": 3},
+        "subject": f"Issue {issue_id}",
+        "status": {"id": 1, "name": status},
+        "priority": {"id": 2, "name": "Normal"},
+        "assigned_to": None,
+        "created_on": "2025-01-01T00:00:00Z",
+        "updated_on": updated_on,
+    }
+
+
+@pytest.fixture
+def warehouse():
+    with patch.object(DataWarehouse, "_init_pool"):
+        warehouse = DataWarehouse()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    warehouse.connection_pool = MagicMock()
+    warehouse.connection_pool.getconn.return_value = conn
+    with patch.object(repository, "execute_values") as execute_values, patch.object(
+        repository, "ensure_snapshot_partitions"
+    ), patch.object(repository, "daily_summary_delta"):
+        yield warehouse, conn, cursor, execute_values
+
+
+@pytest.mark.unit
+class TestUpsertIssuesBatch:
+    """Tests for DataWarehouse.upsert_issues_batch."""
+
+    def test_one_transaction_for_all_rows(self, warehouse):
+        warehouse, conn, cursor, execute_values = warehouse
+        issues = [_issue(i) for i in range(1, 2501)]
+
+        warehouse.upsert_issues_batch(3, issues, SNAPSHOT_DATE, {})
+
+        warehouse.connection_pool.getconn.assert_called_once()
+        conn.commit.assert_called_once()
+        execute_values.assert_called_once()
+        _, sql, rows = execute_values.call_args.args
+        assert "VALUES %s" in sql and "ON CONFLICT" in sql
+        assert len(rows) == 2500
+        assert execute_values.call_args.kwargs == {
+            "page_size": repository.SNAPSHOT_UPSERT_PAGE_SIZE
+        }
+        cursor.execute.assert_not_called()
+        repository.daily_summary_delta.assert_called_once_with(
+            conn, 3, SNAPSHOT_DATE, list(range(1, 2501))
+        )
+        summary = repository.daily_summary_delta.return_value
+        summary.__enter__.assert_called_once()
+        summary.__exit__.assert_called_once()
+
+    def test_summary_maintenance_can_be_skipped(self, warehouse):
+        warehouse, _, cursor, execute_values = warehouse
+
+        warehouse.upsert_issues_batch(
+            3, [_issue(1)], SNAPSHOT_DATE, {}, refresh_summary=False
+        )
+
+        execute_values.assert_called_once()
+        cursor.execute.assert_not_called()
+        repository.daily_summary_delta.assert_not_called()
+
+    def test_row_flags(self, warehouse):
+        warehouse, _, _, execute_values = warehouse
+        issues = [
+            _issue(1),
+            _issue(2, status="已shutdown", updated_on="2025-01-02T08:00:00Z"),
+        ]
+        previous = {2: {"issue_id": 2, "status_name": "New"}}
+
+        warehouse.upsert_issues_batch(3, issues, SNAPSHOT_DATE, previous)
+
+        rows = execute_values.call_args.args[2]
+        # (..., is_new, is_closed, is_updated)
+        assert [row[-3:] for row in rows] == [
+            (True, False, False),
+            (False, True, True),
+        ]
+
+    def test_duplicate_issue_ids_keep_last_row(self, warehouse):
+        warehouse, _, _, execute_values = warehouse
+
+        warehouse.upsert_issues_batch(
+            3, [_issue(1), _issue(1, status="Resolved")], SNAPSHOT_DATE, {}
+        )
+
+        rows = execute_values.call_args.args[2]
+        assert len(rows) == 1
+        assert rows[0][5] == "Resolved"
+
+    def test_empty_batch_writes_nothing(self, warehouse):
+        warehouse, _, cursor, execute_values = warehouse
+
+        warehouse.upsert_issues_batch(3, [], SNAPSHOT_DATE, {})
+
+        execute_values.assert_not_called()
+        cursor.execute.assert_not_called()
+        repository.daily_summary_delta.assert_not_called()
+
+    def test_partition_ensured_before_transaction(self, warehouse):
+        warehouse, conn, cursor, execute_values = warehouse
+        order = []
+        repository.ensure_snapshot_partitions.side_effect = (
+            lambda get_connection, days: order.append(("ensure", days))
+        )
+        warehouse.connection_pool.getconn.side_effect = lambda: (
+            order.append("connect") or conn
+        )
+        execute_values.side_effect = lambda cur, *args, **kwargs: order.append(
+            ("insert", cur)
+        )
+
+        warehouse.upsert_issues_batch(
+            3, [_issue(1)], SNAPSHOT_DATE, {}, refresh_summary=False
+        )
+
+        assert order == [("ensure", [SNAPSHOT_DATE]), "connect", ("insert", cursor)]
+        get_connection = repository.ensure_snapshot_partitions.call_args.args[0]
+        assert get_connection == warehouse.get_connection
@@ -0,0 +1,86 @@
+"""
+Tests for server cold-start cost.
+
+Tests cover:
+- Loading the tool registry does not import psycopg2 or apscheduler
+- Import-time budget for the package's own modules (``python -X importtime``)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Modules that must only load on first warehouse/scheduler use
+DEFERRED_MODULES = ("psycopg2", "apscheduler", "redmine_mcp_server.dws.repository")
+
+# Self time of redmine_mcp_server.* modules; third-party imports (mcp,
+# pydantic, redminelib) are excluded so the budget tracks this package only
+DEFAULT_BUDGET_MS = 1000
+
+
+def _import_profile(tmp_path, module):
+    """Import ``module`` in a fresh interpreter under ``-X importtime``."""
+    env = dict(
+        os.environ,
+        PYTHONPATH=str(SRC),
+        REDMINE_URL="http://redmine.example",
+        REDMINE_API_KEY="test",
+    )
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    self_us = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            self_us[name.strip()] = int(own)
+    return result.stdout.strip(), self_us
+
+
+@pytest.fixture(scope="module")
+def profile(tmp_path_factory):
+    return _import_profile(
+        tmp_path_factory.mktemp("cwd"), "redmine_mcp_server.mcp.server"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.slow
+class TestColdStart:
+    """Importing the MCP server stays cheap for per-session stdio processes."""
+
+    def test_heavy_dependencies_are_deferred(self, profile):
+        loaded, _ = profile
+
+        assert loaded == ""
+
+    def test_import_time_budget(self, profile):
+        _, self_us = profile
+        budget_ms = int(os.getenv("REDMINE_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS))
+        own = {
+            name: us
+            for name, us in self_us.items()
+            if name.startswith("redmine_mcp_server")
+        }
+
+        total_ms = sum(own.values()) / 1000
+        slowest = sorted(own.items(), key=lambda item: -item[1])[:5]
+        assert total_ms <= budget_ms, f"{total_ms:.0f} ms > {budget_ms} ms: {slowest}"
@@ -0,0 +1,120 @@
+"""
+Tests for prepared warehouse read statements.
+
+Tests cover:
+- PREPARE/EXECUTE rendering of a Statement
+- Preparing once per connection and executing by name afterwards
+- Recycled connections preparing again
+- Per-statement call and prepare timings
+- Snapshot statements named by column list and id filter
+"""
+
+import gc
+from unittest.mock import MagicMock
+
+import pytest
+
+from redmine_mcp_server.dws import statements
+from redmine_mcp_server.dws.statements import (
+    Statement,
+    StatementRegistry,
+    issues_snapshot_statement,
+)
+
+STATEMENT = Statement("rmcp_test", "SELECT $1::int + $2::int", 2)
+
+
+def _cursor():
+    cur = MagicMock()
+    cur.connection = MagicMock()
+    return cur
+
+
+@pytest.mark.unit
+class TestStatement:
+    """Tests for Statement SQL rendering."""
+
+    def test_prepare_and_execute_sql(self):
+        assert STATEMENT.prepare_sql == "PREPARE rmcp_test AS SELECT $1::int + $2::int"
+        assert STATEMENT.execute_sql == "EXECUTE rmcp_test (%s, %s)"
+
+    def test_execute_without_parameters(self):
+        assert Statement("rmcp_now", "SELECT now()", 0).execute_sql == "EXECUTE rmcp_now"
+
+
+@pytest.mark.unit
+class TestStatementRegistry:
+    """Tests for StatementRegistry.execute."""
+
+    def test_prepares_once_per_connection(self):
+        registry = StatementRegistry()
+        cur = _cursor()
+
+        registry.execute(cur, STATEMENT, [1, 2])
+        registry.execute(cur, STATEMENT, [3, 4])
+
+        assert [call.args for call in cur.execute.call_args_list] == [
+            (STATEMENT.prepare_sql,),
+            (STATEMENT.execute_sql, (1, 2)),
+            (STATEMENT.execute_sql, (3, 4)),
+        ]
+
+    def test_new_connection_prepares_again(self):
+        registry = StatementRegistry()
+        first, second = _cursor(), _cursor()
+
+        registry.execute(first, STATEMENT, (1, 2))
+        registry.execute(second, STATEMENT, (1, 2))
+
+        assert second.execute.call_args_list[0].args == (STATEMENT.prepare_sql,)
+        assert registry.get_stats()["rmcp_test"]["prepares"] == 2
+
+    def test_dropped_connection_is_forgotten(self):
+        registry = StatementRegistry()
+        cur = _cursor()
+        registry.execute(cur, STATEMENT, (1, 2))
+
+        del cur
+        gc.collect()  # mocks hold reference cycles
+        assert len(registry._prepared) == 0
+
+    def test_timings(self):
+        registry = StatementRegistry()
+        cur = _cursor()
+
+        for _ in range(3):
+            registry.execute(cur, STATEMENT, (1, 2))
+
+        stats = registry.get_stats()["rmcp_test"]
+        assert stats["calls"] == 3
+        assert stats["prepares"] == 1
+        assert stats["max_ms"] >= stats["avg_ms"] >= 0
+
+    def test_stats_empty_until_first_statement(self):
+        statements.registry.reset()
+        assert statements.get_statement_stats() is None
+
+        statements.execute_prepared(_cursor(), STATEMENT, (1, 2))
+
+        assert set(statements.get_statement_stats()) == {"rmcp_test"}
+        statements.registry.reset()
+
+
+@pytest.mark.unit
+class TestIssuesSnapshotStatement:
+    """Tests for issues_snapshot_statement."""
+
+    def test_one_statement_per_column_list(self):
+        columns = issues_snapshot_statement('"issue_id"', False)
+
+        assert issues_snapshot_statement('"issue_id"', False) is columns
+        assert issues_snapshot_statement("*", False).name != columns.name
+        assert columns.name.startswith("rmcp_issues_snapshot_")
+        assert columns.param_count == 2
+
+    def test_issue_id_filter(self):
+        statement = issues_snapshot_statement("*", True)
+
+        assert statement.name.endswith("_ids")
+        assert "issue_id = ANY($3)" in statement.text
+        assert statement.param_count == 3
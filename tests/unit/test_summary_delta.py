@@ -0,0 +1,119 @@
+"""
+Tests for the incremental dws_project_daily_summary maintenance.
+
+Tests cover:
+- Summary row locked, issues counted before and after the writes
+- Per-bucket delta applied to the summary row
+- No update when the counts did not change
+- Full recompute when the day has no summary row yet
+- Nothing applied when the write fails
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from redmine_mcp_server.dws.summary import (
+    SUMMARY_COLUMNS,
+    daily_summary_delta,
+    refresh_daily_summary,
+)
+
+DAY = date(2025, 1, 2)
+
+
+def _counts(**values):
+    return tuple(values.get(column, 0) for column in SUMMARY_COLUMNS)
+
+
+@pytest.fixture
+def connection():
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    return conn, cur
+
+
+def _sql(cur):
+    return [" ".join(call.args[0].split()) for call in cur.execute.call_args_list]
+
+
+@pytest.mark.unit
+class TestDailySummaryDelta:
+    """Tests for daily_summary_delta."""
+
+    def test_delta_applied(self, connection):
+        conn, cur = connection
+        cur.fetchone.side_effect = [
+            (1,),
+            _counts(total_issues=2, status_new=2, priority_normal=2),
+            _counts(total_issues=3, status_new=1, status_resolved=2, priority_normal=3),
+        ]
+        writes = []
+
+        with daily_summary_delta(conn, 3, DAY, [10, 11, 12]):
+            writes.append(len(cur.execute.call_args_list))
+
+        statements = _sql(cur)
+        assert statements[0].endswith("FOR UPDATE")
+        assert "summarize_issue_snapshots" in statements[1]
+        assert writes == [2]
+        assert cur.execute.call_args_list[1].args[1] == (3, DAY, [10, 11, 12])
+        assert statements[3].startswith(
+            "UPDATE warehouse.dws_project_daily_summary "
+            "SET total_issues = total_issues + %s"
+        )
+        delta = dict(zip(SUMMARY_COLUMNS, cur.execute.call_args.args[1]))
+        assert delta["total_issues"] == 1
+        assert delta["status_new"] == -1
+        assert delta["status_resolved"] == 2
+        assert delta["priority_normal"] == 1
+        assert cur.execute.call_args.args[1][-2:] == (3, DAY)
+
+    def test_unchanged_counts_skip_update(self, connection):
+        conn, cur = connection
+        cur.fetchone.side_effect = [
+            (1,),
+            _counts(total_issues=4),
+            _counts(total_issues=4),
+        ]
+
+        with daily_summary_delta(conn, 3, DAY, [10]):
+            pass
+
+        assert len(cur.execute.call_args_list) == 3
+        assert not any(sql.startswith("UPDATE") for sql in _sql(cur))
+
+    def test_missing_summary_row_recomputed(self, connection):
+        conn, cur = connection
+        cur.fetchone.side_effect = [None]
+
+        with daily_summary_delta(conn, 3, DAY, [10]):
+            pass
+
+        assert cur.execute.call_args.args == (
+            "SELECT warehouse.refresh_dws_project_daily_summary(%s, %s)",
+            (3, DAY),
+        )
+        assert len(cur.execute.call_args_list) == 2
+
+    def test_failed_write_applies_nothing(self, connection):
+        conn, cur = connection
+        cur.fetchone.side_effect = [(1,), _counts(total_issues=1)]
+
+        with pytest.raises(RuntimeError):
+            with daily_summary_delta(conn, 3, DAY, [10]):
+                raise RuntimeError("insert failed")
+
+        assert len(cur.execute.call_args_list) == 2
+
+
+@pytest.mark.unit
+def test_refresh_daily_summary(connection):
+    conn, cur = connection
+
+    refresh_daily_summary(conn, 5, DAY)
+
+    cur.execute.assert_called_once_with(
+        "SELECT warehouse.refresh_dws_project_daily_summary(%s, %s)", (5, DAY)
+    )
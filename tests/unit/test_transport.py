@@ -0,0 +1,152 @@
+"""
+Tests for the shared pooled Redmine transport.
+
+Tests cover:
+- Session authentication and SSL settings
+- Endpoint URL resolution
+- JSON helper error handling
+- Request counters and pool statistics
+- python-redmine engine sharing the transport's connection pool
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from redmine_mcp_server.core import transport as transport_module
+from redmine_mcp_server.core.transport import (
+    PooledSyncEngine,
+    RedmineTransport,
+    configure_redmine_transport,
+    get_transport_stats,
+)
+
+
+def _response(status=200, payload=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = b"{}" if payload is None else payload
+    return resp
+
+
+@pytest.mark.unit
+class TestRedmineTransport:
+    """Tests for RedmineTransport."""
+
+    def test_api_key_header_and_ssl_settings(self):
+        transport = RedmineTransport(
+            "https://redmine.example.com/",
+            api_key="secret",
+            verify="/path/ca.crt",
+            cert=("client.crt", "client.key"),
+        )
+
+        assert transport.session.headers["X-Redmine-API-Key"] == "secret"
+        assert transport.session.auth is None
+        assert transport.session.verify == "/path/ca.crt"
+        assert transport.session.cert == ("client.crt", "client.key")
+        assert transport.session.get_adapter("https://x") is transport.adapter
+
+    def test_basic_auth_when_no_api_key(self):
+        transport = RedmineTransport(
+            "http://redmine.example.com", username="u", password="p"
+        )
+
+        assert "X-Redmine-API-Key" not in transport.session.headers
+        assert transport.session.auth == ("u", "p")
+
+    def test_url_resolution(self):
+        transport = RedmineTransport("http://redmine.example.com/", api_key="k")
+
+        assert transport.url("issues.json") == "http://redmine.example.com/issues.json"
+        assert transport.url("/projects/1.json") == (
+            "http://redmine.example.com/projects/1.json"
+        )
+        assert transport.url("http://other/x.json") == "http://other/x.json"
+
+    def test_get_uses_default_timeout(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k", timeout=7)
+
+        with patch.object(transport.session, "get") as mock_get:
+            transport.get("issues.json", params={"limit": 1})
+
+        mock_get.assert_called_once_with(
+            "http://redmine.example.com/issues.json", params={"limit": 1}, timeout=7
+        )
+
+    def test_get_json_raises_on_http_error(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k")
+
+        with patch.object(transport, "get", return_value=_response(404)):
+            with pytest.raises(requests.HTTPError):
+                transport.get_json("issues/1.json")
+
+    def test_get_json_returns_body(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k")
+
+        with patch.object(
+            transport, "get", return_value=_response(payload=b'{"total_count": 3}')
+        ):
+            assert transport.get_json("issues.json") == {"total_count": 3}
+
+    def test_adapter_counts_requests_and_errors(self):
+        transport = RedmineTransport("http://redmine.example.com", api_key="k")
+
+        with patch(
+            "requests.adapters.HTTPAdapter.send",
+            side_effect=[_response(), requests.ConnectionError("down")],
+        ):
+            transport.get("issues.json")
+            with pytest.raises(requests.ConnectionError):
+                transport.get("issues.json")
+
+        stats = transport.get_stats()
+        assert stats["requests_sent"] == 2
+        assert stats["request_errors"] == 1
+        assert stats["base_url"] == "http://redmine.example.com"
+        assert isinstance(stats["hosts"], dict)
+
+
+@pytest.mark.unit
+class TestSharedTransport:
+    """Tests for the process-wide transport and engine wiring."""
+
+    @pytest.fixture(autouse=True)
+    def restore_transport(self):
+        previous = transport_module._transport
+        yield
+        transport_module._transport = previous
+
+    def test_configure_reads_pool_settings_from_env(self, monkeypatch):
+        monkeypatch.setenv("REDMINE_HTTP_POOL_MAXSIZE", "5")
+        monkeypatch.setenv("REDMINE_HTTP_TIMEOUT", "12")
+
+        transport = configure_redmine_transport(
+            "http://redmine.example.com",
+            api_key="k",
+            requests_config={"verify": False},
+        )
+
+        assert transport.pool_maxsize == 5
+        assert transport.timeout == 12
+        assert transport.session.verify is False
+        assert get_transport_stats()["base_url"] == "http://redmine.example.com"
+
+    def test_configure_replaces_and_closes_previous(self):
+        first = configure_redmine_transport("http://a.example.com", api_key="k")
+        first.close = MagicMock()
+
+        second = configure_redmine_transport("http://b.example.com", api_key="k")
+
+        first.close.assert_called_once()
+        assert transport_module._transport is second
+
+    def test_pooled_engine_mounts_shared_adapter(self):
+        transport = configure_redmine_transport("http://redmine.example.com", api_key="k")
+
+        session = PooledSyncEngine(key="k").session
+
+        assert session.get_adapter("http://redmine.example.com") is transport.adapter
+        assert session.get_adapter("https://redmine.example.com") is transport.adapter
+        assert session.headers["X-Redmine-API-Key"] == "k"
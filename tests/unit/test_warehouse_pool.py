@@ -0,0 +1,207 @@
+"""
+Tests for the process-wide warehouse connection pool.
+
+Tests cover:
+- One pool shared by every DataWarehouse instance, created on first use
+- Blocking checkout with a timeout instead of PoolError
+- Validation on checkout (closed and broken idle connections are replaced)
+- Recycling connections by age
+- Checkout wait / in-use metrics
+- The psycopg2 behaviour the pool depends on, and the quality monitor using it
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redmine_mcp_server.dws import pool as warehouse_pool
+from redmine_mcp_server.dws.pool import (
+    WarehousePool,
+    WarehousePoolTimeout,
+    close_warehouse_pool,
+    get_warehouse_pool_stats,
+)
+
+
+class FakeThreadedPool:
+    """Minimal stand-in for psycopg2's ThreadedConnectionPool."""
+
+    instances = []
+
+    def __init__(self, minconn, maxconn, **kwargs):
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.kwargs = kwargs
+        self._pool = []
+        self._used = {}
+        self.opened = 0
+        self.closed_all = False
+        FakeThreadedPool.instances.append(self)
+
+    def getconn(self):
+        if self._pool:
+            conn = self._pool.pop()
+        else:
+            self.opened += 1
+            conn = MagicMock(closed=0, name=f"conn{self.opened}")
+        self._used[id(conn)] = conn
+        return conn
+
+    def putconn(self, conn, close=False):
+        del self._used[id(conn)]
+        if close:
+            conn.closed = 1
+        elif len(self._pool) < self.minconn:
+            self._pool.append(conn)
+
+    def closeall(self):
+        self.closed_all = True
+
+
+@pytest.fixture(autouse=True)
+def fake_psycopg2_pool():
+    FakeThreadedPool.instances = []
+    close_warehouse_pool()
+    with patch("psycopg2.pool.ThreadedConnectionPool", FakeThreadedPool):
+        yield
+    close_warehouse_pool()
+
+
+@pytest.mark.unit
+class TestSharedPool:
+    """DataWarehouse instances share one lazily created pool."""
+
+    def test_instances_share_one_pool(self):
+        from redmine_mcp_server.dws.repository import DataWarehouse
+
+        assert get_warehouse_pool_stats() is None
+
+        first, second = DataWarehouse(), DataWarehouse()
+        first.close()
+        with second.get_connection():
+            pass
+
+        assert len(FakeThreadedPool.instances) == 1
+        assert first.connection_pool is None
+        assert second.connection_pool is warehouse_pool._pool
+        assert FakeThreadedPool.instances[0].closed_all is False
+        assert get_warehouse_pool_stats()["checkouts"] == 1
+
+    def test_returned_connections_are_reused(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=4)
+
+        conns = [wh_pool.getconn() for _ in range(3)]
+        for conn in conns:
+            wh_pool.putconn(conn)
+        again = [wh_pool.getconn() for _ in range(3)]
+
+        assert set(map(id, again)) == set(map(id, conns))
+        assert FakeThreadedPool.instances[0].opened == 3
+
+
+@pytest.mark.unit
+class TestCheckout:
+    """Tests for WarehousePool.getconn/putconn."""
+
+    def test_exhausted_pool_times_out(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=1)
+        held = wh_pool.getconn()
+
+        with pytest.raises(WarehousePoolTimeout):
+            wh_pool.getconn(timeout=0.05)
+
+        wh_pool.putconn(held)
+        assert wh_pool.get_stats()["timeouts"] == 1
+        assert wh_pool.get_stats()["in_use"] == 0
+
+    def test_waiter_gets_released_connection(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=1)
+        held = wh_pool.getconn()
+        threading.Timer(0.05, wh_pool.putconn, args=(held,)).start()
+
+        conn = wh_pool.getconn(timeout=2)
+
+        stats = wh_pool.get_stats()
+        assert conn is held
+        assert stats["waited"] == 1
+        assert stats["max_wait_ms"] >= 40
+        assert stats["max_in_use"] == 1
+
+    def test_closed_connection_is_replaced(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=2)
+        conn = wh_pool.getconn()
+        wh_pool.putconn(conn)
+        conn.closed = 2  # e.g. the server dropped it while idle
+
+        fresh = wh_pool.getconn()
+
+        assert fresh is not conn
+        assert wh_pool.get_stats()["invalidated"] == 1
+
+    def test_idle_connection_failing_ping_is_replaced(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=2, validate_idle=0)
+        conn = wh_pool.getconn()
+        wh_pool.putconn(conn)
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            RuntimeError("server closed the connection")
+        )
+
+        fresh = wh_pool.getconn()
+
+        assert fresh is not conn
+        assert wh_pool.get_stats()["invalidated"] == 1
+
+    def test_fresh_connections_are_not_pinged(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=2, validate_idle=0)
+
+        conn = wh_pool.getconn()
+
+        conn.cursor.assert_not_called()
+
+    def test_old_connections_are_recycled(self):
+        wh_pool = WarehousePool(minconn=1, maxconn=2, max_age=0.01)
+        conn = wh_pool.getconn()
+        wh_pool.putconn(conn)
+        time.sleep(0.02)
+
+        fresh = wh_pool.getconn()
+
+        assert fresh is not conn
+        assert conn.closed
+        assert wh_pool.get_stats()["recycled"] == 1
+
+
+@pytest.mark.unit
+def test_psycopg2_putconn_honours_raised_minconn():
+    """WarehousePool relies on psycopg2 reading minconn on every return."""
+    from psycopg2 import extensions
+    from psycopg2.pool import AbstractConnectionPool
+
+    real_pool = AbstractConnectionPool(0, 2)
+    real_pool.minconn = 2
+    conn = MagicMock(closed=0)
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+    real_pool._used["key"] = conn
+    real_pool._rused[id(conn)] = "key"
+
+    real_pool._putconn(conn)
+
+    assert real_pool._pool == [conn]
+    conn.close.assert_not_called()
+
+
+@pytest.mark.unit
+def test_quality_monitor_uses_shared_pool():
+    from redmine_mcp_server.dws.services.quality_service import DataQualityMonitor
+
+    monitor = DataQualityMonitor()
+    monitor.connect_db()
+    conn = monitor.conn
+    monitor.close_db()
+
+    assert monitor.pool is warehouse_pool._pool
+    assert get_warehouse_pool_stats()["checkouts"] == 1
+    assert get_warehouse_pool_stats()["in_use"] == 0
+    assert conn in FakeThreadedPool.instances[0]._pool
@@ -4,16 +4,25 @@
 完整解决方案 - 同步 Issues + Journals + 状态历史
 """
 
-import requests
 import psycopg2
+from contextlib import contextmanager
 from datetime import datetime
 from psycopg2.extras import RealDictCursor
 import sys
-import time
+
+from redmine_mcp_server.core.ratelimit import AdaptiveRateLimiter
+from redmine_mcp_server.core.transport import RedmineTransport
+from redmine_mcp_server.dws.ods_loader import compact_journal_details
 
 REDMINE_URL = 'http://redmine.fa-software.com'
 API_KEY = 'adabb6a1089a5ac90e5649f505029d28e1cc9bc7'
-HEADERS = {'X-Redmine-API-Key': API_KEY}
+
+# 共享 keep-alive 连接，自适应限流（REDMINE_RATE_LIMIT 等环境变量可调）
+redmine_api = RedmineTransport(
+    REDMINE_URL,
+    api_key=API_KEY,
+    rate_limiter=AdaptiveRateLimiter.from_env(),
+)
 
 DB_CONFIG = {
     'host': 'warehouse-db',
@@ -23,10 +32,23 @@ DB_CONFIG = {
     'password': 'WarehouseP@ss2026'
 }
 
+
 def get_db_connection():
     """获取数据库连接"""
     return psycopg2.connect(**DB_CONFIG)
 
+
+@contextmanager
+def db_transaction():
+    """单个事务的数据库连接，结束时提交（异常时回滚）并关闭"""
+    conn = get_db_connection()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
 def sync_issues(project_id):
     """同步项目所有 Issue"""
     print('='*70)
@@ -37,9 +59,8 @@ def sync_issues(project_id):
     cur = conn.cursor()
     
     # 获取总数量
-    resp = requests.get(
-        f'{REDMINE_URL}/issues.json',
-        headers=HEADERS,
+    resp = redmine_api.get(
+        'issues.json',
         params={'project_id': project_id, 'status_id': '*', 'limit': 1},
         timeout=30
     )
@@ -51,9 +72,8 @@ def sync_issues(project_id):
     total_inserted = 0
     
     while offset < total_count:
-        resp = requests.get(
-            f'{REDMINE_URL}/issues.json',
-            headers=HEADERS,
+        resp = redmine_api.get(
+            'issues.json',
             params={'project_id': project_id, 'status_id': '*', 'offset': offset, 'limit': batch_size},
             timeout=120
         )
@@ -102,6 +122,7 @@ def sync_issues(project_id):
     print(f'✅ Issue 同步完成！新增 {total_inserted:,} 个\n')
     return total_inserted
 
+
 def sync_journals(project_id):
     """同步所有 Issue 的 Journals"""
     print('='*70)
@@ -117,14 +138,17 @@ def sync_journals(project_id):
     
     print(f'项目 {project_id} 共有 {total_issues} 个 Issue')
     
+    # ON CONFLICT (journal_id, detail_ordinal) 需要唯一索引：
+    # 先清理旧的重复明细并建索引（索引已存在时直接返回）
+    compact_journal_details(db_transaction)
+    
     total_journals = 0
     total_details = 0
     
     for i, issue_id in enumerate(issue_ids, 1):
         try:
-            resp = requests.get(
-                f'{REDMINE_URL}/issues/{issue_id}.json',
-                headers=HEADERS,
+            resp = redmine_api.get(
+                f'issues/{issue_id}.json',
                 params={'include': 'journals'},
                 timeout=30
             )
@@ -155,15 +179,28 @@ def sync_journals(project_id):
                 except psycopg2.errors.UniqueViolation:
                     pass
                 
+                # 与 ODS 加载器（_MERGE_DETAILS）同一规则：更新已变化的明细，删除已移除的明细
                 details = journal.get('details', [])
-                for detail in details:
+                cur.execute('''
+                    DELETE FROM warehouse.ods_journal_details
+                    WHERE journal_id = %s AND detail_ordinal >= %s
+                ''', (journal_id, len(details)))
+                for ordinal, detail in enumerate(details):
                     try:
                         cur.execute('''
-                            INSERT INTO warehouse.ods_journal_details (
-                                journal_id, property, name, old_value, new_value, sync_time
-                            ) VALUES (%s, %s, %s, %s, %s, %s)
+                            INSERT INTO warehouse.ods_journal_details AS d (
+                                journal_id, detail_ordinal, property, name, old_value, new_value, sync_time
+                            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                            ON CONFLICT (journal_id, detail_ordinal) DO UPDATE SET
+                                property = EXCLUDED.property,
+                                name = EXCLUDED.name,
+                                old_value = EXCLUDED.old_value,
+                                new_value = EXCLUDED.new_value
+                            WHERE (d.property, d.name, d.old_value, d.new_value) IS DISTINCT FROM
+                                (EXCLUDED.property, EXCLUDED.name, EXCLUDED.old_value, EXCLUDED.new_value)
                         ''', (
                             journal_id,
+                            ordinal,
                             detail.get('property', 'attr'),
                             detail.get('name', ''),
                             str(detail.get('old_value', '')) if detail.get('old_value') is not None else None,
@@ -179,8 +216,6 @@ def sync_journals(project_id):
             if i % 10 == 0 or i == total_issues:
                 print(f'进度：{i}/{total_issues} ({i*100/total_issues:.1f}%) - Journals: {total_journals}, Details: {total_details}')
             
-            time.sleep(0.2)
-            
         except Exception as e:
             continue
     
@@ -194,6 +229,7 @@ def sync_journals(project_id):
     print(f'  数据库总计：{result[0]:,}\n')
     return total_journals, total_details
 
+
 def build_status_history(project_id):
     """从 Journals 构建状态历史"""
     print('='*70)
@@ -301,6 +337,7 @@ def build_status_history(project_id):
     print(f'  涉及 Issue：{len(issues_dict):,}\n')
     return total_records
 
+
 if __name__ == '__main__':
     if len(sys.argv) != 2:
         print(f'用法：python3 {sys.argv[0]} <project_id>')